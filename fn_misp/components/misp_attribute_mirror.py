@@ -0,0 +1,70 @@
+# -*- coding: utf-8 -*-
+# pragma pylint: disable=unused-argument, no-self-use
+"""Background synchronisation of the local MISP attribute mirror"""
+
+import logging
+import threading
+import sys
+if sys.version_info.major < 3:
+    from fn_misp.lib import misp_2_helper as misp_helper
+else:
+    from fn_misp.lib import misp_3_helper as misp_helper
+from resilient_circuits import ResilientComponent, handler
+from fn_misp.lib import common, mirror, throttle
+
+
+PACKAGE= "fn_misp"
+
+log = logging.getLogger(__name__)
+
+class FunctionComponent(ResilientComponent):
+    """Component that keeps the local MISP attribute mirror up to date while attribute_mirror_db is set"""
+
+    def __init__(self, opts):
+        """constructor provides access to the configuration options"""
+        super(FunctionComponent, self).__init__(opts)
+        self.opts = opts
+        self.options = opts.get(PACKAGE, {})
+        throttle.configure(self.options)
+        misp_helper.configure_mirror(self.options)
+        self._stop_event = None
+        self._start_sync()
+
+    @handler("reload")
+    def _reload(self, event, opts):
+        """Configuration options have changed, save new values"""
+        self._stop_sync()
+        self.opts = opts
+        self.options = opts.get(PACKAGE, {})
+        misp_helper.invalidate_misp_clients()
+        throttle.configure(self.options)
+        misp_helper.configure_mirror(self.options)
+        self._start_sync()
+
+    @handler("stopped")
+    def _stopped(self, *args, **kwargs):
+        self._stop_sync()
+
+    def _start_sync(self):
+        if mirror.get_mirror() is None:
+            return
+        self._stop_event = threading.Event()
+        thread = threading.Thread(target=self._sync_loop, args=(self._stop_event,), name="misp-attribute-mirror")
+        thread.daemon = True
+        thread.start()
+
+    def _stop_sync(self):
+        if self._stop_event is not None:
+            self._stop_event.set()
+            self._stop_event = None
+
+    def _sync_loop(self, stop_event):
+        while not stop_event.is_set():
+            try:
+                API_KEY, URL, VERIFY_CERT = common.validate(self.options)
+                proxies = common.get_proxies(self.opts, self.options)
+                misp_client = misp_helper.get_misp_client(URL, API_KEY, VERIFY_CERT, proxies=proxies)
+                misp_helper.sync_attribute_mirror(misp_client)
+            except Exception as err:
+                log.error("Failed to sync the MISP attribute mirror: %s", err)
+            stop_event.wait(mirror.get_sync_interval())
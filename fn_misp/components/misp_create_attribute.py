@@ -4,14 +4,12 @@
 
 import logging
 import sys
-import os
-import json
 if sys.version_info.major < 3:
     from fn_misp.lib import misp_2_helper as misp_helper
 else:
     from fn_misp.lib import misp_3_helper as misp_helper
 from resilient_circuits import ResilientComponent, function, handler, StatusMessage, FunctionResult, FunctionError
-from fn_misp.lib import common
+from fn_misp.lib import common, mapping, throttle
 from resilient_lib import IntegrationError
 
 PACKAGE= "fn_misp"
@@ -24,9 +22,10 @@ class FunctionComponent(ResilientComponent):
         super(FunctionComponent, self).__init__(opts)
         self.opts = opts
         self.options = opts.get(PACKAGE, {})
-        self.misp_mapping_config = f"{os.path.dirname(os.getenv('APP_CONFIG_FILE'))}/misp_mapping.cfg"
-        with open(self.misp_mapping_config, encoding='utf8') as f:
-            self.misp_type_mapping = json.load(f)
+        throttle.configure(self.options)
+        misp_helper.configure_warninglists(self.options)
+        misp_helper.configure_outbox(self.opts, self.options)
+        self.misp_type_mapping = mapping.get_type_mapping()
 
 
     @handler("reload")
@@ -34,6 +33,11 @@ class FunctionComponent(ResilientComponent):
         """Configuration options have changed, save new values"""
         self.opts = opts
         self.options = opts.get(PACKAGE, {})
+        misp_helper.invalidate_misp_clients()
+        self.misp_type_mapping.reload()
+        throttle.configure(self.options)
+        misp_helper.configure_warninglists(self.options)
+        misp_helper.configure_outbox(self.opts, self.options)
 
     @function("misp_create_attribute")
     def _misp_create_attribute_function(self, event, *args, **kwargs):
@@ -57,6 +61,17 @@ class FunctionComponent(ResilientComponent):
             log.info("misp_attribute_value: %s", misp_attribute_value)
             log.info("misp_attribute_type: %s", resilient_attribute_type)
 
+            if misp_helper.outbox_enabled():
+                # The warninglist check is done when the outbox replays the attribute
+                misp_attribute_type = self.misp_type_mapping.get(resilient_attribute_type)
+                attribute = misp_helper.enqueue_misp_attribute(misp_event_uuid, misp_attribute_type, misp_attribute_value, misp_override_warninglist)
+                if attribute["queued"]:
+                    yield StatusMessage(f"Attribute {resilient_attribute_type} {misp_attribute_value} has been queued")
+                else:
+                    yield StatusMessage(f"Attribute {resilient_attribute_type} {misp_attribute_value} is already queued or was just created")
+                yield FunctionResult({"success": attribute["queued"], "content": attribute})
+                return
+
             yield StatusMessage("Setting up connection to MISP")
 
             proxies = common.get_proxies(self.opts, self.options)
@@ -9,7 +9,7 @@ if sys.version_info.major < 3:
 else:
     from fn_misp.lib import misp_3_helper as misp_helper
 from resilient_circuits import ResilientComponent, function, handler, StatusMessage, FunctionResult, FunctionError
-from fn_misp.lib import common
+from fn_misp.lib import common, sightings, throttle
 
 
 PACKAGE= "fn_misp"
@@ -22,12 +22,24 @@ class FunctionComponent(ResilientComponent):
         super(FunctionComponent, self).__init__(opts)
         self.opts = opts
         self.options = opts.get(PACKAGE, {})
+        throttle.configure(self.options)
+        misp_helper.configure_sightings(self.options)
+        misp_helper.configure_outbox(self.opts, self.options)
 
     @handler("reload")
     def _reload(self, event, opts):
         """Configuration options have changed, save new values"""
         self.opts = opts
         self.options = opts.get(PACKAGE, {})
+        misp_helper.invalidate_misp_clients()
+        throttle.configure(self.options)
+        misp_helper.configure_sightings(self.options)
+        misp_helper.configure_outbox(self.opts, self.options)
+
+    @handler("stopped")
+    def _stopped(self, *args, **kwargs):
+        """Send the buffered sightings before shutting down"""
+        sightings.flush_all()
 
     @function("misp_create_sighting")
     def _misp_create_sighting_function(self, event, *args, **kwargs):
@@ -42,6 +54,15 @@ class FunctionComponent(ResilientComponent):
             log = logging.getLogger(__name__)
             log.info("misp_sighting: %s", misp_sighting)
 
+            if misp_helper.outbox_enabled():
+                sighting = misp_helper.enqueue_misp_sighting(misp_sighting)
+                if sighting["queued"]:
+                    yield StatusMessage(u"Sighting of {} has been queued".format(misp_sighting))
+                else:
+                    yield StatusMessage(u"Sighting of {} is already queued or was just sent".format(misp_sighting))
+                yield FunctionResult({"success": sighting["queued"], "content": sighting})
+                return
+
             yield StatusMessage("Setting up connection to MISP")
 
             proxies = common.get_proxies(self.opts, self.options)
@@ -54,10 +75,17 @@ class FunctionComponent(ResilientComponent):
 
             log.debug(sighting)
 
-            yield StatusMessage("Sighting has been created")
+            sighted = True
+            if isinstance(sighting, dict) and sighting.get("queued"):
+                yield StatusMessage("Sighting has been queued")
+            elif isinstance(sighting, dict) and sighting.get("skipped"):
+                sighted = False
+                yield StatusMessage(u"No MISP attribute has the value {}, sighting skipped".format(misp_sighting))
+            else:
+                yield StatusMessage("Sighting has been created")
 
             results = { 
-                        "success": True,
+                        "success": sighted,
                         "content": sighting
                     }
 
@@ -0,0 +1,92 @@
+# -*- coding: utf-8 -*-
+# pragma pylint: disable=unused-argument, no-self-use
+"""Function implementation"""
+
+import logging
+import sys
+if sys.version_info.major < 3:
+    from fn_misp.lib import misp_2_helper as misp_helper
+else:
+    from fn_misp.lib import misp_3_helper as misp_helper
+from resilient_circuits import ResilientComponent, function, handler, StatusMessage, FunctionResult, FunctionError
+from fn_misp.lib import common, mapping, throttle
+from resilient_lib import IntegrationError
+
+
+PACKAGE= "fn_misp"
+
+class FunctionComponent(ResilientComponent):
+    """Component that implements Resilient function(s)"""
+
+    def __init__(self, opts):
+        """constructor provides access to the configuration options"""
+        super(FunctionComponent, self).__init__(opts)
+        self.opts = opts
+        self.options = opts.get(PACKAGE, {})
+        throttle.configure(self.options)
+        misp_helper.configure_search(self.options)
+        misp_helper.configure_sightings(self.options)
+        self.misp_type_mapping = mapping.get_type_mapping()
+        self.artifact_page_size = int(self.options.get("artifact_page_size", 500))
+        self.max_concurrency = int(self.options.get("max_concurrency", 4))
+        self.sighting_batch_size = int(self.options.get("sighting_batch_size", 500))
+
+    @handler("reload")
+    def _reload(self, event, opts):
+        """Configuration options have changed, save new values"""
+        self.opts = opts
+        self.options = opts.get(PACKAGE, {})
+        self.artifact_page_size = int(self.options.get("artifact_page_size", 500))
+        self.max_concurrency = int(self.options.get("max_concurrency", 4))
+        self.sighting_batch_size = int(self.options.get("sighting_batch_size", 500))
+        misp_helper.invalidate_misp_clients()
+        self.misp_type_mapping.reload()
+        throttle.configure(self.options)
+        misp_helper.configure_search(self.options)
+        misp_helper.configure_sightings(self.options)
+
+    @function("misp_create_sightings_bulk")
+    def _misp_create_sightings_bulk_function(self, event, *args, **kwargs):
+        """Function: Sight all artifacts of an incident that have a MISP attribute"""
+        try:
+
+            API_KEY, URL, VERIFY_CERT = common.validate(self.options)
+
+            # Get the function parameters:
+            incident_id = kwargs.get("incident_id")  # number
+
+            if not isinstance(incident_id, int):
+                raise IntegrationError(f"Unexpected input type for Incident ID. Expected an integer, received {type(incident_id)}")
+
+            log = logging.getLogger(__name__)
+            log.info("incident_id: %s", incident_id)
+
+            # Sight all artifacts of the incident whose type maps to a MISP attribute type
+            sighting_values = common.get_incident_artifact_values(self.rest_client(), incident_id, self.misp_type_mapping,
+                                                                  self.artifact_page_size)
+
+            yield StatusMessage("Setting up connection to MISP")
+
+            proxies = common.get_proxies(self.opts, self.options)
+
+            misp_client = misp_helper.get_misp_client(URL, API_KEY, VERIFY_CERT, proxies=proxies)
+
+            yield StatusMessage(f"Sighting those of the {len(set(sighting_values))} artifact values that exist in MISP")
+
+            sightings = misp_helper.create_misp_sightings(misp_client, sighting_values, batch_size=self.sighting_batch_size,
+                                                          max_concurrency=self.max_concurrency)
+
+            log.debug(sightings)
+
+            yield StatusMessage(f"Sighted {len(sightings['sighted'])} attributes, skipped {len(sightings['skipped'])} values without a MISP attribute, "
+                                f"{len(sightings['failed'])} failed.")
+
+            results = {
+                "success": len(sightings["sighted"]) > 0,
+                "content": sightings
+            }
+
+            # Produce a FunctionResult with the results
+            yield FunctionResult(results)
+        except Exception:
+            yield FunctionError()
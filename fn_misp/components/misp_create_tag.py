@@ -9,7 +9,7 @@ if sys.version_info.major < 3:
 else:
     from fn_misp.lib import misp_3_helper as misp_helper
 from resilient_circuits import ResilientComponent, function, handler, StatusMessage, FunctionResult, FunctionError
-from fn_misp.lib import common
+from fn_misp.lib import common, throttle
 from resilient_lib import IntegrationError
 
 
@@ -23,12 +23,17 @@ class FunctionComponent(ResilientComponent):
         super(FunctionComponent, self).__init__(opts)
         self.opts = opts
         self.options = opts.get(PACKAGE, {})
+        throttle.configure(self.options)
+        misp_helper.configure_outbox(self.opts, self.options)
 
     @handler("reload")
     def _reload(self, event, opts):
         """Configuration options have changed, save new values"""
         self.opts = opts
         self.options = opts.get(PACKAGE, {})
+        misp_helper.invalidate_misp_clients()
+        throttle.configure(self.options)
+        misp_helper.configure_outbox(self.opts, self.options)
 
     @function("misp_create_tag")
     def _misp_create_tag_function(self, event, *args, **kwargs):
@@ -57,6 +62,15 @@ class FunctionComponent(ResilientComponent):
             if sys.version_info.major < 3:
                 raise FunctionError("Tagging is only supported when using Python 3")
 
+            if misp_helper.outbox_enabled():
+                tag_result = misp_helper.enqueue_tag(misp_attribute_value, misp_tag_type, misp_tag_name, misp_event_id)
+                if tag_result["queued"]:
+                    yield StatusMessage(u"Tagging {} with {} has been queued".format(misp_tag_type, misp_tag_name))
+                else:
+                    yield StatusMessage(u"Tagging {} with {} is already queued or was just done".format(misp_tag_type, misp_tag_name))
+                yield FunctionResult({"success": tag_result["queued"], "content": tag_result})
+                return
+
             yield StatusMessage("Setting up connection to MISP")
 
             proxies = common.get_proxies(self.opts, self.options)
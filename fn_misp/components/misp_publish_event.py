@@ -9,7 +9,7 @@ if sys.version_info.major < 3:
 else:
     from fn_misp.lib import misp_3_helper as misp_helper
 from resilient_circuits import ResilientComponent, function, handler, StatusMessage, FunctionResult, FunctionError
-from fn_misp.lib import common
+from fn_misp.lib import common, throttle
 
 
 PACKAGE= "fn_misp"
@@ -22,12 +22,15 @@ class FunctionComponent(ResilientComponent):
         super(FunctionComponent, self).__init__(opts)
         self.opts = opts
         self.options = opts.get(PACKAGE, {})
+        throttle.configure(self.options)
 
     @handler("reload")
     def _reload(self, event, opts):
         """Configuration options have changed, save new values"""
         self.opts = opts
         self.options = opts.get(PACKAGE, {})
+        misp_helper.invalidate_misp_clients()
+        throttle.configure(self.options)
 
     @function("misp_publish_event")
     def _misp_publish_event_function(self, event, *args, **kwargs):
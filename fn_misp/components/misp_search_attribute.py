@@ -9,7 +9,7 @@ if sys.version_info.major < 3:
 else:
     from fn_misp.lib import misp_3_helper as misp_helper
 from resilient_circuits import ResilientComponent, function, handler, StatusMessage, FunctionResult, FunctionError
-from fn_misp.lib import common
+from fn_misp.lib import common, throttle
 
 
 PACKAGE= "fn_misp"
@@ -22,12 +22,17 @@ class FunctionComponent(ResilientComponent):
         super(FunctionComponent, self).__init__(opts)
         self.opts = opts
         self.options = opts.get(PACKAGE, {})
+        throttle.configure(self.options)
+        misp_helper.configure_search(self.options)
 
     @handler("reload")
     def _reload(self, event, opts):
         """Configuration options have changed, save new values"""
         self.opts = opts
         self.options = opts.get(PACKAGE, {})
+        misp_helper.invalidate_misp_clients()
+        throttle.configure(self.options)
+        misp_helper.configure_search(self.options)
 
     @function("misp_search_attribute")
     def _misp_search_attribute_function(self, event, *args, **kwargs):
@@ -59,11 +64,16 @@ class FunctionComponent(ResilientComponent):
             if search_results['search_status']:
                 results['success'] = True
                 results['content'] = search_results['search_results']
-                misp_tags = misp_helper.get_misp_attribute_tags(misp_client, search_results['search_results'])
+                misp_tags = search_results.get('search_tags')
+                if misp_tags is None:
+                    misp_tags = misp_helper.get_misp_attribute_tags(misp_client, search_results['search_results'])
                 results['tags'] = misp_tags
             else:
                 results['success'] = False
 
+            results['cache'] = misp_helper.search_cache_stats()
+            log.info("search cache: %s", results['cache'])
+
             yield StatusMessage("Attribute search complete.")
 
             # Produce a FunctionResult with the results
@@ -0,0 +1,100 @@
+# -*- coding: utf-8 -*-
+# pragma pylint: disable=unused-argument, no-self-use
+"""Function implementation"""
+
+import logging
+import re
+import sys
+if sys.version_info.major < 3:
+    from fn_misp.lib import misp_2_helper as misp_helper
+else:
+    from fn_misp.lib import misp_3_helper as misp_helper
+from resilient_circuits import ResilientComponent, function, handler, StatusMessage, FunctionResult, FunctionError
+from fn_misp.lib import common, mapping, throttle
+from resilient_lib import IntegrationError
+
+
+PACKAGE= "fn_misp"
+
+class FunctionComponent(ResilientComponent):
+    """Component that implements Resilient function(s)"""
+
+    def __init__(self, opts):
+        """constructor provides access to the configuration options"""
+        super(FunctionComponent, self).__init__(opts)
+        self.opts = opts
+        self.options = opts.get(PACKAGE, {})
+        throttle.configure(self.options)
+        misp_helper.configure_search(self.options)
+        self.misp_type_mapping = mapping.get_type_mapping()
+        self.artifact_page_size = int(self.options.get("artifact_page_size", 500))
+        self.max_concurrency = int(self.options.get("max_concurrency", 4))
+
+    @handler("reload")
+    def _reload(self, event, opts):
+        """Configuration options have changed, save new values"""
+        self.opts = opts
+        self.options = opts.get(PACKAGE, {})
+        self.artifact_page_size = int(self.options.get("artifact_page_size", 500))
+        self.max_concurrency = int(self.options.get("max_concurrency", 4))
+        misp_helper.invalidate_misp_clients()
+        self.misp_type_mapping.reload()
+        throttle.configure(self.options)
+        misp_helper.configure_search(self.options)
+
+    @function("misp_search_attributes_bulk")
+    def _misp_search_attributes_bulk_function(self, event, *args, **kwargs):
+        """Function: Search many values in MISP at once and return a hit/tag map per value"""
+        try:
+
+            API_KEY, URL, VERIFY_CERT = common.validate(self.options)
+
+            # Get the function parameters:
+            misp_attribute_values = kwargs.get("misp_attribute_values")  # text, comma or newline separated
+            incident_id = kwargs.get("incident_id")  # number
+
+            if not misp_attribute_values and not isinstance(incident_id, int):
+                raise IntegrationError("Either misp_attribute_values or an integer incident_id is required")
+
+            log = logging.getLogger(__name__)
+            log.info("misp_attribute_values: %s", misp_attribute_values)
+            log.info("incident_id: %s", incident_id)
+
+            if misp_attribute_values:
+                search_attributes = [value.strip() for value in re.split(r"[,\n]", misp_attribute_values) if value.strip()]
+            else:
+                # Search all artifacts of the incident whose type maps to a MISP attribute type
+                search_attributes = common.get_incident_artifact_values(self.rest_client(), incident_id, self.misp_type_mapping,
+                                                                        self.artifact_page_size)
+            search_attributes = list(dict.fromkeys(search_attributes))
+
+            yield StatusMessage("Setting up connection to MISP")
+
+            proxies = common.get_proxies(self.opts, self.options)
+
+            misp_client = misp_helper.get_misp_client(URL, API_KEY, VERIFY_CERT, proxies=proxies)
+
+            yield StatusMessage(f"Searching for {len(search_attributes)} attributes")
+
+            search_results = misp_helper.search_misp_attributes(misp_client, search_attributes, max_concurrency=self.max_concurrency)
+
+            content = {
+                value: {
+                    "hit": search_result["search_status"],
+                    "tags": search_result["search_tags"]
+                }
+                for value, search_result in search_results.items()
+            }
+            hit_cnt = sum(1 for value in content.values() if value["hit"])
+
+            yield StatusMessage(f"Attribute search complete, {hit_cnt}/{len(content)} values found.")
+
+            results = {
+                "success": hit_cnt > 0,
+                "content": content
+            }
+
+            # Produce a FunctionResult with the results
+            yield FunctionResult(results)
+        except Exception:
+            yield FunctionError()
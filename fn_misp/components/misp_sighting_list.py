@@ -9,7 +9,8 @@ if sys.version_info.major < 3:
 else:
     from fn_misp.lib import misp_3_helper as misp_helper
 from resilient_circuits import ResilientComponent, function, handler, StatusMessage, FunctionResult, FunctionError
-from fn_misp.lib import common
+from fn_misp.lib import common, throttle
+from fn_misp.lib.sightings import SightingSummary
 
 
 PACKAGE= "fn_misp"
@@ -22,12 +23,15 @@ class FunctionComponent(ResilientComponent):
         super(FunctionComponent, self).__init__(opts)
         self.opts = opts
         self.options = opts.get(PACKAGE, {})
+        throttle.configure(self.options)
 
     @handler("reload")
     def _reload(self, event, opts):
         """Configuration options have changed, save new values"""
         self.opts = opts
         self.options = opts.get(PACKAGE, {})
+        misp_helper.invalidate_misp_clients()
+        throttle.configure(self.options)
 
     @function("misp_sighting_list")
     def _misp_sighting_list_function(self, event, *args, **kwargs):
@@ -38,9 +42,15 @@ class FunctionComponent(ResilientComponent):
 
             # Get the function parameters:
             event_id = int(kwargs.get("misp_event_id"))  # text
+            misp_sighting_summary = kwargs.get("misp_sighting_summary", False)  # bool
+            misp_sighting_page = kwargs.get("misp_sighting_page")  # number
+            misp_sighting_page_size = kwargs.get("misp_sighting_page_size") or 1000  # number
+            misp_sighting_bucket = kwargs.get("misp_sighting_bucket")  # number, seconds
 
             log = logging.getLogger(__name__)
             log.info("event_id: %s", event_id)
+            log.info("misp_sighting_summary: %s", misp_sighting_summary)
+            log.info("misp_sighting_page: %s", misp_sighting_page)
 
             yield StatusMessage("Setting up connection to MISP")
 
@@ -50,7 +60,17 @@ class FunctionComponent(ResilientComponent):
 
             yield StatusMessage("Getting sighted list")
 
-            sighting_list_result = misp_helper.get_misp_sighting_list(misp_client, event_id)
+            if misp_sighting_summary:
+                # Aggregate page by page, only the per-attribute summaries are returned
+                summary = SightingSummary(bucket=misp_sighting_bucket)
+                for sightings in misp_helper.get_misp_sighting_pages(misp_client, event_id, page_size=misp_sighting_page_size):
+                    summary.add(sightings)
+                sighting_list_result = summary.result()
+            elif misp_sighting_page:
+                sighting_list_result = next(misp_helper.get_misp_sighting_pages(misp_client, event_id, page_size=misp_sighting_page_size,
+                                                                                page=misp_sighting_page))
+            else:
+                sighting_list_result = misp_helper.get_misp_sighting_list(misp_client, event_id)
 
             yield StatusMessage("Finished getting sighting list")
 
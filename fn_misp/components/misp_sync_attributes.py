@@ -3,12 +3,12 @@
 """Function implementation"""
 
 from resilient_circuits import ResilientComponent, function, handler, StatusMessage, FunctionResult, FunctionError
-from fn_misp.lib import common
+from fn_misp.lib import common, mapping, throttle
+from fn_misp.lib.checkpoints import SyncCheckpoints
+from fn_misp.lib.progress import ProgressReporter
 from resilient_lib import IntegrationError
 import logging
 import sys
-import os
-import json
 if sys.version_info.major < 3:
     from fn_misp.lib import misp_2_helper as misp_helper
 else:
@@ -24,15 +24,31 @@ class FunctionComponent(ResilientComponent):
         super(FunctionComponent, self).__init__(opts)
         self.opts = opts
         self.options = opts.get(PACKAGE, {})
-        self.misp_mapping_config = f"{os.path.dirname(os.getenv('APP_CONFIG_FILE'))}/misp_mapping.cfg"
-        with open(self.misp_mapping_config) as f:
-            self.misp_type_mapping = json.load(f)
+        throttle.configure(self.options)
+        misp_helper.configure_warninglists(self.options)
+        self.misp_type_mapping = mapping.get_type_mapping()
+        self.attribute_batch_size = int(self.options.get("attribute_batch_size", 100))
+        self.artifact_page_size = int(self.options.get("artifact_page_size", 500))
+        self.max_concurrency = int(self.options.get("max_concurrency", 4))
+        self.status_every = int(self.options.get("status_every", 100))
+        self.status_interval = float(self.options.get("status_interval", 10))
+        self.sync_checkpoints = SyncCheckpoints(self.options["sync_checkpoint_db"]) if self.options.get("sync_checkpoint_db") else None
 
     @handler("reload")
     def _reload(self, event, opts):
         """Configuration options have changed, save new values"""
         self.opts = opts
         self.options = opts.get(PACKAGE, {})
+        self.attribute_batch_size = int(self.options.get("attribute_batch_size", 100))
+        self.artifact_page_size = int(self.options.get("artifact_page_size", 500))
+        self.max_concurrency = int(self.options.get("max_concurrency", 4))
+        self.status_every = int(self.options.get("status_every", 100))
+        self.status_interval = float(self.options.get("status_interval", 10))
+        self.sync_checkpoints = SyncCheckpoints(self.options["sync_checkpoint_db"]) if self.options.get("sync_checkpoint_db") else None
+        misp_helper.invalidate_misp_clients()
+        self.misp_type_mapping.reload()
+        throttle.configure(self.options)
+        misp_helper.configure_warninglists(self.options)
 
     @function("misp_sync_attributes")
     def _misp_sync_attributes_function(self, event, *args, **kwargs):
@@ -45,6 +61,7 @@ class FunctionComponent(ResilientComponent):
             misp_event_uuid = kwargs.get("misp_event_uuid")  # number
             incident_id = kwargs.get("incident_id")  # number
             misp_override_warninglist = kwargs.get("misp_override_warninglist", False)  # bool
+            misp_verbose_status = kwargs.get("misp_verbose_status", False)  # bool
 
             # ensure misp_event_uuid is an integer so we can get an event by it's index
             if not isinstance(misp_event_uuid, str):
@@ -58,62 +75,127 @@ class FunctionComponent(ResilientComponent):
             log.info("misp_event_uuid: %s", misp_event_uuid)
             log.info("incident_id: %s", incident_id)
 
-            # Instantiate a rest client
-            res_client = self.rest_client()
-
-            # Get artifacts for this incident
-            log.info("Start: Gathering artifacts from API")
-            artifacts = res_client.post("/incidents/{}/artifacts/query_paged?handle_format=names".format(incident_id), payload={})
-            log.info("Stopped: Gathering artifacts from API")
-            yield StatusMessage(f"Caught {len(artifacts)} from Incident {incident_id}")
-
             yield StatusMessage("Setting up connection to MISP")
 
             proxies = common.get_proxies(self.opts, self.options)
 
             misp_client = misp_helper.get_misp_client(URL, API_KEY, VERIFY_CERT, proxies=proxies)
-            misp_event_uuid = kwargs.get("misp_event_uuid")  # string (uuid4)
+
+            # Artifacts synced by earlier runs, only new or changed ones are processed again
+            checkpoint = self.sync_checkpoints.get(incident_id, misp_event_uuid) if self.sync_checkpoints else {}
+
+            # Instantiate a rest client
+            res_client = self.rest_client()
 
             loop_cnt = 0
-            artifact_cnt = len(artifacts.get('data'))
-            for artifact in artifacts.get('data'):
-                # Do something with the artifact
-                log.info(artifact)
-                misp_override_warninglist = False
-                # Skip if blacklisted artifact type
-                if self.misp_type_mapping.get(artifact.get('type')) is None:
-                    log.info("Data Type blacklisted in mapping!")
-                else:
-                    # Check misp_attribute_value against MISP Warninglists
-                    # if misp_override_warninglist is NOT set
+            removed_cnt = 0
+            artifact_cnt = 0
+            failed_attributes = []
+            orphaned_values = set()
+            event_attributes = None
+            progress = ProgressReporter("attributes", self.status_every, self.status_interval, misp_verbose_status)
+            # Artifacts arrive page by page, the next page loads while MISP works on the current one
+            for artifacts in common.get_incident_artifact_pages(res_client, incident_id, self.artifact_page_size):
+                artifact_cnt += len(artifacts)
+                yield StatusMessage(f"Caught {len(artifacts)} artifacts from Incident {incident_id}")
+
+                artifacts = [artifact for artifact in artifacts if checkpoint.get(artifact['id']) != artifact['last_modified']]
+                if not artifacts:
+                    continue
+
+                if event_attributes is None:
+                    # Fetch what the event already holds once, so only the difference is written
+                    event_attributes = misp_helper.get_event_attributes(misp_client, misp_event_uuid)
+                    # Compared on normalized values, MISP stores e.g. domains lowercased and IPv6 addresses compressed
+                    existing_attributes = {(attribute['type'], misp_helper.normalize_attribute_value(attribute['value']))
+                                           for attribute in event_attributes}
+                    existing_values = {value for _, value in existing_attributes}
+
+                candidates = []
+                page_orphaned_values = []
+                page_failed_values = set()
+                for artifact in artifacts:
+                    log.debug(artifact)
+                    misp_override_warninglist = False
+                    # Skip if blacklisted artifact type
+                    if self.misp_type_mapping.is_blacklisted(artifact.get('type')):
+                        log.info("Data Type blacklisted in mapping!")
+                        continue
+                    if self.misp_type_mapping.get(artifact.get('type')) is None:
+                        log.info("Data Type %s missing from mapping!", artifact.get('type'))
+                        continue
+
                     misp_attribute_value = artifact.get('value')
                     misp_attribute_type = self.misp_type_mapping.get(artifact.get('type'))
-
-                    artifact_tags = artifact['global_info'].get('tags')
-                    for tag in artifact_tags:
-                        if tag.get('tag_handle') == "override-warninglist":
-                            misp_override_warninglist = True
-                        if tag.get('tag_handle') == "dont_share":
-                            misp_helper.clean_orphaned_attribute(misp_client, misp_event_uuid, misp_attribute_value)
-                            continue
-
-                    if misp_helper.check_misp_warninglist(misp_client, misp_attribute_value, misp_override_warninglist):
+                    normalized_value = misp_helper.normalize_attribute_value(misp_attribute_value)
+
+                    if "dont_share" in artifact['tags']:
+                        if normalized_value in existing_values and normalized_value not in orphaned_values:
+                            orphaned_values.add(normalized_value)
+                            page_orphaned_values.append(misp_attribute_value)
+                        continue
+                    if "override-warninglist" in artifact['tags']:
+                        misp_override_warninglist = True
+
+                    if (misp_attribute_type, normalized_value) in existing_attributes:
+                        log.debug("'%s' already exists on the MISP event", misp_attribute_value)
+                        continue
+                    candidates.append((misp_attribute_type, misp_attribute_value, misp_override_warninglist))
+                    existing_attributes.add((misp_attribute_type, normalized_value))
+
+                # Remove attributes of artifacts that must not be shared (anymore)
+                if page_orphaned_values:
+                    delete_results = misp_helper.clean_orphaned_attributes(misp_client, misp_event_uuid, page_orphaned_values, event_attributes, self.max_concurrency)
+                    for delete_result in delete_results:
+                        log.debug(delete_result)
+                        if delete_result["success"]:
+                            removed_cnt += 1
+                            yield from progress.item("removed", f"Attribute '{delete_result['value']}' has been removed")
+                        else:
+                            page_failed_values.add(misp_helper.normalize_attribute_value(delete_result['value']))
+                            yield from progress.item("not removed", f"Attribute '{delete_result['value']}' could not be removed: {delete_result['content']['errors']}")
+
+                # Check all candidate values against MISP Warninglists in one go,
+                # leaving out those tagged override-warninglist
+                warninglist_hits = misp_helper.check_misp_warninglists(misp_client, [value for _, value, override in candidates if not override], max_concurrency=self.max_concurrency)
+                misp_attributes = []
+                for misp_attribute_type, misp_attribute_value, misp_override_warninglist in candidates:
+                    if not misp_override_warninglist and warninglist_hits.get(misp_attribute_value, False):
                         message = f"'{misp_attribute_value}' is member of at least one MISP Warninglist. Skipping..."
-                        yield StatusMessage(message)
+                        yield from progress.item("warninglisted", message)
 
                     else:
-                        yield StatusMessage(f"Creating new misp attribute {misp_attribute_type} {misp_attribute_value}")
-
-                        attribute = misp_helper.create_misp_attribute(misp_client, misp_event_uuid, misp_attribute_type, misp_attribute_value)
-
-                        log.debug(attribute)
-                        loop_cnt += 1
-                        yield StatusMessage(f"Attribute '{misp_attribute_value}' has been created")
-
-            yield StatusMessage(f"Created {loop_cnt}/{artifact_cnt} attributes.")
+                        misp_attributes.append((misp_attribute_type, misp_attribute_value))
+
+                # Submit all surviving attributes in as few requests as possible
+                if misp_attributes:
+                    yield StatusMessage(f"Creating {len(misp_attributes)} new misp attributes")
+                    attribute_results = misp_helper.create_misp_attributes(misp_client, misp_event_uuid, misp_attributes, self.attribute_batch_size, self.max_concurrency)
+                    for attribute_result in attribute_results:
+                        log.debug(attribute_result)
+                        if attribute_result["success"]:
+                            loop_cnt += 1
+                            yield from progress.item("created", f"Attribute '{attribute_result['value']}' has been created")
+                        elif misp_helper.is_duplicate_error(attribute_result['error']):
+                            # MISP matched it to an attribute of the event the comparison above did not catch
+                            yield from progress.item("already present", f"Attribute '{attribute_result['value']}' already exists on the MISP event")
+                        else:
+                            failed_attributes.append(attribute_result)
+                            page_failed_values.add(misp_helper.normalize_attribute_value(attribute_result['value']))
+                            yield from progress.item("failed", f"Attribute '{attribute_result['value']}' could not be created: {attribute_result['error']}")
+
+                # Failed artifacts are not recorded, so the next run retries them
+                if self.sync_checkpoints:
+                    self.sync_checkpoints.record(incident_id, misp_event_uuid,
+                                                 [(artifact['id'], artifact['last_modified']) for artifact in artifacts
+                                                  if misp_helper.normalize_attribute_value(artifact['value']) not in page_failed_values])
+
+            yield from progress.finish()
+            yield StatusMessage(f"Created {loop_cnt}/{artifact_cnt} attributes, removed {removed_cnt}.")
 
             results = { "success": True,
-                        "content": f"Created {loop_cnt}/{artifact_cnt} attributes."
+                        "content": f"Created {loop_cnt}/{artifact_cnt} attributes, removed {removed_cnt}.",
+                        "failed": failed_attributes
                       }
 
             # Produce a FunctionResult with the results
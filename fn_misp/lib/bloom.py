@@ -0,0 +1,83 @@
+import math
+import time
+import hashlib
+import threading
+
+
+class CountingBloomFilter(object):
+    """Bloom filter with 8-bit counters, so values can be removed again"""
+
+    def __init__(self, capacity, error_rate=0.001):
+        self.size = max(8, int(-capacity * math.log(error_rate) / math.log(2) ** 2))
+        self.hashes = max(1, int(round(self.size / capacity * math.log(2))))
+        self._counters = bytearray(self.size)
+
+    def _indexes(self, value):
+        # Double hashing: k indexes from two 64-bit halves of one digest
+        digest = hashlib.blake2b(value.encode('utf8'), digest_size=16).digest()
+        first, second = int.from_bytes(digest[:8], 'little'), int.from_bytes(digest[8:], 'little') | 1
+        return [(first + i * second) % self.size for i in range(self.hashes)]
+
+    def add(self, value):
+        for index in self._indexes(value):
+            if self._counters[index] < 255:
+                self._counters[index] += 1
+
+    def remove(self, value):
+        # Removing a false positive only causes false negatives, never false positives
+        indexes = self._indexes(value)
+        if all(self._counters[index] for index in indexes):
+            for index in indexes:
+                if self._counters[index] < 255:
+                    self._counters[index] -= 1
+
+    def __contains__(self, value):
+        return all(self._counters[index] for index in self._indexes(value))
+
+
+class RotatingBloomFilter(object):
+    """
+    Time-bounded set membership: values are kept in a current and a previous
+    generation, and the oldest generation is dropped every rotation_interval seconds,
+    so a value is remembered between one and two intervals
+    """
+
+    def __init__(self, capacity=100000, error_rate=0.001, rotation_interval=600):
+        self.capacity = capacity
+        self.error_rate = error_rate
+        self.rotation_interval = rotation_interval
+        self._lock = threading.Lock()
+        self.clear()
+
+    def clear(self):
+        with self._lock:
+            self._current = CountingBloomFilter(self.capacity, self.error_rate)
+            self._previous = CountingBloomFilter(self.capacity, self.error_rate)
+            self._rotated = time.monotonic()
+
+    def _rotate(self):
+        now = time.monotonic()
+        if now - self._rotated >= self.rotation_interval:
+            if now - self._rotated >= 2 * self.rotation_interval:
+                self._previous = CountingBloomFilter(self.capacity, self.error_rate)
+            else:
+                self._previous = self._current
+            self._current = CountingBloomFilter(self.capacity, self.error_rate)
+            self._rotated = now
+
+    def add(self, value):
+        with self._lock:
+            self._rotate()
+            # Once per generation, so one remove undoes any number of concurrent adds
+            if value not in self._current:
+                self._current.add(value)
+
+    def remove(self, value):
+        with self._lock:
+            self._current.remove(value)
+            self._previous.remove(value)
+
+    def __contains__(self, value):
+        with self._lock:
+            self._rotate()
+            return value in self._current or value in self._previous
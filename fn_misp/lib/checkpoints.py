@@ -0,0 +1,68 @@
+import logging
+import sqlite3
+import threading
+from contextlib import closing
+
+log = logging.getLogger(__name__)
+
+
+class SyncCheckpoints(object):
+    """
+    Persistent record, per (incident_id, misp_event_uuid) pair, of the artifacts
+    misp_sync_attributes has synced and their last-modified time, kept in SQLite.
+    The database is created on first use; if it cannot be used, checkpoints are
+    disabled and every sync processes all artifacts.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self._lock = threading.Lock()
+        self._initialized = False
+        self._disabled = False
+
+    def _connect(self):
+        conn = sqlite3.connect(self.path, timeout=30)
+        if not self._initialized:
+            with conn:
+                conn.execute("CREATE TABLE IF NOT EXISTS synced_artifacts ("
+                             "incident_id INTEGER NOT NULL, "
+                             "misp_event_uuid TEXT NOT NULL, "
+                             "artifact_id INTEGER NOT NULL, "
+                             "last_modified INTEGER, "
+                             "PRIMARY KEY (incident_id, misp_event_uuid, artifact_id))")
+            self._initialized = True
+        return conn
+
+    def _disable(self, err):
+        self._disabled = True
+        log.error("Disabling the sync checkpoints in %s, all artifacts will be synced: %s", self.path, err)
+
+    def get(self, incident_id, misp_event_uuid):
+        """Return a dict of artifact id -> last-modified time synced to the event"""
+        if self._disabled:
+            return {}
+        try:
+            with self._lock, closing(self._connect()) as conn:
+                rows = conn.execute("SELECT artifact_id, last_modified FROM synced_artifacts "
+                                    "WHERE incident_id = ? AND misp_event_uuid = ?",
+                                    (incident_id, misp_event_uuid))
+                return dict(rows.fetchall())
+        except sqlite3.Error as err:
+            self._disable(err)
+            return {}
+
+    def record(self, incident_id, misp_event_uuid, artifacts):
+        """
+        Mark artifacts as synced to the event
+        :param artifacts: iterable of (artifact_id, last_modified) tuples
+        """
+        if self._disabled:
+            return
+        try:
+            with self._lock, closing(self._connect()) as conn, conn:
+                conn.executemany("INSERT OR REPLACE INTO synced_artifacts "
+                                 "(incident_id, misp_event_uuid, artifact_id, last_modified) VALUES (?, ?, ?, ?)",
+                                 [(incident_id, misp_event_uuid, artifact_id, last_modified)
+                                  for artifact_id, last_modified in artifacts])
+        except sqlite3.Error as err:
+            self._disable(err)
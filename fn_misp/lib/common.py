@@ -1,5 +1,9 @@
+import logging
+from multiprocessing.pool import ThreadPool
 from resilient_lib import validate_fields, RequestsCommon, str_to_bool
 
+log = logging.getLogger(__name__)
+
 def validate(options):
     """
     validate API_KEY, URL, and VERIFY_CERT
@@ -20,3 +24,68 @@ def get_proxies(opts, options):
     rc = RequestsCommon(opts, options)
     proxies = rc.get_proxies()
     return proxies
+
+
+def get_incident_artifact_pages(res_client, incident_id, page_size=500):
+    """
+    Generator over the artifacts of an incident, one list per query_paged page.
+    The next page is requested in the background while the caller works on the current one.
+    Artifacts are reduced to their id, type, value, tag handles and last-modified time.
+    :param res_client: Resilient rest client
+    :param incident_id: incident to read the artifacts from
+    :param page_size: number of artifacts requested per page
+    """
+    def get_page(start):
+        payload = {
+            "start": start,
+            "length": page_size,
+            "sorts": [{"field_name": "id", "type": "asc"}]
+        }
+        return res_client.post("/incidents/{}/artifacts/query_paged?handle_format=names".format(incident_id), payload=payload)
+
+    # multiprocessing.pool.ThreadPool, as concurrent.futures is not in the Python 2 standard library
+    pool = ThreadPool(1)
+    try:
+        start = 0
+        pending = pool.apply_async(get_page, (start,))
+        while pending is not None:
+            page = pending.get()
+            data = page.get('data', [])
+            start += len(data)
+            pending = pool.apply_async(get_page, (start,)) if data and start < page.get('recordsTotal', 0) else None
+            yield [{
+                "id": artifact.get('id'),
+                "type": artifact.get('type'),
+                "value": artifact.get('value'),
+                "tags": [tag.get('tag_handle') for tag in artifact.get('global_info', {}).get('tags', [])],
+                "last_modified": artifact.get('last_modified_time', artifact.get('created'))
+            } for artifact in data]
+    finally:
+        pool.close()
+        pool.join()
+
+
+def get_incident_artifact_values(res_client, incident_id, type_mapping, page_size=500):
+    """Values of the artifacts of an incident whose type maps to a MISP attribute type"""
+    values = []
+    unmapped_types = set()
+    for artifacts in get_incident_artifact_pages(res_client, incident_id, page_size):
+        for artifact in artifacts:
+            if type_mapping.is_blacklisted(artifact['type']):
+                continue
+            if type_mapping.get(artifact['type']) is None:
+                unmapped_types.add(artifact['type'])
+                continue
+            values.append(artifact['value'])
+    if unmapped_types:
+        log.info("Skipping artifacts of types missing from the MISP type mapping: %s", ", ".join(sorted(unmapped_types)))
+    return values
+
+
+def value_keys(value):
+    """
+    Keys a MISP attribute value is found under: MISP compares values case-insensitively,
+    and composite values such as ip-dst|port also match on either part
+    """
+    value = str(value).strip().lower()
+    return set([value] + value.split('|'))
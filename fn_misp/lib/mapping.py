@@ -0,0 +1,83 @@
+import os
+import json
+import time
+import logging
+import threading
+
+log = logging.getLogger(__name__)
+
+_mappings = {}
+_mappings_lock = threading.Lock()
+
+
+def default_mapping_path():
+    return f"{os.path.dirname(os.getenv('APP_CONFIG_FILE'))}/misp_mapping.cfg"
+
+
+def get_type_mapping(path=None):
+    """Return the shared TypeMapping for path, misp_mapping.cfg next to app.config by default"""
+    path = path or default_mapping_path()
+    with _mappings_lock:
+        type_mapping = _mappings.get(path)
+        if type_mapping is None:
+            type_mapping = TypeMapping(path)
+            _mappings[path] = type_mapping
+    return type_mapping
+
+
+class TypeMapping(object):
+    """
+    Resilient artifact type -> MISP attribute type mapping from misp_mapping.cfg.
+    The file is loaded once and reloaded atomically when its mtime changes, which is
+    checked at most every check_interval seconds so lookups do no file I/O.
+    Types mapped to null are blacklisted.
+    """
+
+    def __init__(self, path, check_interval=5):
+        self.path = path
+        self.check_interval = check_interval
+        self._lock = threading.Lock()
+        self._next_check = 0
+        self._mtime = None
+        # (mapping, blacklisted types), replaced as a whole on reload
+        self._snapshot = ({}, frozenset())
+        self.reload()
+
+    def reload(self):
+        """Load the mapping file, keeping the current mapping if it cannot be read or parsed"""
+        with self._lock:
+            try:
+                mtime = os.stat(self.path).st_mtime
+                with open(self.path, encoding='utf8') as f:
+                    type_mapping = json.load(f)
+            except (OSError, ValueError) as err:
+                if self._mtime is None:
+                    raise
+                log.error("Failed to reload %s, keeping the current mapping: %s", self.path, err)
+                # A file that does not parse is not read again until it changes
+                self._mtime = mtime if isinstance(err, ValueError) else self._mtime
+                self._next_check = time.monotonic() + self.check_interval
+                return
+            blacklisted = frozenset(t for t, misp_type in type_mapping.items() if misp_type is None)
+            self._snapshot = (type_mapping, blacklisted)
+            self._mtime = mtime
+            self._next_check = time.monotonic() + self.check_interval
+            log.info("Loaded MISP type mapping from %s", self.path)
+
+    def _current(self):
+        if time.monotonic() >= self._next_check:
+            self._next_check = time.monotonic() + self.check_interval
+            try:
+                if os.stat(self.path).st_mtime != self._mtime:
+                    self.reload()
+            except OSError as err:
+                log.error("Failed to check %s for changes: %s", self.path, err)
+        return self._snapshot
+
+    def get(self, resilient_type, default=None):
+        """MISP attribute type for a Resilient artifact type, default if blacklisted or unmapped"""
+        misp_type = self._current()[0].get(resilient_type)
+        return default if misp_type is None else misp_type
+
+    def is_blacklisted(self, resilient_type):
+        return resilient_type in self._current()[1]
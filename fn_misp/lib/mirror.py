@@ -0,0 +1,183 @@
+"""
+Local mirror of the MISP attributes in SQLite, so lookups need no round trip to MISP.
+
+The mirror is updated incrementally: each sync asks the attributes controller for
+the attributes of the events changed since the previous sync (restSearch
+event_timestamp filter) and replaces the stored attributes of those events.
+A full sync every full_sync_interval seconds also drops the attributes of deleted events.
+Values fn_misp itself changed in MISP are not answered from the mirror until the next sync.
+"""
+
+import json
+import time
+import sqlite3
+import logging
+import threading
+from contextlib import closing
+from fn_misp.lib import common
+
+log = logging.getLogger(__name__)
+
+# Attributes of events changed shortly before a sync may be missed, so syncs overlap by this many seconds
+SYNC_OVERLAP = 300
+
+_settings = {"path": None, "sync_interval": 300, "max_age": 900, "full_sync_interval": 86400}
+_mirrors = {}
+_mirrors_lock = threading.Lock()
+
+
+def configure(path, sync_interval=300, max_age=900, full_sync_interval=86400):
+    """Set the mirror database, a path of None disables the mirror"""
+    _settings["path"] = path or None
+    _settings["sync_interval"] = sync_interval
+    _settings["max_age"] = max_age
+    _settings["full_sync_interval"] = full_sync_interval
+
+
+def get_mirror():
+    """Return the shared mirror for the configured database, or None if the mirror is disabled"""
+    if _settings["path"] is None:
+        return None
+    with _mirrors_lock:
+        attribute_mirror = _mirrors.get(_settings["path"])
+        if attribute_mirror is None:
+            attribute_mirror = AttributeMirror(_settings["path"])
+            _mirrors[_settings["path"]] = attribute_mirror
+    return attribute_mirror
+
+
+def get_sync_interval():
+    return _settings["sync_interval"]
+
+
+class AttributeMirror(object):
+    """Attributes with their event and tags, indexed by value"""
+
+    def __init__(self, path):
+        self.path = path
+        self._local = threading.local()
+        self._write_lock = threading.Lock()
+        self._dirty_lock = threading.Lock()
+        # normalized value -> time it was changed by fn_misp, None key for all values
+        self._dirty = {}
+        with closing(sqlite3.connect(self.path, timeout=30)) as conn, conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("CREATE TABLE IF NOT EXISTS attributes ("
+                         "uuid TEXT PRIMARY KEY, "
+                         "event_id TEXT NOT NULL, "
+                         "attribute TEXT NOT NULL, "
+                         "sync_id INTEGER NOT NULL)")
+            conn.execute("CREATE INDEX IF NOT EXISTS attributes_event_id ON attributes (event_id)")
+            conn.execute("CREATE TABLE IF NOT EXISTS attribute_values ("
+                         "value_key TEXT NOT NULL, "
+                         "uuid TEXT NOT NULL, "
+                         "PRIMARY KEY (value_key, uuid))")
+            conn.execute("CREATE INDEX IF NOT EXISTS attribute_values_uuid ON attribute_values (uuid)")
+            conn.execute("CREATE TABLE IF NOT EXISTS mirror_state (name TEXT PRIMARY KEY, value INTEGER)")
+
+    def _connect(self):
+        # One connection per thread, so lookups do not pay for opening the database
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=30)
+            self._local.conn = conn
+        return conn
+
+    def _get_state(self, name, default=0):
+        row = self._connect().execute("SELECT value FROM mirror_state WHERE name = ?", (name,)).fetchone()
+        return default if row is None else row[0]
+
+    def is_fresh(self, value=None):
+        """True if the mirror synced within max_age seconds and value was not changed by fn_misp since"""
+        if time.time() - self._get_state("synced_at") > _settings["max_age"]:
+            return False
+        with self._dirty_lock:
+            return None not in self._dirty and (value is None or not common.value_keys(value) & self._dirty.keys())
+
+    def has_data(self):
+        return self._get_state("synced_at") > 0
+
+    def invalidate(self, *values):
+        """Do not answer values, or any value if none is given, from the mirror until the next sync"""
+        now = time.time()
+        with self._dirty_lock:
+            for value in values or (None,):
+                for value_key in ([None] if value is None else common.value_keys(value)):
+                    self._dirty[value_key] = now
+
+    def lookup(self, value):
+        """Return the mirrored attributes matching value, shaped like attributes controller search results"""
+        rows = self._connect().execute("SELECT a.attribute FROM attribute_values v JOIN attributes a ON a.uuid = v.uuid "
+                                       "WHERE v.value_key = ?", (str(value).strip().lower(),))
+        return [json.loads(attribute) for attribute, in rows.fetchall()]
+
+    def sync(self, search_page, page_size=1000):
+        """
+        Bring the mirror up to date
+        :param search_page: function(event_timestamp, limit, page) returning a page of attributes, with
+                            their event metadata and tags, of the events changed since event_timestamp
+        :return: number of attributes stored
+        """
+        with self._write_lock:
+            started = time.time()
+            full_sync = started - self._get_state("full_synced_at") > _settings["full_sync_interval"]
+            since = 0 if full_sync else max(0, self._get_state("event_timestamp") - SYNC_OVERLAP)
+            sync_id = self._get_state("sync_id") + 1
+            conn = self._connect()
+            replaced_events = set()
+            stored = 0
+            page = 1
+            while True:
+                attributes = search_page(since, page_size, page)
+                with conn:
+                    for attribute in attributes:
+                        event_id = str(attribute.get('event_id') or attribute.get('Event', {}).get('id'))
+                        if event_id not in replaced_events:
+                            # The attributes of a changed event are replaced as a whole, dropping deleted ones
+                            conn.execute("DELETE FROM attribute_values WHERE uuid IN (SELECT uuid FROM attributes WHERE event_id = ?)", (event_id,))
+                            conn.execute("DELETE FROM attributes WHERE event_id = ?", (event_id,))
+                            replaced_events.add(event_id)
+                        self._store(conn, event_id, attribute, sync_id)
+                stored += len(attributes)
+                if len(attributes) < page_size:
+                    break
+                page += 1
+            with conn:
+                if full_sync:
+                    # Events that were not returned by a full sync no longer exist
+                    conn.execute("DELETE FROM attribute_values WHERE uuid IN (SELECT uuid FROM attributes WHERE sync_id < ?)", (sync_id,))
+                    conn.execute("DELETE FROM attributes WHERE sync_id < ?", (sync_id,))
+                    self._set_state(conn, "full_synced_at", int(started))
+                self._set_state(conn, "sync_id", sync_id)
+                self._set_state(conn, "event_timestamp", int(started))
+                self._set_state(conn, "synced_at", int(started))
+            with self._dirty_lock:
+                self._dirty = {value_key: changed for value_key, changed in self._dirty.items() if changed >= started}
+            log.info("Synced %d attributes of %d MISP events to the attribute mirror%s",
+                     stored, len(replaced_events), " (full sync)" if full_sync else "")
+            return stored
+
+    @staticmethod
+    def _store(conn, event_id, attribute, sync_id):
+        event = attribute.get('Event', {})
+        mirrored = {
+            "id": attribute.get('id'),
+            "uuid": attribute['uuid'],
+            "event_id": event_id,
+            "type": attribute.get('type'),
+            "category": attribute.get('category'),
+            "value": attribute['value'],
+            "to_ids": attribute.get('to_ids'),
+            "timestamp": attribute.get('timestamp'),
+            "Event": {key: event[key] for key in ('id', 'uuid', 'info', 'orgc_id', 'distribution') if key in event},
+            "Tag": [{"name": tag['name']} for tag in attribute.get('Tag', [])]
+        }
+        conn.execute("DELETE FROM attribute_values WHERE uuid = ?", (attribute['uuid'],))
+        conn.execute("INSERT OR REPLACE INTO attributes (uuid, event_id, attribute, sync_id) VALUES (?, ?, ?, ?)",
+                     (attribute['uuid'], event_id, json.dumps(mirrored), sync_id))
+        conn.executemany("INSERT OR IGNORE INTO attribute_values (value_key, uuid) VALUES (?, ?)",
+                         [(value_key, attribute['uuid']) for value_key in common.value_keys(attribute['value'])])
+
+    @staticmethod
+    def _set_state(conn, name, value):
+        conn.execute("INSERT OR REPLACE INTO mirror_state (name, value) VALUES (?, ?)", (name, value))
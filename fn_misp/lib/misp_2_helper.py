@@ -1,15 +1,55 @@
 import time
 import json
 import logging
+import threading
+from collections import OrderedDict
+from multiprocessing.pool import ThreadPool
 from pymisp import PyMISP
 from resilient_lib import IntegrationError
 
 log = logging.getLogger(__name__)
 
+# Process-wide registry of warm MISP clients, keyed by connection settings
+_misp_clients = {}
+_misp_clients_lock = threading.Lock()
+
 def get_misp_client(URL, API_KEY, VERIFY_CERT, proxies):
-    misp_client = PyMISP(URL, API_KEY, VERIFY_CERT, 'json', proxies=proxies)
+    client_key = (URL, API_KEY, VERIFY_CERT, tuple(sorted((proxies or {}).items())))
+    with _misp_clients_lock:
+        misp_client = _misp_clients.get(client_key)
+        if misp_client is None:
+            misp_client = PyMISP(URL, API_KEY, VERIFY_CERT, 'json', proxies=proxies)
+            _misp_clients[client_key] = misp_client
     return misp_client
 
+def invalidate_misp_clients():
+    with _misp_clients_lock:
+        _misp_clients.clear()
+
+# The search cache, attribute mirror, warninglist, sighting and outbox settings only apply to
+# the Python 3 helper, their configuration hooks are no-ops here so the components load on Python 2
+
+def configure_search(options):
+    pass
+
+def configure_mirror(options):
+    pass
+
+def configure_warninglists(options):
+    pass
+
+def configure_sightings(options):
+    pass
+
+def configure_outbox(opts, options):
+    pass
+
+def outbox_enabled():
+    return False
+
+def search_cache_stats():
+    return {}
+
 def create_misp_event(misp_client, misp_distribution, misp_threat_level, misp_analysis_level, misp_event_name):
     misp_event = misp_client.new_event(misp_distribution, misp_threat_level, misp_analysis_level, misp_event_name)
     return misp_event
@@ -78,7 +118,7 @@ def get_attribute_tags(attribute_result):
         pass
     return misp_tags
 
-def get_misp_attribute_tags(misp_client, search_results):
+def get_misp_attribute_tags(misp_client, search_results, max_concurrency=4):
     misp_tags = []
     misp_tag_names = []
 
@@ -88,11 +128,20 @@ def get_misp_attribute_tags(misp_client, search_results):
     for attribute_result in attribute_json:
         misp_tags += get_attribute_tags(attribute_result)
 
-    # Get events attribute is in
-    misp_event_list = get_event_list(misp_client, attribute_json)
-    # Get event tags for each event attribute is in
-    for misp_event_id in misp_event_list:
-        misp_tags += get_event_tags(misp_client, misp_event_id)
+    # Get events attribute is in, each event only once
+    misp_event_list = list(OrderedDict.fromkeys(get_event_list(misp_client, attribute_json)))
+    # Get event tags for each event attribute is in, up to max_concurrency events at a time
+    if max_concurrency > 1 and len(misp_event_list) > 1:
+        pool = ThreadPool(min(max_concurrency, len(misp_event_list)))
+        try:
+            event_tags = pool.map(lambda misp_event_id: get_event_tags(misp_client, misp_event_id), misp_event_list)
+        finally:
+            pool.close()
+            pool.join()
+    else:
+        event_tags = [get_event_tags(misp_client, misp_event_id) for misp_event_id in misp_event_list]
+    for tags in event_tags:
+        misp_tags += tags
 
     for misp_tag in misp_tags:
         misp_tag_names.append(misp_tag['name'])
@@ -1,16 +1,205 @@
 import time
 import json
 import logging
+import threading
+import ipaddress
+from concurrent.futures import ThreadPoolExecutor
 from pymisp import ExpandedPyMISP, MISPAttribute, MISPEvent, MISPSighting
-from resilient_lib import IntegrationError
+from resilient_lib import IntegrationError, str_to_bool
+from fn_misp.lib.cache import TTLCache
+from fn_misp.lib.bloom import RotatingBloomFilter
+from fn_misp.lib import common, mirror, outbox, sightings, streaming, throttle, warninglists
 
 
 log = logging.getLogger(__name__)
 
+# Process-wide registry of warm MISP clients, keyed by connection settings.
+# ExpandedPyMISP does several round trips on construction and keeps a
+# keep-alive requests session, so clients are shared across invocations.
+_misp_clients = {}
+_misp_clients_lock = threading.Lock()
+
+def _misp_client_key(URL, API_KEY, VERIFY_CERT, proxies):
+    return (URL, API_KEY, VERIFY_CERT, tuple(sorted((proxies or {}).items())))
+
 def get_misp_client(URL, API_KEY, VERIFY_CERT, proxies):
-    misp_client = ExpandedPyMISP(URL, API_KEY, ssl=VERIFY_CERT, proxies=proxies)
+    client_key = _misp_client_key(URL, API_KEY, VERIFY_CERT, proxies)
+    with _misp_clients_lock:
+        misp_client = _misp_clients.get(client_key)
+        if misp_client is None:
+            log.debug("Creating new MISP client for %s", URL)
+            adapter = throttle.get_adapter()
+            misp_client = ExpandedPyMISP(URL, API_KEY, ssl=VERIFY_CERT, proxies=proxies, https_adapter=adapter)
+            # PyMISP only mounts the adapter for https://, throttle plain http MISP URLs as well
+            session = getattr(misp_client, '_PyMISP__session', None)
+            if adapter is not None and session is not None:
+                session.mount('http://', adapter)
+            _misp_clients[client_key] = misp_client
     return misp_client
 
+def invalidate_misp_clients():
+    """Drop all pooled MISP clients, e.g. after the configuration was reloaded"""
+    with _misp_clients_lock:
+        _misp_clients.clear()
+    warninglists.reset()
+
+def configure_warninglists(options):
+    """Choose between server-side and local warninglist checks from the app.config options"""
+    warninglists.configure(str_to_bool(options.get("local_warninglists", "false")),
+                           int(options.get("warninglist_refresh_interval", 3600)))
+
+def _map_concurrently(function, items, max_concurrency):
+    # Calls share the pooled client session, results keep the order of items
+    if max_concurrency <= 1 or len(items) <= 1:
+        return [function(item) for item in items]
+    with ThreadPoolExecutor(max_workers=min(max_concurrency, len(items))) as executor:
+        return list(executor.map(function, items))
+
+def _estimate_size(value, samples=3):
+    """Approximate JSON size of a search response; long lists are extrapolated from their first elements"""
+    if isinstance(value, dict):
+        return 2 + sum(len(str(key)) + 4 + _estimate_size(item, samples) for key, item in value.items())
+    if isinstance(value, (list, tuple)):
+        if not value:
+            return 2
+        sampled = value[:samples]
+        return 2 + len(value) * sum(_estimate_size(item, samples) + 1 for item in sampled) // len(sampled)
+    if isinstance(value, str):
+        return len(value) + 2
+    return len(str(value))
+
+# Search results and their tags by (search mode, normalized value), invalidated when fn_misp changes the value in MISP
+_search_cache = TTLCache(maxsize=1000, ttl=300, max_bytes=32 * 1024 * 1024, sizeof=_estimate_size)
+
+# Values recently confirmed absent from MISP, answered without a search
+_absent_values = RotatingBloomFilter(capacity=100000, rotation_interval=600)
+_absent_settings = {"enabled": True}
+
+# Invalidation counters, striped by value, and one for invalidating everything. A search notes the counters of its
+# value before asking MISP and only caches its result if they did not change meanwhile, so a search that was in
+# flight while fn_misp changed the value cannot cache what it saw before the change
+_INVALIDATION_STRIPES = 4096
+_invalidations = [0] * (_INVALIDATION_STRIPES + 1)
+_invalidations_lock = threading.Lock()
+
+# events: full events from the events controller, attributes: matching attributes with event metadata
+_search_settings = {"mode": "events", "page_size": 500, "max_results": 5000}
+
+def configure_search(options):
+    """Apply the search mode and cache settings from the app.config options, a ttl of 0 disables a cache"""
+    _search_settings["mode"] = options.get("search_mode", "events")
+    _search_settings["page_size"] = int(options.get("search_page_size", 500))
+    _search_settings["max_results"] = int(options.get("search_max_results", 5000))
+    streaming.configure(str_to_bool(options.get("stream_responses", "false")))
+    configure_mirror(options)
+
+    ttl = int(options.get("search_cache_ttl", 300))
+    _search_cache.ttl = ttl
+    _search_cache.maxsize = int(options.get("search_cache_size", 1000)) if ttl > 0 else 0
+    _search_cache.max_bytes = int(options.get("search_cache_bytes", 32 * 1024 * 1024))
+    _search_cache.clear()
+
+    absent_ttl = int(options.get("absent_cache_ttl", 600))
+    _absent_settings["enabled"] = absent_ttl > 0
+    _absent_values.capacity = int(options.get("absent_cache_capacity", 100000))
+    _absent_values.rotation_interval = absent_ttl
+    _absent_values.clear()
+
+def configure_mirror(options):
+    """Enable the local attribute mirror if attribute_mirror_db is set in the app.config options"""
+    mirror.configure(options.get("attribute_mirror_db"),
+                     int(options.get("attribute_mirror_interval", 300)),
+                     int(options.get("attribute_mirror_max_age", 900)),
+                     int(options.get("attribute_mirror_full_sync_interval", 86400)))
+
+def sync_attribute_mirror(misp_client):
+    """Update the local attribute mirror from MISP, returns the number of attributes stored"""
+    def search_page(event_timestamp, limit, page):
+        if streaming.is_enabled():
+            return list(streaming.search(misp_client, 'attributes', 'response.Attribute', event_timestamp=event_timestamp or None,
+                                         includeEventTags=True, limit=limit, page=page))
+        result = misp_client.search(controller='attributes', event_timestamp=event_timestamp or None, include_event_tags=True,
+                                    limit=limit, page=page)
+        if not isinstance(result, dict) or 'errors' in result:
+            raise IntegrationError("Received an unexpected response from the MISP API: {}".format(result))
+        return result.get('Attribute', [])
+    return mirror.get_mirror().sync(search_page)
+
+def _mirror_response(search_results):
+    return {
+        "search_status": len(search_results) > 0,
+        "search_results": search_results,
+        "search_tags": get_misp_attribute_tags(None, search_results)
+    }
+
+def normalize_value(value):
+    # MISP compares attribute values case-insensitively
+    return str(value).strip().lower()
+
+def normalize_attribute_value(value):
+    """Attribute value as MISP stores and compares it: case-insensitive, IP addresses, also in composites, compressed"""
+    parts = normalize_value(value).split('|')
+    for index, part in enumerate(parts):
+        try:
+            parts[index] = str(ipaddress.ip_address(part))
+        except ValueError:
+            pass
+    return '|'.join(parts)
+
+def is_duplicate_error(error):
+    """True if MISP rejected an attribute because the event already has it"""
+    return "already exists" in str(error)
+
+def invalidate_search_cache(*values):
+    """Forget cached searches for values, or all of them if no value is given"""
+    attribute_mirror = mirror.get_mirror()
+    if attribute_mirror is not None:
+        attribute_mirror.invalidate(*values)
+    with _invalidations_lock:
+        if not values:
+            _invalidations[_INVALIDATION_STRIPES] += 1
+            _search_cache.clear()
+        for value in values:
+            # Searches for either part of a composite value find it as well
+            for key in common.value_keys(value):
+                _invalidations[hash(key) % _INVALIDATION_STRIPES] += 1
+                for mode in ("events", "attributes"):
+                    _search_cache.pop((mode, key))
+                _absent_values.remove(key)
+
+def _search_generation(cache_key):
+    return _invalidations[hash(cache_key) % _INVALIDATION_STRIPES], _invalidations[_INVALIDATION_STRIPES]
+
+def _store_search(mode, cache_key, search_results_response, generation):
+    """Cache a search result, unless the value was invalidated since the search started"""
+    with _invalidations_lock:
+        if _search_generation(cache_key) != generation:
+            log.debug("'%s' changed while it was searched, not caching the result", cache_key)
+            return
+        _search_cache.set((mode, cache_key), search_results_response)
+        if _absent_settings["enabled"] and not search_results_response["search_status"]:
+            _absent_values.add(cache_key)
+
+def search_cache_stats():
+    return _search_cache.stats()
+
+# Bidirectional event uuid <-> id cache, filled from every event payload the helpers see
+_event_ids = TTLCache(maxsize=1024, ttl=3600)    # uuid -> id
+_event_uuids = TTLCache(maxsize=1024, ttl=3600)  # id -> uuid
+
+def remember_event(event):
+    """Record the uuid <-> id pair of an event response, event dict or MISPEvent"""
+    if isinstance(event, MISPEvent):
+        event_id, event_uuid = getattr(event, 'id', None), getattr(event, 'uuid', None)
+    elif isinstance(event, dict):
+        event = event.get('Event', event)
+        event_id, event_uuid = event.get('id'), event.get('uuid')
+    else:
+        return
+    if event_id and event_uuid:
+        _event_ids.set(str(event_uuid), str(event_id))
+        _event_uuids.set(str(event_id), str(event_uuid))
+
 def create_misp_event(misp_client, misp_distribution, misp_threat_level, misp_analysis_level, misp_event_name, misp_tags):
     misp_event = MISPEvent()
     misp_event.distribution = misp_distribution
@@ -22,10 +211,12 @@ def create_misp_event(misp_client, misp_distribution, misp_threat_level, misp_an
         misp_event.add_tag(misp_tag)
 
     event_response = misp_client.add_event(misp_event)
+    remember_event(event_response)
     return event_response
 
 def update_misp_event(misp_client, misp_event_uuid, misp_distribution, misp_threat_level, misp_analysis_level, misp_event_name, misp_tags):
     misp_event = misp_client.get_event(event=misp_event_uuid, pythonify=True)
+    remember_event(misp_event)
     misp_event.distribution = misp_distribution
     misp_event.threat_level_id = misp_threat_level
     misp_event.analysis = misp_analysis_level
@@ -40,16 +231,39 @@ def update_misp_event(misp_client, misp_event_uuid, misp_distribution, misp_thre
         misp_event.add_tag(misp_tag)
 
     event_response = misp_client.update_event(misp_event)
+    invalidate_search_cache()
     return event_response
 
 def clean_orphaned_attribute(misp_client, misp_event_uuid, artifact_name):
-    misp_event = misp_client.get_event(event=misp_event_uuid, pythonify=True)
-    for a in misp_event.Attribute:
-        if a.value==artifact_name:
-            a.delete()
+    return clean_orphaned_attributes(misp_client, misp_event_uuid, [artifact_name])
 
-    event_response = misp_client.update_event(misp_event)
-    return event_response
+def clean_orphaned_attributes(misp_client, misp_event_uuid, artifact_names, event_attributes=None, max_concurrency=1):
+    """
+    Delete all attributes of an event whose value is one of artifact_names, compared as MISP compares values
+    :param event_attributes: attributes of the event if already fetched, otherwise they are looked up once
+    :param max_concurrency: maximum number of delete requests in flight
+    :return: list of dicts with value, uuid, success and the MISP response
+    """
+    if event_attributes is None:
+        event_attributes = get_event_attributes(misp_client, misp_event_uuid)
+    artifact_names = list(artifact_names)
+    normalized_names = {normalize_attribute_value(artifact_name) for artifact_name in artifact_names}
+
+    def delete_attribute(attribute):
+        delete_response = misp_client.delete_attribute(attribute['uuid'])
+        return {
+            "value": attribute['value'],
+            "uuid": attribute['uuid'],
+            "success": 'errors' not in delete_response,
+            "content": delete_response
+        }
+
+    orphaned_attributes = [attribute for attribute in event_attributes if normalize_attribute_value(attribute['value']) in normalized_names]
+    try:
+        return _map_concurrently(delete_attribute, orphaned_attributes, max_concurrency)
+    finally:
+        # After the deletes, so searches started from now on see them; earlier ones do not cache their results
+        invalidate_search_cache(*artifact_names)
 
 def create_misp_attribute(misp_client, misp_event_uuid, misp_attribute_type, misp_attribute_value):
     misp_event = MISPEvent()
@@ -59,20 +273,204 @@ def create_misp_attribute(misp_client, misp_event_uuid, misp_attribute_type, mis
     misp_attribute.type = misp_attribute_type
     misp_attribute.value = misp_attribute_value
     attribute_response = misp_client.add_attribute(misp_event, misp_attribute)
+    invalidate_search_cache(misp_attribute_value)
     return attribute_response
 
+def create_misp_attributes(misp_client, misp_event_uuid, misp_attributes, batch_size=100, max_concurrency=1):
+    """
+    Create several attributes on one event using the array form of attributes/add
+    :param misp_attributes: list of (misp_attribute_type, misp_attribute_value) tuples
+    :param batch_size: maximum number of attributes submitted per request
+    :param max_concurrency: maximum number of batches in flight
+    :return: list of dicts with type, value, success and either the created attribute or the error
+    """
+    misp_event = MISPEvent()
+    misp_event.id = get_event_id(misp_client, misp_event_uuid)
+    misp_event.uuid = misp_event_uuid
+
+    def add_attributes(batch):
+        attributes = []
+        for misp_attribute_type, misp_attribute_value in batch:
+            misp_attribute = MISPAttribute()
+            misp_attribute.type = misp_attribute_type
+            misp_attribute.value = misp_attribute_value
+            attributes.append(misp_attribute)
+        attribute_response = misp_client.add_attribute(misp_event, attributes)
+        return _split_attributes_response(batch, attribute_response)
+
+    batches = [misp_attributes[start:start + batch_size] for start in range(0, len(misp_attributes), batch_size)]
+    attribute_results = []
+    try:
+        for batch_results in _map_concurrently(add_attributes, batches, max_concurrency):
+            attribute_results += batch_results
+    finally:
+        # After the writes, so searches started from now on see them; earlier ones do not cache their results
+        invalidate_search_cache(*[misp_attribute_value for _, misp_attribute_value in misp_attributes])
+    return attribute_results
+
+def _split_attributes_response(batch, attribute_response):
+    # MISP answers with the created attributes in input order (a single dict for a
+    # batch of one) and reports rejected ones in 'errors', keyed "attribute_<index>"
+    created = attribute_response.get('Attribute', [])
+    if isinstance(created, dict):
+        created = [created]
+    errors = attribute_response.get('errors', {})
+    if not isinstance(errors, dict):
+        # The request as a whole was rejected
+        return [{"type": t, "value": v, "success": False, "error": str(errors)} for t, v in batch]
+
+    created = iter(created)
+    attribute_results = []
+    for index, (misp_attribute_type, misp_attribute_value) in enumerate(batch):
+        attribute_result = {"type": misp_attribute_type, "value": misp_attribute_value}
+        error = errors.get(f"attribute_{index}", errors.get(str(index), errors.get(index)))
+        attribute = None if error else next(created, None)
+        if attribute is not None:
+            attribute_result.update(success=True, content=attribute)
+        else:
+            attribute_result.update(success=False, error=str(error or "Attribute missing from MISP response"))
+        attribute_results.append(attribute_result)
+    return attribute_results
+
+SIGHTING_SOURCE = "IBM Resilient SOAR"
+
+# value: sightings by value, MISP looks the attributes up; uuid: sightings by attribute uuid, looked up through the search cache
+_sighting_settings = {"mode": "value", "max_concurrency": 4}
+
+def configure_sightings(options):
+    """Apply the sighting mode and batching settings from the app.config options, flushing buffered sightings first"""
+    _sighting_settings["mode"] = options.get("sighting_mode", "value")
+    _sighting_settings["max_concurrency"] = int(options.get("max_concurrency", 4))
+    sightings.reset()
+    sightings.configure(float(options.get("sighting_batch_window", 0)), int(options.get("sighting_batch_size", 500)),
+                        int(options.get("sighting_batch_max_attempts", 5)))
+
+def resolve_attribute_uuids(misp_client, values):
+    """Map each value to the uuids of the attributes with that value, using the cached bulk search"""
+    return {
+        value: [attribute['uuid'] for attribute in search_results_response['search_results'] if 'uuid' in attribute]
+        for value, search_results_response in search_misp_attributes(misp_client, values).items()
+    }
+
+def _send_sightings(misp_client, source, timestamp, values):
+    """
+    Sight values, returns a dict of value -> error for the values that could not be sighted,
+    so only those are retried and sightings MISP already recorded are not duplicated
+    """
+    # Sightings do not show up in search results, so the search cache stays valid
+    if _sighting_settings["mode"] == "uuid":
+        return _send_sightings_by_uuid(misp_client, source, timestamp, values)["errors"]
+    # sightings/add takes a list of values, each of them is sighted once, and fails as a whole
+    try:
+        sighting_response = misp_client.add_sighting({"values": values, "source": source, "timestamp": timestamp})
+    except Exception as err:
+        return {value: str(err) for value in values}
+    if isinstance(sighting_response, dict) and 'errors' in sighting_response:
+        return {value: str(sighting_response['errors']) for value in values}
+    return {}
+
+def _send_sightings_by_uuid(misp_client, source, timestamp, values):
+    """Sight the attributes with the values, returns the responses, the skipped values and a dict of value -> error"""
+    # Spares MISP a search of its attribute table per value, values without an attribute are skipped without a request
+    attribute_uuids = resolve_attribute_uuids(misp_client, values)
+    skipped = [value for value in values if not attribute_uuids.get(value)]
+    uuids = list(dict.fromkeys(uuid for value in values for uuid in attribute_uuids.get(value, [])))
+
+    def add_sighting(attribute_uuid):
+        try:
+            sighting_response = misp_client.add_sighting({"source": source, "timestamp": timestamp}, attribute=attribute_uuid)
+        except Exception as err:
+            return attribute_uuid, None, str(err)
+        if isinstance(sighting_response, dict) and 'errors' in sighting_response:
+            return attribute_uuid, None, str(sighting_response['errors'])
+        return attribute_uuid, sighting_response, None
+
+    if skipped:
+        log.info("Skipped sightings of %d values without a MISP attribute", len(skipped))
+    sighting_results = _map_concurrently(add_sighting, uuids, _sighting_settings["max_concurrency"])
+    uuid_errors = {attribute_uuid: error for attribute_uuid, _, error in sighting_results if error is not None}
+    errors = {}
+    for value in values:
+        value_errors = [uuid_errors[attribute_uuid] for attribute_uuid in attribute_uuids.get(value, []) if attribute_uuid in uuid_errors]
+        if value_errors:
+            errors[value] = "Failed to add a MISP sighting to {} of its attributes: {}".format(len(value_errors), value_errors[0])
+    return {
+        "sightings": [sighting_response for _, sighting_response, error in sighting_results if error is None],
+        "skipped": skipped,
+        "errors": errors
+    }
+
 def create_misp_sighting(misp_client, my_misp_sighting):
+    if outbox_enabled():
+        # Durable, and replayed in batches by the outbox flusher
+        return enqueue_misp_sighting(my_misp_sighting)
+    if sightings.is_enabled():
+        timestamp = int(time.time())
+        sightings.add(misp_client, _send_sightings, my_misp_sighting, SIGHTING_SOURCE, timestamp)
+        return {"queued": True, "value": my_misp_sighting, "source": SIGHTING_SOURCE, "timestamp": timestamp}
+    if _sighting_settings["mode"] == "uuid":
+        sighting_result = _send_sightings_by_uuid(misp_client, SIGHTING_SOURCE, int(time.time()), [my_misp_sighting])
+        if sighting_result["errors"]:
+            raise IntegrationError(sighting_result["errors"][my_misp_sighting])
+        return sighting_result
     misp_sighting = MISPSighting()
     misp_sighting.value = my_misp_sighting
     misp_sighting.timestamp = int(time.time())
-    misp_sighting.source = "IBM Resilient SOAR"
+    misp_sighting.source = SIGHTING_SOURCE
     sighting_response = misp_client.add_sighting(misp_sighting)
     return sighting_response
 
+def create_misp_sightings(misp_client, values, batch_size=500, max_concurrency=1):
+    """
+    Sight many values at once, skipping values without a MISP attribute
+    :param values: iterable of values that were seen
+    :param batch_size: maximum number of values per sightings request
+    :param max_concurrency: maximum number of existence searches in flight
+    :return: dict with the sighted and the skipped values, and the values that failed with their error
+    """
+    values = list(dict.fromkeys(values))
+    search_results = search_misp_attributes(misp_client, values, max_concurrency=max_concurrency)
+    found = [value for value in values if search_results[value]["search_status"]]
+    timestamp = int(time.time())
+    errors = {}
+    for start in range(0, len(found), batch_size):
+        errors.update(_send_sightings(misp_client, SIGHTING_SOURCE, timestamp, found[start:start + batch_size]))
+    return {
+        "sighted": [value for value in found if value not in errors],
+        "skipped": [value for value in values if not search_results[value]["search_status"]],
+        "failed": [{"value": value, "error": error} for value, error in errors.items()]
+    }
+
 def search_misp_attribute(misp_client, search_attribute):
-    search_results = misp_client.search(value=search_attribute)
+    cache_key = normalize_value(search_attribute)
+    search_results_response = _search_cache.get((_search_settings["mode"], cache_key))
+    if search_results_response is not None:
+        return search_results_response
+    # The mirror answers with attributes, so it is only used when searches return attributes as well
+    attribute_mirror = mirror.get_mirror() if _search_settings["mode"] == "attributes" else None
+    if attribute_mirror is not None and attribute_mirror.is_fresh(search_attribute):
+        return _mirror_response(attribute_mirror.lookup(search_attribute))
+    if _absent_settings["enabled"] and cache_key in _absent_values:
+        log.debug("'%s' was recently confirmed absent from MISP", search_attribute)
+        return {"search_status": False, "search_results": [], "search_tags": []}
+    generation = _search_generation(cache_key)
+    try:
+        if _search_settings["mode"] == "attributes":
+            search_results = _search_attributes(misp_client, search_attribute)
+        elif streaming.is_enabled():
+            search_results = _stream_events(misp_client, search_attribute)
+        else:
+            search_results = misp_client.search(value=search_attribute)
+    except Exception as err:
+        # Keep answering, possibly stale, from the mirror while MISP is unavailable
+        if attribute_mirror is None or not attribute_mirror.has_data():
+            raise
+        log.warning("Failed to search MISP for '%s', answering from the attribute mirror: %s", search_attribute, err)
+        return _mirror_response(attribute_mirror.lookup(search_attribute))
     if not isinstance(search_results, list):
         raise IntegrationError("Received an unexpected response type from the MISP API. Expected a list but received: {}".format(type(search_results)))
+    for event in search_results:
+        remember_event(event)
     search_results_len = len(search_results)
     if search_results_len == 0:
         success_status = False
@@ -82,19 +480,147 @@ def search_misp_attribute(misp_client, search_attribute):
         success_status = False
     search_results_response = { 
                                 "search_status": success_status,
-                                "search_results" : search_results
+                                "search_results" : search_results,
+                                "search_tags": get_misp_attribute_tags(misp_client, search_results)
                             }
+    _store_search(_search_settings["mode"], cache_key, search_results_response, generation)
     return search_results_response
 
+def search_misp_attributes(misp_client, search_attributes, batch_size=100, max_concurrency=1):
+    """
+    Search many values at once, using restSearch on the attributes controller with a list of values
+    :param search_attributes: iterable of values to search
+    :param batch_size: maximum number of values per search
+    :param max_concurrency: maximum number of searches in flight
+    :return: dict mapping each value to a search_misp_attribute style response
+    """
+    search_results_responses = {}
+    pending = {}
+    attribute_mirror = mirror.get_mirror()
+    for search_attribute in search_attributes:
+        cache_key = normalize_value(search_attribute)
+        search_results_response = _search_cache.get(("attributes", cache_key))
+        if search_results_response is None and attribute_mirror is not None and attribute_mirror.is_fresh(search_attribute):
+            search_results_response = _mirror_response(attribute_mirror.lookup(search_attribute))
+        if search_results_response is None and _absent_settings["enabled"] and cache_key in _absent_values:
+            search_results_response = {"search_status": False, "search_results": [], "search_tags": []}
+        if search_results_response is not None:
+            search_results_responses[search_attribute] = search_results_response
+        else:
+            pending.setdefault(cache_key, []).append(search_attribute)
+
+    cache_keys = list(pending)
+    generations = {cache_key: _search_generation(cache_key) for cache_key in cache_keys}
+    batches = [cache_keys[start:start + batch_size] for start in range(0, len(cache_keys), batch_size)]
+    matches = {}
+    for batch_matches in _map_concurrently(lambda batch: _search_attribute_batch(misp_client, batch), batches, max_concurrency):
+        matches.update(batch_matches)
+
+    for cache_key, search_results in matches.items():
+        search_results_response = {
+            "search_status": len(search_results) > 0,
+            "search_results": search_results,
+            "search_tags": get_misp_attribute_tags(misp_client, search_results)
+        }
+        _store_search("attributes", cache_key, search_results_response, generations[cache_key])
+        for search_attribute in pending[cache_key]:
+            search_results_responses[search_attribute] = search_results_response
+    return search_results_responses
+
+def _matches(attribute, cache_key):
+    return cache_key in common.value_keys(attribute.get('value', ''))
+
+def _stream_events(misp_client, search_attribute):
+    # Events are parsed one at a time, keeping only the (object) attributes that match the value
+    cache_key = normalize_value(search_attribute)
+    keep = {
+        "Event.Attribute": lambda attribute: _matches(attribute, cache_key),
+        "Event.Object": lambda misp_object: any(_matches(attribute, cache_key) for attribute in misp_object.get('Attribute', []))
+    }
+    return list(streaming.search(misp_client, 'events', 'response', keep=keep, value=search_attribute))
+
+def _search_attribute_batch(misp_client, cache_keys):
+    # search_max_results applies per value. A batch shares one result set, in which a popular
+    # value can crowd out the others, so a batch over the cap is searched again value by value
+    max_results = _search_settings["max_results"]
+    attributes = _search_attributes(misp_client, cache_keys, max_results + 1)
+    if len(attributes) > max_results and len(cache_keys) > 1:
+        matches = {}
+        for cache_key in cache_keys:
+            matches.update(_search_attribute_batch(misp_client, [cache_key]))
+        return matches
+    matches = {cache_key: [] for cache_key in cache_keys}
+    for attribute in attributes:
+        remember_event(attribute)
+        for cache_key in common.value_keys(attribute['value']):
+            if cache_key in matches:
+                matches[cache_key].append(attribute)
+    return {cache_key: search_results[:max_results] for cache_key, search_results in matches.items()}
+
+def _search_attributes(misp_client, search_attribute, max_results=None):
+    # Page through the attributes controller, which returns only the matching attributes
+    # with their event metadata, the event tags being inlined by include_event_tags.
+    # search_attribute may be a single value or a list of values
+    max_results = max_results or _search_settings["max_results"]
+    page_size = _search_settings["page_size"]
+    attributes = []
+    page = 1
+    while len(attributes) < max_results:
+        if streaming.is_enabled():
+            page_attributes = list(streaming.search(misp_client, 'attributes', 'response.Attribute', value=search_attribute,
+                                                    includeEventTags=True, limit=page_size, page=page))
+        else:
+            result = misp_client.search(controller='attributes', value=search_attribute, include_event_tags=True,
+                                        limit=page_size, page=page)
+            if not isinstance(result, dict) or 'errors' in result:
+                raise IntegrationError("Received an unexpected response from the MISP API: {}".format(result))
+            page_attributes = result.get('Attribute', [])
+        attributes += page_attributes
+        if len(page_attributes) < page_size:
+            break
+        page += 1
+    return attributes[:max_results]
+
 def check_misp_warninglist(misp_client, search_attribute, misp_override_warninglist) -> bool:
     if misp_override_warninglist:
         return False
+    if warninglists.is_enabled():
+        return warninglists.get_engine(misp_client).check(misp_client, search_attribute)
     warning_list_entries = misp_client.values_in_warninglist(search_attribute)
     if len(warning_list_entries) > 0:
         return True
     else:
         return False
 
+def check_misp_warninglists(misp_client, search_attributes, batch_size=500, max_concurrency=1):
+    """
+    Check many values against the MISP Warninglists with as few requests as possible
+    :param search_attributes: iterable of values to check
+    :param batch_size: maximum number of values sent per request
+    :param max_concurrency: maximum number of requests in flight
+    :return: dict mapping each value to True if it is member of at least one Warninglist
+    """
+    if warninglists.is_enabled():
+        return warninglists.get_engine(misp_client).check_values(misp_client, search_attributes)
+    warninglist_hits = {value: False for value in search_attributes}
+    # MISP reports hits keyed by the trimmed value
+    trimmed_values = {}
+    for value in warninglist_hits:
+        trimmed_values.setdefault(str(value).strip(), []).append(value)
+    values = list(trimmed_values)
+    batches = [values[start:start + batch_size] for start in range(0, len(values), batch_size)]
+    for warning_list_entries in _map_concurrently(misp_client.values_in_warninglist, batches, max_concurrency):
+        # Without any hit MISP answers with an empty list instead of a dict
+        if not isinstance(warning_list_entries, dict):
+            continue
+        if 'errors' in warning_list_entries:
+            raise IntegrationError("Failed to check values against the MISP Warninglists: {}".format(warning_list_entries['errors']))
+        for value, entries in warning_list_entries.items():
+            if entries:
+                for original_value in trimmed_values.get(str(value).strip(), []):
+                    warninglist_hits[original_value] = True
+    return warninglist_hits
+
 def get_event_tags(event):
     search_tags = []
     if "Tag" in event["Event"]:
@@ -114,12 +640,17 @@ def get_attribute_tags(attribute):
 
 def get_misp_attribute_tags(misp_client, search_results):
     search_tags = []
-    log.debug(json.dumps(search_results, indent=4))
-    for event in search_results:
+    if log.isEnabledFor(logging.DEBUG):
+        log.debug(json.dumps(search_results, indent=4))
+    for result in search_results:
+        if "Attribute" not in result.get("Event", {}):
+            # Attribute search result, event tags are inlined
+            search_tags += get_attribute_tags(result)
+            continue
         # Grab Event Tags
-        search_tags += get_event_tags(event)
+        search_tags += get_event_tags(result)
         # Grab Attribute Tags
-        for attribute in event["Event"]["Attribute"]:
+        for attribute in result["Event"]["Attribute"]:
             search_tags += get_attribute_tags(attribute)
     search_tags = list(set(search_tags))
     return search_tags
@@ -130,24 +661,73 @@ def get_misp_sighting_list(misp_client, misp_event_uuid):
     sighting_result = misp_client.sightings(misp_event)
     return sighting_result
 
-def get_event_id(misp_client, misp_event_uuid):
-    # returns list with a single element: an event dict
-    result = misp_client.search(eventid=misp_event_uuid)
+def get_misp_sighting_pages(misp_client, misp_event_id, page_size=1000, page=None, date_from=None, date_to=None):
+    """
+    Generator of the sightings of an event, page_size at a time, using the sightings restSearch
+    :param page: only return this page, 1-based
+    :param date_from: only sightings from this unix timestamp on
+    :param date_to: only sightings up to this unix timestamp
+    """
+    query = {
+        "id": misp_event_id,
+        "includeAttribute": True,
+        "from": date_from,
+        "to": date_to,
+        "limit": page_size,
+        "page": page or 1
+    }
+    first_ids = None
+    while True:
+        result = misp_client.direct_call('sightings/restSearch/event', {k: v for k, v in query.items() if v is not None})
+        if isinstance(result, dict):
+            if 'errors' in result:
+                raise IntegrationError("Failed to get the sightings of MISP event {}: {}".format(misp_event_id, result['errors']))
+            result = result.get('response', [])
+        # A MISP without sighting paging returns everything at once, and again for the next page
+        page_ids = [sighting.get('Sighting', sighting).get('id') for sighting in result[:1]]
+        if page_ids and page_ids == first_ids:
+            return
+        first_ids = page_ids
+        yield result
+        if page or len(result) != page_size:
+            return
+        query["page"] += 1
+
+def _lookup_event(misp_client, misp_event_id_or_uuid):
+    # metadata-only search: returns a list with a single event dict, without attributes
+    result = misp_client.search(eventid=misp_event_id_or_uuid, metadata=True)
+    if not result:
+        raise IntegrationError("Failed to find MISP event {}".format(misp_event_id_or_uuid))
     for event in result:
-        event_uuid = event['Event']['id']
-    return event_uuid
+        remember_event(event)
+    return result[0]['Event']
+
+def get_event_attributes(misp_client, misp_event_uuid):
+    """Return the attributes of an event without downloading the rest of it"""
+    if streaming.is_enabled():
+        return list(streaming.search(misp_client, 'attributes', 'response.Attribute', eventid=misp_event_uuid))
+    result = misp_client.search(controller='attributes', eventid=misp_event_uuid)
+    if 'errors' in result:
+        raise IntegrationError("Failed to get the attributes of MISP event {}: {}".format(misp_event_uuid, result['errors']))
+    return result.get('Attribute', [])
+
+def get_event_id(misp_client, misp_event_uuid):
+    event_id = _event_ids.get(str(misp_event_uuid))
+    if event_id is None:
+        event_id = _lookup_event(misp_client, misp_event_uuid)['id']
+    return event_id
 
 def get_event_uuid(misp_client, misp_event_id):
-    # returns list with a single element: an event dict
-    result = misp_client.search(eventid=misp_event_id)
-    for event in result:
-        event_uuid = event['Event']['uuid']
+    event_uuid = _event_uuids.get(str(misp_event_id))
+    if event_uuid is None:
+        event_uuid = _lookup_event(misp_client, misp_event_id)['uuid']
     return event_uuid
   
 def get_attribute_uuid(misp_client, misp_attribute_value, misp_event_uuid):
     misp_event = MISPEvent()
     misp_event.id = misp_event_uuid
     event_response = misp_client.get_event(misp_event)
+    remember_event(event_response)
     attribute_uuid = None
     if not event_response['Event']['Attribute']:
         log.error("Could not get a uuid for event = %s and attribute = %s. Does it exist?", misp_event_uuid, misp_attribute_value)
@@ -168,9 +748,101 @@ def create_tag(misp_client, misp_attribute_value, misp_tag_type, misp_tag_name,
     elif misp_tag_type == "Attribute":
         object_uuid = get_attribute_uuid(misp_client, misp_attribute_value, misp_event_uuid)
     tag_result = misp_client.tag(object_uuid, misp_tag_name)
+    # Event tags show up in the search results of every value on the event
+    if misp_tag_type == "Event":
+        invalidate_search_cache()
+    else:
+        invalidate_search_cache(misp_attribute_value)
     return tag_result
 
 def publish_event(misp_client, misp_event_uuid):
     # returns list with a single element: an event dict
     result = misp_client.publish(event=misp_event_uuid)
+    invalidate_search_cache()
     return result.get('message')
+
+def configure_outbox(opts, options):
+    """Queue writes in the durable outbox if outbox_db is set in the app.config options"""
+    def replay(operation, entries):
+        API_KEY, URL, VERIFY_CERT = common.validate(options)
+        misp_client = get_misp_client(URL, API_KEY, VERIFY_CERT, proxies=common.get_proxies(opts, options))
+        return _outbox_handlers[operation](misp_client, entries)
+    outbox.configure(options.get("outbox_db"), replay,
+                     flush_interval=float(options.get("outbox_flush_interval", 5)),
+                     batch_size=int(options.get("outbox_batch_size", 100)),
+                     max_attempts=int(options.get("outbox_max_attempts", 10)))
+
+def outbox_enabled():
+    return outbox.get_outbox() is not None
+
+def outbox_stats():
+    """Depth, lag in seconds of the oldest pending write, and number of writes given up on"""
+    return outbox.get_outbox().stats()
+
+def _enqueue(operation, payload, idempotency_key):
+    queued = outbox.get_outbox().enqueue(operation, payload, idempotency_key)
+    return {"queued": queued, "idempotency_key": idempotency_key, "outbox": outbox_stats()}
+
+def enqueue_misp_attribute(misp_event_uuid, misp_attribute_type, misp_attribute_value, misp_override_warninglist=False):
+    payload = {"event_uuid": misp_event_uuid, "type": misp_attribute_type, "value": misp_attribute_value,
+               "override_warninglist": bool(misp_override_warninglist)}
+    return _enqueue("attribute", payload, outbox.make_key("attribute", misp_event_uuid, misp_attribute_type, normalize_value(misp_attribute_value)))
+
+def enqueue_misp_sighting(my_misp_sighting):
+    payload = {"value": my_misp_sighting, "source": SIGHTING_SOURCE, "timestamp": int(time.time())}
+    return _enqueue("sighting", payload, outbox.make_key("sighting", normalize_value(my_misp_sighting), payload["source"], payload["timestamp"]))
+
+def enqueue_tag(misp_attribute_value, misp_tag_type, misp_tag_name, misp_event_uuid):
+    payload = {"value": misp_attribute_value, "tag_type": misp_tag_type, "tag_name": misp_tag_name, "event_uuid": misp_event_uuid}
+    return _enqueue("tag", payload, outbox.make_key("tag", misp_event_uuid, misp_tag_type, misp_attribute_value, misp_tag_name))
+
+def _replay_attributes(misp_client, entries):
+    # Warninglisted values are dropped as they would have been by misp_create_attribute
+    errors = {}
+    warninglist_hits = check_misp_warninglists(misp_client, [payload["value"] for _, payload in entries
+                                                             if not payload["override_warninglist"]])
+    by_event = {}
+    for idempotency_key, payload in entries:
+        if warninglist_hits.get(payload["value"]):
+            log.info("'%s' is member of at least one MISP Warninglist, dropping it from the outbox", payload["value"])
+            continue
+        by_event.setdefault(payload["event_uuid"], []).append((idempotency_key, payload))
+    for misp_event_uuid, event_entries in by_event.items():
+        attribute_results = create_misp_attributes(misp_client, misp_event_uuid,
+                                                   [(payload["type"], payload["value"]) for _, payload in event_entries])
+        for (idempotency_key, _), attribute_result in zip(event_entries, attribute_results):
+            # A replay of a write MISP already applied is a success
+            if not attribute_result["success"] and not is_duplicate_error(attribute_result["error"]):
+                errors[idempotency_key] = attribute_result["error"]
+    return errors
+
+def _replay_sightings(misp_client, entries):
+    # Only the entries whose value failed are retried, the others are already recorded by MISP
+    errors = {}
+    by_source = {}
+    for idempotency_key, payload in entries:
+        by_source.setdefault(payload["source"], []).append((idempotency_key, payload))
+    for source, source_entries in by_source.items():
+        value_errors = _send_sightings(misp_client, source, max(payload["timestamp"] for _, payload in source_entries),
+                                       list(dict.fromkeys(payload["value"] for _, payload in source_entries)))
+        for idempotency_key, payload in source_entries:
+            if payload["value"] in value_errors:
+                errors[idempotency_key] = value_errors[payload["value"]]
+    return errors
+
+def _replay_tags(misp_client, entries):
+    errors = {}
+    for idempotency_key, payload in entries:
+        try:
+            tag_result = create_tag(misp_client, payload["value"], payload["tag_type"], payload["tag_name"], payload["event_uuid"])
+            if 'errors' in tag_result:
+                errors[idempotency_key] = str(tag_result['errors'])
+        except Exception as err:
+            errors[idempotency_key] = str(err)
+    return errors
+
+_outbox_handlers = {
+    "attribute": _replay_attributes,
+    "sighting": _replay_sightings,
+    "tag": _replay_tags
+}
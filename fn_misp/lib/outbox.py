@@ -0,0 +1,184 @@
+"""
+Durable outbox for MISP writes.
+
+Write operations are committed to a local SQLite database (synchronous=FULL, so
+an enqueued write survives a crash) and replayed to MISP by a background flusher
+in batches. Every operation carries an idempotency key: enqueueing an operation
+whose key is already queued, or was completed within retention seconds, is a no-op.
+Failed operations are retried with exponential backoff up to max_attempts times, and
+queued again from scratch when an operation with their key is enqueued once more.
+"""
+
+import json
+import time
+import sqlite3
+import hashlib
+import logging
+import threading
+from collections import OrderedDict
+from contextlib import closing
+
+log = logging.getLogger(__name__)
+
+PENDING, DONE, FAILED = "pending", "done", "failed"
+
+_settings = {"path": None, "flush_interval": 5, "batch_size": 100, "max_attempts": 10, "retention": 86400}
+_outboxes = {}
+_outboxes_lock = threading.Lock()
+
+
+def configure(path, replay, flush_interval=5, batch_size=100, max_attempts=10, retention=86400):
+    """
+    Set the outbox database and start its flusher, a path of None disables the outbox
+    :param replay: function(operation, entries) sending a list of (idempotency_key, payload) tuples
+                   of one operation to MISP, returning a dict of idempotency_key -> error for the failed ones
+    """
+    _settings.update(path=path or None, flush_interval=flush_interval, batch_size=batch_size,
+                     max_attempts=max_attempts, retention=retention)
+    outbox = get_outbox()
+    if outbox is not None:
+        outbox.start(replay)
+
+
+def get_outbox():
+    """Return the shared outbox for the configured database, or None if the outbox is disabled"""
+    if _settings["path"] is None:
+        return None
+    with _outboxes_lock:
+        outbox = _outboxes.get(_settings["path"])
+        if outbox is None:
+            outbox = Outbox(_settings["path"])
+            _outboxes[_settings["path"]] = outbox
+    return outbox
+
+
+def make_key(*parts):
+    """Derive an idempotency key from the identifying parts of an operation"""
+    return hashlib.sha256(json.dumps(parts, default=str).encode('utf8')).hexdigest()
+
+
+class Outbox(object):
+    """Queue of pending MISP write operations in SQLite"""
+
+    def __init__(self, path):
+        self.path = path
+        self._replay = None
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._thread = None
+        self._queued = 0
+        with self._lock, closing(self._connect()) as conn, conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("CREATE TABLE IF NOT EXISTS outbox ("
+                         "id INTEGER PRIMARY KEY AUTOINCREMENT, "
+                         "idempotency_key TEXT NOT NULL UNIQUE, "
+                         "operation TEXT NOT NULL, "
+                         "payload TEXT NOT NULL, "
+                         "state TEXT NOT NULL, "
+                         "created REAL NOT NULL, "
+                         "attempts INTEGER NOT NULL DEFAULT 0, "
+                         "next_attempt REAL NOT NULL, "
+                         "completed REAL, "
+                         "last_error TEXT)")
+            conn.execute("CREATE INDEX IF NOT EXISTS outbox_due ON outbox (state, next_attempt)")
+
+    def _connect(self):
+        conn = sqlite3.connect(self.path, timeout=30)
+        # fsync on every commit, an acknowledged write must survive a crash
+        conn.execute("PRAGMA synchronous=FULL")
+        return conn
+
+    def enqueue(self, operation, payload, idempotency_key):
+        """Persist an operation, returns False if an operation with the same key is already pending or done"""
+        now = time.time()
+        with self._lock, closing(self._connect()) as conn, conn:
+            cursor = conn.execute("INSERT OR IGNORE INTO outbox (idempotency_key, operation, payload, state, created, next_attempt) "
+                                  "VALUES (?, ?, ?, ?, ?, ?)",
+                                  (idempotency_key, operation, json.dumps(payload), PENDING, now, now))
+            if cursor.rowcount == 0:
+                # An operation that was given up on is retried from scratch
+                cursor = conn.execute("UPDATE outbox SET operation = ?, payload = ?, state = ?, created = ?, attempts = 0, "
+                                      "next_attempt = ?, completed = NULL, last_error = NULL WHERE idempotency_key = ? AND state = ?",
+                                      (operation, json.dumps(payload), PENDING, now, now, idempotency_key, FAILED))
+            queued = cursor.rowcount > 0
+            if queued:
+                self._queued += 1
+        # Flush early once a full batch is waiting
+        if self._queued >= _settings["batch_size"]:
+            self._wakeup.set()
+        return queued
+
+    def stats(self):
+        """Queue depth, lag of the oldest pending operation in seconds and number of operations given up on"""
+        with self._lock, closing(self._connect()) as conn:
+            depth, oldest = conn.execute("SELECT COUNT(*), MIN(created) FROM outbox WHERE state = ?", (PENDING,)).fetchone()
+            failed, = conn.execute("SELECT COUNT(*) FROM outbox WHERE state = ?", (FAILED,)).fetchone()
+        return {
+            "depth": depth,
+            "lag": round(time.time() - oldest, 3) if oldest else 0,
+            "failed": failed
+        }
+
+    def start(self, replay):
+        """Start the background flusher, or only swap its replay function if it is running"""
+        self._replay = replay
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, name="misp-outbox")
+            self._thread.daemon = True
+            self._thread.start()
+        self._wakeup.set()
+
+    def flush(self):
+        """Replay all due operations, in batches of batch_size"""
+        with self._flush_lock:
+            self._queued = 0
+            while True:
+                with self._lock, closing(self._connect()) as conn:
+                    rows = conn.execute("SELECT id, idempotency_key, operation, payload, attempts FROM outbox "
+                                        "WHERE state = ? AND next_attempt <= ? ORDER BY id LIMIT ?",
+                                        (PENDING, time.time(), _settings["batch_size"])).fetchall()
+                if not rows:
+                    return
+                # Operations are replayed grouped by type, in the order their first operation was queued
+                by_operation = OrderedDict()
+                for row in rows:
+                    by_operation.setdefault(row[2], []).append(row)
+                for operation, operation_rows in by_operation.items():
+                    entries = [(idempotency_key, json.loads(payload)) for _, idempotency_key, _, payload, _ in operation_rows]
+                    try:
+                        errors = self._replay(operation, entries) or {}
+                    except Exception as err:
+                        errors = {idempotency_key: str(err) for _, idempotency_key, _, _, _ in operation_rows}
+                    self._record(operation_rows, errors)
+
+    def _record(self, rows, errors):
+        now = time.time()
+        retried = []
+        with self._lock, closing(self._connect()) as conn, conn:
+            for row_id, idempotency_key, operation, _, attempts in rows:
+                error = errors.get(idempotency_key)
+                if error is None:
+                    conn.execute("UPDATE outbox SET state = ?, completed = ?, last_error = NULL WHERE id = ?", (DONE, now, row_id))
+                elif attempts + 1 >= _settings["max_attempts"]:
+                    log.error("Giving up on MISP %s operation %s after %d attempts: %s", operation, idempotency_key, attempts + 1, error)
+                    conn.execute("UPDATE outbox SET state = ?, attempts = ?, completed = ?, last_error = ? WHERE id = ?",
+                                 (FAILED, attempts + 1, now, error, row_id))
+                else:
+                    delay = min(600, _settings["flush_interval"] * 2 ** attempts)
+                    retried.append(error)
+                    conn.execute("UPDATE outbox SET attempts = ?, next_attempt = ?, last_error = ? WHERE id = ?",
+                                 (attempts + 1, now + delay, error, row_id))
+            # Completed operations are kept for retention seconds to deduplicate replays of the same write
+            conn.execute("DELETE FROM outbox WHERE state != ? AND completed < ?", (PENDING, now - _settings["retention"]))
+        if retried:
+            log.warning("%d MISP %s operations failed and will be retried: %s", len(retried), rows[0][2], retried[0])
+
+    def _run(self):
+        while True:
+            self._wakeup.wait(_settings["flush_interval"])
+            self._wakeup.clear()
+            try:
+                self.flush()
+            except Exception as err:
+                log.error("Failed to flush the MISP outbox: %s", err)
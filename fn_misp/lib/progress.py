@@ -0,0 +1,44 @@
+import time
+from resilient_circuits import StatusMessage
+
+
+class ProgressReporter(object):
+    """
+    Coalesces the per-item progress of bulk functions into periodic StatusMessages,
+    sent every `every` items or `interval` seconds. Per-item messages are only sent when verbose.
+    Use with `yield from` inside a function generator.
+    """
+
+    def __init__(self, noun="items", every=100, interval=10, verbose=False):
+        self.noun = noun
+        self.every = every
+        self.interval = interval
+        self.verbose = verbose
+        self.processed = 0
+        self.counts = {}
+        self._reported = 0
+        self._last_report = time.monotonic()
+
+    def item(self, outcome, message=None):
+        """Record one processed item with its outcome, e.g. "created" or "failed" """
+        self.processed += 1
+        self.counts[outcome] = self.counts.get(outcome, 0) + 1
+        if self.verbose:
+            if message:
+                yield StatusMessage(message)
+        elif self.processed - self._reported >= self.every or time.monotonic() - self._last_report >= self.interval:
+            yield self._report()
+
+    def finish(self):
+        """Send the final totals unless the last summary already covers them"""
+        if self.processed != self._reported:
+            yield self._report()
+
+    def summary(self):
+        outcomes = ", ".join("{} {}".format(count, outcome) for outcome, count in self.counts.items())
+        return "Processed {} {}: {}".format(self.processed, self.noun, outcomes or "none")
+
+    def _report(self):
+        self._reported = self.processed
+        self._last_report = time.monotonic()
+        return StatusMessage(self.summary())
@@ -0,0 +1,234 @@
+"""
+Coalescing of MISP sightings.
+
+Sightings are buffered for a short window, deduplicated by (source, value) and
+sent with one sightings/add request per source, which takes a list of values.
+Buffered sightings are flushed by a background thread, when the configuration
+is reloaded and when the process exits. The buffer is in memory: sightings that
+must survive a crash go through the outbox instead. Sightings that failed are
+retried with exponential backoff up to max_attempts times, then dropped and logged.
+
+Sighting lists can be summarized per attribute with SightingSummary.
+"""
+
+import time
+import atexit
+import logging
+import threading
+from collections import OrderedDict
+
+log = logging.getLogger(__name__)
+
+_settings = {"window": 0, "batch_size": 500, "max_attempts": 5}
+_batchers = {}
+_batchers_lock = threading.Lock()
+
+
+def configure(window=0, batch_size=500, max_attempts=5):
+    """Set the buffering window in seconds, a window of 0 sends every sighting right away"""
+    _settings["window"] = window
+    _settings["batch_size"] = batch_size
+    _settings["max_attempts"] = max_attempts
+
+
+def is_enabled():
+    return _settings["window"] > 0
+
+
+def get_batcher(misp_client, send):
+    """
+    Return the shared batcher for the MISP instance misp_client talks to
+    :param send: function(misp_client, source, timestamp, values) submitting one batch of sightings,
+                 returning a dict of value -> error for the values that failed
+    """
+    with _batchers_lock:
+        batcher = _batchers.get(misp_client.root_url)
+        if batcher is None:
+            batcher = SightingBatcher(send, _settings["window"], _settings["batch_size"], _settings["max_attempts"])
+            _batchers[misp_client.root_url] = batcher
+    return batcher
+
+
+@atexit.register
+def flush_all():
+    """Send all buffered sightings, e.g. on shutdown"""
+    with _batchers_lock:
+        batchers = list(_batchers.values())
+    for batcher in batchers:
+        batcher.flush()
+
+
+def add(misp_client, send, value, source, timestamp=None):
+    """Buffer a sighting in the shared batcher, retrying with a new batcher if the current one was just closed by reset"""
+    while not get_batcher(misp_client, send).add(misp_client, value, source, timestamp):
+        pass
+
+
+def reset():
+    """Flush and stop all batchers, so they are recreated with the current settings"""
+    with _batchers_lock:
+        batchers = list(_batchers.values())
+        _batchers.clear()
+    for batcher in batchers:
+        batcher.close()
+
+
+class SightingBatcher(object):
+    """Buffers sightings and flushes them every window seconds or once batch_size are pending"""
+
+    def __init__(self, send, window=5, batch_size=500, max_attempts=5):
+        self.send = send
+        self.window = window
+        self.batch_size = batch_size
+        self.max_attempts = max_attempts
+        self._misp_client = None
+        # (source, normalized value) -> (value, timestamp, failed attempts), only the latest sighting of a value is kept
+        self._pending = OrderedDict()
+        # Consecutive flushes with failures, the flusher backs off exponentially while MISP keeps failing
+        self._failures = 0
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._closed = False
+        self._thread = threading.Thread(target=self._run, name="misp-sighting-batcher")
+        self._thread.daemon = True
+        self._thread.start()
+
+    def add(self, misp_client, value, source, timestamp=None):
+        """
+        Buffer a sighting of value, sightings of the same value and source within the window are coalesced.
+        Returns False if the batcher is closed, the sighting must then go to a new batcher.
+        """
+        with self._lock:
+            if self._closed:
+                return False
+            self._misp_client = misp_client
+            key = (source, str(value).strip().lower())
+            self._pending.pop(key, None)
+            self._pending[key] = (value, timestamp or int(time.time()), 0)
+            if len(self._pending) >= self.batch_size:
+                self._wakeup.set()
+        return True
+
+    def pending(self):
+        return len(self._pending)
+
+    def flush(self):
+        """Send the buffered sightings, the values that failed stay buffered for the next flush"""
+        with self._flush_lock:
+            with self._lock:
+                pending, self._pending = self._pending, OrderedDict()
+                misp_client = self._misp_client
+            if not pending:
+                return
+            by_source = OrderedDict()
+            for (source, _), sighting in pending.items():
+                by_source.setdefault(source, []).append(sighting)
+            failed = False
+            for source, sightings in by_source.items():
+                for start in range(0, len(sightings), self.batch_size):
+                    batch = sightings[start:start + self.batch_size]
+                    try:
+                        # One request per batch, stamped with the time of its latest sighting
+                        errors = self.send(misp_client, source, max(timestamp for _, timestamp, _ in batch), [value for value, _, _ in batch])
+                    except Exception as err:
+                        errors = {value: str(err) for value, _, _ in batch}
+                    if errors:
+                        failed = True
+                        self._requeue(source, [sighting for sighting in batch if sighting[0] in errors], errors)
+            self._failures = self._failures + 1 if failed else 0
+
+    def _requeue(self, source, batch, errors):
+        retried, dropped = 0, []
+        with self._lock:
+            for value, timestamp, attempts in batch:
+                if attempts + 1 >= self.max_attempts:
+                    dropped.append(value)
+                    continue
+                # Newer sightings of the value buffered meanwhile win
+                if self._pending.setdefault((source, str(value).strip().lower()), (value, timestamp, attempts + 1))[2]:
+                    retried += 1
+        error = next(iter(errors.values()))
+        if retried:
+            log.warning("Failed to send %d MISP sightings, retrying them: %s", retried, error)
+        if dropped:
+            log.error("Dropping %d MISP sightings after %d attempts: %s. Dropped values: %s",
+                      len(dropped), self.max_attempts, error, ", ".join(str(value) for value in dropped))
+
+    def close(self):
+        with self._lock:
+            self._closed = True
+        self._wakeup.set()
+        self.flush()
+        with self._lock:
+            dropped, self._pending = self._pending, OrderedDict()
+        if dropped:
+            log.error("Dropping %d MISP sightings that could not be sent before closing: %s",
+                      len(dropped), ", ".join(str(value) for value, _, _ in dropped.values()))
+
+    def _run(self):
+        while not self._closed:
+            # Back off while MISP keeps failing, at most to 64 windows
+            self._wakeup.wait(self.window * 2 ** min(self._failures, 6))
+            self._wakeup.clear()
+            try:
+                self.flush()
+            except Exception as err:
+                log.error("Failed to flush MISP sightings: %s", err)
+
+
+class SightingSummary(object):
+    """
+    Per-attribute aggregates of sightings, computed in one pass over pages of
+    sightings restSearch results: count, first and last seen, count per source and
+    per sighting type, and optionally a histogram of bucket seconds wide time buckets
+    """
+
+    def __init__(self, bucket=None):
+        self.bucket = bucket
+        self.total = 0
+        self._attributes = OrderedDict()
+
+    def add(self, sightings):
+        for item in sightings:
+            sighting = item.get('Sighting', item)
+            attribute = sighting.get('Attribute', {})
+            attribute_id = str(sighting.get('attribute_id') or attribute.get('id'))
+            seen = int(sighting.get('date_sighting') or 0)
+            summary = self._attributes.get(attribute_id)
+            if summary is None:
+                summary = {
+                    "attribute_id": attribute_id,
+                    "attribute_uuid": attribute.get('uuid'),
+                    "value": attribute.get('value'),
+                    "type": attribute.get('type'),
+                    "count": 0,
+                    "first_seen": seen,
+                    "last_seen": seen,
+                    "sources": {},
+                    "sighting_types": {},
+                    "histogram": {}
+                }
+                self._attributes[attribute_id] = summary
+            summary["count"] += 1
+            summary["first_seen"] = min(summary["first_seen"], seen)
+            summary["last_seen"] = max(summary["last_seen"], seen)
+            source = sighting.get('source') or ""
+            summary["sources"][source] = summary["sources"].get(source, 0) + 1
+            sighting_type = str(sighting.get('type', 0))
+            summary["sighting_types"][sighting_type] = summary["sighting_types"].get(sighting_type, 0) + 1
+            if self.bucket:
+                bucket_start = seen - seen % self.bucket
+                summary["histogram"][bucket_start] = summary["histogram"].get(bucket_start, 0) + 1
+            self.total += 1
+
+    def result(self):
+        attributes = []
+        for summary in self._attributes.values():
+            summary = dict(summary)
+            if self.bucket:
+                summary["histogram"] = [{"start": start, "count": count} for start, count in sorted(summary["histogram"].items())]
+            else:
+                del summary["histogram"]
+            attributes.append(summary)
+        return {"total": self.total, "attributes": attributes}
@@ -0,0 +1,139 @@
+"""
+Streaming restSearch for very large MISP responses.
+
+The response body is parsed incrementally with ijson while it is downloaded, and
+the items of the result array are assembled one at a time. Elements of nested
+arrays, such as the attributes of an event, can be filtered as they are parsed,
+so a large event never has to be held in memory as a whole. ijson is optional:
+without it the helpers keep using PyMISP, which loads whole responses.
+"""
+
+import sys
+import logging
+import threading
+import weakref
+import requests
+from resilient_lib import IntegrationError
+from fn_misp.lib import throttle
+
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+log = logging.getLogger(__name__)
+
+_settings = {"enabled": False}
+
+# One streaming session per pooled MISP client, dropped together with the client
+_sessions = weakref.WeakKeyDictionary()
+_sessions_lock = threading.Lock()
+
+
+def configure(enabled):
+    if enabled and ijson is None:
+        log.warning("stream_responses needs the ijson package, falling back to loading whole MISP responses")
+    _settings["enabled"] = enabled
+
+
+def is_enabled():
+    return _settings["enabled"] and ijson is not None
+
+
+def _get_session(misp_client):
+    with _sessions_lock:
+        session = _sessions.get(misp_client)
+        if session is None:
+            session = requests.Session()
+            adapter = throttle.get_adapter()
+            if adapter is not None:
+                session.mount('https://', adapter)
+                session.mount('http://', adapter)
+            session.headers.update({
+                'Authorization': misp_client.key,
+                'Accept': 'application/json',
+                'content-type': 'application/json',
+                'User-Agent': 'fn_misp - Python {}.{}'.format(*sys.version_info[:2])
+            })
+            _sessions[misp_client] = session
+    return session
+
+
+def search(misp_client, controller, prefix, keep=None, **query):
+    """
+    Run a restSearch on controller and yield the elements of the JSON array at prefix one by one
+    :param prefix: ijson prefix of the result array, e.g. "response" for events or "response.Attribute"
+    :param keep: dict mapping the paths of nested arrays, relative to a result element, to a predicate;
+                 their elements are dropped as soon as they are parsed unless the predicate is true
+    :param query: restSearch filters, e.g. value, eventid, includeEventTags, limit, page
+    """
+    query = {key: value for key, value in query.items() if value is not None}
+    query['returnFormat'] = 'json'
+    response = _get_session(misp_client).post(
+        '{}/{}/restSearch'.format(misp_client.root_url.rstrip('/'), controller), json=query, stream=True,
+        timeout=misp_client.timeout, verify=misp_client.ssl, proxies=misp_client.proxies or {}, cert=misp_client.cert)
+    with response:
+        if response.status_code != 200:
+            raise IntegrationError("MISP restSearch on {} failed with HTTP {}: {}".format(controller, response.status_code, response.text[:500]))
+        response.raw.decode_content = True
+        yield from iter_items(ijson.parse(response.raw), prefix, keep)
+
+
+def iter_items(parse_events, prefix, keep=None):
+    """Assemble the elements of the JSON array at prefix from ijson parse events, see search"""
+    item_prefix = "{}.item".format(prefix) if prefix else "item"
+    filters = {"{}.{}.item".format(item_prefix, path): predicate for path, predicate in (keep or {}).items()}
+    item = element = element_prefix = None
+    for event_prefix, event, value in parse_events:
+        if element is not None:
+            # Inside a filtered element: assemble it on its own, then keep or drop it
+            element.event(event, value)
+            if event_prefix == element_prefix and event in ('end_map', 'end_array'):
+                if filters[element_prefix](element.value):
+                    item.add(element.value)
+                element = None
+        elif item is None:
+            if event_prefix == item_prefix:
+                if event in ('start_map', 'start_array'):
+                    item = _ValueBuilder()
+                    item.event(event, value)
+                else:
+                    yield value
+        elif event_prefix in filters and event in ('start_map', 'start_array'):
+            element = _ValueBuilder()
+            element_prefix = event_prefix
+            element.event(event, value)
+        else:
+            item.event(event, value)
+            if event_prefix == item_prefix and event in ('end_map', 'end_array'):
+                yield item.value
+                item = None
+
+
+class _ValueBuilder(object):
+    """Builds a JSON value from ijson parse events"""
+
+    def __init__(self):
+        self.value = None
+        self._containers = []
+        self._key = None
+
+    def add(self, value):
+        if not self._containers:
+            self.value = value
+        elif isinstance(self._containers[-1], list):
+            self._containers[-1].append(value)
+        else:
+            self._containers[-1][self._key] = value
+
+    def event(self, event, value):
+        if event == 'map_key':
+            self._key = value
+        elif event in ('start_map', 'start_array'):
+            container = {} if event == 'start_map' else []
+            self.add(container)
+            self._containers.append(container)
+        elif event in ('end_map', 'end_array'):
+            self._containers.pop()
+        else:
+            self.add(value)
@@ -0,0 +1,146 @@
+"""
+Adaptive rate limiting of the requests fn_misp sends to MISP.
+
+All pooled MISP clients share one token bucket. Its rate follows the server
+AIMD-style: it grows additively while requests succeed quickly and is halved
+on 429/5xx responses, timeouts or slow answers. Requests wait for a token
+instead of failing, and requests the server refused as overloaded are retried.
+"""
+
+import time
+import logging
+import threading
+from requests.adapters import HTTPAdapter
+from requests.exceptions import ConnectTimeout, ReadTimeout
+
+log = logging.getLogger(__name__)
+
+# time.monotonic is not available on Python 2, fall back to the wall clock there
+_clock = getattr(time, "monotonic", time.time)
+
+_settings = {"enabled": True, "retries": 3}
+
+
+def configure(options):
+    """
+    Apply the app.config options to the shared limiter, rate_limit=0 disables it.
+    The limiter is updated in place, so adapters already mounted on pooled clients keep sharing it.
+    """
+    max_rate = float(options.get("rate_limit", 20))
+    _settings["retries"] = int(options.get("rate_limit_retries", 3))
+    _settings["enabled"] = max_rate > 0
+    if max_rate > 0:
+        _limiter.reconfigure(max_rate, float(options.get("rate_limit_latency", 5)))
+
+
+def get_adapter():
+    """Return a transport adapter bound to the shared limiter, or None if rate limiting is off"""
+    if not _settings["enabled"]:
+        return None
+    return ThrottledAdapter(_limiter)
+
+
+class AdaptiveRateLimiter(object):
+    """Token bucket with an additive-increase/multiplicative-decrease rate"""
+
+    def __init__(self, max_rate, min_rate=0.5, latency_target=5.0, increase=0.5):
+        self.max_rate = max_rate
+        self._floor = min_rate
+        self.min_rate = min(min_rate, max_rate)
+        self.latency_target = latency_target
+        self.increase = increase
+        self.rate = max_rate
+        self._tokens = max_rate
+        self._updated = _clock()
+        self._last_decrease = 0
+        self._lock = threading.Lock()
+
+    def reconfigure(self, max_rate, latency_target):
+        with self._lock:
+            self.max_rate = max_rate
+            self.min_rate = min(self._floor, max_rate)
+            self.latency_target = latency_target
+            self.rate = min(self.rate, max_rate)
+            self._tokens = min(self._tokens, max_rate)
+
+    def acquire(self):
+        """Block until a request may be sent"""
+        while True:
+            with self._lock:
+                now = _clock()
+                self._tokens = min(max(1.0, self.rate), self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait = (1 - self._tokens) / self.rate
+            time.sleep(wait)
+
+    def on_success(self, latency):
+        with self._lock:
+            if latency > self.latency_target:
+                self._decrease()
+            else:
+                self.rate = min(self.max_rate, self.rate + self.increase)
+
+    def on_overload(self):
+        with self._lock:
+            self._decrease()
+
+    def _decrease(self):
+        # Concurrent failures caused by the same overload only halve the rate once
+        now = _clock()
+        if now - self._last_decrease < 1:
+            return
+        self._last_decrease = now
+        self.rate = max(self.min_rate, self.rate / 2)
+        log.info("MISP seems overloaded, reducing the request rate to %.2f/s", self.rate)
+
+
+class ThrottledAdapter(HTTPAdapter):
+    """requests transport adapter that sends through an AdaptiveRateLimiter"""
+
+    RETRY_STATUS = (429, 503)
+
+    def __init__(self, limiter, **kwargs):
+        super(ThrottledAdapter, self).__init__(**kwargs)
+        self.limiter = limiter
+
+    def send(self, request, **kwargs):
+        if not _settings["enabled"]:
+            # Rate limiting was switched off after this adapter was mounted
+            return super(ThrottledAdapter, self).send(request, **kwargs)
+        retries = _settings["retries"]
+        attempt = 0
+        while True:
+            self.limiter.acquire()
+            started = _clock()
+            try:
+                response = super(ThrottledAdapter, self).send(request, **kwargs)
+            except ConnectTimeout:
+                # Nothing reached the server, safe to retry
+                self.limiter.on_overload()
+                if attempt >= retries:
+                    raise
+                retry_after = None
+            except ReadTimeout:
+                self.limiter.on_overload()
+                raise
+            else:
+                if response.status_code in self.RETRY_STATUS or response.status_code >= 500:
+                    self.limiter.on_overload()
+                else:
+                    self.limiter.on_success(_clock() - started)
+                if response.status_code not in self.RETRY_STATUS or attempt >= retries:
+                    return response
+                retry_after = response.headers.get("Retry-After")
+                response.close()
+
+            attempt += 1
+            delay = float(retry_after) if retry_after and retry_after.isdigit() else 2 ** attempt
+            log.info("MISP refused the request, retrying in %s seconds (%d/%d)", delay, attempt, retries)
+            time.sleep(delay)
+
+
+# The one limiter all MISP clients and streaming sessions send through
+_limiter = AdaptiveRateLimiter(20)
@@ -0,0 +1,227 @@
+"""
+Local, in-memory evaluation of the MISP Warninglists.
+
+The enabled warninglists are downloaded once per MISP instance and indexed by
+list type, so checking a value does not need a round trip to the server.
+Lists are re-downloaded only when their version changes.
+"""
+
+import re
+import time
+import logging
+import threading
+import ipaddress
+from urllib.parse import urlsplit
+from resilient_lib import IntegrationError
+
+log = logging.getLogger(__name__)
+
+_settings = {"enabled": False, "refresh_interval": 3600}
+_engines = {}
+_engines_lock = threading.Lock()
+
+
+def configure(enabled, refresh_interval=3600):
+    _settings["enabled"] = enabled
+    _settings["refresh_interval"] = refresh_interval
+
+
+def is_enabled():
+    return _settings["enabled"]
+
+
+def get_engine(misp_client):
+    """Return the shared engine for the MISP instance misp_client talks to"""
+    with _engines_lock:
+        engine = _engines.get(misp_client.root_url)
+        if engine is None:
+            engine = WarninglistEngine(_settings["refresh_interval"])
+            _engines[misp_client.root_url] = engine
+    return engine
+
+
+def reset():
+    with _engines_lock:
+        _engines.clear()
+
+
+class CidrIndex(object):
+    """Prefix table of IP networks: one set of network addresses per prefix length"""
+
+    def __init__(self):
+        self._prefixes = {4: {}, 6: {}}
+
+    def add(self, entry):
+        network = ipaddress.ip_network(entry, strict=False)
+        self._prefixes[network.version].setdefault(network.prefixlen, set()).add(int(network.network_address))
+
+    def __contains__(self, value):
+        try:
+            network = ipaddress.ip_network(value, strict=False)
+        except ValueError:
+            return False
+        address = int(network.network_address)
+        bits = network.max_prefixlen
+        for prefixlen, networks in self._prefixes[network.version].items():
+            if prefixlen > network.prefixlen:
+                continue
+            mask = ((1 << prefixlen) - 1) << (bits - prefixlen)
+            if address & mask in networks:
+                return True
+        return False
+
+
+class HostnameIndex(object):
+    """Suffix trie over reversed hostname labels, an entry matches itself and its subdomains"""
+
+    _TERMINAL = ""
+
+    def __init__(self):
+        self._root = {}
+
+    def add(self, entry):
+        node = self._root
+        for label in reversed(normalize_hostname(entry).split(".")):
+            node = node.setdefault(label, {})
+        node[self._TERMINAL] = True
+
+    def __contains__(self, value):
+        node = self._root
+        for label in reversed(normalize_hostname(value).split(".")):
+            node = node.get(label)
+            if node is None:
+                return False
+            if self._TERMINAL in node:
+                return True
+        return False
+
+
+def normalize_hostname(value):
+    value = value.strip().lower()
+    if "://" in value:
+        value = urlsplit(value).hostname or ""
+    return value.strip(".")
+
+
+def compile_pattern(entry):
+    """Compile a warninglist regex, which MISP stores in PCRE form such as /pattern/i"""
+    flags = 0
+    match = re.match(r"^/(.*)/([a-zA-Z]*)$", entry, re.DOTALL)
+    if match:
+        entry, modifiers = match.groups()
+        if "i" in modifiers:
+            flags |= re.IGNORECASE
+        if "m" in modifiers:
+            flags |= re.MULTILINE
+        if "s" in modifiers:
+            flags |= re.DOTALL
+    return re.compile(entry, flags)
+
+
+class WarninglistIndex(object):
+    """Combined indexes over the entries of all loaded warninglists"""
+
+    def __init__(self, warninglists):
+        self.cidr = CidrIndex()
+        self.hostnames = HostnameIndex()
+        self.strings = set()
+        self.substrings = []
+        self.patterns = []
+        for warninglist in warninglists:
+            for entry in warninglist["entries"]:
+                try:
+                    self._add(warninglist["type"], entry)
+                except (ValueError, re.error) as err:
+                    log.debug("Skipping entry '%s' of warninglist '%s': %s", entry, warninglist["name"], err)
+
+    def _add(self, list_type, entry):
+        if list_type == "cidr":
+            self.cidr.add(entry)
+        elif list_type == "hostname":
+            self.hostnames.add(entry)
+        elif list_type == "substring":
+            self.substrings.append(entry)
+        elif list_type == "regex":
+            self.patterns.append(compile_pattern(entry))
+        else:
+            self.strings.add(entry)
+
+    def __contains__(self, value):
+        return (value in self.strings
+                or value in self.cidr
+                or value in self.hostnames
+                or any(substring in value for substring in self.substrings)
+                or any(pattern.search(value) for pattern in self.patterns))
+
+
+class WarninglistEngine(object):
+    """Answers warninglist checks from local indexes that are refreshed periodically"""
+
+    def __init__(self, refresh_interval=3600):
+        self.refresh_interval = refresh_interval
+        self._warninglists = {}
+        self._index = None
+        self._next_refresh = 0
+        self._refresh_lock = threading.Lock()
+
+    def check(self, misp_client, value):
+        """Return True if value is member of at least one enabled warninglist"""
+        return value in self._get_index(misp_client)
+
+    def check_values(self, misp_client, values):
+        index = self._get_index(misp_client)
+        return {value: value in index for value in values}
+
+    def _get_index(self, misp_client):
+        if time.monotonic() >= self._next_refresh:
+            # Only one thread refreshes, the others keep using the current index if there is one
+            if self._refresh_lock.acquire(blocking=self._index is None):
+                try:
+                    if time.monotonic() >= self._next_refresh:
+                        self.refresh(misp_client)
+                except Exception as err:
+                    if self._index is None:
+                        raise
+                    log.warning("Failed to refresh the MISP Warninglists, keeping the current ones: %s", err)
+                    self._next_refresh = time.monotonic() + self.refresh_interval
+                finally:
+                    self._refresh_lock.release()
+        return self._index
+
+    def refresh(self, misp_client):
+        """Download new or changed enabled warninglists and rebuild the indexes"""
+        index_response = misp_client.warninglists()
+        if isinstance(index_response, dict):
+            if 'errors' in index_response:
+                raise IntegrationError("Failed to get the MISP Warninglists: {}".format(index_response['errors']))
+            index_response = index_response.get('Warninglists', [])
+
+        warninglists = {}
+        for item in index_response:
+            warninglist = item.get('Warninglist', item)
+            if str(warninglist.get('enabled')).lower() not in ("true", "1"):
+                continue
+            current = self._warninglists.get(warninglist['id'])
+            if current is None or current["version"] != warninglist.get('version'):
+                current = self._download(misp_client, warninglist['id'])
+            warninglists[warninglist['id']] = current
+
+        log.info("Loaded %d MISP Warninglists", len(warninglists))
+        self._index = WarninglistIndex(warninglists.values())
+        self._warninglists = warninglists
+        self._next_refresh = time.monotonic() + self.refresh_interval
+
+    @staticmethod
+    def _download(misp_client, warninglist_id):
+        response = misp_client.get_warninglist(warninglist_id)
+        if 'errors' in response:
+            raise IntegrationError("Failed to get MISP Warninglist {}: {}".format(warninglist_id, response['errors']))
+        warninglist = response.get('Warninglist', response)
+        entries = response.get('WarninglistEntry', warninglist.get('WarninglistEntry', []))
+        log.debug("Downloaded MISP Warninglist '%s' version %s", warninglist.get('name'), warninglist.get('version'))
+        return {
+            "name": warninglist.get('name'),
+            "type": warninglist.get('type'),
+            "version": warninglist.get('version'),
+            "entries": [entry['value'] for entry in entries]
+        }
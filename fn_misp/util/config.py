@@ -16,6 +16,70 @@ misp_key=<your key>
 verify_cert=true
 # Depending on your MISP version and configuration - your tag can be different, the default is below.
 mitre_tag=misp-galaxy:mitre-attack-pattern
+# Optional: number of attributes misp_sync_attributes submits per request
+#attribute_batch_size=100
+# Optional: number of incident artifacts misp_sync_attributes reads per page
+#artifact_page_size=500
+# Optional: maximum number of parallel requests bulk functions send to MISP
+#max_concurrency=4
+# Optional: bulk functions summarize their progress every status_every items or status_interval seconds
+# instead of sending one status message per item
+#status_every=100
+#status_interval=10
+# Optional: with search_mode=attributes, misp_search_attribute only fetches the matching attributes and their
+# event metadata instead of whole events, search_page_size at a time up to search_max_results
+#search_mode=events
+#search_page_size=500
+#search_max_results=5000
+# Optional: parse large search responses while they are downloaded, needs the ijson package.
+# In events search_mode only the attributes matching the searched value are kept
+#stream_responses=false
+# Optional: mirror the MISP attributes into a local SQLite database, synced every attribute_mirror_interval
+# seconds. Searches are answered from the mirror while its last sync is at most attribute_mirror_max_age
+# seconds old, and from the mirror when MISP is unavailable. misp_search_attribute only uses it with search_mode=attributes
+#attribute_mirror_db=/var/lib/fn_misp/attribute_mirror.db
+#attribute_mirror_interval=300
+#attribute_mirror_max_age=900
+#attribute_mirror_full_sync_interval=86400
+# Optional: cache misp_search_attribute results for search_cache_ttl seconds (0 disables the cache),
+# keeping at most search_cache_size values and search_cache_bytes bytes
+#search_cache_ttl=300
+#search_cache_size=1000
+#search_cache_bytes=33554432
+# Optional: remember values confirmed absent from MISP for absent_cache_ttl to 2*absent_cache_ttl seconds
+# in a Bloom filter sized for absent_cache_capacity values (0 disables it)
+#absent_cache_ttl=600
+#absent_cache_capacity=100000
+# Optional: with sighting_mode=uuid, sightings are added by attribute uuid, looked up through the search cache,
+# and values without a MISP attribute are skipped
+#sighting_mode=value
+# Optional: buffer misp_create_sighting sightings for sighting_batch_window seconds (0 sends them right away)
+# and send each value once per window, up to sighting_batch_size values per request
+#sighting_batch_window=0
+#sighting_batch_size=500
+# Buffered sightings that fail are retried with backoff up to sighting_batch_max_attempts times, then dropped and logged.
+# The buffer is held in memory, set outbox_db for sightings that must survive a restart
+#sighting_batch_max_attempts=5
+# Optional: queue misp_create_attribute, misp_create_sighting and misp_create_tag writes in a durable
+# local outbox and replay them to MISP every outbox_flush_interval seconds, retrying failed writes
+# up to outbox_max_attempts times
+#outbox_db=/var/lib/fn_misp/outbox.db
+#outbox_flush_interval=5
+#outbox_batch_size=100
+#outbox_max_attempts=10
+# Optional: answer warninglist checks from a local copy of the enabled MISP Warninglists,
+# re-downloading changed lists every warninglist_refresh_interval seconds
+#local_warninglists=false
+#warninglist_refresh_interval=3600
+# Optional: SQLite file in which misp_sync_attributes records synced artifacts per incident and event,
+# so later runs only process new or changed artifacts
+#sync_checkpoint_db=/var/log/rescircuits/fn_misp_sync.sqlite
+# Optional: adaptive limit of the requests per second sent to MISP, shared by all functions (0 disables it).
+# The rate backs off on 429/5xx responses, timeouts or answers slower than rate_limit_latency seconds,
+# refused requests are retried up to rate_limit_retries times
+#rate_limit=20
+#rate_limit_latency=5
+#rate_limit_retries=3
 # Optional: access MISP via an http/https proxy
 #http_proxy=<http_proxy_server>
 #https_proxy=<https_proxy_server>
@@ -16,7 +16,7 @@ def codegen_reload_data():
     return {
         "package": u"fn_misp",
         "message_destinations": [u"fn_misp"],
-        "functions": [u"misp_search_attribute", u"misp_create_sighting", u"misp_create_tag", u"misp_sighting_list", u"misp_create_event", u"misp_create_attribute"],
+        "functions": [u"misp_search_attribute", u"misp_create_sighting", u"misp_create_tag", u"misp_sighting_list", u"misp_create_event", u"misp_create_attribute", u"misp_search_attributes_bulk", u"misp_create_sightings_bulk"],
         "workflows": [u"example_misp_search_attribute", u"example_misp_create_event", u"example_misp_create_sighting", u"example_misp_create_tag_on_attribute", u"example_misp_create_tag_on_event", u"example_misp_sighting_list", u"example_misp_create_attribute"],
         "actions": [u"Example: Create MISP Event", u"Example: Create MISP Sighting", u"Example: MISP Search Attribute", u"Example: MISP Sighting List", u"Example: Create MISP Attribute"],
         "incident_fields": [u"misp_event_id"],
@@ -42,6 +42,8 @@ def customization_data(client=None):
         - misp_sighting_list
         - misp_create_event
         - misp_create_attribute
+        - misp_search_attributes_bulk
+        - misp_create_sightings_bulk
     - Workflows:
         - example_misp_search_attribute
         - example_misp_create_event
@@ -233,277 +235,795 @@ ICJpbmNpZGVudC9pbnRlcm5hbF9jdXN0b21pemF0aW9uc19maWVsZCIsICJpZCI6IDAsICJpbnB1
 dF90eXBlIjogInRleHQiLCAiaW50ZXJuYWwiOiB0cnVlLCAibmFtZSI6ICJpbnRlcm5hbF9jdXN0
 b21pemF0aW9uc19maWVsZCIsICJyZWFkX29ubHkiOiB0cnVlLCAidGV4dCI6ICJDdXN0b21pemF0
 aW9ucyBGaWVsZCAoaW50ZXJuYWwpIiwgInR5cGVfaWQiOiAwLCAidXVpZCI6ICJiZmVlYzJkNC0z
-NzcwLTExZTgtYWQzOS00YTAwMDQwNDRhYTEifV0sICJmdW5jdGlvbnMiOiBbeyJjcmVhdG9yIjog
-eyJkaXNwbGF5X25hbWUiOiAiaW50ZWdyYXRpb25zIiwgImlkIjogNCwgIm5hbWUiOiAiZWIyZDFm
-N2QtNjY1MS00MTVhLWI0ZmYtYTE0ZmNkMmY4NGY1IiwgInR5cGUiOiAiYXBpa2V5In0sICJkZXNj
-cmlwdGlvbiI6IHsiZm9ybWF0IjogInRleHQiLCAiY29udGVudCI6ICJDcmVhdGUgYSBNSVNQIGF0
-dHJpYnV0ZSBmcm9tIGFuIGluY2lkZW50IGFydGlmYWN0In0sICJkZXN0aW5hdGlvbl9oYW5kbGUi
-OiAiZm5fbWlzcCIsICJkaXNwbGF5X25hbWUiOiAiTUlTUCBDcmVhdGUgQXR0cmlidXRlIiwgImV4
-cG9ydF9rZXkiOiAibWlzcF9jcmVhdGVfYXR0cmlidXRlIiwgImlkIjogNSwgImxhc3RfbW9kaWZp
-ZWRfYnkiOiB7ImRpc3BsYXlfbmFtZSI6ICJpbnRlZ3JhdGlvbnMiLCAiaWQiOiA0LCAibmFtZSI6
-ICJlYjJkMWY3ZC02NjUxLTQxNWEtYjRmZi1hMTRmY2QyZjg0ZjUiLCAidHlwZSI6ICJhcGlrZXki
-fSwgImxhc3RfbW9kaWZpZWRfdGltZSI6IDE2MDA3ODkxMjM3NzgsICJuYW1lIjogIm1pc3BfY3Jl
-YXRlX2F0dHJpYnV0ZSIsICJ0YWdzIjogW10sICJ1dWlkIjogImY1YzRhYWUyLTEzNWUtNDFhYy04
-YmJjLTA4MmIwMDY3N2VjYiIsICJ2ZXJzaW9uIjogMiwgInZpZXdfaXRlbXMiOiBbeyJjb250ZW50
-IjogIjIxNzYwMDMwLThkZGYtNDNkYS04NGU4LTViMGM2MzM2MmI0NyIsICJlbGVtZW50IjogImZp
-ZWxkX3V1aWQiLCAiZmllbGRfdHlwZSI6ICJfX2Z1bmN0aW9uIiwgInNob3dfaWYiOiBudWxsLCAi
-c2hvd19saW5rX2hlYWRlciI6IGZhbHNlLCAic3RlcF9sYWJlbCI6IG51bGx9LCB7ImNvbnRlbnQi
-OiAiYmRlOGU4M2MtMDYwZC00YzVhLTkyOGQtZDk5OWE5N2NmZGEwIiwgImVsZW1lbnQiOiAiZmll
-bGRfdXVpZCIsICJmaWVsZF90eXBlIjogIl9fZnVuY3Rpb24iLCAic2hvd19pZiI6IG51bGwsICJz
-aG93X2xpbmtfaGVhZGVyIjogZmFsc2UsICJzdGVwX2xhYmVsIjogbnVsbH0sIHsiY29udGVudCI6
-ICJkOTU3YzJiMC03NWZlLTQxYjctYWMwNi0xY2UwYTdhN2IyNTEiLCAiZWxlbWVudCI6ICJmaWVs
-ZF91dWlkIiwgImZpZWxkX3R5cGUiOiAiX19mdW5jdGlvbiIsICJzaG93X2lmIjogbnVsbCwgInNo
-b3dfbGlua19oZWFkZXIiOiBmYWxzZSwgInN0ZXBfbGFiZWwiOiBudWxsfV0sICJ3b3JrZmxvd3Mi
-OiBbeyJhY3Rpb25zIjogW10sICJkZXNjcmlwdGlvbiI6IG51bGwsICJuYW1lIjogIkV4YW1wbGU6
-IE1JU1AgQ3JlYXRlIEF0dHJpYnV0ZSIsICJvYmplY3RfdHlwZSI6ICJhcnRpZmFjdCIsICJwcm9n
-cmFtbWF0aWNfbmFtZSI6ICJleGFtcGxlX21pc3BfY3JlYXRlX2F0dHJpYnV0ZSIsICJ0YWdzIjog
-W10sICJ1dWlkIjogbnVsbCwgIndvcmtmbG93X2lkIjogN31dfSwgeyJjcmVhdG9yIjogeyJkaXNw
-bGF5X25hbWUiOiAiaW50ZWdyYXRpb25zIiwgImlkIjogNCwgIm5hbWUiOiAiZWIyZDFmN2QtNjY1
-MS00MTVhLWI0ZmYtYTE0ZmNkMmY4NGY1IiwgInR5cGUiOiAiYXBpa2V5In0sICJkZXNjcmlwdGlv
-biI6IHsiZm9ybWF0IjogInRleHQiLCAiY29udGVudCI6ICJDcmVhdGUgYSBNSVNQIGV2ZW50IGZy
-b20gYW4gaW5jaWRlbnQifSwgImRlc3RpbmF0aW9uX2hhbmRsZSI6ICJmbl9taXNwIiwgImRpc3Bs
-YXlfbmFtZSI6ICJNSVNQIENyZWF0ZSBFdmVudCIsICJleHBvcnRfa2V5IjogIm1pc3BfY3JlYXRl
-X2V2ZW50IiwgImlkIjogNiwgImxhc3RfbW9kaWZpZWRfYnkiOiB7ImRpc3BsYXlfbmFtZSI6ICJp
-bnRlZ3JhdGlvbnMiLCAiaWQiOiA0LCAibmFtZSI6ICJlYjJkMWY3ZC02NjUxLTQxNWEtYjRmZi1h
-MTRmY2QyZjg0ZjUiLCAidHlwZSI6ICJhcGlrZXkifSwgImxhc3RfbW9kaWZpZWRfdGltZSI6IDE2
-MDA3ODkxMjM3NzgsICJuYW1lIjogIm1pc3BfY3JlYXRlX2V2ZW50IiwgInRhZ3MiOiBbXSwgInV1
-aWQiOiAiOGY5YjdjNDUtOWQ0ZS00ZDM1LThiZGQtZWIyZTI5MjM0MTNhIiwgInZlcnNpb24iOiAy
-LCAidmlld19pdGVtcyI6IFt7ImNvbnRlbnQiOiAiY2NlMWFkNjEtMTM2OC00YmJkLWJhMzYtNWE3
-OWJmZGVjODhjIiwgImVsZW1lbnQiOiAiZmllbGRfdXVpZCIsICJmaWVsZF90eXBlIjogIl9fZnVu
-Y3Rpb24iLCAic2hvd19pZiI6IG51bGwsICJzaG93X2xpbmtfaGVhZGVyIjogZmFsc2UsICJzdGVw
-X2xhYmVsIjogbnVsbH0sIHsiY29udGVudCI6ICIzNDdiNTUwNi1mNWFlLTQ1OTctYTkxOC1lMzZl
-OWZkZmI3OWEiLCAiZWxlbWVudCI6ICJmaWVsZF91dWlkIiwgImZpZWxkX3R5cGUiOiAiX19mdW5j
-dGlvbiIsICJzaG93X2lmIjogbnVsbCwgInNob3dfbGlua19oZWFkZXIiOiBmYWxzZSwgInN0ZXBf
-bGFiZWwiOiBudWxsfSwgeyJjb250ZW50IjogIjFkY2Y2NDg4LTZlMmQtNDA2Mi1iYjc0LTE2YmU0
-YmI0ZmJkZCIsICJlbGVtZW50IjogImZpZWxkX3V1aWQiLCAiZmllbGRfdHlwZSI6ICJfX2Z1bmN0
-aW9uIiwgInNob3dfaWYiOiBudWxsLCAic2hvd19saW5rX2hlYWRlciI6IGZhbHNlLCAic3RlcF9s
-YWJlbCI6IG51bGx9LCB7ImNvbnRlbnQiOiAiYTQ5Mjk2OTEtMTJlNi00YzM2LWIxNTEtYmI4MTU3
-OWM4YTc2IiwgImVsZW1lbnQiOiAiZmllbGRfdXVpZCIsICJmaWVsZF90eXBlIjogIl9fZnVuY3Rp
-b24iLCAic2hvd19pZiI6IG51bGwsICJzaG93X2xpbmtfaGVhZGVyIjogZmFsc2UsICJzdGVwX2xh
-YmVsIjogbnVsbH1dLCAid29ya2Zsb3dzIjogW3siYWN0aW9ucyI6IFtdLCAiZGVzY3JpcHRpb24i
-OiBudWxsLCAibmFtZSI6ICJFeGFtcGxlOiBNSVNQIENyZWF0ZSBFdmVudCIsICJvYmplY3RfdHlw
-ZSI6ICJpbmNpZGVudCIsICJwcm9ncmFtbWF0aWNfbmFtZSI6ICJleGFtcGxlX21pc3BfY3JlYXRl
-X2V2ZW50IiwgInRhZ3MiOiBbXSwgInV1aWQiOiBudWxsLCAid29ya2Zsb3dfaWQiOiAxM31dfSwg
-eyJjcmVhdG9yIjogeyJkaXNwbGF5X25hbWUiOiAiaW50ZWdyYXRpb25zIiwgImlkIjogNCwgIm5h
-bWUiOiAiZWIyZDFmN2QtNjY1MS00MTVhLWI0ZmYtYTE0ZmNkMmY4NGY1IiwgInR5cGUiOiAiYXBp
-a2V5In0sICJkZXNjcmlwdGlvbiI6IHsiZm9ybWF0IjogInRleHQiLCAiY29udGVudCI6ICJDcmVh
-dGUgYSBNSVNQIHNpZ2h0aW5nIGZyb20gYW4gaW5jaWRlbnQgYXJ0aWZhY3QifSwgImRlc3RpbmF0
-aW9uX2hhbmRsZSI6ICJmbl9taXNwIiwgImRpc3BsYXlfbmFtZSI6ICJNSVNQIENyZWF0ZSBTaWdo
-dGluZyIsICJleHBvcnRfa2V5IjogIm1pc3BfY3JlYXRlX3NpZ2h0aW5nIiwgImlkIjogNywgImxh
-c3RfbW9kaWZpZWRfYnkiOiB7ImRpc3BsYXlfbmFtZSI6ICJpbnRlZ3JhdGlvbnMiLCAiaWQiOiA0
-LCAibmFtZSI6ICJlYjJkMWY3ZC02NjUxLTQxNWEtYjRmZi1hMTRmY2QyZjg0ZjUiLCAidHlwZSI6
-ICJhcGlrZXkifSwgImxhc3RfbW9kaWZpZWRfdGltZSI6IDE2MDA3ODkxMjM3NzgsICJuYW1lIjog
-Im1pc3BfY3JlYXRlX3NpZ2h0aW5nIiwgInRhZ3MiOiBbXSwgInV1aWQiOiAiZTlkZjc5MmItYTNh
-Zi00ZDY3LWFlOTAtZTQ4YWFiY2ExMzhjIiwgInZlcnNpb24iOiAyLCAidmlld19pdGVtcyI6IFt7
-ImNvbnRlbnQiOiAiMmU5YThkMmItOWZkMS00YTQyLWE2MWUtNDVjZTgyMTNmZWI3IiwgImVsZW1l
-bnQiOiAiZmllbGRfdXVpZCIsICJmaWVsZF90eXBlIjogIl9fZnVuY3Rpb24iLCAic2hvd19pZiI6
-IG51bGwsICJzaG93X2xpbmtfaGVhZGVyIjogZmFsc2UsICJzdGVwX2xhYmVsIjogbnVsbH1dLCAi
-d29ya2Zsb3dzIjogW3siYWN0aW9ucyI6IFtdLCAiZGVzY3JpcHRpb24iOiBudWxsLCAibmFtZSI6
-ICJFeGFtcGxlOiBNSVNQIENyZWF0ZSBTaWdodGluZyIsICJvYmplY3RfdHlwZSI6ICJhcnRpZmFj
-dCIsICJwcm9ncmFtbWF0aWNfbmFtZSI6ICJleGFtcGxlX21pc3BfY3JlYXRlX3NpZ2h0aW5nIiwg
-InRhZ3MiOiBbXSwgInV1aWQiOiBudWxsLCAid29ya2Zsb3dfaWQiOiAxMH1dfSwgeyJjcmVhdG9y
-IjogeyJkaXNwbGF5X25hbWUiOiAiaW50ZWdyYXRpb25zIiwgImlkIjogNCwgIm5hbWUiOiAiZWIy
-ZDFmN2QtNjY1MS00MTVhLWI0ZmYtYTE0ZmNkMmY4NGY1IiwgInR5cGUiOiAiYXBpa2V5In0sICJk
-ZXNjcmlwdGlvbiI6IHsiZm9ybWF0IjogInRleHQiLCAiY29udGVudCI6ICJDcmVhdGVzIGEgVGFn
-In0sICJkZXN0aW5hdGlvbl9oYW5kbGUiOiAiZm5fbWlzcCIsICJkaXNwbGF5X25hbWUiOiAiTUlT
-UCBDcmVhdGUgVGFnIiwgImV4cG9ydF9rZXkiOiAibWlzcF9jcmVhdGVfdGFnIiwgImlkIjogOCwg
-Imxhc3RfbW9kaWZpZWRfYnkiOiB7ImRpc3BsYXlfbmFtZSI6ICJpbnRlZ3JhdGlvbnMiLCAiaWQi
-OiA0LCAibmFtZSI6ICJlYjJkMWY3ZC02NjUxLTQxNWEtYjRmZi1hMTRmY2QyZjg0ZjUiLCAidHlw
-ZSI6ICJhcGlrZXkifSwgImxhc3RfbW9kaWZpZWRfdGltZSI6IDE2MDA3ODkxMjM3NzgsICJuYW1l
-IjogIm1pc3BfY3JlYXRlX3RhZyIsICJ0YWdzIjogW10sICJ1dWlkIjogIjcxZDNmZWQyLTBlZWMt
-NDlhZi1hNDE4LThlODE3OGU1YTQ1OCIsICJ2ZXJzaW9uIjogMiwgInZpZXdfaXRlbXMiOiBbeyJj
-b250ZW50IjogImEyMDFkYzk0LWQ3ZjAtNGIwOS05ZTllLTdjNGJhNWE3YTVkYSIsICJlbGVtZW50
+NzcwLTExZTgtYWQzOS00YTAwMDQwNDRhYTEifSwgeyJhbGxvd19kZWZhdWx0X3ZhbHVlIjogZmFs
+c2UsICJibGFua19vcHRpb24iOiBmYWxzZSwgImNhbGN1bGF0ZWQiOiBmYWxzZSwgImNoYW5nZWFi
+bGUiOiB0cnVlLCAiY2hvc2VuIjogZmFsc2UsICJkZWZhdWx0X2Nob3Nlbl9ieV9zZXJ2ZXIiOiBm
+YWxzZSwgImRlcHJlY2F0ZWQiOiBmYWxzZSwgImV4cG9ydF9rZXkiOiAiX19mdW5jdGlvbi9taXNw
+X2F0dHJpYnV0ZV92YWx1ZXMiLCAiaGlkZV9ub3RpZmljYXRpb24iOiBmYWxzZSwgImlkIjogMjA2
+LCAiaW5wdXRfdHlwZSI6ICJ0ZXh0YXJlYSIsICJpbnRlcm5hbCI6IGZhbHNlLCAiaXNfdHJhY2tl
+ZCI6IGZhbHNlLCAibmFtZSI6ICJtaXNwX2F0dHJpYnV0ZV92YWx1ZXMiLCAib3BlcmF0aW9uX3Bl
+cm1zIjoge30sICJvcGVyYXRpb25zIjogW10sICJwbGFjZWhvbGRlciI6ICIiLCAicHJlZml4Ijog
+bnVsbCwgInJlYWRfb25seSI6IGZhbHNlLCAicmljaF90ZXh0IjogZmFsc2UsICJ0YWdzIjogW10s
+ICJ0ZW1wbGF0ZXMiOiBbXSwgInRleHQiOiAibWlzcF9hdHRyaWJ1dGVfdmFsdWVzIiwgInRvb2x0
+aXAiOiAiQ29tbWEgb3IgbmV3bGluZSBzZXBhcmF0ZWQgdmFsdWVzIHRvIHNlYXJjaCwgdGFrZXMg
+cHJlY2VkZW5jZSBvdmVyIGluY2lkZW50X2lkIiwgInR5cGVfaWQiOiAxMSwgInV1aWQiOiAiNzJk
+Y2RlNDMtOTFkZS00ZWY2LWE0Y2EtMmQ3MDQyYzljZTcxIiwgInZhbHVlcyI6IFtdfSwgeyJhbGxv
+d19kZWZhdWx0X3ZhbHVlIjogZmFsc2UsICJibGFua19vcHRpb24iOiBmYWxzZSwgImNhbGN1bGF0
+ZWQiOiBmYWxzZSwgImNoYW5nZWFibGUiOiB0cnVlLCAiY2hvc2VuIjogZmFsc2UsICJkZWZhdWx0
+X2Nob3Nlbl9ieV9zZXJ2ZXIiOiBmYWxzZSwgImRlcHJlY2F0ZWQiOiBmYWxzZSwgImV4cG9ydF9r
+ZXkiOiAiX19mdW5jdGlvbi9pbmNpZGVudF9pZCIsICJoaWRlX25vdGlmaWNhdGlvbiI6IGZhbHNl
+LCAiaWQiOiAyMDcsICJpbnB1dF90eXBlIjogIm51bWJlciIsICJpbnRlcm5hbCI6IGZhbHNlLCAi
+aXNfdHJhY2tlZCI6IGZhbHNlLCAibmFtZSI6ICJpbmNpZGVudF9pZCIsICJvcGVyYXRpb25fcGVy
+bXMiOiB7fSwgIm9wZXJhdGlvbnMiOiBbXSwgInBsYWNlaG9sZGVyIjogIiIsICJwcmVmaXgiOiBu
+dWxsLCAicmVhZF9vbmx5IjogZmFsc2UsICJyaWNoX3RleHQiOiBmYWxzZSwgInRhZ3MiOiBbXSwg
+InRlbXBsYXRlcyI6IFtdLCAidGV4dCI6ICJpbmNpZGVudF9pZCIsICJ0b29sdGlwIjogIkluY2lk
+ZW50IHdob3NlIGFydGlmYWN0cyBhcmUgdXNlZCIsICJ0eXBlX2lkIjogMTEsICJ1dWlkIjogIjlj
+NmU3NTFkLTRjMTItNDE3ZC1hZTQ1LWU5NzJlZGQ1ZDNkNiIsICJ2YWx1ZXMiOiBbXX0sIHsiYWxs
+b3dfZGVmYXVsdF92YWx1ZSI6IGZhbHNlLCAiYmxhbmtfb3B0aW9uIjogZmFsc2UsICJjYWxjdWxh
+dGVkIjogZmFsc2UsICJjaGFuZ2VhYmxlIjogdHJ1ZSwgImNob3NlbiI6IGZhbHNlLCAiZGVmYXVs
+dF9jaG9zZW5fYnlfc2VydmVyIjogZmFsc2UsICJkZXByZWNhdGVkIjogZmFsc2UsICJleHBvcnRf
+a2V5IjogIl9fZnVuY3Rpb24vbWlzcF9zaWdodGluZ19zdW1tYXJ5IiwgImhpZGVfbm90aWZpY2F0
+aW9uIjogZmFsc2UsICJpZCI6IDIwOCwgImlucHV0X3R5cGUiOiAiYm9vbGVhbiIsICJpbnRlcm5h
+bCI6IGZhbHNlLCAiaXNfdHJhY2tlZCI6IGZhbHNlLCAibmFtZSI6ICJtaXNwX3NpZ2h0aW5nX3N1
+bW1hcnkiLCAib3BlcmF0aW9uX3Blcm1zIjoge30sICJvcGVyYXRpb25zIjogW10sICJwbGFjZWhv
+bGRlciI6ICIiLCAicHJlZml4IjogbnVsbCwgInJlYWRfb25seSI6IGZhbHNlLCAicmljaF90ZXh0
+IjogZmFsc2UsICJ0YWdzIjogW10sICJ0ZW1wbGF0ZXMiOiBbXSwgInRleHQiOiAibWlzcF9zaWdo
+dGluZ19zdW1tYXJ5IiwgInRvb2x0aXAiOiAiUmV0dXJuIHBlci1hdHRyaWJ1dGUgYWdncmVnYXRl
+cyBpbnN0ZWFkIG9mIHRoZSBzaWdodGluZ3MiLCAidHlwZV9pZCI6IDExLCAidXVpZCI6ICJjNzZm
+MWVmNy0yYmIyLTQxN2EtODdiNy0xY2UzYjhlOWU0YzgiLCAidmFsdWVzIjogW119LCB7ImFsbG93
+X2RlZmF1bHRfdmFsdWUiOiBmYWxzZSwgImJsYW5rX29wdGlvbiI6IGZhbHNlLCAiY2FsY3VsYXRl
+ZCI6IGZhbHNlLCAiY2hhbmdlYWJsZSI6IHRydWUsICJjaG9zZW4iOiBmYWxzZSwgImRlZmF1bHRf
+Y2hvc2VuX2J5X3NlcnZlciI6IGZhbHNlLCAiZGVwcmVjYXRlZCI6IGZhbHNlLCAiZXhwb3J0X2tl
+eSI6ICJfX2Z1bmN0aW9uL21pc3Bfc2lnaHRpbmdfcGFnZSIsICJoaWRlX25vdGlmaWNhdGlvbiI6
+IGZhbHNlLCAiaWQiOiAyMDksICJpbnB1dF90eXBlIjogIm51bWJlciIsICJpbnRlcm5hbCI6IGZh
+bHNlLCAiaXNfdHJhY2tlZCI6IGZhbHNlLCAibmFtZSI6ICJtaXNwX3NpZ2h0aW5nX3BhZ2UiLCAi
+b3BlcmF0aW9uX3Blcm1zIjoge30sICJvcGVyYXRpb25zIjogW10sICJwbGFjZWhvbGRlciI6ICIi
+LCAicHJlZml4IjogbnVsbCwgInJlYWRfb25seSI6IGZhbHNlLCAicmljaF90ZXh0IjogZmFsc2Us
+ICJ0YWdzIjogW10sICJ0ZW1wbGF0ZXMiOiBbXSwgInRleHQiOiAibWlzcF9zaWdodGluZ19wYWdl
+IiwgInRvb2x0aXAiOiAiT25seSByZXR1cm4gdGhpcyBwYWdlIG9mIHNpZ2h0aW5ncyIsICJ0eXBl
+X2lkIjogMTEsICJ1dWlkIjogImIwODE1M2Q4LWJiNDUtNDllNi05YzU3LTM5ZDgyNjk1ZDUyMCIs
+ICJ2YWx1ZXMiOiBbXX0sIHsiYWxsb3dfZGVmYXVsdF92YWx1ZSI6IGZhbHNlLCAiYmxhbmtfb3B0
+aW9uIjogZmFsc2UsICJjYWxjdWxhdGVkIjogZmFsc2UsICJjaGFuZ2VhYmxlIjogdHJ1ZSwgImNo
+b3NlbiI6IGZhbHNlLCAiZGVmYXVsdF9jaG9zZW5fYnlfc2VydmVyIjogZmFsc2UsICJkZXByZWNh
+dGVkIjogZmFsc2UsICJleHBvcnRfa2V5IjogIl9fZnVuY3Rpb24vbWlzcF9zaWdodGluZ19wYWdl
+X3NpemUiLCAiaGlkZV9ub3RpZmljYXRpb24iOiBmYWxzZSwgImlkIjogMjEwLCAiaW5wdXRfdHlw
+ZSI6ICJudW1iZXIiLCAiaW50ZXJuYWwiOiBmYWxzZSwgImlzX3RyYWNrZWQiOiBmYWxzZSwgIm5h
+bWUiOiAibWlzcF9zaWdodGluZ19wYWdlX3NpemUiLCAib3BlcmF0aW9uX3Blcm1zIjoge30sICJv
+cGVyYXRpb25zIjogW10sICJwbGFjZWhvbGRlciI6ICIiLCAicHJlZml4IjogbnVsbCwgInJlYWRf
+b25seSI6IGZhbHNlLCAicmljaF90ZXh0IjogZmFsc2UsICJ0YWdzIjogW10sICJ0ZW1wbGF0ZXMi
+OiBbXSwgInRleHQiOiAibWlzcF9zaWdodGluZ19wYWdlX3NpemUiLCAidG9vbHRpcCI6ICJTaWdo
+dGluZ3MgcGVyIHBhZ2UsIGRlZmF1bHQgMTAwMCIsICJ0eXBlX2lkIjogMTEsICJ1dWlkIjogIjk2
+NWM5NGU3LWRjZjYtNGUxZC05YTZlLWEzNTE3NWI0ZjM5OSIsICJ2YWx1ZXMiOiBbXX0sIHsiYWxs
+b3dfZGVmYXVsdF92YWx1ZSI6IGZhbHNlLCAiYmxhbmtfb3B0aW9uIjogZmFsc2UsICJjYWxjdWxh
+dGVkIjogZmFsc2UsICJjaGFuZ2VhYmxlIjogdHJ1ZSwgImNob3NlbiI6IGZhbHNlLCAiZGVmYXVs
+dF9jaG9zZW5fYnlfc2VydmVyIjogZmFsc2UsICJkZXByZWNhdGVkIjogZmFsc2UsICJleHBvcnRf
+a2V5IjogIl9fZnVuY3Rpb24vbWlzcF9zaWdodGluZ19idWNrZXQiLCAiaGlkZV9ub3RpZmljYXRp
+b24iOiBmYWxzZSwgImlkIjogMjExLCAiaW5wdXRfdHlwZSI6ICJudW1iZXIiLCAiaW50ZXJuYWwi
+OiBmYWxzZSwgImlzX3RyYWNrZWQiOiBmYWxzZSwgIm5hbWUiOiAibWlzcF9zaWdodGluZ19idWNr
+ZXQiLCAib3BlcmF0aW9uX3Blcm1zIjoge30sICJvcGVyYXRpb25zIjogW10sICJwbGFjZWhvbGRl
+ciI6ICIiLCAicHJlZml4IjogbnVsbCwgInJlYWRfb25seSI6IGZhbHNlLCAicmljaF90ZXh0Ijog
+ZmFsc2UsICJ0YWdzIjogW10sICJ0ZW1wbGF0ZXMiOiBbXSwgInRleHQiOiAibWlzcF9zaWdodGlu
+Z19idWNrZXQiLCAidG9vbHRpcCI6ICJXaXRoIG1pc3Bfc2lnaHRpbmdfc3VtbWFyeSwgYWRkIGEg
+aGlzdG9ncmFtIG9mIGJ1Y2tldHMgdGhpcyBtYW55IHNlY29uZHMgd2lkZSIsICJ0eXBlX2lkIjog
+MTEsICJ1dWlkIjogImVhYmNkZWEyLWQ1ZGEtNDE0ZS1hZmM3LTQwNzlkMjQ1ODU0ZSIsICJ2YWx1
+ZXMiOiBbXX1dLCAiZnVuY3Rpb25zIjogW3siY3JlYXRvciI6IHsiZGlzcGxheV9uYW1lIjogImlu
+dGVncmF0aW9ucyIsICJpZCI6IDQsICJuYW1lIjogImViMmQxZjdkLTY2NTEtNDE1YS1iNGZmLWEx
+NGZjZDJmODRmNSIsICJ0eXBlIjogImFwaWtleSJ9LCAiZGVzY3JpcHRpb24iOiB7ImZvcm1hdCI6
+ICJ0ZXh0IiwgImNvbnRlbnQiOiAiQ3JlYXRlIGEgTUlTUCBhdHRyaWJ1dGUgZnJvbSBhbiBpbmNp
+ZGVudCBhcnRpZmFjdCJ9LCAiZGVzdGluYXRpb25faGFuZGxlIjogImZuX21pc3AiLCAiZGlzcGxh
+eV9uYW1lIjogIk1JU1AgQ3JlYXRlIEF0dHJpYnV0ZSIsICJleHBvcnRfa2V5IjogIm1pc3BfY3Jl
+YXRlX2F0dHJpYnV0ZSIsICJpZCI6IDUsICJsYXN0X21vZGlmaWVkX2J5IjogeyJkaXNwbGF5X25h
+bWUiOiAiaW50ZWdyYXRpb25zIiwgImlkIjogNCwgIm5hbWUiOiAiZWIyZDFmN2QtNjY1MS00MTVh
+LWI0ZmYtYTE0ZmNkMmY4NGY1IiwgInR5cGUiOiAiYXBpa2V5In0sICJsYXN0X21vZGlmaWVkX3Rp
+bWUiOiAxNjAwNzg5MTIzNzc4LCAibmFtZSI6ICJtaXNwX2NyZWF0ZV9hdHRyaWJ1dGUiLCAidGFn
+cyI6IFtdLCAidXVpZCI6ICJmNWM0YWFlMi0xMzVlLTQxYWMtOGJiYy0wODJiMDA2NzdlY2IiLCAi
+dmVyc2lvbiI6IDIsICJ2aWV3X2l0ZW1zIjogW3siY29udGVudCI6ICIyMTc2MDAzMC04ZGRmLTQz
+ZGEtODRlOC01YjBjNjMzNjJiNDciLCAiZWxlbWVudCI6ICJmaWVsZF91dWlkIiwgImZpZWxkX3R5
+cGUiOiAiX19mdW5jdGlvbiIsICJzaG93X2lmIjogbnVsbCwgInNob3dfbGlua19oZWFkZXIiOiBm
+YWxzZSwgInN0ZXBfbGFiZWwiOiBudWxsfSwgeyJjb250ZW50IjogImJkZThlODNjLTA2MGQtNGM1
+YS05MjhkLWQ5OTlhOTdjZmRhMCIsICJlbGVtZW50IjogImZpZWxkX3V1aWQiLCAiZmllbGRfdHlw
+ZSI6ICJfX2Z1bmN0aW9uIiwgInNob3dfaWYiOiBudWxsLCAic2hvd19saW5rX2hlYWRlciI6IGZh
+bHNlLCAic3RlcF9sYWJlbCI6IG51bGx9LCB7ImNvbnRlbnQiOiAiZDk1N2MyYjAtNzVmZS00MWI3
+LWFjMDYtMWNlMGE3YTdiMjUxIiwgImVsZW1lbnQiOiAiZmllbGRfdXVpZCIsICJmaWVsZF90eXBl
+IjogIl9fZnVuY3Rpb24iLCAic2hvd19pZiI6IG51bGwsICJzaG93X2xpbmtfaGVhZGVyIjogZmFs
+c2UsICJzdGVwX2xhYmVsIjogbnVsbH1dLCAid29ya2Zsb3dzIjogW3siYWN0aW9ucyI6IFtdLCAi
+ZGVzY3JpcHRpb24iOiBudWxsLCAibmFtZSI6ICJFeGFtcGxlOiBNSVNQIENyZWF0ZSBBdHRyaWJ1
+dGUiLCAib2JqZWN0X3R5cGUiOiAiYXJ0aWZhY3QiLCAicHJvZ3JhbW1hdGljX25hbWUiOiAiZXhh
+bXBsZV9taXNwX2NyZWF0ZV9hdHRyaWJ1dGUiLCAidGFncyI6IFtdLCAidXVpZCI6IG51bGwsICJ3
+b3JrZmxvd19pZCI6IDd9XX0sIHsiY3JlYXRvciI6IHsiZGlzcGxheV9uYW1lIjogImludGVncmF0
+aW9ucyIsICJpZCI6IDQsICJuYW1lIjogImViMmQxZjdkLTY2NTEtNDE1YS1iNGZmLWExNGZjZDJm
+ODRmNSIsICJ0eXBlIjogImFwaWtleSJ9LCAiZGVzY3JpcHRpb24iOiB7ImZvcm1hdCI6ICJ0ZXh0
+IiwgImNvbnRlbnQiOiAiQ3JlYXRlIGEgTUlTUCBldmVudCBmcm9tIGFuIGluY2lkZW50In0sICJk
+ZXN0aW5hdGlvbl9oYW5kbGUiOiAiZm5fbWlzcCIsICJkaXNwbGF5X25hbWUiOiAiTUlTUCBDcmVh
+dGUgRXZlbnQiLCAiZXhwb3J0X2tleSI6ICJtaXNwX2NyZWF0ZV9ldmVudCIsICJpZCI6IDYsICJs
+YXN0X21vZGlmaWVkX2J5IjogeyJkaXNwbGF5X25hbWUiOiAiaW50ZWdyYXRpb25zIiwgImlkIjog
+NCwgIm5hbWUiOiAiZWIyZDFmN2QtNjY1MS00MTVhLWI0ZmYtYTE0ZmNkMmY4NGY1IiwgInR5cGUi
+OiAiYXBpa2V5In0sICJsYXN0X21vZGlmaWVkX3RpbWUiOiAxNjAwNzg5MTIzNzc4LCAibmFtZSI6
+ICJtaXNwX2NyZWF0ZV9ldmVudCIsICJ0YWdzIjogW10sICJ1dWlkIjogIjhmOWI3YzQ1LTlkNGUt
+NGQzNS04YmRkLWViMmUyOTIzNDEzYSIsICJ2ZXJzaW9uIjogMiwgInZpZXdfaXRlbXMiOiBbeyJj
+b250ZW50IjogImNjZTFhZDYxLTEzNjgtNGJiZC1iYTM2LTVhNzliZmRlYzg4YyIsICJlbGVtZW50
 IjogImZpZWxkX3V1aWQiLCAiZmllbGRfdHlwZSI6ICJfX2Z1bmN0aW9uIiwgInNob3dfaWYiOiBu
 dWxsLCAic2hvd19saW5rX2hlYWRlciI6IGZhbHNlLCAic3RlcF9sYWJlbCI6IG51bGx9LCB7ImNv
-bnRlbnQiOiAiNmZkYjg5NWYtZTY2Zi00N2U4LTk1OGMtM2M3MjI3MjE4ZjBkIiwgImVsZW1lbnQi
+bnRlbnQiOiAiMzQ3YjU1MDYtZjVhZS00NTk3LWE5MTgtZTM2ZTlmZGZiNzlhIiwgImVsZW1lbnQi
 OiAiZmllbGRfdXVpZCIsICJmaWVsZF90eXBlIjogIl9fZnVuY3Rpb24iLCAic2hvd19pZiI6IG51
 bGwsICJzaG93X2xpbmtfaGVhZGVyIjogZmFsc2UsICJzdGVwX2xhYmVsIjogbnVsbH0sIHsiY29u
-dGVudCI6ICJiZGU4ZTgzYy0wNjBkLTRjNWEtOTI4ZC1kOTk5YTk3Y2ZkYTAiLCAiZWxlbWVudCI6
+dGVudCI6ICIxZGNmNjQ4OC02ZTJkLTQwNjItYmI3NC0xNmJlNGJiNGZiZGQiLCAiZWxlbWVudCI6
 ICJmaWVsZF91dWlkIiwgImZpZWxkX3R5cGUiOiAiX19mdW5jdGlvbiIsICJzaG93X2lmIjogbnVs
 bCwgInNob3dfbGlua19oZWFkZXIiOiBmYWxzZSwgInN0ZXBfbGFiZWwiOiBudWxsfSwgeyJjb250
-ZW50IjogIjIxNzYwMDMwLThkZGYtNDNkYS04NGU4LTViMGM2MzM2MmI0NyIsICJlbGVtZW50Ijog
+ZW50IjogImE0OTI5NjkxLTEyZTYtNGMzNi1iMTUxLWJiODE1NzljOGE3NiIsICJlbGVtZW50Ijog
 ImZpZWxkX3V1aWQiLCAiZmllbGRfdHlwZSI6ICJfX2Z1bmN0aW9uIiwgInNob3dfaWYiOiBudWxs
 LCAic2hvd19saW5rX2hlYWRlciI6IGZhbHNlLCAic3RlcF9sYWJlbCI6IG51bGx9XSwgIndvcmtm
 bG93cyI6IFt7ImFjdGlvbnMiOiBbXSwgImRlc2NyaXB0aW9uIjogbnVsbCwgIm5hbWUiOiAiRXhh
-bXBsZTogTUlTUCBDcmVhdGUgVGFnIG9uIEF0dHJpYnV0ZSIsICJvYmplY3RfdHlwZSI6ICJhcnRp
-ZmFjdCIsICJwcm9ncmFtbWF0aWNfbmFtZSI6ICJleGFtcGxlX21pc3BfY3JlYXRlX3RhZ19vbl9h
-dHRyaWJ1dGUiLCAidGFncyI6IFtdLCAidXVpZCI6IG51bGwsICJ3b3JrZmxvd19pZCI6IDl9LCB7
-ImFjdGlvbnMiOiBbXSwgImRlc2NyaXB0aW9uIjogbnVsbCwgIm5hbWUiOiAiRXhhbXBsZTogTUlT
-UCBDcmVhdGUgVGFnIG9uIEV2ZW50IiwgIm9iamVjdF90eXBlIjogImluY2lkZW50IiwgInByb2dy
-YW1tYXRpY19uYW1lIjogImV4YW1wbGVfbWlzcF9jcmVhdGVfdGFnX29uX2V2ZW50IiwgInRhZ3Mi
-OiBbXSwgInV1aWQiOiBudWxsLCAid29ya2Zsb3dfaWQiOiAxMX1dfSwgeyJjcmVhdG9yIjogeyJk
+bXBsZTogTUlTUCBDcmVhdGUgRXZlbnQiLCAib2JqZWN0X3R5cGUiOiAiaW5jaWRlbnQiLCAicHJv
+Z3JhbW1hdGljX25hbWUiOiAiZXhhbXBsZV9taXNwX2NyZWF0ZV9ldmVudCIsICJ0YWdzIjogW10s
+ICJ1dWlkIjogbnVsbCwgIndvcmtmbG93X2lkIjogMTN9XX0sIHsiY3JlYXRvciI6IHsiZGlzcGxh
+eV9uYW1lIjogImludGVncmF0aW9ucyIsICJpZCI6IDQsICJuYW1lIjogImViMmQxZjdkLTY2NTEt
+NDE1YS1iNGZmLWExNGZjZDJmODRmNSIsICJ0eXBlIjogImFwaWtleSJ9LCAiZGVzY3JpcHRpb24i
+OiB7ImZvcm1hdCI6ICJ0ZXh0IiwgImNvbnRlbnQiOiAiQ3JlYXRlIGEgTUlTUCBzaWdodGluZyBm
+cm9tIGFuIGluY2lkZW50IGFydGlmYWN0In0sICJkZXN0aW5hdGlvbl9oYW5kbGUiOiAiZm5fbWlz
+cCIsICJkaXNwbGF5X25hbWUiOiAiTUlTUCBDcmVhdGUgU2lnaHRpbmciLCAiZXhwb3J0X2tleSI6
+ICJtaXNwX2NyZWF0ZV9zaWdodGluZyIsICJpZCI6IDcsICJsYXN0X21vZGlmaWVkX2J5IjogeyJk
 aXNwbGF5X25hbWUiOiAiaW50ZWdyYXRpb25zIiwgImlkIjogNCwgIm5hbWUiOiAiZWIyZDFmN2Qt
-NjY1MS00MTVhLWI0ZmYtYTE0ZmNkMmY4NGY1IiwgInR5cGUiOiAiYXBpa2V5In0sICJkZXNjcmlw
-dGlvbiI6IHsiZm9ybWF0IjogInRleHQiLCAiY29udGVudCI6ICJTZWFyY2ggTUlTUCBldmVudCBh
-dHRyaWJ1dGVzIGZvciBhIGdpdmVuIG1hdGNoIG9uIGFuIGFydGlmYWN0In0sICJkZXN0aW5hdGlv
-bl9oYW5kbGUiOiAiZm5fbWlzcCIsICJkaXNwbGF5X25hbWUiOiAiTUlTUCBTZWFyY2ggQXR0cmli
-dXRlIiwgImV4cG9ydF9rZXkiOiAibWlzcF9zZWFyY2hfYXR0cmlidXRlIiwgImlkIjogOSwgImxh
-c3RfbW9kaWZpZWRfYnkiOiB7ImRpc3BsYXlfbmFtZSI6ICJpbnRlZ3JhdGlvbnMiLCAiaWQiOiA0
-LCAibmFtZSI6ICJlYjJkMWY3ZC02NjUxLTQxNWEtYjRmZi1hMTRmY2QyZjg0ZjUiLCAidHlwZSI6
-ICJhcGlrZXkifSwgImxhc3RfbW9kaWZpZWRfdGltZSI6IDE2MDA3ODkxMjM3NzksICJuYW1lIjog
-Im1pc3Bfc2VhcmNoX2F0dHJpYnV0ZSIsICJ0YWdzIjogW10sICJ1dWlkIjogImMyNDhiYzdjLWI2
-MGYtNGQzNi05YTJlLTI5NGVlNzhhNTk4MSIsICJ2ZXJzaW9uIjogMiwgInZpZXdfaXRlbXMiOiBb
-eyJjb250ZW50IjogImJkZThlODNjLTA2MGQtNGM1YS05MjhkLWQ5OTlhOTdjZmRhMCIsICJlbGVt
-ZW50IjogImZpZWxkX3V1aWQiLCAiZmllbGRfdHlwZSI6ICJfX2Z1bmN0aW9uIiwgInNob3dfaWYi
-OiBudWxsLCAic2hvd19saW5rX2hlYWRlciI6IGZhbHNlLCAic3RlcF9sYWJlbCI6IG51bGx9XSwg
-IndvcmtmbG93cyI6IFt7ImFjdGlvbnMiOiBbXSwgImRlc2NyaXB0aW9uIjogbnVsbCwgIm5hbWUi
-OiAiRXhhbXBsZTogTUlTUCBTZWFyY2ggQXR0cmlidXRlIiwgIm9iamVjdF90eXBlIjogImFydGlm
-YWN0IiwgInByb2dyYW1tYXRpY19uYW1lIjogImV4YW1wbGVfbWlzcF9zZWFyY2hfYXR0cmlidXRl
-IiwgInRhZ3MiOiBbXSwgInV1aWQiOiBudWxsLCAid29ya2Zsb3dfaWQiOiA4fV19LCB7ImNyZWF0
-b3IiOiB7ImRpc3BsYXlfbmFtZSI6ICJpbnRlZ3JhdGlvbnMiLCAiaWQiOiA0LCAibmFtZSI6ICJl
-YjJkMWY3ZC02NjUxLTQxNWEtYjRmZi1hMTRmY2QyZjg0ZjUiLCAidHlwZSI6ICJhcGlrZXkifSwg
-ImRlc2NyaXB0aW9uIjogeyJmb3JtYXQiOiAidGV4dCIsICJjb250ZW50IjogIkxpc3QgYWxsIHNp
-Z2h0aW5ncyBhc3NvY2lhdGVkIHdpdGggYW4gZXZlbnQifSwgImRlc3RpbmF0aW9uX2hhbmRsZSI6
-ICJmbl9taXNwIiwgImRpc3BsYXlfbmFtZSI6ICJNSVNQIFNpZ2h0aW5nIExpc3QiLCAiZXhwb3J0
-X2tleSI6ICJtaXNwX3NpZ2h0aW5nX2xpc3QiLCAiaWQiOiAxMCwgImxhc3RfbW9kaWZpZWRfYnki
-OiB7ImRpc3BsYXlfbmFtZSI6ICJpbnRlZ3JhdGlvbnMiLCAiaWQiOiA0LCAibmFtZSI6ICJlYjJk
-MWY3ZC02NjUxLTQxNWEtYjRmZi1hMTRmY2QyZjg0ZjUiLCAidHlwZSI6ICJhcGlrZXkifSwgImxh
-c3RfbW9kaWZpZWRfdGltZSI6IDE2MDA3ODkxMjM3NzksICJuYW1lIjogIm1pc3Bfc2lnaHRpbmdf
-bGlzdCIsICJ0YWdzIjogW10sICJ1dWlkIjogIjhiNTMxODI3LTc0MWQtNDBlOC05MGE1LTFlYzk5
-Y2IxNzEwZCIsICJ2ZXJzaW9uIjogMiwgInZpZXdfaXRlbXMiOiBbeyJjb250ZW50IjogIjIxNzYw
-MDMwLThkZGYtNDNkYS04NGU4LTViMGM2MzM2MmI0NyIsICJlbGVtZW50IjogImZpZWxkX3V1aWQi
-LCAiZmllbGRfdHlwZSI6ICJfX2Z1bmN0aW9uIiwgInNob3dfaWYiOiBudWxsLCAic2hvd19saW5r
-X2hlYWRlciI6IGZhbHNlLCAic3RlcF9sYWJlbCI6IG51bGx9XSwgIndvcmtmbG93cyI6IFt7ImFj
-dGlvbnMiOiBbXSwgImRlc2NyaXB0aW9uIjogbnVsbCwgIm5hbWUiOiAiRXhhbXBsZTogTUlTUCBT
-aWdodGluZyBMaXN0IiwgIm9iamVjdF90eXBlIjogImluY2lkZW50IiwgInByb2dyYW1tYXRpY19u
-YW1lIjogImV4YW1wbGVfbWlzcF9zaWdodGluZ19saXN0IiwgInRhZ3MiOiBbXSwgInV1aWQiOiBu
-dWxsLCAid29ya2Zsb3dfaWQiOiAxMn1dfV0sICJnZW9zIjogbnVsbCwgImdyb3VwcyI6IG51bGws
-ICJpZCI6IDUsICJpbmJvdW5kX21haWxib3hlcyI6IG51bGwsICJpbmNpZGVudF9hcnRpZmFjdF90
-eXBlcyI6IFtdLCAiaW5jaWRlbnRfdHlwZXMiOiBbeyJ1cGRhdGVfZGF0ZSI6IDE2MDA3OTY1NTU3
-NTIsICJjcmVhdGVfZGF0ZSI6IDE2MDA3OTY1NTU3NTIsICJ1dWlkIjogImJmZWVjMmQ0LTM3NzAt
-MTFlOC1hZDM5LTRhMDAwNDA0NGFhMCIsICJkZXNjcmlwdGlvbiI6ICJDdXN0b21pemF0aW9uIFBh
-Y2thZ2VzIChpbnRlcm5hbCkiLCAiZXhwb3J0X2tleSI6ICJDdXN0b21pemF0aW9uIFBhY2thZ2Vz
-IChpbnRlcm5hbCkiLCAibmFtZSI6ICJDdXN0b21pemF0aW9uIFBhY2thZ2VzIChpbnRlcm5hbCki
-LCAiZW5hYmxlZCI6IGZhbHNlLCAic3lzdGVtIjogZmFsc2UsICJwYXJlbnRfaWQiOiBudWxsLCAi
-aGlkZGVuIjogZmFsc2UsICJpZCI6IDB9XSwgImluZHVzdHJpZXMiOiBudWxsLCAibGF5b3V0cyI6
-IFtdLCAibG9jYWxlIjogbnVsbCwgIm1lc3NhZ2VfZGVzdGluYXRpb25zIjogW3siYXBpX2tleXMi
-OiBbImViMmQxZjdkLTY2NTEtNDE1YS1iNGZmLWExNGZjZDJmODRmNSJdLCAiZGVzdGluYXRpb25f
-dHlwZSI6IDAsICJleHBlY3RfYWNrIjogdHJ1ZSwgImV4cG9ydF9rZXkiOiAiZm5fbWlzcCIsICJu
-YW1lIjogImZuX21pc3AiLCAicHJvZ3JhbW1hdGljX25hbWUiOiAiZm5fbWlzcCIsICJ0YWdzIjog
-W10sICJ1c2VycyI6IFtdLCAidXVpZCI6ICI0ZDgzY2E4Ni0zOTkzLTQyNzEtYWI4Yi03NjMyZTk2
-YzFlZTEifV0sICJub3RpZmljYXRpb25zIjogbnVsbCwgIm92ZXJyaWRlcyI6IFtdLCAicGhhc2Vz
-IjogW10sICJyZWd1bGF0b3JzIjogbnVsbCwgInJvbGVzIjogW10sICJzY3JpcHRzIjogW10sICJz
-ZXJ2ZXJfdmVyc2lvbiI6IHsiYnVpbGRfbnVtYmVyIjogMzIsICJtYWpvciI6IDM1LCAibWlub3Ii
-OiAyLCAidmVyc2lvbiI6ICIzNS4yLjMyIn0sICJ0YWdzIjogW10sICJ0YXNrX29yZGVyIjogW10s
-ICJ0aW1lZnJhbWVzIjogbnVsbCwgInR5cGVzIjogW10sICJ3b3JrZmxvd3MiOiBbeyJhY3Rpb25z
-IjogW10sICJjb250ZW50IjogeyJ2ZXJzaW9uIjogMiwgIndvcmtmbG93X2lkIjogImV4YW1wbGVf
-bWlzcF9jcmVhdGVfYXR0cmlidXRlIiwgInhtbCI6ICI8P3htbCB2ZXJzaW9uPVwiMS4wXCIgZW5j
-b2Rpbmc9XCJVVEYtOFwiPz48ZGVmaW5pdGlvbnMgeG1sbnM9XCJodHRwOi8vd3d3Lm9tZy5vcmcv
-c3BlYy9CUE1OLzIwMTAwNTI0L01PREVMXCIgeG1sbnM6YnBtbmRpPVwiaHR0cDovL3d3dy5vbWcu
-b3JnL3NwZWMvQlBNTi8yMDEwMDUyNC9ESVwiIHhtbG5zOm9tZ2RjPVwiaHR0cDovL3d3dy5vbWcu
-b3JnL3NwZWMvREQvMjAxMDA1MjQvRENcIiB4bWxuczpvbWdkaT1cImh0dHA6Ly93d3cub21nLm9y
-Zy9zcGVjL0RELzIwMTAwNTI0L0RJXCIgeG1sbnM6cmVzaWxpZW50PVwiaHR0cDovL3Jlc2lsaWVu
-dC5pYm0uY29tL2JwbW5cIiB4bWxuczp4c2Q9XCJodHRwOi8vd3d3LnczLm9yZy8yMDAxL1hNTFNj
-aGVtYVwiIHhtbG5zOnhzaT1cImh0dHA6Ly93d3cudzMub3JnLzIwMDEvWE1MU2NoZW1hLWluc3Rh
-bmNlXCIgdGFyZ2V0TmFtZXNwYWNlPVwiaHR0cDovL3d3dy5jYW11bmRhLm9yZy90ZXN0XCI+PHBy
-b2Nlc3MgaWQ9XCJleGFtcGxlX21pc3BfY3JlYXRlX2F0dHJpYnV0ZVwiIGlzRXhlY3V0YWJsZT1c
-InRydWVcIiBuYW1lPVwiRXhhbXBsZTogTUlTUCBDcmVhdGUgQXR0cmlidXRlXCI+PGRvY3VtZW50
-YXRpb24+Q3JlYXRlIGFuIE1JU1AgZXZlbnQgYXR0cmlidXRlIGJhc2VkIG9uIGFuIGFydGlmYWN0
-IHZhbHVlLiBUaGlzIG9ubHkgd29ya3Mgb24gaW5jaWRlbnRzIGFscmVhZHkgc3VibWl0dGVkIHRv
-IE1JU1AuPC9kb2N1bWVudGF0aW9uPjxzdGFydEV2ZW50IGlkPVwiU3RhcnRFdmVudF8xNTVhc3ht
-XCI+PG91dGdvaW5nPlNlcXVlbmNlRmxvd18wZ2c3aDZ0PC9vdXRnb2luZz48L3N0YXJ0RXZlbnQ+
-PHNlcnZpY2VUYXNrIGlkPVwiU2VydmljZVRhc2tfMHZndmJsMlwiIG5hbWU9XCJNSVNQIENyZWF0
-ZSBBdHRyaWJ1dGVcIiByZXNpbGllbnQ6dHlwZT1cImZ1bmN0aW9uXCI+PGV4dGVuc2lvbkVsZW1l
-bnRzPjxyZXNpbGllbnQ6ZnVuY3Rpb24gdXVpZD1cImY1YzRhYWUyLTEzNWUtNDFhYy04YmJjLTA4
-MmIwMDY3N2VjYlwiPntcImlucHV0c1wiOnt9LFwicG9zdF9wcm9jZXNzaW5nX3NjcmlwdFwiOlwi
-IyBSZXN1bHQ6IHsnc3VjY2Vzcyc6IFRydWUsICdjb250ZW50JzogW3snQXR0cmlidXRlJzogeydp
-ZCc6ICczJywgJ2V2ZW50X2lkJzogJzMnLCAnb2JqZWN0X2lkJzogJzAnLCAnb2JqZWN0X3JlbGF0
-aW9uJzogTm9uZSwgJ2NhdGVnb3J5JzogJ05ldHdvcmsgYWN0aXZpdHknLCAndHlwZSc6ICdpcC1k
-c3QnLCAndmFsdWUxJzogJzguOC44LjgnLCAndmFsdWUyJzogJycsICd0b19pZHMnOiBGYWxzZSwg
-J3V1aWQnOiAnNjY2YTY4OTAtZmRkZC00YTVkLWE0NzQtMjJjODVjNmExY2U1JywgJ3RpbWVzdGFt
-cCc6ICcxNTUzMzUyNzgxJywgJ2Rpc3RyaWJ1dGlvbic6ICc1JywgJ3NoYXJpbmdfZ3JvdXBfaWQn
-OiAnMCcsICdjb21tZW50JzogJycsICdkZWxldGVkJzogRmFsc2UsICdkaXNhYmxlX2NvcnJlbGF0
-aW9uJzogRmFsc2UsICd2YWx1ZSc6ICc4LjguOC44J319XX1cXG4jIFJlc3VsdDogeydzdWNjZXNz
-JzogVHJ1ZSwgJ2NvbnRlbnQnOiBbeyduYW1lJzogJ0NvdWxkIG5vdCBhZGQgQXR0cmlidXRlJywg
-J21lc3NhZ2UnOiAnQ291bGQgbm90IGFkZCBBdHRyaWJ1dGUnLCAndXJsJzogJy9hdHRyaWJ1dGVz
-L2FkZCcsICdlcnJvcnMnOiB7J3ZhbHVlJzogWydBIHNpbWlsYXIgYXR0cmlidXRlIGFscmVhZHkg
-ZXhpc3RzIGZvciB0aGlzIGV2ZW50LiddfX1dfVxcbmV4aXN0aW5nX2Rlc2NyaXB0aW9uID0gYXJ0
-aWZhY3QuZGVzY3JpcHRpb24uY29udGVudCsnXFxcXG4nIGlmIGFydGlmYWN0LmRlc2NyaXB0aW9u
-IGVsc2UgXFxcIlxcXCJcXG5cXG5pZiByZXN1bHRzLmNvbnRlbnRbMF0uZ2V0KCdlcnJvcnMnKTpc
-XG4gIGFydGlmYWN0LmRlc2NyaXB0aW9uID0gdVxcXCJ7fU1JU1AgQXR0cmlidXRlIGZhaWx1cmU6
-IHt9XFxcIi5mb3JtYXQoZXhpc3RpbmdfZGVzY3JpcHRpb24sIHJlc3VsdHMuY29udGVudFswXVsn
-ZXJyb3JzJ11bJ3ZhbHVlJ10pXFxuZWxzZTpcXG4gIGFydGlmYWN0LmRlc2NyaXB0aW9uID0gdVxc
-XCJ7fU1JU1AgQXR0cmlidXRlIGNyZWF0ZWQ6IHt9XFxcIi5mb3JtYXQoZXhpc3RpbmdfZGVzY3Jp
-cHRpb24sIHJlc3VsdHMuY29udGVudFswXVsnQXR0cmlidXRlJ11bJ2NhdGVnb3J5J10pXCIsXCJw
-cmVfcHJvY2Vzc2luZ19zY3JpcHRcIjpcImlucHV0cy5taXNwX2F0dHJpYnV0ZV92YWx1ZSA9IGFy
-dGlmYWN0LnZhbHVlXFxuaW5wdXRzLm1pc3BfZXZlbnRfaWQgPSBpbmNpZGVudC5wcm9wZXJ0aWVz
-Lm1pc3BfZXZlbnRfaWRcXG5cXG5cXG5yZXNpbGllbnRfdG9fbWlzcF9tYXAgPSB7IFxcbiAgICBc
-XFwiRE5TIE5hbWVcXFwiOiBcXFwiZG9tYWluXFxcIixcXG4gICAgXFxcIkVtYWlsIEF0dGFjaG1l
-bnRcXFwiOiBcXFwiZW1haWwtYXR0YWNobWVudFxcXCIsXFxuICAgIFxcXCJFbWFpbCBCb2R5XFxc
-IjogXFxcImVtYWlsLWJvZHlcXFwiLFxcbiAgICBcXFwiRW1haWwgUmVjaXBpZW50XFxcIjogXFxc
-ImVtYWlsLWRzdFxcXCIsXFxuICAgIFxcXCJFbWFpbCBTZW5kZXJcXFwiOiBcXFwiZW1haWwtc3Jj
-XFxcIixcXG4gICAgXFxcIkVtYWlsIHN1YmplY3RcXFwiOiBcXFwiZW1haWwtc3ViamVjdFxcXCIs
-XFxuICAgIFxcXCJGaWxlIE5hbWVcXFwiOiBcXFwiZmlsZW5hbWVcXFwiLFxcbiAgICBcXFwiRE5T
-IE5hbWVcXFwiOiBcXFwiaG9zdG5hbWVcXFwiLFxcbiAgICBcXFwiTUFDIEFkZHJlc3NcXFwiOiBc
-XFwibWFjLWFkZHJlc3NcXFwiLFxcbiAgICBcXFwiTWFsd2FyZSBNRDUgSGFzaFxcXCI6IFxcXCJt
-ZDVcXFwiLFxcbiAgICBcXFwiUG9ydFxcXCI6IFxcXCJwb3J0XFxcIixcXG4gICAgXFxcIk1hbHdh
-cmUgU0hBLTEgSGFzaFxcXCI6IFxcXCJzaGExXFxcIixcXG4gICAgXFxcIk1hbHdhcmUgU0hBLTI1
-NiBIYXNoXFxcIjogXFxcInNoYTI1NlxcXCIsXFxuICAgIFxcXCJVUkkgUGF0aFxcXCI6IFxcXCJ1
-cmlcXFwiLFxcbiAgICBcXFwiVVJMXFxcIjogXFxcInVybFxcXCIsXFxuICAgIFxcXCJUaHJlYXQg
-Q1ZFIElEXFxcIjogXFxcInZ1bG5lcmFiaWxpdHlcXFwiLFxcbiAgICBcXFwiSVAgQWRkcmVzc1xc
-XCI6IFxcXCJpcC1kc3RcXFwiXFxufVxcblxcbnRyeTpcXG4gIG1pc3BfdHlwZSA9IHJlc2lsaWVu
-dF90b19taXNwX21hcFthcnRpZmFjdC50eXBlXVxcbiAgaW5wdXRzLm1pc3BfYXR0cmlidXRlX3R5
-cGUgPSBtaXNwX3R5cGVcXG5leGNlcHQgRXhjZXB0aW9uLCBlOlxcbiAgaGVscGVyLmZhaWwodVxc
-XCJZb3UgZG8gbm90IGhhdmUgdGhpcyBhcnRpZmFjdCB0eXBlIHt9IG1hcHBlZCB0byBhIHR5cGUg
-aW4gTUlTUCAtIEFzayB5b3VyIEFkbWluXFxcIi5mb3JtYXQoYXJ0aWZhY3QudmFsdWUpKVxcbiAg
-cmFpc2UgZSBcXG5cXG5cIn08L3Jlc2lsaWVudDpmdW5jdGlvbj48L2V4dGVuc2lvbkVsZW1lbnRz
-PjxpbmNvbWluZz5TZXF1ZW5jZUZsb3dfMGdnN2g2dDwvaW5jb21pbmc+PG91dGdvaW5nPlNlcXVl
-bmNlRmxvd18xN290MWFqPC9vdXRnb2luZz48L3NlcnZpY2VUYXNrPjxzZXF1ZW5jZUZsb3cgaWQ9
-XCJTZXF1ZW5jZUZsb3dfMGdnN2g2dFwiIHNvdXJjZVJlZj1cIlN0YXJ0RXZlbnRfMTU1YXN4bVwi
-IHRhcmdldFJlZj1cIlNlcnZpY2VUYXNrXzB2Z3ZibDJcIi8+PGVuZEV2ZW50IGlkPVwiRW5kRXZl
-bnRfMHdkaWNuZVwiPjxpbmNvbWluZz5TZXF1ZW5jZUZsb3dfMTdvdDFhajwvaW5jb21pbmc+PC9l
-bmRFdmVudD48c2VxdWVuY2VGbG93IGlkPVwiU2VxdWVuY2VGbG93XzE3b3QxYWpcIiBzb3VyY2VS
-ZWY9XCJTZXJ2aWNlVGFza18wdmd2YmwyXCIgdGFyZ2V0UmVmPVwiRW5kRXZlbnRfMHdkaWNuZVwi
-Lz48dGV4dEFubm90YXRpb24gaWQ9XCJUZXh0QW5ub3RhdGlvbl8wb2t1ZjN2XCI+PHRleHQ+VXBk
-YXRlcyB0aGUgYXJ0aWZhY3QgZGVzY3JpcHRpb24gd2l0aCByZXN1bHRzIG9mIHRoZSBvcGVyYXRp
-b248L3RleHQ+PC90ZXh0QW5ub3RhdGlvbj48YXNzb2NpYXRpb24gaWQ9XCJBc3NvY2lhdGlvbl8x
-MndsOXJpXCIgc291cmNlUmVmPVwiU2VydmljZVRhc2tfMHZndmJsMlwiIHRhcmdldFJlZj1cIlRl
-eHRBbm5vdGF0aW9uXzBva3VmM3ZcIi8+PC9wcm9jZXNzPjxicG1uZGk6QlBNTkRpYWdyYW0gaWQ9
-XCJCUE1ORGlhZ3JhbV8xXCI+PGJwbW5kaTpCUE1OUGxhbmUgYnBtbkVsZW1lbnQ9XCJ1bmRlZmlu
-ZWRcIiBpZD1cIkJQTU5QbGFuZV8xXCI+PGJwbW5kaTpCUE1OU2hhcGUgYnBtbkVsZW1lbnQ9XCJT
-dGFydEV2ZW50XzE1NWFzeG1cIiBpZD1cIlN0YXJ0RXZlbnRfMTU1YXN4bV9kaVwiPjxvbWdkYzpC
-b3VuZHMgaGVpZ2h0PVwiMzZcIiB3aWR0aD1cIjM2XCIgeD1cIjE2MlwiIHk9XCIxODhcIi8+PGJw
-bW5kaTpCUE1OTGFiZWw+PG9tZ2RjOkJvdW5kcyBoZWlnaHQ9XCIwXCIgd2lkdGg9XCI5MFwiIHg9
-XCIxNTdcIiB5PVwiMjIzXCIvPjwvYnBtbmRpOkJQTU5MYWJlbD48L2JwbW5kaTpCUE1OU2hhcGU+
-PGJwbW5kaTpCUE1OU2hhcGUgYnBtbkVsZW1lbnQ9XCJTZXJ2aWNlVGFza18wdmd2YmwyXCIgaWQ9
-XCJTZXJ2aWNlVGFza18wdmd2YmwyX2RpXCI+PG9tZ2RjOkJvdW5kcyBoZWlnaHQ9XCI4MFwiIHdp
-ZHRoPVwiMTAwXCIgeD1cIjI3NVwiIHk9XCIxNjZcIi8+PC9icG1uZGk6QlBNTlNoYXBlPjxicG1u
-ZGk6QlBNTkVkZ2UgYnBtbkVsZW1lbnQ9XCJTZXF1ZW5jZUZsb3dfMGdnN2g2dFwiIGlkPVwiU2Vx
-dWVuY2VGbG93XzBnZzdoNnRfZGlcIj48b21nZGk6d2F5cG9pbnQgeD1cIjE5OFwiIHhzaTp0eXBl
-PVwib21nZGM6UG9pbnRcIiB5PVwiMjA2XCIvPjxvbWdkaTp3YXlwb2ludCB4PVwiMjc1XCIgeHNp
-OnR5cGU9XCJvbWdkYzpQb2ludFwiIHk9XCIyMDZcIi8+PGJwbW5kaTpCUE1OTGFiZWw+PG9tZ2Rj
-OkJvdW5kcyBoZWlnaHQ9XCIxM1wiIHdpZHRoPVwiMFwiIHg9XCIyMzYuNVwiIHk9XCIxODRcIi8+
-PC9icG1uZGk6QlBNTkxhYmVsPjwvYnBtbmRpOkJQTU5FZGdlPjxicG1uZGk6QlBNTlNoYXBlIGJw
-bW5FbGVtZW50PVwiRW5kRXZlbnRfMHdkaWNuZVwiIGlkPVwiRW5kRXZlbnRfMHdkaWNuZV9kaVwi
-PjxvbWdkYzpCb3VuZHMgaGVpZ2h0PVwiMzZcIiB3aWR0aD1cIjM2XCIgeD1cIjQyOVwiIHk9XCIx
-ODhcIi8+PGJwbW5kaTpCUE1OTGFiZWw+PG9tZ2RjOkJvdW5kcyBoZWlnaHQ9XCIxM1wiIHdpZHRo
-PVwiMFwiIHg9XCI0NDdcIiB5PVwiMjI3XCIvPjwvYnBtbmRpOkJQTU5MYWJlbD48L2JwbW5kaTpC
-UE1OU2hhcGU+PGJwbW5kaTpCUE1ORWRnZSBicG1uRWxlbWVudD1cIlNlcXVlbmNlRmxvd18xN290
-MWFqXCIgaWQ9XCJTZXF1ZW5jZUZsb3dfMTdvdDFhal9kaVwiPjxvbWdkaTp3YXlwb2ludCB4PVwi
-Mzc1XCIgeHNpOnR5cGU9XCJvbWdkYzpQb2ludFwiIHk9XCIyMDZcIi8+PG9tZ2RpOndheXBvaW50
-IHg9XCI0MjlcIiB4c2k6dHlwZT1cIm9tZ2RjOlBvaW50XCIgeT1cIjIwNlwiLz48YnBtbmRpOkJQ
-TU5MYWJlbD48b21nZGM6Qm91bmRzIGhlaWdodD1cIjEzXCIgd2lkdGg9XCIwXCIgeD1cIjQwMlwi
-IHk9XCIxODRcIi8+PC9icG1uZGk6QlBNTkxhYmVsPjwvYnBtbmRpOkJQTU5FZGdlPjxicG1uZGk6
-QlBNTlNoYXBlIGJwbW5FbGVtZW50PVwiVGV4dEFubm90YXRpb25fMG9rdWYzdlwiIGlkPVwiVGV4
-dEFubm90YXRpb25fMG9rdWYzdl9kaVwiPjxvbWdkYzpCb3VuZHMgaGVpZ2h0PVwiNjdcIiB3aWR0
-aD1cIjI3MFwiIHg9XCIzNTZcIiB5PVwiODNcIi8+PC9icG1uZGk6QlBNTlNoYXBlPjxicG1uZGk6
-QlBNTkVkZ2UgYnBtbkVsZW1lbnQ9XCJBc3NvY2lhdGlvbl8xMndsOXJpXCIgaWQ9XCJBc3NvY2lh
-dGlvbl8xMndsOXJpX2RpXCI+PG9tZ2RpOndheXBvaW50IHg9XCIzNzVcIiB4c2k6dHlwZT1cIm9t
-Z2RjOlBvaW50XCIgeT1cIjE3OVwiLz48b21nZGk6d2F5cG9pbnQgeD1cIjQyOVwiIHhzaTp0eXBl
-PVwib21nZGM6UG9pbnRcIiB5PVwiMTUwXCIvPjwvYnBtbmRpOkJQTU5FZGdlPjwvYnBtbmRpOkJQ
-TU5QbGFuZT48L2JwbW5kaTpCUE1ORGlhZ3JhbT48L2RlZmluaXRpb25zPiJ9LCAiY29udGVudF92
-ZXJzaW9uIjogMiwgImNyZWF0b3JfaWQiOiAiZWIyZDFmN2QtNjY1MS00MTVhLWI0ZmYtYTE0ZmNk
-MmY4NGY1IiwgImRlc2NyaXB0aW9uIjogIkNyZWF0ZSBhbiBNSVNQIGV2ZW50IGF0dHJpYnV0ZSBi
-YXNlZCBvbiBhbiBhcnRpZmFjdCB2YWx1ZS4gVGhpcyBvbmx5IHdvcmtzIG9uIGluY2lkZW50cyBh
-bHJlYWR5IHN1Ym1pdHRlZCB0byBNSVNQLiIsICJleHBvcnRfa2V5IjogImV4YW1wbGVfbWlzcF9j
-cmVhdGVfYXR0cmlidXRlIiwgImxhc3RfbW9kaWZpZWRfYnkiOiAiZWIyZDFmN2QtNjY1MS00MTVh
-LWI0ZmYtYTE0ZmNkMmY4NGY1IiwgImxhc3RfbW9kaWZpZWRfdGltZSI6IDE2MDA3ODkxMjQxMjAs
-ICJuYW1lIjogIkV4YW1wbGU6IE1JU1AgQ3JlYXRlIEF0dHJpYnV0ZSIsICJvYmplY3RfdHlwZSI6
-ICJhcnRpZmFjdCIsICJwcm9ncmFtbWF0aWNfbmFtZSI6ICJleGFtcGxlX21pc3BfY3JlYXRlX2F0
-dHJpYnV0ZSIsICJ0YWdzIjogW10sICJ1dWlkIjogIjFlZmIwNDQyLWI0ODYtNGNiMi1hM2NjLTVm
-MmU1ZmI4M2FhNCIsICJ3b3JrZmxvd19pZCI6IDd9LCB7ImFjdGlvbnMiOiBbXSwgImNvbnRlbnQi
-OiB7InZlcnNpb24iOiAyLCAid29ya2Zsb3dfaWQiOiAiZXhhbXBsZV9taXNwX2NyZWF0ZV9zaWdo
-dGluZyIsICJ4bWwiOiAiPD94bWwgdmVyc2lvbj1cIjEuMFwiIGVuY29kaW5nPVwiVVRGLThcIj8+
+NjY1MS00MTVhLWI0ZmYtYTE0ZmNkMmY4NGY1IiwgInR5cGUiOiAiYXBpa2V5In0sICJsYXN0X21v
+ZGlmaWVkX3RpbWUiOiAxNjAwNzg5MTIzNzc4LCAibmFtZSI6ICJtaXNwX2NyZWF0ZV9zaWdodGlu
+ZyIsICJ0YWdzIjogW10sICJ1dWlkIjogImU5ZGY3OTJiLWEzYWYtNGQ2Ny1hZTkwLWU0OGFhYmNh
+MTM4YyIsICJ2ZXJzaW9uIjogMiwgInZpZXdfaXRlbXMiOiBbeyJjb250ZW50IjogIjJlOWE4ZDJi
+LTlmZDEtNGE0Mi1hNjFlLTQ1Y2U4MjEzZmViNyIsICJlbGVtZW50IjogImZpZWxkX3V1aWQiLCAi
+ZmllbGRfdHlwZSI6ICJfX2Z1bmN0aW9uIiwgInNob3dfaWYiOiBudWxsLCAic2hvd19saW5rX2hl
+YWRlciI6IGZhbHNlLCAic3RlcF9sYWJlbCI6IG51bGx9XSwgIndvcmtmbG93cyI6IFt7ImFjdGlv
+bnMiOiBbXSwgImRlc2NyaXB0aW9uIjogbnVsbCwgIm5hbWUiOiAiRXhhbXBsZTogTUlTUCBDcmVh
+dGUgU2lnaHRpbmciLCAib2JqZWN0X3R5cGUiOiAiYXJ0aWZhY3QiLCAicHJvZ3JhbW1hdGljX25h
+bWUiOiAiZXhhbXBsZV9taXNwX2NyZWF0ZV9zaWdodGluZyIsICJ0YWdzIjogW10sICJ1dWlkIjog
+bnVsbCwgIndvcmtmbG93X2lkIjogMTB9XX0sIHsiY3JlYXRvciI6IHsiZGlzcGxheV9uYW1lIjog
+ImludGVncmF0aW9ucyIsICJpZCI6IDQsICJuYW1lIjogImViMmQxZjdkLTY2NTEtNDE1YS1iNGZm
+LWExNGZjZDJmODRmNSIsICJ0eXBlIjogImFwaWtleSJ9LCAiZGVzY3JpcHRpb24iOiB7ImNvbnRl
+bnQiOiAiU2lnaHQgYWxsIGFydGlmYWN0cyBvZiBhbiBpbmNpZGVudCB0aGF0IGhhdmUgYSBNSVNQ
+IGF0dHJpYnV0ZSIsICJmb3JtYXQiOiAidGV4dCJ9LCAiZGVzdGluYXRpb25faGFuZGxlIjogImZu
+X21pc3AiLCAiZGlzcGxheV9uYW1lIjogIk1JU1AgQ3JlYXRlIFNpZ2h0aW5ncyBCdWxrIiwgImV4
+cG9ydF9rZXkiOiAibWlzcF9jcmVhdGVfc2lnaHRpbmdzX2J1bGsiLCAiaWQiOiAxMiwgImxhc3Rf
+bW9kaWZpZWRfYnkiOiB7ImRpc3BsYXlfbmFtZSI6ICJpbnRlZ3JhdGlvbnMiLCAiaWQiOiA0LCAi
+bmFtZSI6ICJlYjJkMWY3ZC02NjUxLTQxNWEtYjRmZi1hMTRmY2QyZjg0ZjUiLCAidHlwZSI6ICJh
+cGlrZXkifSwgImxhc3RfbW9kaWZpZWRfdGltZSI6IDE2MDA3ODkxMjM3NzksICJuYW1lIjogIm1p
+c3BfY3JlYXRlX3NpZ2h0aW5nc19idWxrIiwgInRhZ3MiOiBbXSwgInV1aWQiOiAiOWJkODcwMmUt
+ZjRhYy00MmU3LWI3MDEtYTc0YjIyYjllMTI4IiwgInZlcnNpb24iOiAxLCAidmlld19pdGVtcyI6
+IFt7ImNvbnRlbnQiOiAiOWM2ZTc1MWQtNGMxMi00MTdkLWFlNDUtZTk3MmVkZDVkM2Q2IiwgImVs
+ZW1lbnQiOiAiZmllbGRfdXVpZCIsICJmaWVsZF90eXBlIjogIl9fZnVuY3Rpb24iLCAic2hvd19p
+ZiI6IG51bGwsICJzaG93X2xpbmtfaGVhZGVyIjogZmFsc2UsICJzdGVwX2xhYmVsIjogbnVsbH1d
+LCAid29ya2Zsb3dzIjogW119LCB7ImNyZWF0b3IiOiB7ImRpc3BsYXlfbmFtZSI6ICJpbnRlZ3Jh
+dGlvbnMiLCAiaWQiOiA0LCAibmFtZSI6ICJlYjJkMWY3ZC02NjUxLTQxNWEtYjRmZi1hMTRmY2Qy
+Zjg0ZjUiLCAidHlwZSI6ICJhcGlrZXkifSwgImRlc2NyaXB0aW9uIjogeyJmb3JtYXQiOiAidGV4
+dCIsICJjb250ZW50IjogIkNyZWF0ZXMgYSBUYWcifSwgImRlc3RpbmF0aW9uX2hhbmRsZSI6ICJm
+bl9taXNwIiwgImRpc3BsYXlfbmFtZSI6ICJNSVNQIENyZWF0ZSBUYWciLCAiZXhwb3J0X2tleSI6
+ICJtaXNwX2NyZWF0ZV90YWciLCAiaWQiOiA4LCAibGFzdF9tb2RpZmllZF9ieSI6IHsiZGlzcGxh
+eV9uYW1lIjogImludGVncmF0aW9ucyIsICJpZCI6IDQsICJuYW1lIjogImViMmQxZjdkLTY2NTEt
+NDE1YS1iNGZmLWExNGZjZDJmODRmNSIsICJ0eXBlIjogImFwaWtleSJ9LCAibGFzdF9tb2RpZmll
+ZF90aW1lIjogMTYwMDc4OTEyMzc3OCwgIm5hbWUiOiAibWlzcF9jcmVhdGVfdGFnIiwgInRhZ3Mi
+OiBbXSwgInV1aWQiOiAiNzFkM2ZlZDItMGVlYy00OWFmLWE0MTgtOGU4MTc4ZTVhNDU4IiwgInZl
+cnNpb24iOiAyLCAidmlld19pdGVtcyI6IFt7ImNvbnRlbnQiOiAiYTIwMWRjOTQtZDdmMC00YjA5
+LTllOWUtN2M0YmE1YTdhNWRhIiwgImVsZW1lbnQiOiAiZmllbGRfdXVpZCIsICJmaWVsZF90eXBl
+IjogIl9fZnVuY3Rpb24iLCAic2hvd19pZiI6IG51bGwsICJzaG93X2xpbmtfaGVhZGVyIjogZmFs
+c2UsICJzdGVwX2xhYmVsIjogbnVsbH0sIHsiY29udGVudCI6ICI2ZmRiODk1Zi1lNjZmLTQ3ZTgt
+OTU4Yy0zYzcyMjcyMThmMGQiLCAiZWxlbWVudCI6ICJmaWVsZF91dWlkIiwgImZpZWxkX3R5cGUi
+OiAiX19mdW5jdGlvbiIsICJzaG93X2lmIjogbnVsbCwgInNob3dfbGlua19oZWFkZXIiOiBmYWxz
+ZSwgInN0ZXBfbGFiZWwiOiBudWxsfSwgeyJjb250ZW50IjogImJkZThlODNjLTA2MGQtNGM1YS05
+MjhkLWQ5OTlhOTdjZmRhMCIsICJlbGVtZW50IjogImZpZWxkX3V1aWQiLCAiZmllbGRfdHlwZSI6
+ICJfX2Z1bmN0aW9uIiwgInNob3dfaWYiOiBudWxsLCAic2hvd19saW5rX2hlYWRlciI6IGZhbHNl
+LCAic3RlcF9sYWJlbCI6IG51bGx9LCB7ImNvbnRlbnQiOiAiMjE3NjAwMzAtOGRkZi00M2RhLTg0
+ZTgtNWIwYzYzMzYyYjQ3IiwgImVsZW1lbnQiOiAiZmllbGRfdXVpZCIsICJmaWVsZF90eXBlIjog
+Il9fZnVuY3Rpb24iLCAic2hvd19pZiI6IG51bGwsICJzaG93X2xpbmtfaGVhZGVyIjogZmFsc2Us
+ICJzdGVwX2xhYmVsIjogbnVsbH1dLCAid29ya2Zsb3dzIjogW3siYWN0aW9ucyI6IFtdLCAiZGVz
+Y3JpcHRpb24iOiBudWxsLCAibmFtZSI6ICJFeGFtcGxlOiBNSVNQIENyZWF0ZSBUYWcgb24gQXR0
+cmlidXRlIiwgIm9iamVjdF90eXBlIjogImFydGlmYWN0IiwgInByb2dyYW1tYXRpY19uYW1lIjog
+ImV4YW1wbGVfbWlzcF9jcmVhdGVfdGFnX29uX2F0dHJpYnV0ZSIsICJ0YWdzIjogW10sICJ1dWlk
+IjogbnVsbCwgIndvcmtmbG93X2lkIjogOX0sIHsiYWN0aW9ucyI6IFtdLCAiZGVzY3JpcHRpb24i
+OiBudWxsLCAibmFtZSI6ICJFeGFtcGxlOiBNSVNQIENyZWF0ZSBUYWcgb24gRXZlbnQiLCAib2Jq
+ZWN0X3R5cGUiOiAiaW5jaWRlbnQiLCAicHJvZ3JhbW1hdGljX25hbWUiOiAiZXhhbXBsZV9taXNw
+X2NyZWF0ZV90YWdfb25fZXZlbnQiLCAidGFncyI6IFtdLCAidXVpZCI6IG51bGwsICJ3b3JrZmxv
+d19pZCI6IDExfV19LCB7ImNyZWF0b3IiOiB7ImRpc3BsYXlfbmFtZSI6ICJpbnRlZ3JhdGlvbnMi
+LCAiaWQiOiA0LCAibmFtZSI6ICJlYjJkMWY3ZC02NjUxLTQxNWEtYjRmZi1hMTRmY2QyZjg0ZjUi
+LCAidHlwZSI6ICJhcGlrZXkifSwgImRlc2NyaXB0aW9uIjogeyJmb3JtYXQiOiAidGV4dCIsICJj
+b250ZW50IjogIlNlYXJjaCBNSVNQIGV2ZW50IGF0dHJpYnV0ZXMgZm9yIGEgZ2l2ZW4gbWF0Y2gg
+b24gYW4gYXJ0aWZhY3QifSwgImRlc3RpbmF0aW9uX2hhbmRsZSI6ICJmbl9taXNwIiwgImRpc3Bs
+YXlfbmFtZSI6ICJNSVNQIFNlYXJjaCBBdHRyaWJ1dGUiLCAiZXhwb3J0X2tleSI6ICJtaXNwX3Nl
+YXJjaF9hdHRyaWJ1dGUiLCAiaWQiOiA5LCAibGFzdF9tb2RpZmllZF9ieSI6IHsiZGlzcGxheV9u
+YW1lIjogImludGVncmF0aW9ucyIsICJpZCI6IDQsICJuYW1lIjogImViMmQxZjdkLTY2NTEtNDE1
+YS1iNGZmLWExNGZjZDJmODRmNSIsICJ0eXBlIjogImFwaWtleSJ9LCAibGFzdF9tb2RpZmllZF90
+aW1lIjogMTYwMDc4OTEyMzc3OSwgIm5hbWUiOiAibWlzcF9zZWFyY2hfYXR0cmlidXRlIiwgInRh
+Z3MiOiBbXSwgInV1aWQiOiAiYzI0OGJjN2MtYjYwZi00ZDM2LTlhMmUtMjk0ZWU3OGE1OTgxIiwg
+InZlcnNpb24iOiAyLCAidmlld19pdGVtcyI6IFt7ImNvbnRlbnQiOiAiYmRlOGU4M2MtMDYwZC00
+YzVhLTkyOGQtZDk5OWE5N2NmZGEwIiwgImVsZW1lbnQiOiAiZmllbGRfdXVpZCIsICJmaWVsZF90
+eXBlIjogIl9fZnVuY3Rpb24iLCAic2hvd19pZiI6IG51bGwsICJzaG93X2xpbmtfaGVhZGVyIjog
+ZmFsc2UsICJzdGVwX2xhYmVsIjogbnVsbH1dLCAid29ya2Zsb3dzIjogW3siYWN0aW9ucyI6IFtd
+LCAiZGVzY3JpcHRpb24iOiBudWxsLCAibmFtZSI6ICJFeGFtcGxlOiBNSVNQIFNlYXJjaCBBdHRy
+aWJ1dGUiLCAib2JqZWN0X3R5cGUiOiAiYXJ0aWZhY3QiLCAicHJvZ3JhbW1hdGljX25hbWUiOiAi
+ZXhhbXBsZV9taXNwX3NlYXJjaF9hdHRyaWJ1dGUiLCAidGFncyI6IFtdLCAidXVpZCI6IG51bGws
+ICJ3b3JrZmxvd19pZCI6IDh9XX0sIHsiY3JlYXRvciI6IHsiZGlzcGxheV9uYW1lIjogImludGVn
+cmF0aW9ucyIsICJpZCI6IDQsICJuYW1lIjogImViMmQxZjdkLTY2NTEtNDE1YS1iNGZmLWExNGZj
+ZDJmODRmNSIsICJ0eXBlIjogImFwaWtleSJ9LCAiZGVzY3JpcHRpb24iOiB7ImNvbnRlbnQiOiAi
+U2VhcmNoIG1hbnkgdmFsdWVzLCBvciBhbGwgYXJ0aWZhY3RzIG9mIGFuIGluY2lkZW50LCBpbiBN
+SVNQIGF0IG9uY2UgYW5kIHJldHVybiBhIGhpdC90YWcgbWFwIHBlciB2YWx1ZSIsICJmb3JtYXQi
+OiAidGV4dCJ9LCAiZGVzdGluYXRpb25faGFuZGxlIjogImZuX21pc3AiLCAiZGlzcGxheV9uYW1l
+IjogIk1JU1AgU2VhcmNoIEF0dHJpYnV0ZXMgQnVsayIsICJleHBvcnRfa2V5IjogIm1pc3Bfc2Vh
+cmNoX2F0dHJpYnV0ZXNfYnVsayIsICJpZCI6IDExLCAibGFzdF9tb2RpZmllZF9ieSI6IHsiZGlz
+cGxheV9uYW1lIjogImludGVncmF0aW9ucyIsICJpZCI6IDQsICJuYW1lIjogImViMmQxZjdkLTY2
+NTEtNDE1YS1iNGZmLWExNGZjZDJmODRmNSIsICJ0eXBlIjogImFwaWtleSJ9LCAibGFzdF9tb2Rp
+ZmllZF90aW1lIjogMTYwMDc4OTEyMzc3OSwgIm5hbWUiOiAibWlzcF9zZWFyY2hfYXR0cmlidXRl
+c19idWxrIiwgInRhZ3MiOiBbXSwgInV1aWQiOiAiOTcxZGEwNTYtM2NjNS00ZWNhLWE0NGMtODJl
+ZTAxMzM4NWVhIiwgInZlcnNpb24iOiAxLCAidmlld19pdGVtcyI6IFt7ImNvbnRlbnQiOiAiNzJk
+Y2RlNDMtOTFkZS00ZWY2LWE0Y2EtMmQ3MDQyYzljZTcxIiwgImVsZW1lbnQiOiAiZmllbGRfdXVp
+ZCIsICJmaWVsZF90eXBlIjogIl9fZnVuY3Rpb24iLCAic2hvd19pZiI6IG51bGwsICJzaG93X2xp
+bmtfaGVhZGVyIjogZmFsc2UsICJzdGVwX2xhYmVsIjogbnVsbH0sIHsiY29udGVudCI6ICI5YzZl
+NzUxZC00YzEyLTQxN2QtYWU0NS1lOTcyZWRkNWQzZDYiLCAiZWxlbWVudCI6ICJmaWVsZF91dWlk
+IiwgImZpZWxkX3R5cGUiOiAiX19mdW5jdGlvbiIsICJzaG93X2lmIjogbnVsbCwgInNob3dfbGlu
+a19oZWFkZXIiOiBmYWxzZSwgInN0ZXBfbGFiZWwiOiBudWxsfV0sICJ3b3JrZmxvd3MiOiBbXX0s
+IHsiY3JlYXRvciI6IHsiZGlzcGxheV9uYW1lIjogImludGVncmF0aW9ucyIsICJpZCI6IDQsICJu
+YW1lIjogImViMmQxZjdkLTY2NTEtNDE1YS1iNGZmLWExNGZjZDJmODRmNSIsICJ0eXBlIjogImFw
+aWtleSJ9LCAiZGVzY3JpcHRpb24iOiB7ImZvcm1hdCI6ICJ0ZXh0IiwgImNvbnRlbnQiOiAiTGlz
+dCBhbGwgc2lnaHRpbmdzIGFzc29jaWF0ZWQgd2l0aCBhbiBldmVudCJ9LCAiZGVzdGluYXRpb25f
+aGFuZGxlIjogImZuX21pc3AiLCAiZGlzcGxheV9uYW1lIjogIk1JU1AgU2lnaHRpbmcgTGlzdCIs
+ICJleHBvcnRfa2V5IjogIm1pc3Bfc2lnaHRpbmdfbGlzdCIsICJpZCI6IDEwLCAibGFzdF9tb2Rp
+ZmllZF9ieSI6IHsiZGlzcGxheV9uYW1lIjogImludGVncmF0aW9ucyIsICJpZCI6IDQsICJuYW1l
+IjogImViMmQxZjdkLTY2NTEtNDE1YS1iNGZmLWExNGZjZDJmODRmNSIsICJ0eXBlIjogImFwaWtl
+eSJ9LCAibGFzdF9tb2RpZmllZF90aW1lIjogMTYwMDc4OTEyMzc3OSwgIm5hbWUiOiAibWlzcF9z
+aWdodGluZ19saXN0IiwgInRhZ3MiOiBbXSwgInV1aWQiOiAiOGI1MzE4MjctNzQxZC00MGU4LTkw
+YTUtMWVjOTljYjE3MTBkIiwgInZlcnNpb24iOiAyLCAidmlld19pdGVtcyI6IFt7ImNvbnRlbnQi
+OiAiMjE3NjAwMzAtOGRkZi00M2RhLTg0ZTgtNWIwYzYzMzYyYjQ3IiwgImVsZW1lbnQiOiAiZmll
+bGRfdXVpZCIsICJmaWVsZF90eXBlIjogIl9fZnVuY3Rpb24iLCAic2hvd19pZiI6IG51bGwsICJz
+aG93X2xpbmtfaGVhZGVyIjogZmFsc2UsICJzdGVwX2xhYmVsIjogbnVsbH0sIHsiY29udGVudCI6
+ICJjNzZmMWVmNy0yYmIyLTQxN2EtODdiNy0xY2UzYjhlOWU0YzgiLCAiZWxlbWVudCI6ICJmaWVs
+ZF91dWlkIiwgImZpZWxkX3R5cGUiOiAiX19mdW5jdGlvbiIsICJzaG93X2lmIjogbnVsbCwgInNo
+b3dfbGlua19oZWFkZXIiOiBmYWxzZSwgInN0ZXBfbGFiZWwiOiBudWxsfSwgeyJjb250ZW50Ijog
+ImIwODE1M2Q4LWJiNDUtNDllNi05YzU3LTM5ZDgyNjk1ZDUyMCIsICJlbGVtZW50IjogImZpZWxk
+X3V1aWQiLCAiZmllbGRfdHlwZSI6ICJfX2Z1bmN0aW9uIiwgInNob3dfaWYiOiBudWxsLCAic2hv
+d19saW5rX2hlYWRlciI6IGZhbHNlLCAic3RlcF9sYWJlbCI6IG51bGx9LCB7ImNvbnRlbnQiOiAi
+OTY1Yzk0ZTctZGNmNi00ZTFkLTlhNmUtYTM1MTc1YjRmMzk5IiwgImVsZW1lbnQiOiAiZmllbGRf
+dXVpZCIsICJmaWVsZF90eXBlIjogIl9fZnVuY3Rpb24iLCAic2hvd19pZiI6IG51bGwsICJzaG93
+X2xpbmtfaGVhZGVyIjogZmFsc2UsICJzdGVwX2xhYmVsIjogbnVsbH0sIHsiY29udGVudCI6ICJl
+YWJjZGVhMi1kNWRhLTQxNGUtYWZjNy00MDc5ZDI0NTg1NGUiLCAiZWxlbWVudCI6ICJmaWVsZF91
+dWlkIiwgImZpZWxkX3R5cGUiOiAiX19mdW5jdGlvbiIsICJzaG93X2lmIjogbnVsbCwgInNob3df
+bGlua19oZWFkZXIiOiBmYWxzZSwgInN0ZXBfbGFiZWwiOiBudWxsfV0sICJ3b3JrZmxvd3MiOiBb
+eyJhY3Rpb25zIjogW10sICJkZXNjcmlwdGlvbiI6IG51bGwsICJuYW1lIjogIkV4YW1wbGU6IE1J
+U1AgU2lnaHRpbmcgTGlzdCIsICJvYmplY3RfdHlwZSI6ICJpbmNpZGVudCIsICJwcm9ncmFtbWF0
+aWNfbmFtZSI6ICJleGFtcGxlX21pc3Bfc2lnaHRpbmdfbGlzdCIsICJ0YWdzIjogW10sICJ1dWlk
+IjogbnVsbCwgIndvcmtmbG93X2lkIjogMTJ9XX1dLCAiZ2VvcyI6IG51bGwsICJncm91cHMiOiBu
+dWxsLCAiaWQiOiA1LCAiaW5ib3VuZF9tYWlsYm94ZXMiOiBudWxsLCAiaW5jaWRlbnRfYXJ0aWZh
+Y3RfdHlwZXMiOiBbXSwgImluY2lkZW50X3R5cGVzIjogW3sidXBkYXRlX2RhdGUiOiAxNjAwNzk2
+NTU1NzUyLCAiY3JlYXRlX2RhdGUiOiAxNjAwNzk2NTU1NzUyLCAidXVpZCI6ICJiZmVlYzJkNC0z
+NzcwLTExZTgtYWQzOS00YTAwMDQwNDRhYTAiLCAiZGVzY3JpcHRpb24iOiAiQ3VzdG9taXphdGlv
+biBQYWNrYWdlcyAoaW50ZXJuYWwpIiwgImV4cG9ydF9rZXkiOiAiQ3VzdG9taXphdGlvbiBQYWNr
+YWdlcyAoaW50ZXJuYWwpIiwgIm5hbWUiOiAiQ3VzdG9taXphdGlvbiBQYWNrYWdlcyAoaW50ZXJu
+YWwpIiwgImVuYWJsZWQiOiBmYWxzZSwgInN5c3RlbSI6IGZhbHNlLCAicGFyZW50X2lkIjogbnVs
+bCwgImhpZGRlbiI6IGZhbHNlLCAiaWQiOiAwfV0sICJpbmR1c3RyaWVzIjogbnVsbCwgImxheW91
+dHMiOiBbXSwgImxvY2FsZSI6IG51bGwsICJtZXNzYWdlX2Rlc3RpbmF0aW9ucyI6IFt7ImFwaV9r
+ZXlzIjogWyJlYjJkMWY3ZC02NjUxLTQxNWEtYjRmZi1hMTRmY2QyZjg0ZjUiXSwgImRlc3RpbmF0
+aW9uX3R5cGUiOiAwLCAiZXhwZWN0X2FjayI6IHRydWUsICJleHBvcnRfa2V5IjogImZuX21pc3Ai
+LCAibmFtZSI6ICJmbl9taXNwIiwgInByb2dyYW1tYXRpY19uYW1lIjogImZuX21pc3AiLCAidGFn
+cyI6IFtdLCAidXNlcnMiOiBbXSwgInV1aWQiOiAiNGQ4M2NhODYtMzk5My00MjcxLWFiOGItNzYz
+MmU5NmMxZWUxIn1dLCAibm90aWZpY2F0aW9ucyI6IG51bGwsICJvdmVycmlkZXMiOiBbXSwgInBo
+YXNlcyI6IFtdLCAicmVndWxhdG9ycyI6IG51bGwsICJyb2xlcyI6IFtdLCAic2NyaXB0cyI6IFtd
+LCAic2VydmVyX3ZlcnNpb24iOiB7ImJ1aWxkX251bWJlciI6IDMyLCAibWFqb3IiOiAzNSwgIm1p
+bm9yIjogMiwgInZlcnNpb24iOiAiMzUuMi4zMiJ9LCAidGFncyI6IFtdLCAidGFza19vcmRlciI6
+IFtdLCAidGltZWZyYW1lcyI6IG51bGwsICJ0eXBlcyI6IFtdLCAid29ya2Zsb3dzIjogW3siYWN0
+aW9ucyI6IFtdLCAiY29udGVudCI6IHsidmVyc2lvbiI6IDIsICJ3b3JrZmxvd19pZCI6ICJleGFt
+cGxlX21pc3BfY3JlYXRlX2F0dHJpYnV0ZSIsICJ4bWwiOiAiPD94bWwgdmVyc2lvbj1cIjEuMFwi
+IGVuY29kaW5nPVwiVVRGLThcIj8+PGRlZmluaXRpb25zIHhtbG5zPVwiaHR0cDovL3d3dy5vbWcu
+b3JnL3NwZWMvQlBNTi8yMDEwMDUyNC9NT0RFTFwiIHhtbG5zOmJwbW5kaT1cImh0dHA6Ly93d3cu
+b21nLm9yZy9zcGVjL0JQTU4vMjAxMDA1MjQvRElcIiB4bWxuczpvbWdkYz1cImh0dHA6Ly93d3cu
+b21nLm9yZy9zcGVjL0RELzIwMTAwNTI0L0RDXCIgeG1sbnM6b21nZGk9XCJodHRwOi8vd3d3Lm9t
+Zy5vcmcvc3BlYy9ERC8yMDEwMDUyNC9ESVwiIHhtbG5zOnJlc2lsaWVudD1cImh0dHA6Ly9yZXNp
+bGllbnQuaWJtLmNvbS9icG1uXCIgeG1sbnM6eHNkPVwiaHR0cDovL3d3dy53My5vcmcvMjAwMS9Y
+TUxTY2hlbWFcIiB4bWxuczp4c2k9XCJodHRwOi8vd3d3LnczLm9yZy8yMDAxL1hNTFNjaGVtYS1p
+bnN0YW5jZVwiIHRhcmdldE5hbWVzcGFjZT1cImh0dHA6Ly93d3cuY2FtdW5kYS5vcmcvdGVzdFwi
+Pjxwcm9jZXNzIGlkPVwiZXhhbXBsZV9taXNwX2NyZWF0ZV9hdHRyaWJ1dGVcIiBpc0V4ZWN1dGFi
+bGU9XCJ0cnVlXCIgbmFtZT1cIkV4YW1wbGU6IE1JU1AgQ3JlYXRlIEF0dHJpYnV0ZVwiPjxkb2N1
+bWVudGF0aW9uPkNyZWF0ZSBhbiBNSVNQIGV2ZW50IGF0dHJpYnV0ZSBiYXNlZCBvbiBhbiBhcnRp
+ZmFjdCB2YWx1ZS4gVGhpcyBvbmx5IHdvcmtzIG9uIGluY2lkZW50cyBhbHJlYWR5IHN1Ym1pdHRl
+ZCB0byBNSVNQLjwvZG9jdW1lbnRhdGlvbj48c3RhcnRFdmVudCBpZD1cIlN0YXJ0RXZlbnRfMTU1
+YXN4bVwiPjxvdXRnb2luZz5TZXF1ZW5jZUZsb3dfMGdnN2g2dDwvb3V0Z29pbmc+PC9zdGFydEV2
+ZW50PjxzZXJ2aWNlVGFzayBpZD1cIlNlcnZpY2VUYXNrXzB2Z3ZibDJcIiBuYW1lPVwiTUlTUCBD
+cmVhdGUgQXR0cmlidXRlXCIgcmVzaWxpZW50OnR5cGU9XCJmdW5jdGlvblwiPjxleHRlbnNpb25F
+bGVtZW50cz48cmVzaWxpZW50OmZ1bmN0aW9uIHV1aWQ9XCJmNWM0YWFlMi0xMzVlLTQxYWMtOGJi
+Yy0wODJiMDA2NzdlY2JcIj57XCJpbnB1dHNcIjp7fSxcInBvc3RfcHJvY2Vzc2luZ19zY3JpcHRc
+IjpcIiMgUmVzdWx0OiB7J3N1Y2Nlc3MnOiBUcnVlLCAnY29udGVudCc6IFt7J0F0dHJpYnV0ZSc6
+IHsnaWQnOiAnMycsICdldmVudF9pZCc6ICczJywgJ29iamVjdF9pZCc6ICcwJywgJ29iamVjdF9y
+ZWxhdGlvbic6IE5vbmUsICdjYXRlZ29yeSc6ICdOZXR3b3JrIGFjdGl2aXR5JywgJ3R5cGUnOiAn
+aXAtZHN0JywgJ3ZhbHVlMSc6ICc4LjguOC44JywgJ3ZhbHVlMic6ICcnLCAndG9faWRzJzogRmFs
+c2UsICd1dWlkJzogJzY2NmE2ODkwLWZkZGQtNGE1ZC1hNDc0LTIyYzg1YzZhMWNlNScsICd0aW1l
+c3RhbXAnOiAnMTU1MzM1Mjc4MScsICdkaXN0cmlidXRpb24nOiAnNScsICdzaGFyaW5nX2dyb3Vw
+X2lkJzogJzAnLCAnY29tbWVudCc6ICcnLCAnZGVsZXRlZCc6IEZhbHNlLCAnZGlzYWJsZV9jb3Jy
+ZWxhdGlvbic6IEZhbHNlLCAndmFsdWUnOiAnOC44LjguOCd9fV19XFxuIyBSZXN1bHQ6IHsnc3Vj
+Y2Vzcyc6IFRydWUsICdjb250ZW50JzogW3snbmFtZSc6ICdDb3VsZCBub3QgYWRkIEF0dHJpYnV0
+ZScsICdtZXNzYWdlJzogJ0NvdWxkIG5vdCBhZGQgQXR0cmlidXRlJywgJ3VybCc6ICcvYXR0cmli
+dXRlcy9hZGQnLCAnZXJyb3JzJzogeyd2YWx1ZSc6IFsnQSBzaW1pbGFyIGF0dHJpYnV0ZSBhbHJl
+YWR5IGV4aXN0cyBmb3IgdGhpcyBldmVudC4nXX19XX1cXG5leGlzdGluZ19kZXNjcmlwdGlvbiA9
+IGFydGlmYWN0LmRlc2NyaXB0aW9uLmNvbnRlbnQrJ1xcXFxuJyBpZiBhcnRpZmFjdC5kZXNjcmlw
+dGlvbiBlbHNlIFxcXCJcXFwiXFxuXFxuaWYgcmVzdWx0cy5jb250ZW50WzBdLmdldCgnZXJyb3Jz
+Jyk6XFxuICBhcnRpZmFjdC5kZXNjcmlwdGlvbiA9IHVcXFwie31NSVNQIEF0dHJpYnV0ZSBmYWls
+dXJlOiB7fVxcXCIuZm9ybWF0KGV4aXN0aW5nX2Rlc2NyaXB0aW9uLCByZXN1bHRzLmNvbnRlbnRb
+MF1bJ2Vycm9ycyddWyd2YWx1ZSddKVxcbmVsc2U6XFxuICBhcnRpZmFjdC5kZXNjcmlwdGlvbiA9
+IHVcXFwie31NSVNQIEF0dHJpYnV0ZSBjcmVhdGVkOiB7fVxcXCIuZm9ybWF0KGV4aXN0aW5nX2Rl
+c2NyaXB0aW9uLCByZXN1bHRzLmNvbnRlbnRbMF1bJ0F0dHJpYnV0ZSddWydjYXRlZ29yeSddKVwi
+LFwicHJlX3Byb2Nlc3Npbmdfc2NyaXB0XCI6XCJpbnB1dHMubWlzcF9hdHRyaWJ1dGVfdmFsdWUg
+PSBhcnRpZmFjdC52YWx1ZVxcbmlucHV0cy5taXNwX2V2ZW50X2lkID0gaW5jaWRlbnQucHJvcGVy
+dGllcy5taXNwX2V2ZW50X2lkXFxuXFxuXFxucmVzaWxpZW50X3RvX21pc3BfbWFwID0geyBcXG4g
+ICAgXFxcIkROUyBOYW1lXFxcIjogXFxcImRvbWFpblxcXCIsXFxuICAgIFxcXCJFbWFpbCBBdHRh
+Y2htZW50XFxcIjogXFxcImVtYWlsLWF0dGFjaG1lbnRcXFwiLFxcbiAgICBcXFwiRW1haWwgQm9k
+eVxcXCI6IFxcXCJlbWFpbC1ib2R5XFxcIixcXG4gICAgXFxcIkVtYWlsIFJlY2lwaWVudFxcXCI6
+IFxcXCJlbWFpbC1kc3RcXFwiLFxcbiAgICBcXFwiRW1haWwgU2VuZGVyXFxcIjogXFxcImVtYWls
+LXNyY1xcXCIsXFxuICAgIFxcXCJFbWFpbCBzdWJqZWN0XFxcIjogXFxcImVtYWlsLXN1YmplY3Rc
+XFwiLFxcbiAgICBcXFwiRmlsZSBOYW1lXFxcIjogXFxcImZpbGVuYW1lXFxcIixcXG4gICAgXFxc
+IkROUyBOYW1lXFxcIjogXFxcImhvc3RuYW1lXFxcIixcXG4gICAgXFxcIk1BQyBBZGRyZXNzXFxc
+IjogXFxcIm1hYy1hZGRyZXNzXFxcIixcXG4gICAgXFxcIk1hbHdhcmUgTUQ1IEhhc2hcXFwiOiBc
+XFwibWQ1XFxcIixcXG4gICAgXFxcIlBvcnRcXFwiOiBcXFwicG9ydFxcXCIsXFxuICAgIFxcXCJN
+YWx3YXJlIFNIQS0xIEhhc2hcXFwiOiBcXFwic2hhMVxcXCIsXFxuICAgIFxcXCJNYWx3YXJlIFNI
+QS0yNTYgSGFzaFxcXCI6IFxcXCJzaGEyNTZcXFwiLFxcbiAgICBcXFwiVVJJIFBhdGhcXFwiOiBc
+XFwidXJpXFxcIixcXG4gICAgXFxcIlVSTFxcXCI6IFxcXCJ1cmxcXFwiLFxcbiAgICBcXFwiVGhy
+ZWF0IENWRSBJRFxcXCI6IFxcXCJ2dWxuZXJhYmlsaXR5XFxcIixcXG4gICAgXFxcIklQIEFkZHJl
+c3NcXFwiOiBcXFwiaXAtZHN0XFxcIlxcbn1cXG5cXG50cnk6XFxuICBtaXNwX3R5cGUgPSByZXNp
+bGllbnRfdG9fbWlzcF9tYXBbYXJ0aWZhY3QudHlwZV1cXG4gIGlucHV0cy5taXNwX2F0dHJpYnV0
+ZV90eXBlID0gbWlzcF90eXBlXFxuZXhjZXB0IEV4Y2VwdGlvbiwgZTpcXG4gIGhlbHBlci5mYWls
+KHVcXFwiWW91IGRvIG5vdCBoYXZlIHRoaXMgYXJ0aWZhY3QgdHlwZSB7fSBtYXBwZWQgdG8gYSB0
+eXBlIGluIE1JU1AgLSBBc2sgeW91ciBBZG1pblxcXCIuZm9ybWF0KGFydGlmYWN0LnZhbHVlKSlc
+XG4gIHJhaXNlIGUgXFxuXFxuXCJ9PC9yZXNpbGllbnQ6ZnVuY3Rpb24+PC9leHRlbnNpb25FbGVt
+ZW50cz48aW5jb21pbmc+U2VxdWVuY2VGbG93XzBnZzdoNnQ8L2luY29taW5nPjxvdXRnb2luZz5T
+ZXF1ZW5jZUZsb3dfMTdvdDFhajwvb3V0Z29pbmc+PC9zZXJ2aWNlVGFzaz48c2VxdWVuY2VGbG93
+IGlkPVwiU2VxdWVuY2VGbG93XzBnZzdoNnRcIiBzb3VyY2VSZWY9XCJTdGFydEV2ZW50XzE1NWFz
+eG1cIiB0YXJnZXRSZWY9XCJTZXJ2aWNlVGFza18wdmd2YmwyXCIvPjxlbmRFdmVudCBpZD1cIkVu
+ZEV2ZW50XzB3ZGljbmVcIj48aW5jb21pbmc+U2VxdWVuY2VGbG93XzE3b3QxYWo8L2luY29taW5n
+PjwvZW5kRXZlbnQ+PHNlcXVlbmNlRmxvdyBpZD1cIlNlcXVlbmNlRmxvd18xN290MWFqXCIgc291
+cmNlUmVmPVwiU2VydmljZVRhc2tfMHZndmJsMlwiIHRhcmdldFJlZj1cIkVuZEV2ZW50XzB3ZGlj
+bmVcIi8+PHRleHRBbm5vdGF0aW9uIGlkPVwiVGV4dEFubm90YXRpb25fMG9rdWYzdlwiPjx0ZXh0
+PlVwZGF0ZXMgdGhlIGFydGlmYWN0IGRlc2NyaXB0aW9uIHdpdGggcmVzdWx0cyBvZiB0aGUgb3Bl
+cmF0aW9uPC90ZXh0PjwvdGV4dEFubm90YXRpb24+PGFzc29jaWF0aW9uIGlkPVwiQXNzb2NpYXRp
+b25fMTJ3bDlyaVwiIHNvdXJjZVJlZj1cIlNlcnZpY2VUYXNrXzB2Z3ZibDJcIiB0YXJnZXRSZWY9
+XCJUZXh0QW5ub3RhdGlvbl8wb2t1ZjN2XCIvPjwvcHJvY2Vzcz48YnBtbmRpOkJQTU5EaWFncmFt
+IGlkPVwiQlBNTkRpYWdyYW1fMVwiPjxicG1uZGk6QlBNTlBsYW5lIGJwbW5FbGVtZW50PVwidW5k
+ZWZpbmVkXCIgaWQ9XCJCUE1OUGxhbmVfMVwiPjxicG1uZGk6QlBNTlNoYXBlIGJwbW5FbGVtZW50
+PVwiU3RhcnRFdmVudF8xNTVhc3htXCIgaWQ9XCJTdGFydEV2ZW50XzE1NWFzeG1fZGlcIj48b21n
+ZGM6Qm91bmRzIGhlaWdodD1cIjM2XCIgd2lkdGg9XCIzNlwiIHg9XCIxNjJcIiB5PVwiMTg4XCIv
+PjxicG1uZGk6QlBNTkxhYmVsPjxvbWdkYzpCb3VuZHMgaGVpZ2h0PVwiMFwiIHdpZHRoPVwiOTBc
+IiB4PVwiMTU3XCIgeT1cIjIyM1wiLz48L2JwbW5kaTpCUE1OTGFiZWw+PC9icG1uZGk6QlBNTlNo
+YXBlPjxicG1uZGk6QlBNTlNoYXBlIGJwbW5FbGVtZW50PVwiU2VydmljZVRhc2tfMHZndmJsMlwi
+IGlkPVwiU2VydmljZVRhc2tfMHZndmJsMl9kaVwiPjxvbWdkYzpCb3VuZHMgaGVpZ2h0PVwiODBc
+IiB3aWR0aD1cIjEwMFwiIHg9XCIyNzVcIiB5PVwiMTY2XCIvPjwvYnBtbmRpOkJQTU5TaGFwZT48
+YnBtbmRpOkJQTU5FZGdlIGJwbW5FbGVtZW50PVwiU2VxdWVuY2VGbG93XzBnZzdoNnRcIiBpZD1c
+IlNlcXVlbmNlRmxvd18wZ2c3aDZ0X2RpXCI+PG9tZ2RpOndheXBvaW50IHg9XCIxOThcIiB4c2k6
+dHlwZT1cIm9tZ2RjOlBvaW50XCIgeT1cIjIwNlwiLz48b21nZGk6d2F5cG9pbnQgeD1cIjI3NVwi
+IHhzaTp0eXBlPVwib21nZGM6UG9pbnRcIiB5PVwiMjA2XCIvPjxicG1uZGk6QlBNTkxhYmVsPjxv
+bWdkYzpCb3VuZHMgaGVpZ2h0PVwiMTNcIiB3aWR0aD1cIjBcIiB4PVwiMjM2LjVcIiB5PVwiMTg0
+XCIvPjwvYnBtbmRpOkJQTU5MYWJlbD48L2JwbW5kaTpCUE1ORWRnZT48YnBtbmRpOkJQTU5TaGFw
+ZSBicG1uRWxlbWVudD1cIkVuZEV2ZW50XzB3ZGljbmVcIiBpZD1cIkVuZEV2ZW50XzB3ZGljbmVf
+ZGlcIj48b21nZGM6Qm91bmRzIGhlaWdodD1cIjM2XCIgd2lkdGg9XCIzNlwiIHg9XCI0MjlcIiB5
+PVwiMTg4XCIvPjxicG1uZGk6QlBNTkxhYmVsPjxvbWdkYzpCb3VuZHMgaGVpZ2h0PVwiMTNcIiB3
+aWR0aD1cIjBcIiB4PVwiNDQ3XCIgeT1cIjIyN1wiLz48L2JwbW5kaTpCUE1OTGFiZWw+PC9icG1u
+ZGk6QlBNTlNoYXBlPjxicG1uZGk6QlBNTkVkZ2UgYnBtbkVsZW1lbnQ9XCJTZXF1ZW5jZUZsb3df
+MTdvdDFhalwiIGlkPVwiU2VxdWVuY2VGbG93XzE3b3QxYWpfZGlcIj48b21nZGk6d2F5cG9pbnQg
+eD1cIjM3NVwiIHhzaTp0eXBlPVwib21nZGM6UG9pbnRcIiB5PVwiMjA2XCIvPjxvbWdkaTp3YXlw
+b2ludCB4PVwiNDI5XCIgeHNpOnR5cGU9XCJvbWdkYzpQb2ludFwiIHk9XCIyMDZcIi8+PGJwbW5k
+aTpCUE1OTGFiZWw+PG9tZ2RjOkJvdW5kcyBoZWlnaHQ9XCIxM1wiIHdpZHRoPVwiMFwiIHg9XCI0
+MDJcIiB5PVwiMTg0XCIvPjwvYnBtbmRpOkJQTU5MYWJlbD48L2JwbW5kaTpCUE1ORWRnZT48YnBt
+bmRpOkJQTU5TaGFwZSBicG1uRWxlbWVudD1cIlRleHRBbm5vdGF0aW9uXzBva3VmM3ZcIiBpZD1c
+IlRleHRBbm5vdGF0aW9uXzBva3VmM3ZfZGlcIj48b21nZGM6Qm91bmRzIGhlaWdodD1cIjY3XCIg
+d2lkdGg9XCIyNzBcIiB4PVwiMzU2XCIgeT1cIjgzXCIvPjwvYnBtbmRpOkJQTU5TaGFwZT48YnBt
+bmRpOkJQTU5FZGdlIGJwbW5FbGVtZW50PVwiQXNzb2NpYXRpb25fMTJ3bDlyaVwiIGlkPVwiQXNz
+b2NpYXRpb25fMTJ3bDlyaV9kaVwiPjxvbWdkaTp3YXlwb2ludCB4PVwiMzc1XCIgeHNpOnR5cGU9
+XCJvbWdkYzpQb2ludFwiIHk9XCIxNzlcIi8+PG9tZ2RpOndheXBvaW50IHg9XCI0MjlcIiB4c2k6
+dHlwZT1cIm9tZ2RjOlBvaW50XCIgeT1cIjE1MFwiLz48L2JwbW5kaTpCUE1ORWRnZT48L2JwbW5k
+aTpCUE1OUGxhbmU+PC9icG1uZGk6QlBNTkRpYWdyYW0+PC9kZWZpbml0aW9ucz4ifSwgImNvbnRl
+bnRfdmVyc2lvbiI6IDIsICJjcmVhdG9yX2lkIjogImViMmQxZjdkLTY2NTEtNDE1YS1iNGZmLWEx
+NGZjZDJmODRmNSIsICJkZXNjcmlwdGlvbiI6ICJDcmVhdGUgYW4gTUlTUCBldmVudCBhdHRyaWJ1
+dGUgYmFzZWQgb24gYW4gYXJ0aWZhY3QgdmFsdWUuIFRoaXMgb25seSB3b3JrcyBvbiBpbmNpZGVu
+dHMgYWxyZWFkeSBzdWJtaXR0ZWQgdG8gTUlTUC4iLCAiZXhwb3J0X2tleSI6ICJleGFtcGxlX21p
+c3BfY3JlYXRlX2F0dHJpYnV0ZSIsICJsYXN0X21vZGlmaWVkX2J5IjogImViMmQxZjdkLTY2NTEt
+NDE1YS1iNGZmLWExNGZjZDJmODRmNSIsICJsYXN0X21vZGlmaWVkX3RpbWUiOiAxNjAwNzg5MTI0
+MTIwLCAibmFtZSI6ICJFeGFtcGxlOiBNSVNQIENyZWF0ZSBBdHRyaWJ1dGUiLCAib2JqZWN0X3R5
+cGUiOiAiYXJ0aWZhY3QiLCAicHJvZ3JhbW1hdGljX25hbWUiOiAiZXhhbXBsZV9taXNwX2NyZWF0
+ZV9hdHRyaWJ1dGUiLCAidGFncyI6IFtdLCAidXVpZCI6ICIxZWZiMDQ0Mi1iNDg2LTRjYjItYTNj
+Yy01ZjJlNWZiODNhYTQiLCAid29ya2Zsb3dfaWQiOiA3fSwgeyJhY3Rpb25zIjogW10sICJjb250
+ZW50IjogeyJ2ZXJzaW9uIjogMiwgIndvcmtmbG93X2lkIjogImV4YW1wbGVfbWlzcF9jcmVhdGVf
+c2lnaHRpbmciLCAieG1sIjogIjw/eG1sIHZlcnNpb249XCIxLjBcIiBlbmNvZGluZz1cIlVURi04
+XCI/PjxkZWZpbml0aW9ucyB4bWxucz1cImh0dHA6Ly93d3cub21nLm9yZy9zcGVjL0JQTU4vMjAx
+MDA1MjQvTU9ERUxcIiB4bWxuczpicG1uZGk9XCJodHRwOi8vd3d3Lm9tZy5vcmcvc3BlYy9CUE1O
+LzIwMTAwNTI0L0RJXCIgeG1sbnM6b21nZGM9XCJodHRwOi8vd3d3Lm9tZy5vcmcvc3BlYy9ERC8y
+MDEwMDUyNC9EQ1wiIHhtbG5zOm9tZ2RpPVwiaHR0cDovL3d3dy5vbWcub3JnL3NwZWMvREQvMjAx
+MDA1MjQvRElcIiB4bWxuczpyZXNpbGllbnQ9XCJodHRwOi8vcmVzaWxpZW50LmlibS5jb20vYnBt
+blwiIHhtbG5zOnhzZD1cImh0dHA6Ly93d3cudzMub3JnLzIwMDEvWE1MU2NoZW1hXCIgeG1sbnM6
+eHNpPVwiaHR0cDovL3d3dy53My5vcmcvMjAwMS9YTUxTY2hlbWEtaW5zdGFuY2VcIiB0YXJnZXRO
+YW1lc3BhY2U9XCJodHRwOi8vd3d3LmNhbXVuZGEub3JnL3Rlc3RcIj48cHJvY2VzcyBpZD1cImV4
+YW1wbGVfbWlzcF9jcmVhdGVfc2lnaHRpbmdcIiBpc0V4ZWN1dGFibGU9XCJ0cnVlXCIgbmFtZT1c
+IkV4YW1wbGU6IE1JU1AgQ3JlYXRlIFNpZ2h0aW5nXCI+PGRvY3VtZW50YXRpb24+Q3JlYXRlIGEg
+TUlTUCBTaWdodGluZyBmcm9tIGFuIGFydGlmYWN0PC9kb2N1bWVudGF0aW9uPjxzdGFydEV2ZW50
+IGlkPVwiU3RhcnRFdmVudF8xNTVhc3htXCI+PG91dGdvaW5nPlNlcXVlbmNlRmxvd18xeWF3bTQ1
+PC9vdXRnb2luZz48L3N0YXJ0RXZlbnQ+PHNlcnZpY2VUYXNrIGlkPVwiU2VydmljZVRhc2tfMGRq
+b2ttNVwiIG5hbWU9XCJNSVNQIENyZWF0ZSBTaWdodGluZ1wiIHJlc2lsaWVudDp0eXBlPVwiZnVu
+Y3Rpb25cIj48ZXh0ZW5zaW9uRWxlbWVudHM+PHJlc2lsaWVudDpmdW5jdGlvbiB1dWlkPVwiZTlk
+Zjc5MmItYTNhZi00ZDY3LWFlOTAtZTQ4YWFiY2ExMzhjXCI+e1wiaW5wdXRzXCI6e30sXCJwb3N0
+X3Byb2Nlc3Npbmdfc2NyaXB0XCI6XCIjIFJlc3VsdDogeydzdWNjZXNzJzogVHJ1ZSwgJ2NvbnRl
+bnQnOiB7J21lc3NhZ2UnOiAnU2lnaHRpbmcgYWRkZWQnfX1cXG5leGlzdGluZ19kZXNjcmlwdGlv
+biA9IGFydGlmYWN0LmRlc2NyaXB0aW9uLmNvbnRlbnQrJ1xcXFxuJyBpZiBhcnRpZmFjdC5kZXNj
+cmlwdGlvbiBlbHNlIFxcXCJcXFwiXFxuXFxuI2lmIHJlc3VsdHMuY29udGVudFswXS5nZXQoJ2Vy
+cm9ycycpOlxcbiMgIGFydGlmYWN0LmRlc2NyaXB0aW9uID0gdVxcXCJ7fU1JU1AgQXR0cmlidXRl
+IGZhaWx1cmU6IHt9XFxcIi5mb3JtYXQoZXhpc3RpbmdfZGVzY3JpcHRpb24sIHJlc3VsdHMuY29u
+dGVudFswXVsnZXJyb3JzJ11bJ3ZhbHVlJ10pXFxuI2Vsc2U6XFxuYXJ0aWZhY3QuZGVzY3JpcHRp
+b24gPSB1XFxcInt9TUlTUCBBdHRyaWJ1dGUgY3JlYXRlZDoge31cXFwiLmZvcm1hdChleGlzdGlu
+Z19kZXNjcmlwdGlvbiwgcmVzdWx0cy5jb250ZW50WydtZXNzYWdlJ10pXCIsXCJwcmVfcHJvY2Vz
+c2luZ19zY3JpcHRcIjpcIlxcblxcbmlucHV0cy5taXNwX3NpZ2h0aW5nID0gYXJ0aWZhY3QudmFs
+dWVcIn08L3Jlc2lsaWVudDpmdW5jdGlvbj48L2V4dGVuc2lvbkVsZW1lbnRzPjxpbmNvbWluZz5T
+ZXF1ZW5jZUZsb3dfMXlhd200NTwvaW5jb21pbmc+PG91dGdvaW5nPlNlcXVlbmNlRmxvd18weGhj
+OTN0PC9vdXRnb2luZz48L3NlcnZpY2VUYXNrPjxzZXF1ZW5jZUZsb3cgaWQ9XCJTZXF1ZW5jZUZs
+b3dfMXlhd200NVwiIHNvdXJjZVJlZj1cIlN0YXJ0RXZlbnRfMTU1YXN4bVwiIHRhcmdldFJlZj1c
+IlNlcnZpY2VUYXNrXzBkam9rbTVcIi8+PGVuZEV2ZW50IGlkPVwiRW5kRXZlbnRfMHR2aGh1bVwi
+PjxpbmNvbWluZz5TZXF1ZW5jZUZsb3dfMHhoYzkzdDwvaW5jb21pbmc+PC9lbmRFdmVudD48c2Vx
+dWVuY2VGbG93IGlkPVwiU2VxdWVuY2VGbG93XzB4aGM5M3RcIiBzb3VyY2VSZWY9XCJTZXJ2aWNl
+VGFza18wZGpva201XCIgdGFyZ2V0UmVmPVwiRW5kRXZlbnRfMHR2aGh1bVwiLz48dGV4dEFubm90
+YXRpb24gaWQ9XCJUZXh0QW5ub3RhdGlvbl8wNG9uZzdnXCI+PHRleHQ+VGhlIGFydGlmYWN0IGRl
+c2NyaXB0aW9uIGlzIHVwZGF0ZWQgd2l0aCB0aGUgcmVzdWx0PC90ZXh0PjwvdGV4dEFubm90YXRp
+b24+PGFzc29jaWF0aW9uIGlkPVwiQXNzb2NpYXRpb25fMXI4bDVya1wiIHNvdXJjZVJlZj1cIlNl
+cnZpY2VUYXNrXzBkam9rbTVcIiB0YXJnZXRSZWY9XCJUZXh0QW5ub3RhdGlvbl8wNG9uZzdnXCIv
+PjwvcHJvY2Vzcz48YnBtbmRpOkJQTU5EaWFncmFtIGlkPVwiQlBNTkRpYWdyYW1fMVwiPjxicG1u
+ZGk6QlBNTlBsYW5lIGJwbW5FbGVtZW50PVwidW5kZWZpbmVkXCIgaWQ9XCJCUE1OUGxhbmVfMVwi
+PjxicG1uZGk6QlBNTlNoYXBlIGJwbW5FbGVtZW50PVwiU3RhcnRFdmVudF8xNTVhc3htXCIgaWQ9
+XCJTdGFydEV2ZW50XzE1NWFzeG1fZGlcIj48b21nZGM6Qm91bmRzIGhlaWdodD1cIjM2XCIgd2lk
+dGg9XCIzNlwiIHg9XCIxNjJcIiB5PVwiMTg4XCIvPjxicG1uZGk6QlBNTkxhYmVsPjxvbWdkYzpC
+b3VuZHMgaGVpZ2h0PVwiMFwiIHdpZHRoPVwiOTBcIiB4PVwiMTU3XCIgeT1cIjIyM1wiLz48L2Jw
+bW5kaTpCUE1OTGFiZWw+PC9icG1uZGk6QlBNTlNoYXBlPjxicG1uZGk6QlBNTlNoYXBlIGJwbW5F
+bGVtZW50PVwiU2VydmljZVRhc2tfMGRqb2ttNVwiIGlkPVwiU2VydmljZVRhc2tfMGRqb2ttNV9k
+aVwiPjxvbWdkYzpCb3VuZHMgaGVpZ2h0PVwiODBcIiB3aWR0aD1cIjEwMFwiIHg9XCIyOTRcIiB5
+PVwiMTY2XCIvPjwvYnBtbmRpOkJQTU5TaGFwZT48YnBtbmRpOkJQTU5FZGdlIGJwbW5FbGVtZW50
+PVwiU2VxdWVuY2VGbG93XzF5YXdtNDVcIiBpZD1cIlNlcXVlbmNlRmxvd18xeWF3bTQ1X2RpXCI+
+PG9tZ2RpOndheXBvaW50IHg9XCIxOThcIiB4c2k6dHlwZT1cIm9tZ2RjOlBvaW50XCIgeT1cIjIw
+NlwiLz48b21nZGk6d2F5cG9pbnQgeD1cIjI5NFwiIHhzaTp0eXBlPVwib21nZGM6UG9pbnRcIiB5
+PVwiMjA2XCIvPjxicG1uZGk6QlBNTkxhYmVsPjxvbWdkYzpCb3VuZHMgaGVpZ2h0PVwiMTNcIiB3
+aWR0aD1cIjBcIiB4PVwiMjQ2XCIgeT1cIjE4NFwiLz48L2JwbW5kaTpCUE1OTGFiZWw+PC9icG1u
+ZGk6QlBNTkVkZ2U+PGJwbW5kaTpCUE1OU2hhcGUgYnBtbkVsZW1lbnQ9XCJFbmRFdmVudF8wdHZo
+aHVtXCIgaWQ9XCJFbmRFdmVudF8wdHZoaHVtX2RpXCI+PG9tZ2RjOkJvdW5kcyBoZWlnaHQ9XCIz
+NlwiIHdpZHRoPVwiMzZcIiB4PVwiNDgyXCIgeT1cIjE4OFwiLz48YnBtbmRpOkJQTU5MYWJlbD48
+b21nZGM6Qm91bmRzIGhlaWdodD1cIjEzXCIgd2lkdGg9XCIwXCIgeD1cIjUwMFwiIHk9XCIyMjdc
+Ii8+PC9icG1uZGk6QlBNTkxhYmVsPjwvYnBtbmRpOkJQTU5TaGFwZT48YnBtbmRpOkJQTU5FZGdl
+IGJwbW5FbGVtZW50PVwiU2VxdWVuY2VGbG93XzB4aGM5M3RcIiBpZD1cIlNlcXVlbmNlRmxvd18w
+eGhjOTN0X2RpXCI+PG9tZ2RpOndheXBvaW50IHg9XCIzOTRcIiB4c2k6dHlwZT1cIm9tZ2RjOlBv
+aW50XCIgeT1cIjIwNlwiLz48b21nZGk6d2F5cG9pbnQgeD1cIjQ4MlwiIHhzaTp0eXBlPVwib21n
+ZGM6UG9pbnRcIiB5PVwiMjA2XCIvPjxicG1uZGk6QlBNTkxhYmVsPjxvbWdkYzpCb3VuZHMgaGVp
+Z2h0PVwiMTNcIiB3aWR0aD1cIjBcIiB4PVwiNDM4XCIgeT1cIjE4NFwiLz48L2JwbW5kaTpCUE1O
+TGFiZWw+PC9icG1uZGk6QlBNTkVkZ2U+PGJwbW5kaTpCUE1OU2hhcGUgYnBtbkVsZW1lbnQ9XCJU
+ZXh0QW5ub3RhdGlvbl8wNG9uZzdnXCIgaWQ9XCJUZXh0QW5ub3RhdGlvbl8wNG9uZzdnX2RpXCI+
+PG9tZ2RjOkJvdW5kcyBoZWlnaHQ9XCI1OVwiIHdpZHRoPVwiMjA0XCIgeD1cIjM4N1wiIHk9XCI4
+MVwiLz48L2JwbW5kaTpCUE1OU2hhcGU+PGJwbW5kaTpCUE1ORWRnZSBicG1uRWxlbWVudD1cIkFz
+c29jaWF0aW9uXzFyOGw1cmtcIiBpZD1cIkFzc29jaWF0aW9uXzFyOGw1cmtfZGlcIj48b21nZGk6
+d2F5cG9pbnQgeD1cIjM5MlwiIHhzaTp0eXBlPVwib21nZGM6UG9pbnRcIiB5PVwiMTc0XCIvPjxv
+bWdkaTp3YXlwb2ludCB4PVwiNDQ1XCIgeHNpOnR5cGU9XCJvbWdkYzpQb2ludFwiIHk9XCIxNDBc
+Ii8+PC9icG1uZGk6QlBNTkVkZ2U+PC9icG1uZGk6QlBNTlBsYW5lPjwvYnBtbmRpOkJQTU5EaWFn
+cmFtPjwvZGVmaW5pdGlvbnM+In0sICJjb250ZW50X3ZlcnNpb24iOiAyLCAiY3JlYXRvcl9pZCI6
+ICJlYjJkMWY3ZC02NjUxLTQxNWEtYjRmZi1hMTRmY2QyZjg0ZjUiLCAiZGVzY3JpcHRpb24iOiAi
+Q3JlYXRlIGEgTUlTUCBTaWdodGluZyBmcm9tIGFuIGFydGlmYWN0IiwgImV4cG9ydF9rZXkiOiAi
+ZXhhbXBsZV9taXNwX2NyZWF0ZV9zaWdodGluZyIsICJsYXN0X21vZGlmaWVkX2J5IjogImViMmQx
+ZjdkLTY2NTEtNDE1YS1iNGZmLWExNGZjZDJmODRmNSIsICJsYXN0X21vZGlmaWVkX3RpbWUiOiAx
+NjAwNzg5MTI0NjM3LCAibmFtZSI6ICJFeGFtcGxlOiBNSVNQIENyZWF0ZSBTaWdodGluZyIsICJv
+YmplY3RfdHlwZSI6ICJhcnRpZmFjdCIsICJwcm9ncmFtbWF0aWNfbmFtZSI6ICJleGFtcGxlX21p
+c3BfY3JlYXRlX3NpZ2h0aW5nIiwgInRhZ3MiOiBbXSwgInV1aWQiOiAiYjkwZDFjYzItZjFhNC00
+YWE2LWFiNzEtMmRmYWVkNTY2OGY3IiwgIndvcmtmbG93X2lkIjogMTB9LCB7ImFjdGlvbnMiOiBb
+XSwgImNvbnRlbnQiOiB7InZlcnNpb24iOiAyLCAid29ya2Zsb3dfaWQiOiAiZXhhbXBsZV9taXNw
+X2NyZWF0ZV9ldmVudCIsICJ4bWwiOiAiPD94bWwgdmVyc2lvbj1cIjEuMFwiIGVuY29kaW5nPVwi
+VVRGLThcIj8+PGRlZmluaXRpb25zIHhtbG5zPVwiaHR0cDovL3d3dy5vbWcub3JnL3NwZWMvQlBN
+Ti8yMDEwMDUyNC9NT0RFTFwiIHhtbG5zOmJwbW5kaT1cImh0dHA6Ly93d3cub21nLm9yZy9zcGVj
+L0JQTU4vMjAxMDA1MjQvRElcIiB4bWxuczpvbWdkYz1cImh0dHA6Ly93d3cub21nLm9yZy9zcGVj
+L0RELzIwMTAwNTI0L0RDXCIgeG1sbnM6b21nZGk9XCJodHRwOi8vd3d3Lm9tZy5vcmcvc3BlYy9E
+RC8yMDEwMDUyNC9ESVwiIHhtbG5zOnJlc2lsaWVudD1cImh0dHA6Ly9yZXNpbGllbnQuaWJtLmNv
+bS9icG1uXCIgeG1sbnM6eHNkPVwiaHR0cDovL3d3dy53My5vcmcvMjAwMS9YTUxTY2hlbWFcIiB4
+bWxuczp4c2k9XCJodHRwOi8vd3d3LnczLm9yZy8yMDAxL1hNTFNjaGVtYS1pbnN0YW5jZVwiIHRh
+cmdldE5hbWVzcGFjZT1cImh0dHA6Ly93d3cuY2FtdW5kYS5vcmcvdGVzdFwiPjxwcm9jZXNzIGlk
+PVwiZXhhbXBsZV9taXNwX2NyZWF0ZV9ldmVudFwiIGlzRXhlY3V0YWJsZT1cInRydWVcIiBuYW1l
+PVwiRXhhbXBsZTogTUlTUCBDcmVhdGUgRXZlbnRcIj48ZG9jdW1lbnRhdGlvbj5DcmVhdGUgYSBN
+SVNQIGV2ZW50IGZyb20gYW4gaW5jaWRlbnQ8L2RvY3VtZW50YXRpb24+PHN0YXJ0RXZlbnQgaWQ9
+XCJTdGFydEV2ZW50XzE1NWFzeG1cIj48b3V0Z29pbmc+U2VxdWVuY2VGbG93XzByc2ZsZWQ8L291
+dGdvaW5nPjwvc3RhcnRFdmVudD48c2VydmljZVRhc2sgaWQ9XCJTZXJ2aWNlVGFza18wMGVyNGpr
+XCIgbmFtZT1cIk1JU1AgQ3JlYXRlIEV2ZW50XCIgcmVzaWxpZW50OnR5cGU9XCJmdW5jdGlvblwi
+PjxleHRlbnNpb25FbGVtZW50cz48cmVzaWxpZW50OmZ1bmN0aW9uIHV1aWQ9XCI4ZjliN2M0NS05
+ZDRlLTRkMzUtOGJkZC1lYjJlMjkyMzQxM2FcIj57XCJpbnB1dHNcIjp7XCIzNDdiNTUwNi1mNWFl
+LTQ1OTctYTkxOC1lMzZlOWZkZmI3OWFcIjp7XCJpbnB1dF90eXBlXCI6XCJzdGF0aWNcIixcInN0
+YXRpY19pbnB1dFwiOntcIm11bHRpc2VsZWN0X3ZhbHVlXCI6W10sXCJudW1iZXJfdmFsdWVcIjow
+fX0sXCIxZGNmNjQ4OC02ZTJkLTQwNjItYmI3NC0xNmJlNGJiNGZiZGRcIjp7XCJpbnB1dF90eXBl
+XCI6XCJzdGF0aWNcIixcInN0YXRpY19pbnB1dFwiOntcIm11bHRpc2VsZWN0X3ZhbHVlXCI6W10s
+XCJudW1iZXJfdmFsdWVcIjoyfX0sXCJhNDkyOTY5MS0xMmU2LTRjMzYtYjE1MS1iYjgxNTc5Yzhh
+NzZcIjp7XCJpbnB1dF90eXBlXCI6XCJzdGF0aWNcIixcInN0YXRpY19pbnB1dFwiOntcIm11bHRp
+c2VsZWN0X3ZhbHVlXCI6W10sXCJudW1iZXJfdmFsdWVcIjoxfX19LFwicG9zdF9wcm9jZXNzaW5n
+X3NjcmlwdFwiOlwiIyB7J3N1Y2Nlc3MnOiBUcnVlLCAnY29udGVudCc6IHsnRXZlbnQnOiB7J2lk
+JzogJzQnLCAnb3JnY19pZCc6ICcxJywgJ29yZ19pZCc6ICcxJywgJ2RhdGUnOiAnMjAxOS0wMy0y
+MycsICd0aHJlYXRfbGV2ZWxfaWQnOiAnMScsICdpbmZvJzogJ21pc3AgMicsICdwdWJsaXNoZWQn
+OiBGYWxzZSwgJ3V1aWQnOiAnNWM5NjQ3NWEtMzE3MC00OGU3LWIwYjUtMDEzOGFjMTEwMDAyJywg
+J2F0dHJpYnV0ZV9jb3VudCc6ICcwJywgJ2FuYWx5c2lzJzogJzInLCAndGltZXN0YW1wJzogJzE1
+NTMzNTI1MzgnLCAnZGlzdHJpYnV0aW9uJzogJzAnLCAncHJvcG9zYWxfZW1haWxfbG9jayc6IEZh
+bHNlLCAnbG9ja2VkJzogRmFsc2UsICdwdWJsaXNoX3RpbWVzdGFtcCc6ICcwJywgJ3NoYXJpbmdf
+Z3JvdXBfaWQnOiAnMCcsICdkaXNhYmxlX2NvcnJlbGF0aW9uJzogRmFsc2UsICdleHRlbmRzX3V1
+aWQnOiAnJywgJ2V2ZW50X2NyZWF0b3JfZW1haWwnOiAnYWRtaW5AYWRtaW4udGVzdCcsICdPcmcn
+OiB7J2lkJzogJzEnLCAnbmFtZSc6ICdPUkdOQU1FJywgJ3V1aWQnOiAnNWM5NjMxMjQtY2FhMC00
+ZGVlLWE3ODMtMDBiNmFjMTEwMDAyJ30sICdPcmdjJzogeydpZCc6ICcxJywgJ25hbWUnOiAnT1JH
+TkFNRScsICd1dWlkJzogJzVjOTYzMTI0LWNhYTAtNGRlZS1hNzgzLTAwYjZhYzExMDAwMid9LCAn
+QXR0cmlidXRlJzogW10sICdTaGFkb3dBdHRyaWJ1dGUnOiBbXSwgJ1JlbGF0ZWRFdmVudCc6IFtd
+LCAnR2FsYXh5JzogW10sICdPYmplY3QnOiBbXX19fVxcbmluY2lkZW50LnByb3BlcnRpZXMubWlz
+cF9ldmVudF9pZCA9IHJlc3VsdHMuY29udGVudFsnRXZlbnQnXVsnaWQnXVwiLFwicHJlX3Byb2Nl
+c3Npbmdfc2NyaXB0XCI6XCIjaW5wdXRzLm1pc3BfYW5hbHlzaXNfbGV2ZWwgPSAwXFxuI2lucHV0
+cy5taXNwX2Rpc3RyaWJ1dGlvbiA9IDBcXG4jaW5wdXRzLm1pc3BfdGhyZWF0X2xldmVsID0gMlxc
+bmlucHV0cy5taXNwX2V2ZW50X25hbWUgPSBpbmNpZGVudC5uYW1lXCJ9PC9yZXNpbGllbnQ6ZnVu
+Y3Rpb24+PC9leHRlbnNpb25FbGVtZW50cz48aW5jb21pbmc+U2VxdWVuY2VGbG93XzByc2ZsZWQ8
+L2luY29taW5nPjxvdXRnb2luZz5TZXF1ZW5jZUZsb3dfMW9uYmNiNDwvb3V0Z29pbmc+PC9zZXJ2
+aWNlVGFzaz48c2VxdWVuY2VGbG93IGlkPVwiU2VxdWVuY2VGbG93XzByc2ZsZWRcIiBzb3VyY2VS
+ZWY9XCJTdGFydEV2ZW50XzE1NWFzeG1cIiB0YXJnZXRSZWY9XCJTZXJ2aWNlVGFza18wMGVyNGpr
+XCIvPjxlbmRFdmVudCBpZD1cIkVuZEV2ZW50XzF4djQydWxcIj48aW5jb21pbmc+U2VxdWVuY2VG
+bG93XzFvbmJjYjQ8L2luY29taW5nPjwvZW5kRXZlbnQ+PHNlcXVlbmNlRmxvdyBpZD1cIlNlcXVl
+bmNlRmxvd18xb25iY2I0XCIgc291cmNlUmVmPVwiU2VydmljZVRhc2tfMDBlcjRqa1wiIHRhcmdl
+dFJlZj1cIkVuZEV2ZW50XzF4djQydWxcIi8+PHRleHRBbm5vdGF0aW9uIGlkPVwiVGV4dEFubm90
+YXRpb25fMXBldHhqaVwiPjx0ZXh0PlJldHVybnMgdGhlIG1pc3BfZXZlbnRfaWQgZm9yIG9uZ29p
+bmcgcmVmZXJlbmNlPC90ZXh0PjwvdGV4dEFubm90YXRpb24+PGFzc29jaWF0aW9uIGlkPVwiQXNz
+b2NpYXRpb25fMHA4dGM4dFwiIHNvdXJjZVJlZj1cIlNlcnZpY2VUYXNrXzAwZXI0amtcIiB0YXJn
+ZXRSZWY9XCJUZXh0QW5ub3RhdGlvbl8xcGV0eGppXCIvPjwvcHJvY2Vzcz48YnBtbmRpOkJQTU5E
+aWFncmFtIGlkPVwiQlBNTkRpYWdyYW1fMVwiPjxicG1uZGk6QlBNTlBsYW5lIGJwbW5FbGVtZW50
+PVwidW5kZWZpbmVkXCIgaWQ9XCJCUE1OUGxhbmVfMVwiPjxicG1uZGk6QlBNTlNoYXBlIGJwbW5F
+bGVtZW50PVwiU3RhcnRFdmVudF8xNTVhc3htXCIgaWQ9XCJTdGFydEV2ZW50XzE1NWFzeG1fZGlc
+Ij48b21nZGM6Qm91bmRzIGhlaWdodD1cIjM2XCIgd2lkdGg9XCIzNlwiIHg9XCIxNjJcIiB5PVwi
+MTg4XCIvPjxicG1uZGk6QlBNTkxhYmVsPjxvbWdkYzpCb3VuZHMgaGVpZ2h0PVwiMFwiIHdpZHRo
+PVwiOTBcIiB4PVwiMTU3XCIgeT1cIjIyM1wiLz48L2JwbW5kaTpCUE1OTGFiZWw+PC9icG1uZGk6
+QlBNTlNoYXBlPjxicG1uZGk6QlBNTlNoYXBlIGJwbW5FbGVtZW50PVwiU2VydmljZVRhc2tfMDBl
+cjRqa1wiIGlkPVwiU2VydmljZVRhc2tfMDBlcjRqa19kaVwiPjxvbWdkYzpCb3VuZHMgaGVpZ2h0
+PVwiODBcIiB3aWR0aD1cIjEwMFwiIHg9XCIyODdcIiB5PVwiMTY2XCIvPjwvYnBtbmRpOkJQTU5T
+aGFwZT48YnBtbmRpOkJQTU5FZGdlIGJwbW5FbGVtZW50PVwiU2VxdWVuY2VGbG93XzByc2ZsZWRc
+IiBpZD1cIlNlcXVlbmNlRmxvd18wcnNmbGVkX2RpXCI+PG9tZ2RpOndheXBvaW50IHg9XCIxOThc
+IiB4c2k6dHlwZT1cIm9tZ2RjOlBvaW50XCIgeT1cIjIwNlwiLz48b21nZGk6d2F5cG9pbnQgeD1c
+IjI4N1wiIHhzaTp0eXBlPVwib21nZGM6UG9pbnRcIiB5PVwiMjA2XCIvPjxicG1uZGk6QlBNTkxh
+YmVsPjxvbWdkYzpCb3VuZHMgaGVpZ2h0PVwiMTNcIiB3aWR0aD1cIjBcIiB4PVwiMjQyLjVcIiB5
+PVwiMTg0XCIvPjwvYnBtbmRpOkJQTU5MYWJlbD48L2JwbW5kaTpCUE1ORWRnZT48YnBtbmRpOkJQ
+TU5TaGFwZSBicG1uRWxlbWVudD1cIkVuZEV2ZW50XzF4djQydWxcIiBpZD1cIkVuZEV2ZW50XzF4
+djQydWxfZGlcIj48b21nZGM6Qm91bmRzIGhlaWdodD1cIjM2XCIgd2lkdGg9XCIzNlwiIHg9XCI0
+NjZcIiB5PVwiMTg4XCIvPjxicG1uZGk6QlBNTkxhYmVsPjxvbWdkYzpCb3VuZHMgaGVpZ2h0PVwi
+MTNcIiB3aWR0aD1cIjBcIiB4PVwiNDg0XCIgeT1cIjIyN1wiLz48L2JwbW5kaTpCUE1OTGFiZWw+
+PC9icG1uZGk6QlBNTlNoYXBlPjxicG1uZGk6QlBNTkVkZ2UgYnBtbkVsZW1lbnQ9XCJTZXF1ZW5j
+ZUZsb3dfMW9uYmNiNFwiIGlkPVwiU2VxdWVuY2VGbG93XzFvbmJjYjRfZGlcIj48b21nZGk6d2F5
+cG9pbnQgeD1cIjM4N1wiIHhzaTp0eXBlPVwib21nZGM6UG9pbnRcIiB5PVwiMjA2XCIvPjxvbWdk
+aTp3YXlwb2ludCB4PVwiNDY2XCIgeHNpOnR5cGU9XCJvbWdkYzpQb2ludFwiIHk9XCIyMDZcIi8+
+PGJwbW5kaTpCUE1OTGFiZWw+PG9tZ2RjOkJvdW5kcyBoZWlnaHQ9XCIxM1wiIHdpZHRoPVwiMFwi
+IHg9XCI0MjYuNVwiIHk9XCIxODRcIi8+PC9icG1uZGk6QlBNTkxhYmVsPjwvYnBtbmRpOkJQTU5F
+ZGdlPjxicG1uZGk6QlBNTlNoYXBlIGJwbW5FbGVtZW50PVwiVGV4dEFubm90YXRpb25fMXBldHhq
+aVwiIGlkPVwiVGV4dEFubm90YXRpb25fMXBldHhqaV9kaVwiPjxvbWdkYzpCb3VuZHMgaGVpZ2h0
+PVwiNjJcIiB3aWR0aD1cIjE4MVwiIHg9XCIzODdcIiB5PVwiNzVcIi8+PC9icG1uZGk6QlBNTlNo
+YXBlPjxicG1uZGk6QlBNTkVkZ2UgYnBtbkVsZW1lbnQ9XCJBc3NvY2lhdGlvbl8wcDh0Yzh0XCIg
+aWQ9XCJBc3NvY2lhdGlvbl8wcDh0Yzh0X2RpXCI+PG9tZ2RpOndheXBvaW50IHg9XCIzODRcIiB4
+c2k6dHlwZT1cIm9tZ2RjOlBvaW50XCIgeT1cIjE3M1wiLz48b21nZGk6d2F5cG9pbnQgeD1cIjQz
+NFwiIHhzaTp0eXBlPVwib21nZGM6UG9pbnRcIiB5PVwiMTM3XCIvPjwvYnBtbmRpOkJQTU5FZGdl
+PjwvYnBtbmRpOkJQTU5QbGFuZT48L2JwbW5kaTpCUE1ORGlhZ3JhbT48L2RlZmluaXRpb25zPiJ9
+LCAiY29udGVudF92ZXJzaW9uIjogMiwgImNyZWF0b3JfaWQiOiAiZWIyZDFmN2QtNjY1MS00MTVh
+LWI0ZmYtYTE0ZmNkMmY4NGY1IiwgImRlc2NyaXB0aW9uIjogIkNyZWF0ZSBhIE1JU1AgZXZlbnQg
+ZnJvbSBhbiBpbmNpZGVudCIsICJleHBvcnRfa2V5IjogImV4YW1wbGVfbWlzcF9jcmVhdGVfZXZl
+bnQiLCAibGFzdF9tb2RpZmllZF9ieSI6ICJlYjJkMWY3ZC02NjUxLTQxNWEtYjRmZi1hMTRmY2Qy
+Zjg0ZjUiLCAibGFzdF9tb2RpZmllZF90aW1lIjogMTYwMDc4OTEyNTA5NCwgIm5hbWUiOiAiRXhh
+bXBsZTogTUlTUCBDcmVhdGUgRXZlbnQiLCAib2JqZWN0X3R5cGUiOiAiaW5jaWRlbnQiLCAicHJv
+Z3JhbW1hdGljX25hbWUiOiAiZXhhbXBsZV9taXNwX2NyZWF0ZV9ldmVudCIsICJ0YWdzIjogW10s
+ICJ1dWlkIjogImZlZDA4YTNjLTE2ZGItNDM2MC04OTIxLTBlNTAzMTVkNGVlZCIsICJ3b3JrZmxv
+d19pZCI6IDEzfSwgeyJhY3Rpb25zIjogW10sICJjb250ZW50IjogeyJ2ZXJzaW9uIjogMiwgIndv
+cmtmbG93X2lkIjogImV4YW1wbGVfbWlzcF9jcmVhdGVfdGFnX29uX2V2ZW50IiwgInhtbCI6ICI8
+P3htbCB2ZXJzaW9uPVwiMS4wXCIgZW5jb2Rpbmc9XCJVVEYtOFwiPz48ZGVmaW5pdGlvbnMgeG1s
+bnM9XCJodHRwOi8vd3d3Lm9tZy5vcmcvc3BlYy9CUE1OLzIwMTAwNTI0L01PREVMXCIgeG1sbnM6
+YnBtbmRpPVwiaHR0cDovL3d3dy5vbWcub3JnL3NwZWMvQlBNTi8yMDEwMDUyNC9ESVwiIHhtbG5z
+Om9tZ2RjPVwiaHR0cDovL3d3dy5vbWcub3JnL3NwZWMvREQvMjAxMDA1MjQvRENcIiB4bWxuczpv
+bWdkaT1cImh0dHA6Ly93d3cub21nLm9yZy9zcGVjL0RELzIwMTAwNTI0L0RJXCIgeG1sbnM6cmVz
+aWxpZW50PVwiaHR0cDovL3Jlc2lsaWVudC5pYm0uY29tL2JwbW5cIiB4bWxuczp4c2Q9XCJodHRw
+Oi8vd3d3LnczLm9yZy8yMDAxL1hNTFNjaGVtYVwiIHhtbG5zOnhzaT1cImh0dHA6Ly93d3cudzMu
+b3JnLzIwMDEvWE1MU2NoZW1hLWluc3RhbmNlXCIgdGFyZ2V0TmFtZXNwYWNlPVwiaHR0cDovL3d3
+dy5jYW11bmRhLm9yZy90ZXN0XCI+PHByb2Nlc3MgaWQ9XCJleGFtcGxlX21pc3BfY3JlYXRlX3Rh
+Z19vbl9ldmVudFwiIGlzRXhlY3V0YWJsZT1cInRydWVcIiBuYW1lPVwiRXhhbXBsZTogTUlTUCBD
+cmVhdGUgVGFnIG9uIEV2ZW50XCI+PGRvY3VtZW50YXRpb24+Q3JlYXRlcyBhIHRhZyBvbiBhbiBl
+dmVudCBpbiBNSVNQIC0gc3VjaCBhcyBUTFAsIE1JVFJFIEF0dGFjayBvciBUaHJlYXQgQWN0b3I8
+L2RvY3VtZW50YXRpb24+PHN0YXJ0RXZlbnQgaWQ9XCJTdGFydEV2ZW50XzE1NWFzeG1cIj48b3V0
+Z29pbmc+U2VxdWVuY2VGbG93XzFobnR6aXk8L291dGdvaW5nPjwvc3RhcnRFdmVudD48c2Vydmlj
+ZVRhc2sgaWQ9XCJTZXJ2aWNlVGFza18xaWNuMzRyXCIgbmFtZT1cIk1JU1AgQ3JlYXRlIFRhZ1wi
+IHJlc2lsaWVudDp0eXBlPVwiZnVuY3Rpb25cIj48ZXh0ZW5zaW9uRWxlbWVudHM+PHJlc2lsaWVu
+dDpmdW5jdGlvbiB1dWlkPVwiNzFkM2ZlZDItMGVlYy00OWFmLWE0MTgtOGU4MTc4ZTVhNDU4XCI+
+e1wiaW5wdXRzXCI6e1wiYTIwMWRjOTQtZDdmMC00YjA5LTllOWUtN2M0YmE1YTdhNWRhXCI6e1wi
+aW5wdXRfdHlwZVwiOlwic3RhdGljXCIsXCJzdGF0aWNfaW5wdXRcIjp7XCJtdWx0aXNlbGVjdF92
+YWx1ZVwiOltdLFwic2VsZWN0X3ZhbHVlXCI6XCI1NmNhZWU0Ny1lZGVkLTQ1YjUtYjJkZC1jZTRj
+NWE3ZGQxYWVcIn19fSxcInByZV9wcm9jZXNzaW5nX3NjcmlwdFwiOlwiaW5wdXRzLm1pc3BfdGFn
+X25hbWUgPSBcXFwidGxwOndoaXRlXFxcIlxcblxcbmlucHV0cy5taXNwX2V2ZW50X2lkID0gaW5j
+aWRlbnQucHJvcGVydGllcy5taXNwX2V2ZW50X2lkXCJ9PC9yZXNpbGllbnQ6ZnVuY3Rpb24+PC9l
+eHRlbnNpb25FbGVtZW50cz48aW5jb21pbmc+U2VxdWVuY2VGbG93XzFobnR6aXk8L2luY29taW5n
+PjxvdXRnb2luZz5TZXF1ZW5jZUZsb3dfMWRrbmZpYzwvb3V0Z29pbmc+PC9zZXJ2aWNlVGFzaz48
+c2VxdWVuY2VGbG93IGlkPVwiU2VxdWVuY2VGbG93XzFobnR6aXlcIiBzb3VyY2VSZWY9XCJTdGFy
+dEV2ZW50XzE1NWFzeG1cIiB0YXJnZXRSZWY9XCJTZXJ2aWNlVGFza18xaWNuMzRyXCIvPjxlbmRF
+dmVudCBpZD1cIkVuZEV2ZW50XzE1Zjh2ZHFcIj48aW5jb21pbmc+U2VxdWVuY2VGbG93XzFka25m
+aWM8L2luY29taW5nPjwvZW5kRXZlbnQ+PHNlcXVlbmNlRmxvdyBpZD1cIlNlcXVlbmNlRmxvd18x
+ZGtuZmljXCIgc291cmNlUmVmPVwiU2VydmljZVRhc2tfMWljbjM0clwiIHRhcmdldFJlZj1cIkVu
+ZEV2ZW50XzE1Zjh2ZHFcIi8+PC9wcm9jZXNzPjxicG1uZGk6QlBNTkRpYWdyYW0gaWQ9XCJCUE1O
+RGlhZ3JhbV8xXCI+PGJwbW5kaTpCUE1OUGxhbmUgYnBtbkVsZW1lbnQ9XCJ1bmRlZmluZWRcIiBp
+ZD1cIkJQTU5QbGFuZV8xXCI+PGJwbW5kaTpCUE1OU2hhcGUgYnBtbkVsZW1lbnQ9XCJTdGFydEV2
+ZW50XzE1NWFzeG1cIiBpZD1cIlN0YXJ0RXZlbnRfMTU1YXN4bV9kaVwiPjxvbWdkYzpCb3VuZHMg
+aGVpZ2h0PVwiMzZcIiB3aWR0aD1cIjM2XCIgeD1cIjI0MlwiIHk9XCIxMzBcIi8+PGJwbW5kaTpC
+UE1OTGFiZWw+PG9tZ2RjOkJvdW5kcyBoZWlnaHQ9XCIwXCIgd2lkdGg9XCI5MFwiIHg9XCIyMzdc
+IiB5PVwiMTY1XCIvPjwvYnBtbmRpOkJQTU5MYWJlbD48L2JwbW5kaTpCUE1OU2hhcGU+PGJwbW5k
+aTpCUE1OU2hhcGUgYnBtbkVsZW1lbnQ9XCJTZXJ2aWNlVGFza18xaWNuMzRyXCIgaWQ9XCJTZXJ2
+aWNlVGFza18xaWNuMzRyX2RpXCI+PG9tZ2RjOkJvdW5kcyBoZWlnaHQ9XCI4MFwiIHdpZHRoPVwi
+MTAwXCIgeD1cIjM5MlwiIHk9XCIxMDhcIi8+PC9icG1uZGk6QlBNTlNoYXBlPjxicG1uZGk6QlBN
+TkVkZ2UgYnBtbkVsZW1lbnQ9XCJTZXF1ZW5jZUZsb3dfMWhudHppeVwiIGlkPVwiU2VxdWVuY2VG
+bG93XzFobnR6aXlfZGlcIj48b21nZGk6d2F5cG9pbnQgeD1cIjI3OFwiIHhzaTp0eXBlPVwib21n
+ZGM6UG9pbnRcIiB5PVwiMTQ4XCIvPjxvbWdkaTp3YXlwb2ludCB4PVwiMzkyXCIgeHNpOnR5cGU9
+XCJvbWdkYzpQb2ludFwiIHk9XCIxNDhcIi8+PGJwbW5kaTpCUE1OTGFiZWw+PG9tZ2RjOkJvdW5k
+cyBoZWlnaHQ9XCIxM1wiIHdpZHRoPVwiMFwiIHg9XCIzMzVcIiB5PVwiMTI2XCIvPjwvYnBtbmRp
+OkJQTU5MYWJlbD48L2JwbW5kaTpCUE1ORWRnZT48YnBtbmRpOkJQTU5TaGFwZSBicG1uRWxlbWVu
+dD1cIkVuZEV2ZW50XzE1Zjh2ZHFcIiBpZD1cIkVuZEV2ZW50XzE1Zjh2ZHFfZGlcIj48b21nZGM6
+Qm91bmRzIGhlaWdodD1cIjM2XCIgd2lkdGg9XCIzNlwiIHg9XCI2MTBcIiB5PVwiMTMwXCIvPjxi
+cG1uZGk6QlBNTkxhYmVsPjxvbWdkYzpCb3VuZHMgaGVpZ2h0PVwiMTNcIiB3aWR0aD1cIjBcIiB4
+PVwiNjI4XCIgeT1cIjE2OVwiLz48L2JwbW5kaTpCUE1OTGFiZWw+PC9icG1uZGk6QlBNTlNoYXBl
+PjxicG1uZGk6QlBNTkVkZ2UgYnBtbkVsZW1lbnQ9XCJTZXF1ZW5jZUZsb3dfMWRrbmZpY1wiIGlk
+PVwiU2VxdWVuY2VGbG93XzFka25maWNfZGlcIj48b21nZGk6d2F5cG9pbnQgeD1cIjQ5MlwiIHhz
+aTp0eXBlPVwib21nZGM6UG9pbnRcIiB5PVwiMTQ4XCIvPjxvbWdkaTp3YXlwb2ludCB4PVwiNjEw
+XCIgeHNpOnR5cGU9XCJvbWdkYzpQb2ludFwiIHk9XCIxNDhcIi8+PGJwbW5kaTpCUE1OTGFiZWw+
+PG9tZ2RjOkJvdW5kcyBoZWlnaHQ9XCIxM1wiIHdpZHRoPVwiMFwiIHg9XCI1NTFcIiB5PVwiMTI2
+XCIvPjwvYnBtbmRpOkJQTU5MYWJlbD48L2JwbW5kaTpCUE1ORWRnZT48L2JwbW5kaTpCUE1OUGxh
+bmU+PC9icG1uZGk6QlBNTkRpYWdyYW0+PC9kZWZpbml0aW9ucz4ifSwgImNvbnRlbnRfdmVyc2lv
+biI6IDIsICJjcmVhdG9yX2lkIjogImViMmQxZjdkLTY2NTEtNDE1YS1iNGZmLWExNGZjZDJmODRm
+NSIsICJkZXNjcmlwdGlvbiI6ICJDcmVhdGVzIGEgdGFnIG9uIGFuIGV2ZW50IGluIE1JU1AgLSBz
+dWNoIGFzIFRMUCwgTUlUUkUgQXR0YWNrIG9yIFRocmVhdCBBY3RvciIsICJleHBvcnRfa2V5Ijog
+ImV4YW1wbGVfbWlzcF9jcmVhdGVfdGFnX29uX2V2ZW50IiwgImxhc3RfbW9kaWZpZWRfYnkiOiAi
+ZWIyZDFmN2QtNjY1MS00MTVhLWI0ZmYtYTE0ZmNkMmY4NGY1IiwgImxhc3RfbW9kaWZpZWRfdGlt
+ZSI6IDE2MDA3ODkxMjQ4MTQsICJuYW1lIjogIkV4YW1wbGU6IE1JU1AgQ3JlYXRlIFRhZyBvbiBF
+dmVudCIsICJvYmplY3RfdHlwZSI6ICJpbmNpZGVudCIsICJwcm9ncmFtbWF0aWNfbmFtZSI6ICJl
+eGFtcGxlX21pc3BfY3JlYXRlX3RhZ19vbl9ldmVudCIsICJ0YWdzIjogW10sICJ1dWlkIjogIjZi
+ODNlODZiLWQzYzYtNDdiMS1iZDY4LTQ4M2NmODRjZmYyMCIsICJ3b3JrZmxvd19pZCI6IDExfSwg
+eyJhY3Rpb25zIjogW10sICJjb250ZW50IjogeyJ2ZXJzaW9uIjogMiwgIndvcmtmbG93X2lkIjog
+ImV4YW1wbGVfbWlzcF9zaWdodGluZ19saXN0IiwgInhtbCI6ICI8P3htbCB2ZXJzaW9uPVwiMS4w
+XCIgZW5jb2Rpbmc9XCJVVEYtOFwiPz48ZGVmaW5pdGlvbnMgeG1sbnM9XCJodHRwOi8vd3d3Lm9t
+Zy5vcmcvc3BlYy9CUE1OLzIwMTAwNTI0L01PREVMXCIgeG1sbnM6YnBtbmRpPVwiaHR0cDovL3d3
+dy5vbWcub3JnL3NwZWMvQlBNTi8yMDEwMDUyNC9ESVwiIHhtbG5zOm9tZ2RjPVwiaHR0cDovL3d3
+dy5vbWcub3JnL3NwZWMvREQvMjAxMDA1MjQvRENcIiB4bWxuczpvbWdkaT1cImh0dHA6Ly93d3cu
+b21nLm9yZy9zcGVjL0RELzIwMTAwNTI0L0RJXCIgeG1sbnM6cmVzaWxpZW50PVwiaHR0cDovL3Jl
+c2lsaWVudC5pYm0uY29tL2JwbW5cIiB4bWxuczp4c2Q9XCJodHRwOi8vd3d3LnczLm9yZy8yMDAx
+L1hNTFNjaGVtYVwiIHhtbG5zOnhzaT1cImh0dHA6Ly93d3cudzMub3JnLzIwMDEvWE1MU2NoZW1h
+LWluc3RhbmNlXCIgdGFyZ2V0TmFtZXNwYWNlPVwiaHR0cDovL3d3dy5jYW11bmRhLm9yZy90ZXN0
+XCI+PHByb2Nlc3MgaWQ9XCJleGFtcGxlX21pc3Bfc2lnaHRpbmdfbGlzdFwiIGlzRXhlY3V0YWJs
+ZT1cInRydWVcIiBuYW1lPVwiRXhhbXBsZTogTUlTUCBTaWdodGluZyBMaXN0XCI+PGRvY3VtZW50
+YXRpb24+RmluZCBzaWdodGluZ3MgYXNzb2NpYXRlZCB3aXRoIGEgZ2l2ZW4gZXZlbnQ8L2RvY3Vt
+ZW50YXRpb24+PHN0YXJ0RXZlbnQgaWQ9XCJTdGFydEV2ZW50XzE1NWFzeG1cIj48b3V0Z29pbmc+
+U2VxdWVuY2VGbG93XzFuaG42ZWo8L291dGdvaW5nPjwvc3RhcnRFdmVudD48c2VydmljZVRhc2sg
+aWQ9XCJTZXJ2aWNlVGFza18wa2JyZHJ4XCIgbmFtZT1cIk1JU1AgU2lnaHRpbmcgTGlzdFwiIHJl
+c2lsaWVudDp0eXBlPVwiZnVuY3Rpb25cIj48ZXh0ZW5zaW9uRWxlbWVudHM+PHJlc2lsaWVudDpm
+dW5jdGlvbiB1dWlkPVwiOGI1MzE4MjctNzQxZC00MGU4LTkwYTUtMWVjOTljYjE3MTBkXCI+e1wi
+aW5wdXRzXCI6e30sXCJwb3N0X3Byb2Nlc3Npbmdfc2NyaXB0XCI6XCJjb250ZW50ID0gcmVzdWx0
+cy5jb250ZW50XFxuaW5jaWRlbnQuYWRkTm90ZSh1XFxcIlNpZ2h0aW5ncyBmb3IgYXNzb2NpYXRl
+ZCBldmVudC5cXFxcbnt9XFxcIi5mb3JtYXQoY29udGVudCkpXCIsXCJwcmVfcHJvY2Vzc2luZ19z
+Y3JpcHRcIjpcImlucHV0cy5taXNwX2V2ZW50X2lkID0gaW5jaWRlbnQucHJvcGVydGllcy5taXNw
+X2V2ZW50X2lkXCJ9PC9yZXNpbGllbnQ6ZnVuY3Rpb24+PC9leHRlbnNpb25FbGVtZW50cz48aW5j
+b21pbmc+U2VxdWVuY2VGbG93XzFuaG42ZWo8L2luY29taW5nPjxvdXRnb2luZz5TZXF1ZW5jZUZs
+b3dfMWF0b2tveDwvb3V0Z29pbmc+PC9zZXJ2aWNlVGFzaz48c2VxdWVuY2VGbG93IGlkPVwiU2Vx
+dWVuY2VGbG93XzFuaG42ZWpcIiBzb3VyY2VSZWY9XCJTdGFydEV2ZW50XzE1NWFzeG1cIiB0YXJn
+ZXRSZWY9XCJTZXJ2aWNlVGFza18wa2JyZHJ4XCIvPjxlbmRFdmVudCBpZD1cIkVuZEV2ZW50XzB5
+cnA5a3lcIj48aW5jb21pbmc+U2VxdWVuY2VGbG93XzFhdG9rb3g8L2luY29taW5nPjwvZW5kRXZl
+bnQ+PHNlcXVlbmNlRmxvdyBpZD1cIlNlcXVlbmNlRmxvd18xYXRva294XCIgc291cmNlUmVmPVwi
+U2VydmljZVRhc2tfMGticmRyeFwiIHRhcmdldFJlZj1cIkVuZEV2ZW50XzB5cnA5a3lcIi8+PHRl
+eHRBbm5vdGF0aW9uIGlkPVwiVGV4dEFubm90YXRpb25fMWt4eGl5dFwiPjx0ZXh0PlN0YXJ0IHlv
+dXIgd29ya2Zsb3cgaGVyZTwvdGV4dD48L3RleHRBbm5vdGF0aW9uPjxhc3NvY2lhdGlvbiBpZD1c
+IkFzc29jaWF0aW9uXzFzZXVqNDhcIiBzb3VyY2VSZWY9XCJTdGFydEV2ZW50XzE1NWFzeG1cIiB0
+YXJnZXRSZWY9XCJUZXh0QW5ub3RhdGlvbl8xa3h4aXl0XCIvPjx0ZXh0QW5ub3RhdGlvbiBpZD1c
+IlRleHRBbm5vdGF0aW9uXzB4ZzRqMnVcIj48dGV4dD5TaWdodGluZ3MgZm91bmQgcGxhY2VkIGlu
+IGFuIEluY2lkZW50IE5vdGU8L3RleHQ+PC90ZXh0QW5ub3RhdGlvbj48YXNzb2NpYXRpb24gaWQ9
+XCJBc3NvY2lhdGlvbl8waDRxNnR5XCIgc291cmNlUmVmPVwiU2VydmljZVRhc2tfMGticmRyeFwi
+IHRhcmdldFJlZj1cIlRleHRBbm5vdGF0aW9uXzB4ZzRqMnVcIi8+PC9wcm9jZXNzPjxicG1uZGk6
+QlBNTkRpYWdyYW0gaWQ9XCJCUE1ORGlhZ3JhbV8xXCI+PGJwbW5kaTpCUE1OUGxhbmUgYnBtbkVs
+ZW1lbnQ9XCJ1bmRlZmluZWRcIiBpZD1cIkJQTU5QbGFuZV8xXCI+PGJwbW5kaTpCUE1OU2hhcGUg
+YnBtbkVsZW1lbnQ9XCJTdGFydEV2ZW50XzE1NWFzeG1cIiBpZD1cIlN0YXJ0RXZlbnRfMTU1YXN4
+bV9kaVwiPjxvbWdkYzpCb3VuZHMgaGVpZ2h0PVwiMzZcIiB3aWR0aD1cIjM2XCIgeD1cIjE2Mlwi
+IHk9XCIxODhcIi8+PGJwbW5kaTpCUE1OTGFiZWw+PG9tZ2RjOkJvdW5kcyBoZWlnaHQ9XCIwXCIg
+d2lkdGg9XCI5MFwiIHg9XCIxNTdcIiB5PVwiMjIzXCIvPjwvYnBtbmRpOkJQTU5MYWJlbD48L2Jw
+bW5kaTpCUE1OU2hhcGU+PGJwbW5kaTpCUE1OU2hhcGUgYnBtbkVsZW1lbnQ9XCJUZXh0QW5ub3Rh
+dGlvbl8xa3h4aXl0XCIgaWQ9XCJUZXh0QW5ub3RhdGlvbl8xa3h4aXl0X2RpXCI+PG9tZ2RjOkJv
+dW5kcyBoZWlnaHQ9XCIzMFwiIHdpZHRoPVwiMTAwXCIgeD1cIjk5XCIgeT1cIjI1NFwiLz48L2Jw
+bW5kaTpCUE1OU2hhcGU+PGJwbW5kaTpCUE1ORWRnZSBicG1uRWxlbWVudD1cIkFzc29jaWF0aW9u
+XzFzZXVqNDhcIiBpZD1cIkFzc29jaWF0aW9uXzFzZXVqNDhfZGlcIj48b21nZGk6d2F5cG9pbnQg
+eD1cIjE2OVwiIHhzaTp0eXBlPVwib21nZGM6UG9pbnRcIiB5PVwiMjIwXCIvPjxvbWdkaTp3YXlw
+b2ludCB4PVwiMTUzXCIgeHNpOnR5cGU9XCJvbWdkYzpQb2ludFwiIHk9XCIyNTRcIi8+PC9icG1u
+ZGk6QlBNTkVkZ2U+PGJwbW5kaTpCUE1OU2hhcGUgYnBtbkVsZW1lbnQ9XCJTZXJ2aWNlVGFza18w
+a2JyZHJ4XCIgaWQ9XCJTZXJ2aWNlVGFza18wa2JyZHJ4X2RpXCI+PG9tZ2RjOkJvdW5kcyBoZWln
+aHQ9XCI4MFwiIHdpZHRoPVwiMTAwXCIgeD1cIjI1OFwiIHk9XCIxNjZcIi8+PC9icG1uZGk6QlBN
+TlNoYXBlPjxicG1uZGk6QlBNTkVkZ2UgYnBtbkVsZW1lbnQ9XCJTZXF1ZW5jZUZsb3dfMW5objZl
+alwiIGlkPVwiU2VxdWVuY2VGbG93XzFuaG42ZWpfZGlcIj48b21nZGk6d2F5cG9pbnQgeD1cIjE5
+OFwiIHhzaTp0eXBlPVwib21nZGM6UG9pbnRcIiB5PVwiMjA2XCIvPjxvbWdkaTp3YXlwb2ludCB4
+PVwiMjU4XCIgeHNpOnR5cGU9XCJvbWdkYzpQb2ludFwiIHk9XCIyMDZcIi8+PGJwbW5kaTpCUE1O
+TGFiZWw+PG9tZ2RjOkJvdW5kcyBoZWlnaHQ9XCIxM1wiIHdpZHRoPVwiMFwiIHg9XCIyMjhcIiB5
+PVwiMTg0XCIvPjwvYnBtbmRpOkJQTU5MYWJlbD48L2JwbW5kaTpCUE1ORWRnZT48YnBtbmRpOkJQ
+TU5TaGFwZSBicG1uRWxlbWVudD1cIkVuZEV2ZW50XzB5cnA5a3lcIiBpZD1cIkVuZEV2ZW50XzB5
+cnA5a3lfZGlcIj48b21nZGM6Qm91bmRzIGhlaWdodD1cIjM2XCIgd2lkdGg9XCIzNlwiIHg9XCI0
+MTdcIiB5PVwiMTg4XCIvPjxicG1uZGk6QlBNTkxhYmVsPjxvbWdkYzpCb3VuZHMgaGVpZ2h0PVwi
+MTNcIiB3aWR0aD1cIjBcIiB4PVwiNDM1XCIgeT1cIjIyN1wiLz48L2JwbW5kaTpCUE1OTGFiZWw+
+PC9icG1uZGk6QlBNTlNoYXBlPjxicG1uZGk6QlBNTkVkZ2UgYnBtbkVsZW1lbnQ9XCJTZXF1ZW5j
+ZUZsb3dfMWF0b2tveFwiIGlkPVwiU2VxdWVuY2VGbG93XzFhdG9rb3hfZGlcIj48b21nZGk6d2F5
+cG9pbnQgeD1cIjM1OFwiIHhzaTp0eXBlPVwib21nZGM6UG9pbnRcIiB5PVwiMjA2XCIvPjxvbWdk
+aTp3YXlwb2ludCB4PVwiNDE3XCIgeHNpOnR5cGU9XCJvbWdkYzpQb2ludFwiIHk9XCIyMDZcIi8+
+PGJwbW5kaTpCUE1OTGFiZWw+PG9tZ2RjOkJvdW5kcyBoZWlnaHQ9XCIxM1wiIHdpZHRoPVwiMFwi
+IHg9XCIzODcuNVwiIHk9XCIxODRcIi8+PC9icG1uZGk6QlBNTkxhYmVsPjwvYnBtbmRpOkJQTU5F
+ZGdlPjxicG1uZGk6QlBNTlNoYXBlIGJwbW5FbGVtZW50PVwiVGV4dEFubm90YXRpb25fMHhnNGoy
+dVwiIGlkPVwiVGV4dEFubm90YXRpb25fMHhnNGoydV9kaVwiPjxvbWdkYzpCb3VuZHMgaGVpZ2h0
+PVwiNTJcIiB3aWR0aD1cIjE1NVwiIHg9XCIzNDZcIiB5PVwiODFcIi8+PC9icG1uZGk6QlBNTlNo
+YXBlPjxicG1uZGk6QlBNTkVkZ2UgYnBtbkVsZW1lbnQ9XCJBc3NvY2lhdGlvbl8waDRxNnR5XCIg
+aWQ9XCJBc3NvY2lhdGlvbl8waDRxNnR5X2RpXCI+PG9tZ2RpOndheXBvaW50IHg9XCIzNTFcIiB4
+c2k6dHlwZT1cIm9tZ2RjOlBvaW50XCIgeT1cIjE2OVwiLz48b21nZGk6d2F5cG9pbnQgeD1cIjM5
+NFwiIHhzaTp0eXBlPVwib21nZGM6UG9pbnRcIiB5PVwiMTMzXCIvPjwvYnBtbmRpOkJQTU5FZGdl
+PjwvYnBtbmRpOkJQTU5QbGFuZT48L2JwbW5kaTpCUE1ORGlhZ3JhbT48L2RlZmluaXRpb25zPiJ9
+LCAiY29udGVudF92ZXJzaW9uIjogMiwgImNyZWF0b3JfaWQiOiAiZWIyZDFmN2QtNjY1MS00MTVh
+LWI0ZmYtYTE0ZmNkMmY4NGY1IiwgImRlc2NyaXB0aW9uIjogIkZpbmQgc2lnaHRpbmdzIGFzc29j
+aWF0ZWQgd2l0aCBhIGdpdmVuIGV2ZW50IiwgImV4cG9ydF9rZXkiOiAiZXhhbXBsZV9taXNwX3Np
+Z2h0aW5nX2xpc3QiLCAibGFzdF9tb2RpZmllZF9ieSI6ICJlYjJkMWY3ZC02NjUxLTQxNWEtYjRm
+Zi1hMTRmY2QyZjg0ZjUiLCAibGFzdF9tb2RpZmllZF90aW1lIjogMTYwMDc4OTEyNDk4OSwgIm5h
+bWUiOiAiRXhhbXBsZTogTUlTUCBTaWdodGluZyBMaXN0IiwgIm9iamVjdF90eXBlIjogImluY2lk
+ZW50IiwgInByb2dyYW1tYXRpY19uYW1lIjogImV4YW1wbGVfbWlzcF9zaWdodGluZ19saXN0Iiwg
+InRhZ3MiOiBbXSwgInV1aWQiOiAiNzg4NmFhMmEtN2VhNy00ZDM5LWE1N2UtMGIzNWEwNjY5YTFm
+IiwgIndvcmtmbG93X2lkIjogMTJ9LCB7ImFjdGlvbnMiOiBbXSwgImNvbnRlbnQiOiB7InZlcnNp
+b24iOiAyLCAid29ya2Zsb3dfaWQiOiAiZXhhbXBsZV9taXNwX2NyZWF0ZV90YWdfb25fYXR0cmli
+dXRlIiwgInhtbCI6ICI8P3htbCB2ZXJzaW9uPVwiMS4wXCIgZW5jb2Rpbmc9XCJVVEYtOFwiPz48
+ZGVmaW5pdGlvbnMgeG1sbnM9XCJodHRwOi8vd3d3Lm9tZy5vcmcvc3BlYy9CUE1OLzIwMTAwNTI0
+L01PREVMXCIgeG1sbnM6YnBtbmRpPVwiaHR0cDovL3d3dy5vbWcub3JnL3NwZWMvQlBNTi8yMDEw
+MDUyNC9ESVwiIHhtbG5zOm9tZ2RjPVwiaHR0cDovL3d3dy5vbWcub3JnL3NwZWMvREQvMjAxMDA1
+MjQvRENcIiB4bWxuczpvbWdkaT1cImh0dHA6Ly93d3cub21nLm9yZy9zcGVjL0RELzIwMTAwNTI0
+L0RJXCIgeG1sbnM6cmVzaWxpZW50PVwiaHR0cDovL3Jlc2lsaWVudC5pYm0uY29tL2JwbW5cIiB4
+bWxuczp4c2Q9XCJodHRwOi8vd3d3LnczLm9yZy8yMDAxL1hNTFNjaGVtYVwiIHhtbG5zOnhzaT1c
+Imh0dHA6Ly93d3cudzMub3JnLzIwMDEvWE1MU2NoZW1hLWluc3RhbmNlXCIgdGFyZ2V0TmFtZXNw
+YWNlPVwiaHR0cDovL3d3dy5jYW11bmRhLm9yZy90ZXN0XCI+PHByb2Nlc3MgaWQ9XCJleGFtcGxl
+X21pc3BfY3JlYXRlX3RhZ19vbl9hdHRyaWJ1dGVcIiBpc0V4ZWN1dGFibGU9XCJ0cnVlXCIgbmFt
+ZT1cIkV4YW1wbGU6IE1JU1AgQ3JlYXRlIFRhZyBvbiBBdHRyaWJ1dGVcIj48ZG9jdW1lbnRhdGlv
+bj5DcmVhdGVzIGEgdGFnIG9uIGFuIGF0dHJpYnV0ZSBpbiBNSVNQIC0gc3VjaCBhcyBUTFAsIE1J
+VFJFIEF0dGFjayBvciBUaHJlYXQgQWN0b3I8L2RvY3VtZW50YXRpb24+PHN0YXJ0RXZlbnQgaWQ9
+XCJTdGFydEV2ZW50XzE1NWFzeG1cIj48b3V0Z29pbmc+U2VxdWVuY2VGbG93XzBkNG1zZXY8L291
+dGdvaW5nPjwvc3RhcnRFdmVudD48c2VydmljZVRhc2sgaWQ9XCJTZXJ2aWNlVGFza18xd3I4dHhm
+XCIgbmFtZT1cIk1JU1AgQ3JlYXRlIFRhZ1wiIHJlc2lsaWVudDp0eXBlPVwiZnVuY3Rpb25cIj48
+ZXh0ZW5zaW9uRWxlbWVudHM+PHJlc2lsaWVudDpmdW5jdGlvbiB1dWlkPVwiNzFkM2ZlZDItMGVl
+Yy00OWFmLWE0MTgtOGU4MTc4ZTVhNDU4XCI+e1wiaW5wdXRzXCI6e1wiYTIwMWRjOTQtZDdmMC00
+YjA5LTllOWUtN2M0YmE1YTdhNWRhXCI6e1wiaW5wdXRfdHlwZVwiOlwic3RhdGljXCIsXCJzdGF0
+aWNfaW5wdXRcIjp7XCJtdWx0aXNlbGVjdF92YWx1ZVwiOltdLFwic2VsZWN0X3ZhbHVlXCI6XCIw
+NWM3MTE1ZC1jZjM0LTRkYTItYjA0Yy04NTczOTQzMjU5MzhcIn19fSxcInByZV9wcm9jZXNzaW5n
+X3NjcmlwdFwiOlwiaW5wdXRzLm1pc3BfYXR0cmlidXRlX3ZhbHVlID0gYXJ0aWZhY3QudmFsdWVc
+XG5pbnB1dHMubWlzcF9ldmVudF9pZCA9IGluY2lkZW50LnByb3BlcnRpZXMubWlzcF9ldmVudF9p
+ZFxcbmlucHV0cy5taXNwX3RhZ19uYW1lID0gXFxcInRscDp3aGl0ZVxcXCJcIn08L3Jlc2lsaWVu
+dDpmdW5jdGlvbj48L2V4dGVuc2lvbkVsZW1lbnRzPjxpbmNvbWluZz5TZXF1ZW5jZUZsb3dfMGQ0
+bXNldjwvaW5jb21pbmc+PG91dGdvaW5nPlNlcXVlbmNlRmxvd18xNHE3aTE5PC9vdXRnb2luZz48
+L3NlcnZpY2VUYXNrPjxzZXF1ZW5jZUZsb3cgaWQ9XCJTZXF1ZW5jZUZsb3dfMGQ0bXNldlwiIHNv
+dXJjZVJlZj1cIlN0YXJ0RXZlbnRfMTU1YXN4bVwiIHRhcmdldFJlZj1cIlNlcnZpY2VUYXNrXzF3
+cjh0eGZcIi8+PGVuZEV2ZW50IGlkPVwiRW5kRXZlbnRfMXF0aWRhN1wiPjxpbmNvbWluZz5TZXF1
+ZW5jZUZsb3dfMTRxN2kxOTwvaW5jb21pbmc+PC9lbmRFdmVudD48c2VxdWVuY2VGbG93IGlkPVwi
+U2VxdWVuY2VGbG93XzE0cTdpMTlcIiBzb3VyY2VSZWY9XCJTZXJ2aWNlVGFza18xd3I4dHhmXCIg
+dGFyZ2V0UmVmPVwiRW5kRXZlbnRfMXF0aWRhN1wiLz48L3Byb2Nlc3M+PGJwbW5kaTpCUE1ORGlh
+Z3JhbSBpZD1cIkJQTU5EaWFncmFtXzFcIj48YnBtbmRpOkJQTU5QbGFuZSBicG1uRWxlbWVudD1c
+InVuZGVmaW5lZFwiIGlkPVwiQlBNTlBsYW5lXzFcIj48YnBtbmRpOkJQTU5TaGFwZSBicG1uRWxl
+bWVudD1cIlN0YXJ0RXZlbnRfMTU1YXN4bVwiIGlkPVwiU3RhcnRFdmVudF8xNTVhc3htX2RpXCI+
+PG9tZ2RjOkJvdW5kcyBoZWlnaHQ9XCIzNlwiIHdpZHRoPVwiMzZcIiB4PVwiMjY4XCIgeT1cIjE3
+NlwiLz48YnBtbmRpOkJQTU5MYWJlbD48b21nZGM6Qm91bmRzIGhlaWdodD1cIjBcIiB3aWR0aD1c
+IjkwXCIgeD1cIjI2M1wiIHk9XCIyMTFcIi8+PC9icG1uZGk6QlBNTkxhYmVsPjwvYnBtbmRpOkJQ
+TU5TaGFwZT48YnBtbmRpOkJQTU5TaGFwZSBicG1uRWxlbWVudD1cIlNlcnZpY2VUYXNrXzF3cjh0
+eGZcIiBpZD1cIlNlcnZpY2VUYXNrXzF3cjh0eGZfZGlcIj48b21nZGM6Qm91bmRzIGhlaWdodD1c
+IjgwXCIgd2lkdGg9XCIxMDBcIiB4PVwiMzk5XCIgeT1cIjE1NFwiLz48L2JwbW5kaTpCUE1OU2hh
+cGU+PGJwbW5kaTpCUE1ORWRnZSBicG1uRWxlbWVudD1cIlNlcXVlbmNlRmxvd18wZDRtc2V2XCIg
+aWQ9XCJTZXF1ZW5jZUZsb3dfMGQ0bXNldl9kaVwiPjxvbWdkaTp3YXlwb2ludCB4PVwiMzA0XCIg
+eHNpOnR5cGU9XCJvbWdkYzpQb2ludFwiIHk9XCIxOTRcIi8+PG9tZ2RpOndheXBvaW50IHg9XCIz
+OTlcIiB4c2k6dHlwZT1cIm9tZ2RjOlBvaW50XCIgeT1cIjE5NFwiLz48YnBtbmRpOkJQTU5MYWJl
+bD48b21nZGM6Qm91bmRzIGhlaWdodD1cIjEzXCIgd2lkdGg9XCIwXCIgeD1cIjM1MS41XCIgeT1c
+IjE3MlwiLz48L2JwbW5kaTpCUE1OTGFiZWw+PC9icG1uZGk6QlBNTkVkZ2U+PGJwbW5kaTpCUE1O
+U2hhcGUgYnBtbkVsZW1lbnQ9XCJFbmRFdmVudF8xcXRpZGE3XCIgaWQ9XCJFbmRFdmVudF8xcXRp
+ZGE3X2RpXCI+PG9tZ2RjOkJvdW5kcyBoZWlnaHQ9XCIzNlwiIHdpZHRoPVwiMzZcIiB4PVwiNjA3
+XCIgeT1cIjE3NlwiLz48YnBtbmRpOkJQTU5MYWJlbD48b21nZGM6Qm91bmRzIGhlaWdodD1cIjEz
+XCIgd2lkdGg9XCIwXCIgeD1cIjYyNVwiIHk9XCIyMTVcIi8+PC9icG1uZGk6QlBNTkxhYmVsPjwv
+YnBtbmRpOkJQTU5TaGFwZT48YnBtbmRpOkJQTU5FZGdlIGJwbW5FbGVtZW50PVwiU2VxdWVuY2VG
+bG93XzE0cTdpMTlcIiBpZD1cIlNlcXVlbmNlRmxvd18xNHE3aTE5X2RpXCI+PG9tZ2RpOndheXBv
+aW50IHg9XCI0OTlcIiB4c2k6dHlwZT1cIm9tZ2RjOlBvaW50XCIgeT1cIjE5NFwiLz48b21nZGk6
+d2F5cG9pbnQgeD1cIjYwN1wiIHhzaTp0eXBlPVwib21nZGM6UG9pbnRcIiB5PVwiMTk0XCIvPjxi
+cG1uZGk6QlBNTkxhYmVsPjxvbWdkYzpCb3VuZHMgaGVpZ2h0PVwiMTNcIiB3aWR0aD1cIjBcIiB4
+PVwiNTUzXCIgeT1cIjE3MlwiLz48L2JwbW5kaTpCUE1OTGFiZWw+PC9icG1uZGk6QlBNTkVkZ2U+
+PC9icG1uZGk6QlBNTlBsYW5lPjwvYnBtbmRpOkJQTU5EaWFncmFtPjwvZGVmaW5pdGlvbnM+In0s
+ICJjb250ZW50X3ZlcnNpb24iOiAyLCAiY3JlYXRvcl9pZCI6ICJlYjJkMWY3ZC02NjUxLTQxNWEt
+YjRmZi1hMTRmY2QyZjg0ZjUiLCAiZGVzY3JpcHRpb24iOiAiQ3JlYXRlcyBhIHRhZyBvbiBhbiBh
+dHRyaWJ1dGUgaW4gTUlTUCAtIHN1Y2ggYXMgVExQLCBNSVRSRSBBdHRhY2sgb3IgVGhyZWF0IEFj
+dG9yIiwgImV4cG9ydF9rZXkiOiAiZXhhbXBsZV9taXNwX2NyZWF0ZV90YWdfb25fYXR0cmlidXRl
+IiwgImxhc3RfbW9kaWZpZWRfYnkiOiAiZWIyZDFmN2QtNjY1MS00MTVhLWI0ZmYtYTE0ZmNkMmY4
+NGY1IiwgImxhc3RfbW9kaWZpZWRfdGltZSI6IDE2MDA3ODkxMjQ0ODUsICJuYW1lIjogIkV4YW1w
+bGU6IE1JU1AgQ3JlYXRlIFRhZyBvbiBBdHRyaWJ1dGUiLCAib2JqZWN0X3R5cGUiOiAiYXJ0aWZh
+Y3QiLCAicHJvZ3JhbW1hdGljX25hbWUiOiAiZXhhbXBsZV9taXNwX2NyZWF0ZV90YWdfb25fYXR0
+cmlidXRlIiwgInRhZ3MiOiBbXSwgInV1aWQiOiAiZjYwYzRmMTAtMDU1Ny00YjZhLWI4NWYtM2Rj
+YTMxNmJhYTNlIiwgIndvcmtmbG93X2lkIjogOX0sIHsiYWN0aW9ucyI6IFtdLCAiY29udGVudCI6
+IHsidmVyc2lvbiI6IDIsICJ3b3JrZmxvd19pZCI6ICJleGFtcGxlX21pc3Bfc2VhcmNoX2F0dHJp
+YnV0ZSIsICJ4bWwiOiAiPD94bWwgdmVyc2lvbj1cIjEuMFwiIGVuY29kaW5nPVwiVVRGLThcIj8+
 PGRlZmluaXRpb25zIHhtbG5zPVwiaHR0cDovL3d3dy5vbWcub3JnL3NwZWMvQlBNTi8yMDEwMDUy
 NC9NT0RFTFwiIHhtbG5zOmJwbW5kaT1cImh0dHA6Ly93d3cub21nLm9yZy9zcGVjL0JQTU4vMjAx
 MDA1MjQvRElcIiB4bWxuczpvbWdkYz1cImh0dHA6Ly93d3cub21nLm9yZy9zcGVjL0RELzIwMTAw
@@ -512,504 +1032,102 @@ NC9ESVwiIHhtbG5zOnJlc2lsaWVudD1cImh0dHA6Ly9yZXNpbGllbnQuaWJtLmNvbS9icG1uXCIg
 eG1sbnM6eHNkPVwiaHR0cDovL3d3dy53My5vcmcvMjAwMS9YTUxTY2hlbWFcIiB4bWxuczp4c2k9
 XCJodHRwOi8vd3d3LnczLm9yZy8yMDAxL1hNTFNjaGVtYS1pbnN0YW5jZVwiIHRhcmdldE5hbWVz
 cGFjZT1cImh0dHA6Ly93d3cuY2FtdW5kYS5vcmcvdGVzdFwiPjxwcm9jZXNzIGlkPVwiZXhhbXBs
-ZV9taXNwX2NyZWF0ZV9zaWdodGluZ1wiIGlzRXhlY3V0YWJsZT1cInRydWVcIiBuYW1lPVwiRXhh
-bXBsZTogTUlTUCBDcmVhdGUgU2lnaHRpbmdcIj48ZG9jdW1lbnRhdGlvbj5DcmVhdGUgYSBNSVNQ
-IFNpZ2h0aW5nIGZyb20gYW4gYXJ0aWZhY3Q8L2RvY3VtZW50YXRpb24+PHN0YXJ0RXZlbnQgaWQ9
-XCJTdGFydEV2ZW50XzE1NWFzeG1cIj48b3V0Z29pbmc+U2VxdWVuY2VGbG93XzF5YXdtNDU8L291
-dGdvaW5nPjwvc3RhcnRFdmVudD48c2VydmljZVRhc2sgaWQ9XCJTZXJ2aWNlVGFza18wZGpva201
-XCIgbmFtZT1cIk1JU1AgQ3JlYXRlIFNpZ2h0aW5nXCIgcmVzaWxpZW50OnR5cGU9XCJmdW5jdGlv
-blwiPjxleHRlbnNpb25FbGVtZW50cz48cmVzaWxpZW50OmZ1bmN0aW9uIHV1aWQ9XCJlOWRmNzky
-Yi1hM2FmLTRkNjctYWU5MC1lNDhhYWJjYTEzOGNcIj57XCJpbnB1dHNcIjp7fSxcInBvc3RfcHJv
-Y2Vzc2luZ19zY3JpcHRcIjpcIiMgUmVzdWx0OiB7J3N1Y2Nlc3MnOiBUcnVlLCAnY29udGVudCc6
-IHsnbWVzc2FnZSc6ICdTaWdodGluZyBhZGRlZCd9fVxcbmV4aXN0aW5nX2Rlc2NyaXB0aW9uID0g
-YXJ0aWZhY3QuZGVzY3JpcHRpb24uY29udGVudCsnXFxcXG4nIGlmIGFydGlmYWN0LmRlc2NyaXB0
-aW9uIGVsc2UgXFxcIlxcXCJcXG5cXG4jaWYgcmVzdWx0cy5jb250ZW50WzBdLmdldCgnZXJyb3Jz
-Jyk6XFxuIyAgYXJ0aWZhY3QuZGVzY3JpcHRpb24gPSB1XFxcInt9TUlTUCBBdHRyaWJ1dGUgZmFp
-bHVyZToge31cXFwiLmZvcm1hdChleGlzdGluZ19kZXNjcmlwdGlvbiwgcmVzdWx0cy5jb250ZW50
-WzBdWydlcnJvcnMnXVsndmFsdWUnXSlcXG4jZWxzZTpcXG5hcnRpZmFjdC5kZXNjcmlwdGlvbiA9
-IHVcXFwie31NSVNQIEF0dHJpYnV0ZSBjcmVhdGVkOiB7fVxcXCIuZm9ybWF0KGV4aXN0aW5nX2Rl
-c2NyaXB0aW9uLCByZXN1bHRzLmNvbnRlbnRbJ21lc3NhZ2UnXSlcIixcInByZV9wcm9jZXNzaW5n
-X3NjcmlwdFwiOlwiXFxuXFxuaW5wdXRzLm1pc3Bfc2lnaHRpbmcgPSBhcnRpZmFjdC52YWx1ZVwi
-fTwvcmVzaWxpZW50OmZ1bmN0aW9uPjwvZXh0ZW5zaW9uRWxlbWVudHM+PGluY29taW5nPlNlcXVl
-bmNlRmxvd18xeWF3bTQ1PC9pbmNvbWluZz48b3V0Z29pbmc+U2VxdWVuY2VGbG93XzB4aGM5M3Q8
-L291dGdvaW5nPjwvc2VydmljZVRhc2s+PHNlcXVlbmNlRmxvdyBpZD1cIlNlcXVlbmNlRmxvd18x
-eWF3bTQ1XCIgc291cmNlUmVmPVwiU3RhcnRFdmVudF8xNTVhc3htXCIgdGFyZ2V0UmVmPVwiU2Vy
-dmljZVRhc2tfMGRqb2ttNVwiLz48ZW5kRXZlbnQgaWQ9XCJFbmRFdmVudF8wdHZoaHVtXCI+PGlu
-Y29taW5nPlNlcXVlbmNlRmxvd18weGhjOTN0PC9pbmNvbWluZz48L2VuZEV2ZW50PjxzZXF1ZW5j
-ZUZsb3cgaWQ9XCJTZXF1ZW5jZUZsb3dfMHhoYzkzdFwiIHNvdXJjZVJlZj1cIlNlcnZpY2VUYXNr
-XzBkam9rbTVcIiB0YXJnZXRSZWY9XCJFbmRFdmVudF8wdHZoaHVtXCIvPjx0ZXh0QW5ub3RhdGlv
-biBpZD1cIlRleHRBbm5vdGF0aW9uXzA0b25nN2dcIj48dGV4dD5UaGUgYXJ0aWZhY3QgZGVzY3Jp
-cHRpb24gaXMgdXBkYXRlZCB3aXRoIHRoZSByZXN1bHQ8L3RleHQ+PC90ZXh0QW5ub3RhdGlvbj48
-YXNzb2NpYXRpb24gaWQ9XCJBc3NvY2lhdGlvbl8xcjhsNXJrXCIgc291cmNlUmVmPVwiU2Vydmlj
-ZVRhc2tfMGRqb2ttNVwiIHRhcmdldFJlZj1cIlRleHRBbm5vdGF0aW9uXzA0b25nN2dcIi8+PC9w
-cm9jZXNzPjxicG1uZGk6QlBNTkRpYWdyYW0gaWQ9XCJCUE1ORGlhZ3JhbV8xXCI+PGJwbW5kaTpC
-UE1OUGxhbmUgYnBtbkVsZW1lbnQ9XCJ1bmRlZmluZWRcIiBpZD1cIkJQTU5QbGFuZV8xXCI+PGJw
-bW5kaTpCUE1OU2hhcGUgYnBtbkVsZW1lbnQ9XCJTdGFydEV2ZW50XzE1NWFzeG1cIiBpZD1cIlN0
-YXJ0RXZlbnRfMTU1YXN4bV9kaVwiPjxvbWdkYzpCb3VuZHMgaGVpZ2h0PVwiMzZcIiB3aWR0aD1c
-IjM2XCIgeD1cIjE2MlwiIHk9XCIxODhcIi8+PGJwbW5kaTpCUE1OTGFiZWw+PG9tZ2RjOkJvdW5k
-cyBoZWlnaHQ9XCIwXCIgd2lkdGg9XCI5MFwiIHg9XCIxNTdcIiB5PVwiMjIzXCIvPjwvYnBtbmRp
-OkJQTU5MYWJlbD48L2JwbW5kaTpCUE1OU2hhcGU+PGJwbW5kaTpCUE1OU2hhcGUgYnBtbkVsZW1l
-bnQ9XCJTZXJ2aWNlVGFza18wZGpva201XCIgaWQ9XCJTZXJ2aWNlVGFza18wZGpva201X2RpXCI+
-PG9tZ2RjOkJvdW5kcyBoZWlnaHQ9XCI4MFwiIHdpZHRoPVwiMTAwXCIgeD1cIjI5NFwiIHk9XCIx
-NjZcIi8+PC9icG1uZGk6QlBNTlNoYXBlPjxicG1uZGk6QlBNTkVkZ2UgYnBtbkVsZW1lbnQ9XCJT
-ZXF1ZW5jZUZsb3dfMXlhd200NVwiIGlkPVwiU2VxdWVuY2VGbG93XzF5YXdtNDVfZGlcIj48b21n
-ZGk6d2F5cG9pbnQgeD1cIjE5OFwiIHhzaTp0eXBlPVwib21nZGM6UG9pbnRcIiB5PVwiMjA2XCIv
-PjxvbWdkaTp3YXlwb2ludCB4PVwiMjk0XCIgeHNpOnR5cGU9XCJvbWdkYzpQb2ludFwiIHk9XCIy
-MDZcIi8+PGJwbW5kaTpCUE1OTGFiZWw+PG9tZ2RjOkJvdW5kcyBoZWlnaHQ9XCIxM1wiIHdpZHRo
-PVwiMFwiIHg9XCIyNDZcIiB5PVwiMTg0XCIvPjwvYnBtbmRpOkJQTU5MYWJlbD48L2JwbW5kaTpC
-UE1ORWRnZT48YnBtbmRpOkJQTU5TaGFwZSBicG1uRWxlbWVudD1cIkVuZEV2ZW50XzB0dmhodW1c
-IiBpZD1cIkVuZEV2ZW50XzB0dmhodW1fZGlcIj48b21nZGM6Qm91bmRzIGhlaWdodD1cIjM2XCIg
-d2lkdGg9XCIzNlwiIHg9XCI0ODJcIiB5PVwiMTg4XCIvPjxicG1uZGk6QlBNTkxhYmVsPjxvbWdk
-YzpCb3VuZHMgaGVpZ2h0PVwiMTNcIiB3aWR0aD1cIjBcIiB4PVwiNTAwXCIgeT1cIjIyN1wiLz48
-L2JwbW5kaTpCUE1OTGFiZWw+PC9icG1uZGk6QlBNTlNoYXBlPjxicG1uZGk6QlBNTkVkZ2UgYnBt
-bkVsZW1lbnQ9XCJTZXF1ZW5jZUZsb3dfMHhoYzkzdFwiIGlkPVwiU2VxdWVuY2VGbG93XzB4aGM5
-M3RfZGlcIj48b21nZGk6d2F5cG9pbnQgeD1cIjM5NFwiIHhzaTp0eXBlPVwib21nZGM6UG9pbnRc
-IiB5PVwiMjA2XCIvPjxvbWdkaTp3YXlwb2ludCB4PVwiNDgyXCIgeHNpOnR5cGU9XCJvbWdkYzpQ
-b2ludFwiIHk9XCIyMDZcIi8+PGJwbW5kaTpCUE1OTGFiZWw+PG9tZ2RjOkJvdW5kcyBoZWlnaHQ9
-XCIxM1wiIHdpZHRoPVwiMFwiIHg9XCI0MzhcIiB5PVwiMTg0XCIvPjwvYnBtbmRpOkJQTU5MYWJl
-bD48L2JwbW5kaTpCUE1ORWRnZT48YnBtbmRpOkJQTU5TaGFwZSBicG1uRWxlbWVudD1cIlRleHRB
-bm5vdGF0aW9uXzA0b25nN2dcIiBpZD1cIlRleHRBbm5vdGF0aW9uXzA0b25nN2dfZGlcIj48b21n
-ZGM6Qm91bmRzIGhlaWdodD1cIjU5XCIgd2lkdGg9XCIyMDRcIiB4PVwiMzg3XCIgeT1cIjgxXCIv
-PjwvYnBtbmRpOkJQTU5TaGFwZT48YnBtbmRpOkJQTU5FZGdlIGJwbW5FbGVtZW50PVwiQXNzb2Np
-YXRpb25fMXI4bDVya1wiIGlkPVwiQXNzb2NpYXRpb25fMXI4bDVya19kaVwiPjxvbWdkaTp3YXlw
-b2ludCB4PVwiMzkyXCIgeHNpOnR5cGU9XCJvbWdkYzpQb2ludFwiIHk9XCIxNzRcIi8+PG9tZ2Rp
-OndheXBvaW50IHg9XCI0NDVcIiB4c2k6dHlwZT1cIm9tZ2RjOlBvaW50XCIgeT1cIjE0MFwiLz48
-L2JwbW5kaTpCUE1ORWRnZT48L2JwbW5kaTpCUE1OUGxhbmU+PC9icG1uZGk6QlBNTkRpYWdyYW0+
-PC9kZWZpbml0aW9ucz4ifSwgImNvbnRlbnRfdmVyc2lvbiI6IDIsICJjcmVhdG9yX2lkIjogImVi
-MmQxZjdkLTY2NTEtNDE1YS1iNGZmLWExNGZjZDJmODRmNSIsICJkZXNjcmlwdGlvbiI6ICJDcmVh
-dGUgYSBNSVNQIFNpZ2h0aW5nIGZyb20gYW4gYXJ0aWZhY3QiLCAiZXhwb3J0X2tleSI6ICJleGFt
-cGxlX21pc3BfY3JlYXRlX3NpZ2h0aW5nIiwgImxhc3RfbW9kaWZpZWRfYnkiOiAiZWIyZDFmN2Qt
-NjY1MS00MTVhLWI0ZmYtYTE0ZmNkMmY4NGY1IiwgImxhc3RfbW9kaWZpZWRfdGltZSI6IDE2MDA3
-ODkxMjQ2MzcsICJuYW1lIjogIkV4YW1wbGU6IE1JU1AgQ3JlYXRlIFNpZ2h0aW5nIiwgIm9iamVj
-dF90eXBlIjogImFydGlmYWN0IiwgInByb2dyYW1tYXRpY19uYW1lIjogImV4YW1wbGVfbWlzcF9j
-cmVhdGVfc2lnaHRpbmciLCAidGFncyI6IFtdLCAidXVpZCI6ICJiOTBkMWNjMi1mMWE0LTRhYTYt
-YWI3MS0yZGZhZWQ1NjY4ZjciLCAid29ya2Zsb3dfaWQiOiAxMH0sIHsiYWN0aW9ucyI6IFtdLCAi
-Y29udGVudCI6IHsidmVyc2lvbiI6IDIsICJ3b3JrZmxvd19pZCI6ICJleGFtcGxlX21pc3BfY3Jl
-YXRlX2V2ZW50IiwgInhtbCI6ICI8P3htbCB2ZXJzaW9uPVwiMS4wXCIgZW5jb2Rpbmc9XCJVVEYt
-OFwiPz48ZGVmaW5pdGlvbnMgeG1sbnM9XCJodHRwOi8vd3d3Lm9tZy5vcmcvc3BlYy9CUE1OLzIw
-MTAwNTI0L01PREVMXCIgeG1sbnM6YnBtbmRpPVwiaHR0cDovL3d3dy5vbWcub3JnL3NwZWMvQlBN
-Ti8yMDEwMDUyNC9ESVwiIHhtbG5zOm9tZ2RjPVwiaHR0cDovL3d3dy5vbWcub3JnL3NwZWMvREQv
-MjAxMDA1MjQvRENcIiB4bWxuczpvbWdkaT1cImh0dHA6Ly93d3cub21nLm9yZy9zcGVjL0RELzIw
-MTAwNTI0L0RJXCIgeG1sbnM6cmVzaWxpZW50PVwiaHR0cDovL3Jlc2lsaWVudC5pYm0uY29tL2Jw
-bW5cIiB4bWxuczp4c2Q9XCJodHRwOi8vd3d3LnczLm9yZy8yMDAxL1hNTFNjaGVtYVwiIHhtbG5z
-OnhzaT1cImh0dHA6Ly93d3cudzMub3JnLzIwMDEvWE1MU2NoZW1hLWluc3RhbmNlXCIgdGFyZ2V0
-TmFtZXNwYWNlPVwiaHR0cDovL3d3dy5jYW11bmRhLm9yZy90ZXN0XCI+PHByb2Nlc3MgaWQ9XCJl
-eGFtcGxlX21pc3BfY3JlYXRlX2V2ZW50XCIgaXNFeGVjdXRhYmxlPVwidHJ1ZVwiIG5hbWU9XCJF
-eGFtcGxlOiBNSVNQIENyZWF0ZSBFdmVudFwiPjxkb2N1bWVudGF0aW9uPkNyZWF0ZSBhIE1JU1Ag
-ZXZlbnQgZnJvbSBhbiBpbmNpZGVudDwvZG9jdW1lbnRhdGlvbj48c3RhcnRFdmVudCBpZD1cIlN0
-YXJ0RXZlbnRfMTU1YXN4bVwiPjxvdXRnb2luZz5TZXF1ZW5jZUZsb3dfMHJzZmxlZDwvb3V0Z29p
-bmc+PC9zdGFydEV2ZW50PjxzZXJ2aWNlVGFzayBpZD1cIlNlcnZpY2VUYXNrXzAwZXI0amtcIiBu
-YW1lPVwiTUlTUCBDcmVhdGUgRXZlbnRcIiByZXNpbGllbnQ6dHlwZT1cImZ1bmN0aW9uXCI+PGV4
-dGVuc2lvbkVsZW1lbnRzPjxyZXNpbGllbnQ6ZnVuY3Rpb24gdXVpZD1cIjhmOWI3YzQ1LTlkNGUt
-NGQzNS04YmRkLWViMmUyOTIzNDEzYVwiPntcImlucHV0c1wiOntcIjM0N2I1NTA2LWY1YWUtNDU5
-Ny1hOTE4LWUzNmU5ZmRmYjc5YVwiOntcImlucHV0X3R5cGVcIjpcInN0YXRpY1wiLFwic3RhdGlj
-X2lucHV0XCI6e1wibXVsdGlzZWxlY3RfdmFsdWVcIjpbXSxcIm51bWJlcl92YWx1ZVwiOjB9fSxc
-IjFkY2Y2NDg4LTZlMmQtNDA2Mi1iYjc0LTE2YmU0YmI0ZmJkZFwiOntcImlucHV0X3R5cGVcIjpc
-InN0YXRpY1wiLFwic3RhdGljX2lucHV0XCI6e1wibXVsdGlzZWxlY3RfdmFsdWVcIjpbXSxcIm51
-bWJlcl92YWx1ZVwiOjJ9fSxcImE0OTI5NjkxLTEyZTYtNGMzNi1iMTUxLWJiODE1NzljOGE3Nlwi
-OntcImlucHV0X3R5cGVcIjpcInN0YXRpY1wiLFwic3RhdGljX2lucHV0XCI6e1wibXVsdGlzZWxl
-Y3RfdmFsdWVcIjpbXSxcIm51bWJlcl92YWx1ZVwiOjF9fX0sXCJwb3N0X3Byb2Nlc3Npbmdfc2Ny
-aXB0XCI6XCIjIHsnc3VjY2Vzcyc6IFRydWUsICdjb250ZW50JzogeydFdmVudCc6IHsnaWQnOiAn
-NCcsICdvcmdjX2lkJzogJzEnLCAnb3JnX2lkJzogJzEnLCAnZGF0ZSc6ICcyMDE5LTAzLTIzJywg
-J3RocmVhdF9sZXZlbF9pZCc6ICcxJywgJ2luZm8nOiAnbWlzcCAyJywgJ3B1Ymxpc2hlZCc6IEZh
-bHNlLCAndXVpZCc6ICc1Yzk2NDc1YS0zMTcwLTQ4ZTctYjBiNS0wMTM4YWMxMTAwMDInLCAnYXR0
-cmlidXRlX2NvdW50JzogJzAnLCAnYW5hbHlzaXMnOiAnMicsICd0aW1lc3RhbXAnOiAnMTU1MzM1
-MjUzOCcsICdkaXN0cmlidXRpb24nOiAnMCcsICdwcm9wb3NhbF9lbWFpbF9sb2NrJzogRmFsc2Us
-ICdsb2NrZWQnOiBGYWxzZSwgJ3B1Ymxpc2hfdGltZXN0YW1wJzogJzAnLCAnc2hhcmluZ19ncm91
-cF9pZCc6ICcwJywgJ2Rpc2FibGVfY29ycmVsYXRpb24nOiBGYWxzZSwgJ2V4dGVuZHNfdXVpZCc6
-ICcnLCAnZXZlbnRfY3JlYXRvcl9lbWFpbCc6ICdhZG1pbkBhZG1pbi50ZXN0JywgJ09yZyc6IHsn
-aWQnOiAnMScsICduYW1lJzogJ09SR05BTUUnLCAndXVpZCc6ICc1Yzk2MzEyNC1jYWEwLTRkZWUt
-YTc4My0wMGI2YWMxMTAwMDInfSwgJ09yZ2MnOiB7J2lkJzogJzEnLCAnbmFtZSc6ICdPUkdOQU1F
-JywgJ3V1aWQnOiAnNWM5NjMxMjQtY2FhMC00ZGVlLWE3ODMtMDBiNmFjMTEwMDAyJ30sICdBdHRy
-aWJ1dGUnOiBbXSwgJ1NoYWRvd0F0dHJpYnV0ZSc6IFtdLCAnUmVsYXRlZEV2ZW50JzogW10sICdH
-YWxheHknOiBbXSwgJ09iamVjdCc6IFtdfX19XFxuaW5jaWRlbnQucHJvcGVydGllcy5taXNwX2V2
-ZW50X2lkID0gcmVzdWx0cy5jb250ZW50WydFdmVudCddWydpZCddXCIsXCJwcmVfcHJvY2Vzc2lu
-Z19zY3JpcHRcIjpcIiNpbnB1dHMubWlzcF9hbmFseXNpc19sZXZlbCA9IDBcXG4jaW5wdXRzLm1p
-c3BfZGlzdHJpYnV0aW9uID0gMFxcbiNpbnB1dHMubWlzcF90aHJlYXRfbGV2ZWwgPSAyXFxuaW5w
-dXRzLm1pc3BfZXZlbnRfbmFtZSA9IGluY2lkZW50Lm5hbWVcIn08L3Jlc2lsaWVudDpmdW5jdGlv
-bj48L2V4dGVuc2lvbkVsZW1lbnRzPjxpbmNvbWluZz5TZXF1ZW5jZUZsb3dfMHJzZmxlZDwvaW5j
-b21pbmc+PG91dGdvaW5nPlNlcXVlbmNlRmxvd18xb25iY2I0PC9vdXRnb2luZz48L3NlcnZpY2VU
-YXNrPjxzZXF1ZW5jZUZsb3cgaWQ9XCJTZXF1ZW5jZUZsb3dfMHJzZmxlZFwiIHNvdXJjZVJlZj1c
-IlN0YXJ0RXZlbnRfMTU1YXN4bVwiIHRhcmdldFJlZj1cIlNlcnZpY2VUYXNrXzAwZXI0amtcIi8+
-PGVuZEV2ZW50IGlkPVwiRW5kRXZlbnRfMXh2NDJ1bFwiPjxpbmNvbWluZz5TZXF1ZW5jZUZsb3df
-MW9uYmNiNDwvaW5jb21pbmc+PC9lbmRFdmVudD48c2VxdWVuY2VGbG93IGlkPVwiU2VxdWVuY2VG
-bG93XzFvbmJjYjRcIiBzb3VyY2VSZWY9XCJTZXJ2aWNlVGFza18wMGVyNGprXCIgdGFyZ2V0UmVm
-PVwiRW5kRXZlbnRfMXh2NDJ1bFwiLz48dGV4dEFubm90YXRpb24gaWQ9XCJUZXh0QW5ub3RhdGlv
-bl8xcGV0eGppXCI+PHRleHQ+UmV0dXJucyB0aGUgbWlzcF9ldmVudF9pZCBmb3Igb25nb2luZyBy
-ZWZlcmVuY2U8L3RleHQ+PC90ZXh0QW5ub3RhdGlvbj48YXNzb2NpYXRpb24gaWQ9XCJBc3NvY2lh
-dGlvbl8wcDh0Yzh0XCIgc291cmNlUmVmPVwiU2VydmljZVRhc2tfMDBlcjRqa1wiIHRhcmdldFJl
-Zj1cIlRleHRBbm5vdGF0aW9uXzFwZXR4amlcIi8+PC9wcm9jZXNzPjxicG1uZGk6QlBNTkRpYWdy
-YW0gaWQ9XCJCUE1ORGlhZ3JhbV8xXCI+PGJwbW5kaTpCUE1OUGxhbmUgYnBtbkVsZW1lbnQ9XCJ1
-bmRlZmluZWRcIiBpZD1cIkJQTU5QbGFuZV8xXCI+PGJwbW5kaTpCUE1OU2hhcGUgYnBtbkVsZW1l
-bnQ9XCJTdGFydEV2ZW50XzE1NWFzeG1cIiBpZD1cIlN0YXJ0RXZlbnRfMTU1YXN4bV9kaVwiPjxv
-bWdkYzpCb3VuZHMgaGVpZ2h0PVwiMzZcIiB3aWR0aD1cIjM2XCIgeD1cIjE2MlwiIHk9XCIxODhc
-Ii8+PGJwbW5kaTpCUE1OTGFiZWw+PG9tZ2RjOkJvdW5kcyBoZWlnaHQ9XCIwXCIgd2lkdGg9XCI5
-MFwiIHg9XCIxNTdcIiB5PVwiMjIzXCIvPjwvYnBtbmRpOkJQTU5MYWJlbD48L2JwbW5kaTpCUE1O
-U2hhcGU+PGJwbW5kaTpCUE1OU2hhcGUgYnBtbkVsZW1lbnQ9XCJTZXJ2aWNlVGFza18wMGVyNGpr
-XCIgaWQ9XCJTZXJ2aWNlVGFza18wMGVyNGprX2RpXCI+PG9tZ2RjOkJvdW5kcyBoZWlnaHQ9XCI4
-MFwiIHdpZHRoPVwiMTAwXCIgeD1cIjI4N1wiIHk9XCIxNjZcIi8+PC9icG1uZGk6QlBNTlNoYXBl
-PjxicG1uZGk6QlBNTkVkZ2UgYnBtbkVsZW1lbnQ9XCJTZXF1ZW5jZUZsb3dfMHJzZmxlZFwiIGlk
-PVwiU2VxdWVuY2VGbG93XzByc2ZsZWRfZGlcIj48b21nZGk6d2F5cG9pbnQgeD1cIjE5OFwiIHhz
-aTp0eXBlPVwib21nZGM6UG9pbnRcIiB5PVwiMjA2XCIvPjxvbWdkaTp3YXlwb2ludCB4PVwiMjg3
-XCIgeHNpOnR5cGU9XCJvbWdkYzpQb2ludFwiIHk9XCIyMDZcIi8+PGJwbW5kaTpCUE1OTGFiZWw+
-PG9tZ2RjOkJvdW5kcyBoZWlnaHQ9XCIxM1wiIHdpZHRoPVwiMFwiIHg9XCIyNDIuNVwiIHk9XCIx
-ODRcIi8+PC9icG1uZGk6QlBNTkxhYmVsPjwvYnBtbmRpOkJQTU5FZGdlPjxicG1uZGk6QlBNTlNo
-YXBlIGJwbW5FbGVtZW50PVwiRW5kRXZlbnRfMXh2NDJ1bFwiIGlkPVwiRW5kRXZlbnRfMXh2NDJ1
-bF9kaVwiPjxvbWdkYzpCb3VuZHMgaGVpZ2h0PVwiMzZcIiB3aWR0aD1cIjM2XCIgeD1cIjQ2Nlwi
-IHk9XCIxODhcIi8+PGJwbW5kaTpCUE1OTGFiZWw+PG9tZ2RjOkJvdW5kcyBoZWlnaHQ9XCIxM1wi
-IHdpZHRoPVwiMFwiIHg9XCI0ODRcIiB5PVwiMjI3XCIvPjwvYnBtbmRpOkJQTU5MYWJlbD48L2Jw
-bW5kaTpCUE1OU2hhcGU+PGJwbW5kaTpCUE1ORWRnZSBicG1uRWxlbWVudD1cIlNlcXVlbmNlRmxv
-d18xb25iY2I0XCIgaWQ9XCJTZXF1ZW5jZUZsb3dfMW9uYmNiNF9kaVwiPjxvbWdkaTp3YXlwb2lu
-dCB4PVwiMzg3XCIgeHNpOnR5cGU9XCJvbWdkYzpQb2ludFwiIHk9XCIyMDZcIi8+PG9tZ2RpOndh
-eXBvaW50IHg9XCI0NjZcIiB4c2k6dHlwZT1cIm9tZ2RjOlBvaW50XCIgeT1cIjIwNlwiLz48YnBt
-bmRpOkJQTU5MYWJlbD48b21nZGM6Qm91bmRzIGhlaWdodD1cIjEzXCIgd2lkdGg9XCIwXCIgeD1c
-IjQyNi41XCIgeT1cIjE4NFwiLz48L2JwbW5kaTpCUE1OTGFiZWw+PC9icG1uZGk6QlBNTkVkZ2U+
-PGJwbW5kaTpCUE1OU2hhcGUgYnBtbkVsZW1lbnQ9XCJUZXh0QW5ub3RhdGlvbl8xcGV0eGppXCIg
-aWQ9XCJUZXh0QW5ub3RhdGlvbl8xcGV0eGppX2RpXCI+PG9tZ2RjOkJvdW5kcyBoZWlnaHQ9XCI2
-MlwiIHdpZHRoPVwiMTgxXCIgeD1cIjM4N1wiIHk9XCI3NVwiLz48L2JwbW5kaTpCUE1OU2hhcGU+
-PGJwbW5kaTpCUE1ORWRnZSBicG1uRWxlbWVudD1cIkFzc29jaWF0aW9uXzBwOHRjOHRcIiBpZD1c
-IkFzc29jaWF0aW9uXzBwOHRjOHRfZGlcIj48b21nZGk6d2F5cG9pbnQgeD1cIjM4NFwiIHhzaTp0
-eXBlPVwib21nZGM6UG9pbnRcIiB5PVwiMTczXCIvPjxvbWdkaTp3YXlwb2ludCB4PVwiNDM0XCIg
-eHNpOnR5cGU9XCJvbWdkYzpQb2ludFwiIHk9XCIxMzdcIi8+PC9icG1uZGk6QlBNTkVkZ2U+PC9i
-cG1uZGk6QlBNTlBsYW5lPjwvYnBtbmRpOkJQTU5EaWFncmFtPjwvZGVmaW5pdGlvbnM+In0sICJj
-b250ZW50X3ZlcnNpb24iOiAyLCAiY3JlYXRvcl9pZCI6ICJlYjJkMWY3ZC02NjUxLTQxNWEtYjRm
-Zi1hMTRmY2QyZjg0ZjUiLCAiZGVzY3JpcHRpb24iOiAiQ3JlYXRlIGEgTUlTUCBldmVudCBmcm9t
-IGFuIGluY2lkZW50IiwgImV4cG9ydF9rZXkiOiAiZXhhbXBsZV9taXNwX2NyZWF0ZV9ldmVudCIs
-ICJsYXN0X21vZGlmaWVkX2J5IjogImViMmQxZjdkLTY2NTEtNDE1YS1iNGZmLWExNGZjZDJmODRm
-NSIsICJsYXN0X21vZGlmaWVkX3RpbWUiOiAxNjAwNzg5MTI1MDk0LCAibmFtZSI6ICJFeGFtcGxl
-OiBNSVNQIENyZWF0ZSBFdmVudCIsICJvYmplY3RfdHlwZSI6ICJpbmNpZGVudCIsICJwcm9ncmFt
-bWF0aWNfbmFtZSI6ICJleGFtcGxlX21pc3BfY3JlYXRlX2V2ZW50IiwgInRhZ3MiOiBbXSwgInV1
-aWQiOiAiZmVkMDhhM2MtMTZkYi00MzYwLTg5MjEtMGU1MDMxNWQ0ZWVkIiwgIndvcmtmbG93X2lk
-IjogMTN9LCB7ImFjdGlvbnMiOiBbXSwgImNvbnRlbnQiOiB7InZlcnNpb24iOiAyLCAid29ya2Zs
-b3dfaWQiOiAiZXhhbXBsZV9taXNwX2NyZWF0ZV90YWdfb25fZXZlbnQiLCAieG1sIjogIjw/eG1s
-IHZlcnNpb249XCIxLjBcIiBlbmNvZGluZz1cIlVURi04XCI/PjxkZWZpbml0aW9ucyB4bWxucz1c
-Imh0dHA6Ly93d3cub21nLm9yZy9zcGVjL0JQTU4vMjAxMDA1MjQvTU9ERUxcIiB4bWxuczpicG1u
-ZGk9XCJodHRwOi8vd3d3Lm9tZy5vcmcvc3BlYy9CUE1OLzIwMTAwNTI0L0RJXCIgeG1sbnM6b21n
-ZGM9XCJodHRwOi8vd3d3Lm9tZy5vcmcvc3BlYy9ERC8yMDEwMDUyNC9EQ1wiIHhtbG5zOm9tZ2Rp
-PVwiaHR0cDovL3d3dy5vbWcub3JnL3NwZWMvREQvMjAxMDA1MjQvRElcIiB4bWxuczpyZXNpbGll
-bnQ9XCJodHRwOi8vcmVzaWxpZW50LmlibS5jb20vYnBtblwiIHhtbG5zOnhzZD1cImh0dHA6Ly93
-d3cudzMub3JnLzIwMDEvWE1MU2NoZW1hXCIgeG1sbnM6eHNpPVwiaHR0cDovL3d3dy53My5vcmcv
-MjAwMS9YTUxTY2hlbWEtaW5zdGFuY2VcIiB0YXJnZXROYW1lc3BhY2U9XCJodHRwOi8vd3d3LmNh
-bXVuZGEub3JnL3Rlc3RcIj48cHJvY2VzcyBpZD1cImV4YW1wbGVfbWlzcF9jcmVhdGVfdGFnX29u
-X2V2ZW50XCIgaXNFeGVjdXRhYmxlPVwidHJ1ZVwiIG5hbWU9XCJFeGFtcGxlOiBNSVNQIENyZWF0
-ZSBUYWcgb24gRXZlbnRcIj48ZG9jdW1lbnRhdGlvbj5DcmVhdGVzIGEgdGFnIG9uIGFuIGV2ZW50
-IGluIE1JU1AgLSBzdWNoIGFzIFRMUCwgTUlUUkUgQXR0YWNrIG9yIFRocmVhdCBBY3RvcjwvZG9j
-dW1lbnRhdGlvbj48c3RhcnRFdmVudCBpZD1cIlN0YXJ0RXZlbnRfMTU1YXN4bVwiPjxvdXRnb2lu
-Zz5TZXF1ZW5jZUZsb3dfMWhudHppeTwvb3V0Z29pbmc+PC9zdGFydEV2ZW50PjxzZXJ2aWNlVGFz
-ayBpZD1cIlNlcnZpY2VUYXNrXzFpY24zNHJcIiBuYW1lPVwiTUlTUCBDcmVhdGUgVGFnXCIgcmVz
-aWxpZW50OnR5cGU9XCJmdW5jdGlvblwiPjxleHRlbnNpb25FbGVtZW50cz48cmVzaWxpZW50OmZ1
-bmN0aW9uIHV1aWQ9XCI3MWQzZmVkMi0wZWVjLTQ5YWYtYTQxOC04ZTgxNzhlNWE0NThcIj57XCJp
-bnB1dHNcIjp7XCJhMjAxZGM5NC1kN2YwLTRiMDktOWU5ZS03YzRiYTVhN2E1ZGFcIjp7XCJpbnB1
-dF90eXBlXCI6XCJzdGF0aWNcIixcInN0YXRpY19pbnB1dFwiOntcIm11bHRpc2VsZWN0X3ZhbHVl
-XCI6W10sXCJzZWxlY3RfdmFsdWVcIjpcIjU2Y2FlZTQ3LWVkZWQtNDViNS1iMmRkLWNlNGM1YTdk
-ZDFhZVwifX19LFwicHJlX3Byb2Nlc3Npbmdfc2NyaXB0XCI6XCJpbnB1dHMubWlzcF90YWdfbmFt
-ZSA9IFxcXCJ0bHA6d2hpdGVcXFwiXFxuXFxuaW5wdXRzLm1pc3BfZXZlbnRfaWQgPSBpbmNpZGVu
-dC5wcm9wZXJ0aWVzLm1pc3BfZXZlbnRfaWRcIn08L3Jlc2lsaWVudDpmdW5jdGlvbj48L2V4dGVu
-c2lvbkVsZW1lbnRzPjxpbmNvbWluZz5TZXF1ZW5jZUZsb3dfMWhudHppeTwvaW5jb21pbmc+PG91
-dGdvaW5nPlNlcXVlbmNlRmxvd18xZGtuZmljPC9vdXRnb2luZz48L3NlcnZpY2VUYXNrPjxzZXF1
-ZW5jZUZsb3cgaWQ9XCJTZXF1ZW5jZUZsb3dfMWhudHppeVwiIHNvdXJjZVJlZj1cIlN0YXJ0RXZl
-bnRfMTU1YXN4bVwiIHRhcmdldFJlZj1cIlNlcnZpY2VUYXNrXzFpY24zNHJcIi8+PGVuZEV2ZW50
-IGlkPVwiRW5kRXZlbnRfMTVmOHZkcVwiPjxpbmNvbWluZz5TZXF1ZW5jZUZsb3dfMWRrbmZpYzwv
-aW5jb21pbmc+PC9lbmRFdmVudD48c2VxdWVuY2VGbG93IGlkPVwiU2VxdWVuY2VGbG93XzFka25m
-aWNcIiBzb3VyY2VSZWY9XCJTZXJ2aWNlVGFza18xaWNuMzRyXCIgdGFyZ2V0UmVmPVwiRW5kRXZl
-bnRfMTVmOHZkcVwiLz48L3Byb2Nlc3M+PGJwbW5kaTpCUE1ORGlhZ3JhbSBpZD1cIkJQTU5EaWFn
-cmFtXzFcIj48YnBtbmRpOkJQTU5QbGFuZSBicG1uRWxlbWVudD1cInVuZGVmaW5lZFwiIGlkPVwi
-QlBNTlBsYW5lXzFcIj48YnBtbmRpOkJQTU5TaGFwZSBicG1uRWxlbWVudD1cIlN0YXJ0RXZlbnRf
-MTU1YXN4bVwiIGlkPVwiU3RhcnRFdmVudF8xNTVhc3htX2RpXCI+PG9tZ2RjOkJvdW5kcyBoZWln
-aHQ9XCIzNlwiIHdpZHRoPVwiMzZcIiB4PVwiMjQyXCIgeT1cIjEzMFwiLz48YnBtbmRpOkJQTU5M
-YWJlbD48b21nZGM6Qm91bmRzIGhlaWdodD1cIjBcIiB3aWR0aD1cIjkwXCIgeD1cIjIzN1wiIHk9
-XCIxNjVcIi8+PC9icG1uZGk6QlBNTkxhYmVsPjwvYnBtbmRpOkJQTU5TaGFwZT48YnBtbmRpOkJQ
-TU5TaGFwZSBicG1uRWxlbWVudD1cIlNlcnZpY2VUYXNrXzFpY24zNHJcIiBpZD1cIlNlcnZpY2VU
-YXNrXzFpY24zNHJfZGlcIj48b21nZGM6Qm91bmRzIGhlaWdodD1cIjgwXCIgd2lkdGg9XCIxMDBc
-IiB4PVwiMzkyXCIgeT1cIjEwOFwiLz48L2JwbW5kaTpCUE1OU2hhcGU+PGJwbW5kaTpCUE1ORWRn
-ZSBicG1uRWxlbWVudD1cIlNlcXVlbmNlRmxvd18xaG50eml5XCIgaWQ9XCJTZXF1ZW5jZUZsb3df
-MWhudHppeV9kaVwiPjxvbWdkaTp3YXlwb2ludCB4PVwiMjc4XCIgeHNpOnR5cGU9XCJvbWdkYzpQ
-b2ludFwiIHk9XCIxNDhcIi8+PG9tZ2RpOndheXBvaW50IHg9XCIzOTJcIiB4c2k6dHlwZT1cIm9t
-Z2RjOlBvaW50XCIgeT1cIjE0OFwiLz48YnBtbmRpOkJQTU5MYWJlbD48b21nZGM6Qm91bmRzIGhl
-aWdodD1cIjEzXCIgd2lkdGg9XCIwXCIgeD1cIjMzNVwiIHk9XCIxMjZcIi8+PC9icG1uZGk6QlBN
-TkxhYmVsPjwvYnBtbmRpOkJQTU5FZGdlPjxicG1uZGk6QlBNTlNoYXBlIGJwbW5FbGVtZW50PVwi
-RW5kRXZlbnRfMTVmOHZkcVwiIGlkPVwiRW5kRXZlbnRfMTVmOHZkcV9kaVwiPjxvbWdkYzpCb3Vu
-ZHMgaGVpZ2h0PVwiMzZcIiB3aWR0aD1cIjM2XCIgeD1cIjYxMFwiIHk9XCIxMzBcIi8+PGJwbW5k
-aTpCUE1OTGFiZWw+PG9tZ2RjOkJvdW5kcyBoZWlnaHQ9XCIxM1wiIHdpZHRoPVwiMFwiIHg9XCI2
-MjhcIiB5PVwiMTY5XCIvPjwvYnBtbmRpOkJQTU5MYWJlbD48L2JwbW5kaTpCUE1OU2hhcGU+PGJw
-bW5kaTpCUE1ORWRnZSBicG1uRWxlbWVudD1cIlNlcXVlbmNlRmxvd18xZGtuZmljXCIgaWQ9XCJT
-ZXF1ZW5jZUZsb3dfMWRrbmZpY19kaVwiPjxvbWdkaTp3YXlwb2ludCB4PVwiNDkyXCIgeHNpOnR5
-cGU9XCJvbWdkYzpQb2ludFwiIHk9XCIxNDhcIi8+PG9tZ2RpOndheXBvaW50IHg9XCI2MTBcIiB4
-c2k6dHlwZT1cIm9tZ2RjOlBvaW50XCIgeT1cIjE0OFwiLz48YnBtbmRpOkJQTU5MYWJlbD48b21n
-ZGM6Qm91bmRzIGhlaWdodD1cIjEzXCIgd2lkdGg9XCIwXCIgeD1cIjU1MVwiIHk9XCIxMjZcIi8+
-PC9icG1uZGk6QlBNTkxhYmVsPjwvYnBtbmRpOkJQTU5FZGdlPjwvYnBtbmRpOkJQTU5QbGFuZT48
-L2JwbW5kaTpCUE1ORGlhZ3JhbT48L2RlZmluaXRpb25zPiJ9LCAiY29udGVudF92ZXJzaW9uIjog
-MiwgImNyZWF0b3JfaWQiOiAiZWIyZDFmN2QtNjY1MS00MTVhLWI0ZmYtYTE0ZmNkMmY4NGY1Iiwg
-ImRlc2NyaXB0aW9uIjogIkNyZWF0ZXMgYSB0YWcgb24gYW4gZXZlbnQgaW4gTUlTUCAtIHN1Y2gg
-YXMgVExQLCBNSVRSRSBBdHRhY2sgb3IgVGhyZWF0IEFjdG9yIiwgImV4cG9ydF9rZXkiOiAiZXhh
-bXBsZV9taXNwX2NyZWF0ZV90YWdfb25fZXZlbnQiLCAibGFzdF9tb2RpZmllZF9ieSI6ICJlYjJk
-MWY3ZC02NjUxLTQxNWEtYjRmZi1hMTRmY2QyZjg0ZjUiLCAibGFzdF9tb2RpZmllZF90aW1lIjog
-MTYwMDc4OTEyNDgxNCwgIm5hbWUiOiAiRXhhbXBsZTogTUlTUCBDcmVhdGUgVGFnIG9uIEV2ZW50
-IiwgIm9iamVjdF90eXBlIjogImluY2lkZW50IiwgInByb2dyYW1tYXRpY19uYW1lIjogImV4YW1w
-bGVfbWlzcF9jcmVhdGVfdGFnX29uX2V2ZW50IiwgInRhZ3MiOiBbXSwgInV1aWQiOiAiNmI4M2U4
-NmItZDNjNi00N2IxLWJkNjgtNDgzY2Y4NGNmZjIwIiwgIndvcmtmbG93X2lkIjogMTF9LCB7ImFj
-dGlvbnMiOiBbXSwgImNvbnRlbnQiOiB7InZlcnNpb24iOiAyLCAid29ya2Zsb3dfaWQiOiAiZXhh
-bXBsZV9taXNwX3NpZ2h0aW5nX2xpc3QiLCAieG1sIjogIjw/eG1sIHZlcnNpb249XCIxLjBcIiBl
-bmNvZGluZz1cIlVURi04XCI/PjxkZWZpbml0aW9ucyB4bWxucz1cImh0dHA6Ly93d3cub21nLm9y
-Zy9zcGVjL0JQTU4vMjAxMDA1MjQvTU9ERUxcIiB4bWxuczpicG1uZGk9XCJodHRwOi8vd3d3Lm9t
-Zy5vcmcvc3BlYy9CUE1OLzIwMTAwNTI0L0RJXCIgeG1sbnM6b21nZGM9XCJodHRwOi8vd3d3Lm9t
-Zy5vcmcvc3BlYy9ERC8yMDEwMDUyNC9EQ1wiIHhtbG5zOm9tZ2RpPVwiaHR0cDovL3d3dy5vbWcu
-b3JnL3NwZWMvREQvMjAxMDA1MjQvRElcIiB4bWxuczpyZXNpbGllbnQ9XCJodHRwOi8vcmVzaWxp
-ZW50LmlibS5jb20vYnBtblwiIHhtbG5zOnhzZD1cImh0dHA6Ly93d3cudzMub3JnLzIwMDEvWE1M
-U2NoZW1hXCIgeG1sbnM6eHNpPVwiaHR0cDovL3d3dy53My5vcmcvMjAwMS9YTUxTY2hlbWEtaW5z
-dGFuY2VcIiB0YXJnZXROYW1lc3BhY2U9XCJodHRwOi8vd3d3LmNhbXVuZGEub3JnL3Rlc3RcIj48
-cHJvY2VzcyBpZD1cImV4YW1wbGVfbWlzcF9zaWdodGluZ19saXN0XCIgaXNFeGVjdXRhYmxlPVwi
-dHJ1ZVwiIG5hbWU9XCJFeGFtcGxlOiBNSVNQIFNpZ2h0aW5nIExpc3RcIj48ZG9jdW1lbnRhdGlv
-bj5GaW5kIHNpZ2h0aW5ncyBhc3NvY2lhdGVkIHdpdGggYSBnaXZlbiBldmVudDwvZG9jdW1lbnRh
-dGlvbj48c3RhcnRFdmVudCBpZD1cIlN0YXJ0RXZlbnRfMTU1YXN4bVwiPjxvdXRnb2luZz5TZXF1
-ZW5jZUZsb3dfMW5objZlajwvb3V0Z29pbmc+PC9zdGFydEV2ZW50PjxzZXJ2aWNlVGFzayBpZD1c
-IlNlcnZpY2VUYXNrXzBrYnJkcnhcIiBuYW1lPVwiTUlTUCBTaWdodGluZyBMaXN0XCIgcmVzaWxp
-ZW50OnR5cGU9XCJmdW5jdGlvblwiPjxleHRlbnNpb25FbGVtZW50cz48cmVzaWxpZW50OmZ1bmN0
-aW9uIHV1aWQ9XCI4YjUzMTgyNy03NDFkLTQwZTgtOTBhNS0xZWM5OWNiMTcxMGRcIj57XCJpbnB1
-dHNcIjp7fSxcInBvc3RfcHJvY2Vzc2luZ19zY3JpcHRcIjpcImNvbnRlbnQgPSByZXN1bHRzLmNv
-bnRlbnRcXG5pbmNpZGVudC5hZGROb3RlKHVcXFwiU2lnaHRpbmdzIGZvciBhc3NvY2lhdGVkIGV2
-ZW50LlxcXFxue31cXFwiLmZvcm1hdChjb250ZW50KSlcIixcInByZV9wcm9jZXNzaW5nX3Njcmlw
-dFwiOlwiaW5wdXRzLm1pc3BfZXZlbnRfaWQgPSBpbmNpZGVudC5wcm9wZXJ0aWVzLm1pc3BfZXZl
-bnRfaWRcIn08L3Jlc2lsaWVudDpmdW5jdGlvbj48L2V4dGVuc2lvbkVsZW1lbnRzPjxpbmNvbWlu
-Zz5TZXF1ZW5jZUZsb3dfMW5objZlajwvaW5jb21pbmc+PG91dGdvaW5nPlNlcXVlbmNlRmxvd18x
-YXRva294PC9vdXRnb2luZz48L3NlcnZpY2VUYXNrPjxzZXF1ZW5jZUZsb3cgaWQ9XCJTZXF1ZW5j
-ZUZsb3dfMW5objZlalwiIHNvdXJjZVJlZj1cIlN0YXJ0RXZlbnRfMTU1YXN4bVwiIHRhcmdldFJl
-Zj1cIlNlcnZpY2VUYXNrXzBrYnJkcnhcIi8+PGVuZEV2ZW50IGlkPVwiRW5kRXZlbnRfMHlycDlr
-eVwiPjxpbmNvbWluZz5TZXF1ZW5jZUZsb3dfMWF0b2tveDwvaW5jb21pbmc+PC9lbmRFdmVudD48
-c2VxdWVuY2VGbG93IGlkPVwiU2VxdWVuY2VGbG93XzFhdG9rb3hcIiBzb3VyY2VSZWY9XCJTZXJ2
-aWNlVGFza18wa2JyZHJ4XCIgdGFyZ2V0UmVmPVwiRW5kRXZlbnRfMHlycDlreVwiLz48dGV4dEFu
-bm90YXRpb24gaWQ9XCJUZXh0QW5ub3RhdGlvbl8xa3h4aXl0XCI+PHRleHQ+U3RhcnQgeW91ciB3
-b3JrZmxvdyBoZXJlPC90ZXh0PjwvdGV4dEFubm90YXRpb24+PGFzc29jaWF0aW9uIGlkPVwiQXNz
-b2NpYXRpb25fMXNldWo0OFwiIHNvdXJjZVJlZj1cIlN0YXJ0RXZlbnRfMTU1YXN4bVwiIHRhcmdl
-dFJlZj1cIlRleHRBbm5vdGF0aW9uXzFreHhpeXRcIi8+PHRleHRBbm5vdGF0aW9uIGlkPVwiVGV4
-dEFubm90YXRpb25fMHhnNGoydVwiPjx0ZXh0PlNpZ2h0aW5ncyBmb3VuZCBwbGFjZWQgaW4gYW4g
-SW5jaWRlbnQgTm90ZTwvdGV4dD48L3RleHRBbm5vdGF0aW9uPjxhc3NvY2lhdGlvbiBpZD1cIkFz
-c29jaWF0aW9uXzBoNHE2dHlcIiBzb3VyY2VSZWY9XCJTZXJ2aWNlVGFza18wa2JyZHJ4XCIgdGFy
-Z2V0UmVmPVwiVGV4dEFubm90YXRpb25fMHhnNGoydVwiLz48L3Byb2Nlc3M+PGJwbW5kaTpCUE1O
-RGlhZ3JhbSBpZD1cIkJQTU5EaWFncmFtXzFcIj48YnBtbmRpOkJQTU5QbGFuZSBicG1uRWxlbWVu
-dD1cInVuZGVmaW5lZFwiIGlkPVwiQlBNTlBsYW5lXzFcIj48YnBtbmRpOkJQTU5TaGFwZSBicG1u
-RWxlbWVudD1cIlN0YXJ0RXZlbnRfMTU1YXN4bVwiIGlkPVwiU3RhcnRFdmVudF8xNTVhc3htX2Rp
-XCI+PG9tZ2RjOkJvdW5kcyBoZWlnaHQ9XCIzNlwiIHdpZHRoPVwiMzZcIiB4PVwiMTYyXCIgeT1c
-IjE4OFwiLz48YnBtbmRpOkJQTU5MYWJlbD48b21nZGM6Qm91bmRzIGhlaWdodD1cIjBcIiB3aWR0
-aD1cIjkwXCIgeD1cIjE1N1wiIHk9XCIyMjNcIi8+PC9icG1uZGk6QlBNTkxhYmVsPjwvYnBtbmRp
-OkJQTU5TaGFwZT48YnBtbmRpOkJQTU5TaGFwZSBicG1uRWxlbWVudD1cIlRleHRBbm5vdGF0aW9u
-XzFreHhpeXRcIiBpZD1cIlRleHRBbm5vdGF0aW9uXzFreHhpeXRfZGlcIj48b21nZGM6Qm91bmRz
-IGhlaWdodD1cIjMwXCIgd2lkdGg9XCIxMDBcIiB4PVwiOTlcIiB5PVwiMjU0XCIvPjwvYnBtbmRp
-OkJQTU5TaGFwZT48YnBtbmRpOkJQTU5FZGdlIGJwbW5FbGVtZW50PVwiQXNzb2NpYXRpb25fMXNl
-dWo0OFwiIGlkPVwiQXNzb2NpYXRpb25fMXNldWo0OF9kaVwiPjxvbWdkaTp3YXlwb2ludCB4PVwi
-MTY5XCIgeHNpOnR5cGU9XCJvbWdkYzpQb2ludFwiIHk9XCIyMjBcIi8+PG9tZ2RpOndheXBvaW50
-IHg9XCIxNTNcIiB4c2k6dHlwZT1cIm9tZ2RjOlBvaW50XCIgeT1cIjI1NFwiLz48L2JwbW5kaTpC
-UE1ORWRnZT48YnBtbmRpOkJQTU5TaGFwZSBicG1uRWxlbWVudD1cIlNlcnZpY2VUYXNrXzBrYnJk
-cnhcIiBpZD1cIlNlcnZpY2VUYXNrXzBrYnJkcnhfZGlcIj48b21nZGM6Qm91bmRzIGhlaWdodD1c
-IjgwXCIgd2lkdGg9XCIxMDBcIiB4PVwiMjU4XCIgeT1cIjE2NlwiLz48L2JwbW5kaTpCUE1OU2hh
-cGU+PGJwbW5kaTpCUE1ORWRnZSBicG1uRWxlbWVudD1cIlNlcXVlbmNlRmxvd18xbmhuNmVqXCIg
-aWQ9XCJTZXF1ZW5jZUZsb3dfMW5objZlal9kaVwiPjxvbWdkaTp3YXlwb2ludCB4PVwiMTk4XCIg
-eHNpOnR5cGU9XCJvbWdkYzpQb2ludFwiIHk9XCIyMDZcIi8+PG9tZ2RpOndheXBvaW50IHg9XCIy
-NThcIiB4c2k6dHlwZT1cIm9tZ2RjOlBvaW50XCIgeT1cIjIwNlwiLz48YnBtbmRpOkJQTU5MYWJl
-bD48b21nZGM6Qm91bmRzIGhlaWdodD1cIjEzXCIgd2lkdGg9XCIwXCIgeD1cIjIyOFwiIHk9XCIx
-ODRcIi8+PC9icG1uZGk6QlBNTkxhYmVsPjwvYnBtbmRpOkJQTU5FZGdlPjxicG1uZGk6QlBNTlNo
-YXBlIGJwbW5FbGVtZW50PVwiRW5kRXZlbnRfMHlycDlreVwiIGlkPVwiRW5kRXZlbnRfMHlycDlr
-eV9kaVwiPjxvbWdkYzpCb3VuZHMgaGVpZ2h0PVwiMzZcIiB3aWR0aD1cIjM2XCIgeD1cIjQxN1wi
-IHk9XCIxODhcIi8+PGJwbW5kaTpCUE1OTGFiZWw+PG9tZ2RjOkJvdW5kcyBoZWlnaHQ9XCIxM1wi
-IHdpZHRoPVwiMFwiIHg9XCI0MzVcIiB5PVwiMjI3XCIvPjwvYnBtbmRpOkJQTU5MYWJlbD48L2Jw
-bW5kaTpCUE1OU2hhcGU+PGJwbW5kaTpCUE1ORWRnZSBicG1uRWxlbWVudD1cIlNlcXVlbmNlRmxv
-d18xYXRva294XCIgaWQ9XCJTZXF1ZW5jZUZsb3dfMWF0b2tveF9kaVwiPjxvbWdkaTp3YXlwb2lu
-dCB4PVwiMzU4XCIgeHNpOnR5cGU9XCJvbWdkYzpQb2ludFwiIHk9XCIyMDZcIi8+PG9tZ2RpOndh
-eXBvaW50IHg9XCI0MTdcIiB4c2k6dHlwZT1cIm9tZ2RjOlBvaW50XCIgeT1cIjIwNlwiLz48YnBt
-bmRpOkJQTU5MYWJlbD48b21nZGM6Qm91bmRzIGhlaWdodD1cIjEzXCIgd2lkdGg9XCIwXCIgeD1c
-IjM4Ny41XCIgeT1cIjE4NFwiLz48L2JwbW5kaTpCUE1OTGFiZWw+PC9icG1uZGk6QlBNTkVkZ2U+
-PGJwbW5kaTpCUE1OU2hhcGUgYnBtbkVsZW1lbnQ9XCJUZXh0QW5ub3RhdGlvbl8weGc0ajJ1XCIg
-aWQ9XCJUZXh0QW5ub3RhdGlvbl8weGc0ajJ1X2RpXCI+PG9tZ2RjOkJvdW5kcyBoZWlnaHQ9XCI1
-MlwiIHdpZHRoPVwiMTU1XCIgeD1cIjM0NlwiIHk9XCI4MVwiLz48L2JwbW5kaTpCUE1OU2hhcGU+
-PGJwbW5kaTpCUE1ORWRnZSBicG1uRWxlbWVudD1cIkFzc29jaWF0aW9uXzBoNHE2dHlcIiBpZD1c
-IkFzc29jaWF0aW9uXzBoNHE2dHlfZGlcIj48b21nZGk6d2F5cG9pbnQgeD1cIjM1MVwiIHhzaTp0
-eXBlPVwib21nZGM6UG9pbnRcIiB5PVwiMTY5XCIvPjxvbWdkaTp3YXlwb2ludCB4PVwiMzk0XCIg
-eHNpOnR5cGU9XCJvbWdkYzpQb2ludFwiIHk9XCIxMzNcIi8+PC9icG1uZGk6QlBNTkVkZ2U+PC9i
-cG1uZGk6QlBNTlBsYW5lPjwvYnBtbmRpOkJQTU5EaWFncmFtPjwvZGVmaW5pdGlvbnM+In0sICJj
-b250ZW50X3ZlcnNpb24iOiAyLCAiY3JlYXRvcl9pZCI6ICJlYjJkMWY3ZC02NjUxLTQxNWEtYjRm
-Zi1hMTRmY2QyZjg0ZjUiLCAiZGVzY3JpcHRpb24iOiAiRmluZCBzaWdodGluZ3MgYXNzb2NpYXRl
-ZCB3aXRoIGEgZ2l2ZW4gZXZlbnQiLCAiZXhwb3J0X2tleSI6ICJleGFtcGxlX21pc3Bfc2lnaHRp
-bmdfbGlzdCIsICJsYXN0X21vZGlmaWVkX2J5IjogImViMmQxZjdkLTY2NTEtNDE1YS1iNGZmLWEx
-NGZjZDJmODRmNSIsICJsYXN0X21vZGlmaWVkX3RpbWUiOiAxNjAwNzg5MTI0OTg5LCAibmFtZSI6
-ICJFeGFtcGxlOiBNSVNQIFNpZ2h0aW5nIExpc3QiLCAib2JqZWN0X3R5cGUiOiAiaW5jaWRlbnQi
-LCAicHJvZ3JhbW1hdGljX25hbWUiOiAiZXhhbXBsZV9taXNwX3NpZ2h0aW5nX2xpc3QiLCAidGFn
-cyI6IFtdLCAidXVpZCI6ICI3ODg2YWEyYS03ZWE3LTRkMzktYTU3ZS0wYjM1YTA2NjlhMWYiLCAi
-d29ya2Zsb3dfaWQiOiAxMn0sIHsiYWN0aW9ucyI6IFtdLCAiY29udGVudCI6IHsidmVyc2lvbiI6
-IDIsICJ3b3JrZmxvd19pZCI6ICJleGFtcGxlX21pc3BfY3JlYXRlX3RhZ19vbl9hdHRyaWJ1dGUi
-LCAieG1sIjogIjw/eG1sIHZlcnNpb249XCIxLjBcIiBlbmNvZGluZz1cIlVURi04XCI/PjxkZWZp
-bml0aW9ucyB4bWxucz1cImh0dHA6Ly93d3cub21nLm9yZy9zcGVjL0JQTU4vMjAxMDA1MjQvTU9E
-RUxcIiB4bWxuczpicG1uZGk9XCJodHRwOi8vd3d3Lm9tZy5vcmcvc3BlYy9CUE1OLzIwMTAwNTI0
-L0RJXCIgeG1sbnM6b21nZGM9XCJodHRwOi8vd3d3Lm9tZy5vcmcvc3BlYy9ERC8yMDEwMDUyNC9E
-Q1wiIHhtbG5zOm9tZ2RpPVwiaHR0cDovL3d3dy5vbWcub3JnL3NwZWMvREQvMjAxMDA1MjQvRElc
-IiB4bWxuczpyZXNpbGllbnQ9XCJodHRwOi8vcmVzaWxpZW50LmlibS5jb20vYnBtblwiIHhtbG5z
-OnhzZD1cImh0dHA6Ly93d3cudzMub3JnLzIwMDEvWE1MU2NoZW1hXCIgeG1sbnM6eHNpPVwiaHR0
-cDovL3d3dy53My5vcmcvMjAwMS9YTUxTY2hlbWEtaW5zdGFuY2VcIiB0YXJnZXROYW1lc3BhY2U9
-XCJodHRwOi8vd3d3LmNhbXVuZGEub3JnL3Rlc3RcIj48cHJvY2VzcyBpZD1cImV4YW1wbGVfbWlz
-cF9jcmVhdGVfdGFnX29uX2F0dHJpYnV0ZVwiIGlzRXhlY3V0YWJsZT1cInRydWVcIiBuYW1lPVwi
-RXhhbXBsZTogTUlTUCBDcmVhdGUgVGFnIG9uIEF0dHJpYnV0ZVwiPjxkb2N1bWVudGF0aW9uPkNy
-ZWF0ZXMgYSB0YWcgb24gYW4gYXR0cmlidXRlIGluIE1JU1AgLSBzdWNoIGFzIFRMUCwgTUlUUkUg
-QXR0YWNrIG9yIFRocmVhdCBBY3RvcjwvZG9jdW1lbnRhdGlvbj48c3RhcnRFdmVudCBpZD1cIlN0
-YXJ0RXZlbnRfMTU1YXN4bVwiPjxvdXRnb2luZz5TZXF1ZW5jZUZsb3dfMGQ0bXNldjwvb3V0Z29p
-bmc+PC9zdGFydEV2ZW50PjxzZXJ2aWNlVGFzayBpZD1cIlNlcnZpY2VUYXNrXzF3cjh0eGZcIiBu
-YW1lPVwiTUlTUCBDcmVhdGUgVGFnXCIgcmVzaWxpZW50OnR5cGU9XCJmdW5jdGlvblwiPjxleHRl
-bnNpb25FbGVtZW50cz48cmVzaWxpZW50OmZ1bmN0aW9uIHV1aWQ9XCI3MWQzZmVkMi0wZWVjLTQ5
-YWYtYTQxOC04ZTgxNzhlNWE0NThcIj57XCJpbnB1dHNcIjp7XCJhMjAxZGM5NC1kN2YwLTRiMDkt
-OWU5ZS03YzRiYTVhN2E1ZGFcIjp7XCJpbnB1dF90eXBlXCI6XCJzdGF0aWNcIixcInN0YXRpY19p
-bnB1dFwiOntcIm11bHRpc2VsZWN0X3ZhbHVlXCI6W10sXCJzZWxlY3RfdmFsdWVcIjpcIjA1Yzcx
-MTVkLWNmMzQtNGRhMi1iMDRjLTg1NzM5NDMyNTkzOFwifX19LFwicHJlX3Byb2Nlc3Npbmdfc2Ny
-aXB0XCI6XCJpbnB1dHMubWlzcF9hdHRyaWJ1dGVfdmFsdWUgPSBhcnRpZmFjdC52YWx1ZVxcbmlu
-cHV0cy5taXNwX2V2ZW50X2lkID0gaW5jaWRlbnQucHJvcGVydGllcy5taXNwX2V2ZW50X2lkXFxu
-aW5wdXRzLm1pc3BfdGFnX25hbWUgPSBcXFwidGxwOndoaXRlXFxcIlwifTwvcmVzaWxpZW50OmZ1
-bmN0aW9uPjwvZXh0ZW5zaW9uRWxlbWVudHM+PGluY29taW5nPlNlcXVlbmNlRmxvd18wZDRtc2V2
-PC9pbmNvbWluZz48b3V0Z29pbmc+U2VxdWVuY2VGbG93XzE0cTdpMTk8L291dGdvaW5nPjwvc2Vy
-dmljZVRhc2s+PHNlcXVlbmNlRmxvdyBpZD1cIlNlcXVlbmNlRmxvd18wZDRtc2V2XCIgc291cmNl
-UmVmPVwiU3RhcnRFdmVudF8xNTVhc3htXCIgdGFyZ2V0UmVmPVwiU2VydmljZVRhc2tfMXdyOHR4
-ZlwiLz48ZW5kRXZlbnQgaWQ9XCJFbmRFdmVudF8xcXRpZGE3XCI+PGluY29taW5nPlNlcXVlbmNl
-Rmxvd18xNHE3aTE5PC9pbmNvbWluZz48L2VuZEV2ZW50PjxzZXF1ZW5jZUZsb3cgaWQ9XCJTZXF1
-ZW5jZUZsb3dfMTRxN2kxOVwiIHNvdXJjZVJlZj1cIlNlcnZpY2VUYXNrXzF3cjh0eGZcIiB0YXJn
-ZXRSZWY9XCJFbmRFdmVudF8xcXRpZGE3XCIvPjwvcHJvY2Vzcz48YnBtbmRpOkJQTU5EaWFncmFt
-IGlkPVwiQlBNTkRpYWdyYW1fMVwiPjxicG1uZGk6QlBNTlBsYW5lIGJwbW5FbGVtZW50PVwidW5k
-ZWZpbmVkXCIgaWQ9XCJCUE1OUGxhbmVfMVwiPjxicG1uZGk6QlBNTlNoYXBlIGJwbW5FbGVtZW50
-PVwiU3RhcnRFdmVudF8xNTVhc3htXCIgaWQ9XCJTdGFydEV2ZW50XzE1NWFzeG1fZGlcIj48b21n
-ZGM6Qm91bmRzIGhlaWdodD1cIjM2XCIgd2lkdGg9XCIzNlwiIHg9XCIyNjhcIiB5PVwiMTc2XCIv
-PjxicG1uZGk6QlBNTkxhYmVsPjxvbWdkYzpCb3VuZHMgaGVpZ2h0PVwiMFwiIHdpZHRoPVwiOTBc
-IiB4PVwiMjYzXCIgeT1cIjIxMVwiLz48L2JwbW5kaTpCUE1OTGFiZWw+PC9icG1uZGk6QlBNTlNo
-YXBlPjxicG1uZGk6QlBNTlNoYXBlIGJwbW5FbGVtZW50PVwiU2VydmljZVRhc2tfMXdyOHR4Zlwi
-IGlkPVwiU2VydmljZVRhc2tfMXdyOHR4Zl9kaVwiPjxvbWdkYzpCb3VuZHMgaGVpZ2h0PVwiODBc
-IiB3aWR0aD1cIjEwMFwiIHg9XCIzOTlcIiB5PVwiMTU0XCIvPjwvYnBtbmRpOkJQTU5TaGFwZT48
-YnBtbmRpOkJQTU5FZGdlIGJwbW5FbGVtZW50PVwiU2VxdWVuY2VGbG93XzBkNG1zZXZcIiBpZD1c
-IlNlcXVlbmNlRmxvd18wZDRtc2V2X2RpXCI+PG9tZ2RpOndheXBvaW50IHg9XCIzMDRcIiB4c2k6
-dHlwZT1cIm9tZ2RjOlBvaW50XCIgeT1cIjE5NFwiLz48b21nZGk6d2F5cG9pbnQgeD1cIjM5OVwi
-IHhzaTp0eXBlPVwib21nZGM6UG9pbnRcIiB5PVwiMTk0XCIvPjxicG1uZGk6QlBNTkxhYmVsPjxv
-bWdkYzpCb3VuZHMgaGVpZ2h0PVwiMTNcIiB3aWR0aD1cIjBcIiB4PVwiMzUxLjVcIiB5PVwiMTcy
-XCIvPjwvYnBtbmRpOkJQTU5MYWJlbD48L2JwbW5kaTpCUE1ORWRnZT48YnBtbmRpOkJQTU5TaGFw
-ZSBicG1uRWxlbWVudD1cIkVuZEV2ZW50XzFxdGlkYTdcIiBpZD1cIkVuZEV2ZW50XzFxdGlkYTdf
-ZGlcIj48b21nZGM6Qm91bmRzIGhlaWdodD1cIjM2XCIgd2lkdGg9XCIzNlwiIHg9XCI2MDdcIiB5
-PVwiMTc2XCIvPjxicG1uZGk6QlBNTkxhYmVsPjxvbWdkYzpCb3VuZHMgaGVpZ2h0PVwiMTNcIiB3
-aWR0aD1cIjBcIiB4PVwiNjI1XCIgeT1cIjIxNVwiLz48L2JwbW5kaTpCUE1OTGFiZWw+PC9icG1u
-ZGk6QlBNTlNoYXBlPjxicG1uZGk6QlBNTkVkZ2UgYnBtbkVsZW1lbnQ9XCJTZXF1ZW5jZUZsb3df
-MTRxN2kxOVwiIGlkPVwiU2VxdWVuY2VGbG93XzE0cTdpMTlfZGlcIj48b21nZGk6d2F5cG9pbnQg
-eD1cIjQ5OVwiIHhzaTp0eXBlPVwib21nZGM6UG9pbnRcIiB5PVwiMTk0XCIvPjxvbWdkaTp3YXlw
-b2ludCB4PVwiNjA3XCIgeHNpOnR5cGU9XCJvbWdkYzpQb2ludFwiIHk9XCIxOTRcIi8+PGJwbW5k
-aTpCUE1OTGFiZWw+PG9tZ2RjOkJvdW5kcyBoZWlnaHQ9XCIxM1wiIHdpZHRoPVwiMFwiIHg9XCI1
-NTNcIiB5PVwiMTcyXCIvPjwvYnBtbmRpOkJQTU5MYWJlbD48L2JwbW5kaTpCUE1ORWRnZT48L2Jw
-bW5kaTpCUE1OUGxhbmU+PC9icG1uZGk6QlBNTkRpYWdyYW0+PC9kZWZpbml0aW9ucz4ifSwgImNv
-bnRlbnRfdmVyc2lvbiI6IDIsICJjcmVhdG9yX2lkIjogImViMmQxZjdkLTY2NTEtNDE1YS1iNGZm
-LWExNGZjZDJmODRmNSIsICJkZXNjcmlwdGlvbiI6ICJDcmVhdGVzIGEgdGFnIG9uIGFuIGF0dHJp
-YnV0ZSBpbiBNSVNQIC0gc3VjaCBhcyBUTFAsIE1JVFJFIEF0dGFjayBvciBUaHJlYXQgQWN0b3Ii
-LCAiZXhwb3J0X2tleSI6ICJleGFtcGxlX21pc3BfY3JlYXRlX3RhZ19vbl9hdHRyaWJ1dGUiLCAi
-bGFzdF9tb2RpZmllZF9ieSI6ICJlYjJkMWY3ZC02NjUxLTQxNWEtYjRmZi1hMTRmY2QyZjg0ZjUi
-LCAibGFzdF9tb2RpZmllZF90aW1lIjogMTYwMDc4OTEyNDQ4NSwgIm5hbWUiOiAiRXhhbXBsZTog
-TUlTUCBDcmVhdGUgVGFnIG9uIEF0dHJpYnV0ZSIsICJvYmplY3RfdHlwZSI6ICJhcnRpZmFjdCIs
-ICJwcm9ncmFtbWF0aWNfbmFtZSI6ICJleGFtcGxlX21pc3BfY3JlYXRlX3RhZ19vbl9hdHRyaWJ1
-dGUiLCAidGFncyI6IFtdLCAidXVpZCI6ICJmNjBjNGYxMC0wNTU3LTRiNmEtYjg1Zi0zZGNhMzE2
-YmFhM2UiLCAid29ya2Zsb3dfaWQiOiA5fSwgeyJhY3Rpb25zIjogW10sICJjb250ZW50IjogeyJ2
-ZXJzaW9uIjogMiwgIndvcmtmbG93X2lkIjogImV4YW1wbGVfbWlzcF9zZWFyY2hfYXR0cmlidXRl
-IiwgInhtbCI6ICI8P3htbCB2ZXJzaW9uPVwiMS4wXCIgZW5jb2Rpbmc9XCJVVEYtOFwiPz48ZGVm
-aW5pdGlvbnMgeG1sbnM9XCJodHRwOi8vd3d3Lm9tZy5vcmcvc3BlYy9CUE1OLzIwMTAwNTI0L01P
-REVMXCIgeG1sbnM6YnBtbmRpPVwiaHR0cDovL3d3dy5vbWcub3JnL3NwZWMvQlBNTi8yMDEwMDUy
-NC9ESVwiIHhtbG5zOm9tZ2RjPVwiaHR0cDovL3d3dy5vbWcub3JnL3NwZWMvREQvMjAxMDA1MjQv
-RENcIiB4bWxuczpvbWdkaT1cImh0dHA6Ly93d3cub21nLm9yZy9zcGVjL0RELzIwMTAwNTI0L0RJ
-XCIgeG1sbnM6cmVzaWxpZW50PVwiaHR0cDovL3Jlc2lsaWVudC5pYm0uY29tL2JwbW5cIiB4bWxu
-czp4c2Q9XCJodHRwOi8vd3d3LnczLm9yZy8yMDAxL1hNTFNjaGVtYVwiIHhtbG5zOnhzaT1cImh0
-dHA6Ly93d3cudzMub3JnLzIwMDEvWE1MU2NoZW1hLWluc3RhbmNlXCIgdGFyZ2V0TmFtZXNwYWNl
-PVwiaHR0cDovL3d3dy5jYW11bmRhLm9yZy90ZXN0XCI+PHByb2Nlc3MgaWQ9XCJleGFtcGxlX21p
-c3Bfc2VhcmNoX2F0dHJpYnV0ZVwiIGlzRXhlY3V0YWJsZT1cInRydWVcIiBuYW1lPVwiRXhhbXBs
-ZTogTUlTUCBTZWFyY2ggQXR0cmlidXRlXCI+PGRvY3VtZW50YXRpb24+SWRlbnRpZnkgb3RoZXIg
-TUlTUCBldmVudHMgd2l0aCB0aGUgc2FtZSBhdHRyaWJ1dGU8L2RvY3VtZW50YXRpb24+PHN0YXJ0
-RXZlbnQgaWQ9XCJTdGFydEV2ZW50XzE1NWFzeG1cIj48b3V0Z29pbmc+U2VxdWVuY2VGbG93XzBh
-ZmgxMXE8L291dGdvaW5nPjwvc3RhcnRFdmVudD48c2VydmljZVRhc2sgaWQ9XCJTZXJ2aWNlVGFz
-a18waGVnOGg2XCIgbmFtZT1cIk1JU1AgU2VhcmNoIEF0dHJpYnV0ZVwiIHJlc2lsaWVudDp0eXBl
-PVwiZnVuY3Rpb25cIj48ZXh0ZW5zaW9uRWxlbWVudHM+PHJlc2lsaWVudDpmdW5jdGlvbiB1dWlk
-PVwiYzI0OGJjN2MtYjYwZi00ZDM2LTlhMmUtMjk0ZWU3OGE1OTgxXCI+e1wiaW5wdXRzXCI6e30s
-XCJwb3N0X3Byb2Nlc3Npbmdfc2NyaXB0XCI6XCIjIFJlc3VsdDoge1xcXCJyZXNwb25zZVxcXCI6
-IHtcXFwiQXR0cmlidXRlXFxcIjogW3tcXFwiaWRcXFwiOlxcXCIzXFxcIixcXFwiZXZlbnRfaWRc
-XFwiOlxcXCIzXFxcIixcXFwib2JqZWN0X2lkXFxcIjpcXFwiMFxcXCIsXFxcIm9iamVjdF9yZWxh
-dGlvblxcXCI6bnVsbCxcXFwiY2F0ZWdvcnlcXFwiOlxcXCJOZXR3b3JrIGFjdGl2aXR5XFxcIixc
-XFwidHlwZVxcXCI6XFxcImlwLWRzdFxcXCIsXFxcInRvX2lkc1xcXCI6ZmFsc2UsXFxcInV1aWRc
-XFwiOlxcXCI2NjZhNjg5MC1mZGRkLTRhNWQtYTQ3NC0yMmM4NWM2YTFjZTVcXFwiLFxcXCJ0aW1l
-c3RhbXBcXFwiOlxcXCIxNTUzMzUyNzgxXFxcIixcXFwiZGlzdHJpYnV0aW9uXFxcIjpcXFwiNVxc
-XCIsXFxcInNoYXJpbmdfZ3JvdXBfaWRcXFwiOlxcXCIwXFxcIixcXFwiY29tbWVudFxcXCI6XFxc
-IlxcXCIsXFxcImRlbGV0ZWRcXFwiOmZhbHNlLFxcXCJkaXNhYmxlX2NvcnJlbGF0aW9uXFxcIjpm
-YWxzZSxcXFwidmFsdWVcXFwiOlxcXCI4LjguOC44XFxcIixcXFwiRXZlbnRcXFwiOntcXFwib3Jn
-X2lkXFxcIjpcXFwiMVxcXCIsXFxcImRpc3RyaWJ1dGlvblxcXCI6XFxcIjBcXFwiLFxcXCJpZFxc
-XCI6XFxcIjNcXFwiLFxcXCJpbmZvXFxcIjpcXFwibWlzcFxcXCIsXFxcIm9yZ2NfaWRcXFwiOlxc
-XCIxXFxcIixcXFwidXVpZFxcXCI6XFxcIjVjOTY0NDNiLTFkY2MtNDJmYy05MTBhLTAxYWZhYzEx
-MDAwMlxcXCJ9fV19fVxcbmV4aXN0aW5nX2Rlc2NyaXB0aW9uID0gYXJ0aWZhY3QuZGVzY3JpcHRp
-b24uY29udGVudCsnXFxcXG4nIGlmIGFydGlmYWN0LmRlc2NyaXB0aW9uIGVsc2UgXFxcIlxcXCJc
-XG5cXG5pZiBub3QgcmVzdWx0cy5zdWNjZXNzOlxcbiAgYXJ0aWZhY3QuZGVzY3JpcHRpb24gPSB1
-XFxcInt9Tm8gbWF0Y2hpbmcgYXR0cmlidXRlIGZvdW5kXFxcIi5mb3JtYXQoZXhpc3RpbmdfZGVz
-Y3JpcHRpb24pXFxuZWxzZTpcXG4gIG1hdGNoZWQgPSBbXVxcbiAgZm9yIG1hdGNoIGluIHJlc3Vs
-dHMuY29udGVudDpcXG4gICAgICBtYXRjaGVkLmFwcGVuZCh1XFxcIkV2ZW50OiB7fSwgSUQ6IHt9
-LCBUYWdzOiB7fVxcXCIuZm9ybWF0KG1hdGNoWydFdmVudCddWydpbmZvJ10sIG1hdGNoWydFdmVu
-dCddWydpZCddLCByZXN1bHRzLnRhZ3MpKVxcblxcbiAgYXJ0aWZhY3QuZGVzY3JpcHRpb24gPSB1
-XFxcInt9IEF0dHJpYnV0ZSBTZWFyY2ggTWF0Y2hlczpcXFxcbiB7fVxcXCIuZm9ybWF0KGV4aXN0
-aW5nX2Rlc2NyaXB0aW9uLCAnXFxcXG4nLmpvaW4obWF0Y2hlZCkpXCIsXCJwcmVfcHJvY2Vzc2lu
-Z19zY3JpcHRcIjpcImlucHV0cy5taXNwX2F0dHJpYnV0ZV92YWx1ZSA9IGFydGlmYWN0LnZhbHVl
-XCJ9PC9yZXNpbGllbnQ6ZnVuY3Rpb24+PC9leHRlbnNpb25FbGVtZW50cz48aW5jb21pbmc+U2Vx
-dWVuY2VGbG93XzBhZmgxMXE8L2luY29taW5nPjxvdXRnb2luZz5TZXF1ZW5jZUZsb3dfMGhhN2Qx
-dTwvb3V0Z29pbmc+PC9zZXJ2aWNlVGFzaz48c2VxdWVuY2VGbG93IGlkPVwiU2VxdWVuY2VGbG93
-XzBhZmgxMXFcIiBzb3VyY2VSZWY9XCJTdGFydEV2ZW50XzE1NWFzeG1cIiB0YXJnZXRSZWY9XCJT
-ZXJ2aWNlVGFza18waGVnOGg2XCIvPjxlbmRFdmVudCBpZD1cIkVuZEV2ZW50XzBrNGl1dGFcIj48
-aW5jb21pbmc+U2VxdWVuY2VGbG93XzBoYTdkMXU8L2luY29taW5nPjwvZW5kRXZlbnQ+PHNlcXVl
-bmNlRmxvdyBpZD1cIlNlcXVlbmNlRmxvd18waGE3ZDF1XCIgc291cmNlUmVmPVwiU2VydmljZVRh
-c2tfMGhlZzhoNlwiIHRhcmdldFJlZj1cIkVuZEV2ZW50XzBrNGl1dGFcIi8+PHRleHRBbm5vdGF0
-aW9uIGlkPVwiVGV4dEFubm90YXRpb25fMWt4eGl5dFwiPjx0ZXh0PlN0YXJ0IHlvdXIgd29ya2Zs
-b3cgaGVyZTwvdGV4dD48L3RleHRBbm5vdGF0aW9uPjxhc3NvY2lhdGlvbiBpZD1cIkFzc29jaWF0
-aW9uXzFzZXVqNDhcIiBzb3VyY2VSZWY9XCJTdGFydEV2ZW50XzE1NWFzeG1cIiB0YXJnZXRSZWY9
-XCJUZXh0QW5ub3RhdGlvbl8xa3h4aXl0XCIvPjx0ZXh0QW5ub3RhdGlvbiBpZD1cIlRleHRBbm5v
-dGF0aW9uXzAxdzFzazdcIj48dGV4dD5UaGUgYXJ0aWZhY3QgZGVzY3JpcHRpb24gaXMgYXBwZW5k
-ZWQgd2l0aCB0aGUgc2VhcmNoIHJlc3VsdHM8L3RleHQ+PC90ZXh0QW5ub3RhdGlvbj48YXNzb2Np
-YXRpb24gaWQ9XCJBc3NvY2lhdGlvbl8xeG1wZnhvXCIgc291cmNlUmVmPVwiU2VydmljZVRhc2tf
-MGhlZzhoNlwiIHRhcmdldFJlZj1cIlRleHRBbm5vdGF0aW9uXzAxdzFzazdcIi8+PC9wcm9jZXNz
-PjxicG1uZGk6QlBNTkRpYWdyYW0gaWQ9XCJCUE1ORGlhZ3JhbV8xXCI+PGJwbW5kaTpCUE1OUGxh
-bmUgYnBtbkVsZW1lbnQ9XCJ1bmRlZmluZWRcIiBpZD1cIkJQTU5QbGFuZV8xXCI+PGJwbW5kaTpC
-UE1OU2hhcGUgYnBtbkVsZW1lbnQ9XCJTdGFydEV2ZW50XzE1NWFzeG1cIiBpZD1cIlN0YXJ0RXZl
-bnRfMTU1YXN4bV9kaVwiPjxvbWdkYzpCb3VuZHMgaGVpZ2h0PVwiMzZcIiB3aWR0aD1cIjM2XCIg
-eD1cIjE2MlwiIHk9XCIxODhcIi8+PGJwbW5kaTpCUE1OTGFiZWw+PG9tZ2RjOkJvdW5kcyBoZWln
-aHQ9XCIwXCIgd2lkdGg9XCI5MFwiIHg9XCIxNTdcIiB5PVwiMjIzXCIvPjwvYnBtbmRpOkJQTU5M
-YWJlbD48L2JwbW5kaTpCUE1OU2hhcGU+PGJwbW5kaTpCUE1OU2hhcGUgYnBtbkVsZW1lbnQ9XCJU
-ZXh0QW5ub3RhdGlvbl8xa3h4aXl0XCIgaWQ9XCJUZXh0QW5ub3RhdGlvbl8xa3h4aXl0X2RpXCI+
-PG9tZ2RjOkJvdW5kcyBoZWlnaHQ9XCIzMFwiIHdpZHRoPVwiMTAwXCIgeD1cIjk5XCIgeT1cIjI1
-NFwiLz48L2JwbW5kaTpCUE1OU2hhcGU+PGJwbW5kaTpCUE1ORWRnZSBicG1uRWxlbWVudD1cIkFz
-c29jaWF0aW9uXzFzZXVqNDhcIiBpZD1cIkFzc29jaWF0aW9uXzFzZXVqNDhfZGlcIj48b21nZGk6
-d2F5cG9pbnQgeD1cIjE2OVwiIHhzaTp0eXBlPVwib21nZGM6UG9pbnRcIiB5PVwiMjIwXCIvPjxv
-bWdkaTp3YXlwb2ludCB4PVwiMTUzXCIgeHNpOnR5cGU9XCJvbWdkYzpQb2ludFwiIHk9XCIyNTRc
-Ii8+PC9icG1uZGk6QlBNTkVkZ2U+PGJwbW5kaTpCUE1OU2hhcGUgYnBtbkVsZW1lbnQ9XCJTZXJ2
-aWNlVGFza18waGVnOGg2XCIgaWQ9XCJTZXJ2aWNlVGFza18waGVnOGg2X2RpXCI+PG9tZ2RjOkJv
-dW5kcyBoZWlnaHQ9XCI4MFwiIHdpZHRoPVwiMTAwXCIgeD1cIjI4MVwiIHk9XCIxNjZcIi8+PC9i
-cG1uZGk6QlBNTlNoYXBlPjxicG1uZGk6QlBNTkVkZ2UgYnBtbkVsZW1lbnQ9XCJTZXF1ZW5jZUZs
-b3dfMGFmaDExcVwiIGlkPVwiU2VxdWVuY2VGbG93XzBhZmgxMXFfZGlcIj48b21nZGk6d2F5cG9p
-bnQgeD1cIjE5OFwiIHhzaTp0eXBlPVwib21nZGM6UG9pbnRcIiB5PVwiMjA2XCIvPjxvbWdkaTp3
-YXlwb2ludCB4PVwiMjgxXCIgeHNpOnR5cGU9XCJvbWdkYzpQb2ludFwiIHk9XCIyMDZcIi8+PGJw
-bW5kaTpCUE1OTGFiZWw+PG9tZ2RjOkJvdW5kcyBoZWlnaHQ9XCIxM1wiIHdpZHRoPVwiMFwiIHg9
-XCIyMzkuNVwiIHk9XCIxODRcIi8+PC9icG1uZGk6QlBNTkxhYmVsPjwvYnBtbmRpOkJQTU5FZGdl
-PjxicG1uZGk6QlBNTlNoYXBlIGJwbW5FbGVtZW50PVwiRW5kRXZlbnRfMGs0aXV0YVwiIGlkPVwi
-RW5kRXZlbnRfMGs0aXV0YV9kaVwiPjxvbWdkYzpCb3VuZHMgaGVpZ2h0PVwiMzZcIiB3aWR0aD1c
-IjM2XCIgeD1cIjQ2N1wiIHk9XCIxODhcIi8+PGJwbW5kaTpCUE1OTGFiZWw+PG9tZ2RjOkJvdW5k
-cyBoZWlnaHQ9XCIxM1wiIHdpZHRoPVwiMFwiIHg9XCI0ODVcIiB5PVwiMjI3XCIvPjwvYnBtbmRp
-OkJQTU5MYWJlbD48L2JwbW5kaTpCUE1OU2hhcGU+PGJwbW5kaTpCUE1ORWRnZSBicG1uRWxlbWVu
-dD1cIlNlcXVlbmNlRmxvd18waGE3ZDF1XCIgaWQ9XCJTZXF1ZW5jZUZsb3dfMGhhN2QxdV9kaVwi
-PjxvbWdkaTp3YXlwb2ludCB4PVwiMzgxXCIgeHNpOnR5cGU9XCJvbWdkYzpQb2ludFwiIHk9XCIy
-MDZcIi8+PG9tZ2RpOndheXBvaW50IHg9XCI0NjdcIiB4c2k6dHlwZT1cIm9tZ2RjOlBvaW50XCIg
-eT1cIjIwNlwiLz48YnBtbmRpOkJQTU5MYWJlbD48b21nZGM6Qm91bmRzIGhlaWdodD1cIjEzXCIg
-d2lkdGg9XCIwXCIgeD1cIjQyNFwiIHk9XCIxODRcIi8+PC9icG1uZGk6QlBNTkxhYmVsPjwvYnBt
-bmRpOkJQTU5FZGdlPjxicG1uZGk6QlBNTlNoYXBlIGJwbW5FbGVtZW50PVwiVGV4dEFubm90YXRp
-b25fMDF3MXNrN1wiIGlkPVwiVGV4dEFubm90YXRpb25fMDF3MXNrN19kaVwiPjxvbWdkYzpCb3Vu
-ZHMgaGVpZ2h0PVwiNjNcIiB3aWR0aD1cIjIzM1wiIHg9XCIzNjRcIiB5PVwiNzVcIi8+PC9icG1u
-ZGk6QlBNTlNoYXBlPjxicG1uZGk6QlBNTkVkZ2UgYnBtbkVsZW1lbnQ9XCJBc3NvY2lhdGlvbl8x
-eG1wZnhvXCIgaWQ9XCJBc3NvY2lhdGlvbl8xeG1wZnhvX2RpXCI+PG9tZ2RpOndheXBvaW50IHg9
-XCIzNzlcIiB4c2k6dHlwZT1cIm9tZ2RjOlBvaW50XCIgeT1cIjE3NFwiLz48b21nZGk6d2F5cG9p
-bnQgeD1cIjQzNFwiIHhzaTp0eXBlPVwib21nZGM6UG9pbnRcIiB5PVwiMTM4XCIvPjwvYnBtbmRp
-OkJQTU5FZGdlPjwvYnBtbmRpOkJQTU5QbGFuZT48L2JwbW5kaTpCUE1ORGlhZ3JhbT48L2RlZmlu
-aXRpb25zPiJ9LCAiY29udGVudF92ZXJzaW9uIjogMiwgImNyZWF0b3JfaWQiOiAiZWIyZDFmN2Qt
-NjY1MS00MTVhLWI0ZmYtYTE0ZmNkMmY4NGY1IiwgImRlc2NyaXB0aW9uIjogIklkZW50aWZ5IG90
-aGVyIE1JU1AgZXZlbnRzIHdpdGggdGhlIHNhbWUgYXR0cmlidXRlIiwgImV4cG9ydF9rZXkiOiAi
-ZXhhbXBsZV9taXNwX3NlYXJjaF9hdHRyaWJ1dGUiLCAibGFzdF9tb2RpZmllZF9ieSI6ICJlYjJk
-MWY3ZC02NjUxLTQxNWEtYjRmZi1hMTRmY2QyZjg0ZjUiLCAibGFzdF9tb2RpZmllZF90aW1lIjog
-MTYwMDc4OTEyNDMwNywgIm5hbWUiOiAiRXhhbXBsZTogTUlTUCBTZWFyY2ggQXR0cmlidXRlIiwg
-Im9iamVjdF90eXBlIjogImFydGlmYWN0IiwgInByb2dyYW1tYXRpY19uYW1lIjogImV4YW1wbGVf
-bWlzcF9zZWFyY2hfYXR0cmlidXRlIiwgInRhZ3MiOiBbXSwgInV1aWQiOiAiNTA2N2NjMmItNDAy
-Mi00NmZiLWFlMzAtMjhkZGNlMzM0YWM4IiwgIndvcmtmbG93X2lkIjogOH1dLCAid29ya3NwYWNl
-cyI6IFtdfQ==
+ZV9taXNwX3NlYXJjaF9hdHRyaWJ1dGVcIiBpc0V4ZWN1dGFibGU9XCJ0cnVlXCIgbmFtZT1cIkV4
+YW1wbGU6IE1JU1AgU2VhcmNoIEF0dHJpYnV0ZVwiPjxkb2N1bWVudGF0aW9uPklkZW50aWZ5IG90
+aGVyIE1JU1AgZXZlbnRzIHdpdGggdGhlIHNhbWUgYXR0cmlidXRlPC9kb2N1bWVudGF0aW9uPjxz
+dGFydEV2ZW50IGlkPVwiU3RhcnRFdmVudF8xNTVhc3htXCI+PG91dGdvaW5nPlNlcXVlbmNlRmxv
+d18wYWZoMTFxPC9vdXRnb2luZz48L3N0YXJ0RXZlbnQ+PHNlcnZpY2VUYXNrIGlkPVwiU2Vydmlj
+ZVRhc2tfMGhlZzhoNlwiIG5hbWU9XCJNSVNQIFNlYXJjaCBBdHRyaWJ1dGVcIiByZXNpbGllbnQ6
+dHlwZT1cImZ1bmN0aW9uXCI+PGV4dGVuc2lvbkVsZW1lbnRzPjxyZXNpbGllbnQ6ZnVuY3Rpb24g
+dXVpZD1cImMyNDhiYzdjLWI2MGYtNGQzNi05YTJlLTI5NGVlNzhhNTk4MVwiPntcImlucHV0c1wi
+Ont9LFwicG9zdF9wcm9jZXNzaW5nX3NjcmlwdFwiOlwiIyBSZXN1bHQ6IHtcXFwicmVzcG9uc2Vc
+XFwiOiB7XFxcIkF0dHJpYnV0ZVxcXCI6IFt7XFxcImlkXFxcIjpcXFwiM1xcXCIsXFxcImV2ZW50
+X2lkXFxcIjpcXFwiM1xcXCIsXFxcIm9iamVjdF9pZFxcXCI6XFxcIjBcXFwiLFxcXCJvYmplY3Rf
+cmVsYXRpb25cXFwiOm51bGwsXFxcImNhdGVnb3J5XFxcIjpcXFwiTmV0d29yayBhY3Rpdml0eVxc
+XCIsXFxcInR5cGVcXFwiOlxcXCJpcC1kc3RcXFwiLFxcXCJ0b19pZHNcXFwiOmZhbHNlLFxcXCJ1
+dWlkXFxcIjpcXFwiNjY2YTY4OTAtZmRkZC00YTVkLWE0NzQtMjJjODVjNmExY2U1XFxcIixcXFwi
+dGltZXN0YW1wXFxcIjpcXFwiMTU1MzM1Mjc4MVxcXCIsXFxcImRpc3RyaWJ1dGlvblxcXCI6XFxc
+IjVcXFwiLFxcXCJzaGFyaW5nX2dyb3VwX2lkXFxcIjpcXFwiMFxcXCIsXFxcImNvbW1lbnRcXFwi
+OlxcXCJcXFwiLFxcXCJkZWxldGVkXFxcIjpmYWxzZSxcXFwiZGlzYWJsZV9jb3JyZWxhdGlvblxc
+XCI6ZmFsc2UsXFxcInZhbHVlXFxcIjpcXFwiOC44LjguOFxcXCIsXFxcIkV2ZW50XFxcIjp7XFxc
+Im9yZ19pZFxcXCI6XFxcIjFcXFwiLFxcXCJkaXN0cmlidXRpb25cXFwiOlxcXCIwXFxcIixcXFwi
+aWRcXFwiOlxcXCIzXFxcIixcXFwiaW5mb1xcXCI6XFxcIm1pc3BcXFwiLFxcXCJvcmdjX2lkXFxc
+IjpcXFwiMVxcXCIsXFxcInV1aWRcXFwiOlxcXCI1Yzk2NDQzYi0xZGNjLTQyZmMtOTEwYS0wMWFm
+YWMxMTAwMDJcXFwifX1dfX1cXG5leGlzdGluZ19kZXNjcmlwdGlvbiA9IGFydGlmYWN0LmRlc2Ny
+aXB0aW9uLmNvbnRlbnQrJ1xcXFxuJyBpZiBhcnRpZmFjdC5kZXNjcmlwdGlvbiBlbHNlIFxcXCJc
+XFwiXFxuXFxuaWYgbm90IHJlc3VsdHMuc3VjY2VzczpcXG4gIGFydGlmYWN0LmRlc2NyaXB0aW9u
+ID0gdVxcXCJ7fU5vIG1hdGNoaW5nIGF0dHJpYnV0ZSBmb3VuZFxcXCIuZm9ybWF0KGV4aXN0aW5n
+X2Rlc2NyaXB0aW9uKVxcbmVsc2U6XFxuICBtYXRjaGVkID0gW11cXG4gIGZvciBtYXRjaCBpbiBy
+ZXN1bHRzLmNvbnRlbnQ6XFxuICAgICAgbWF0Y2hlZC5hcHBlbmQodVxcXCJFdmVudDoge30sIElE
+OiB7fSwgVGFnczoge31cXFwiLmZvcm1hdChtYXRjaFsnRXZlbnQnXVsnaW5mbyddLCBtYXRjaFsn
+RXZlbnQnXVsnaWQnXSwgcmVzdWx0cy50YWdzKSlcXG5cXG4gIGFydGlmYWN0LmRlc2NyaXB0aW9u
+ID0gdVxcXCJ7fSBBdHRyaWJ1dGUgU2VhcmNoIE1hdGNoZXM6XFxcXG4ge31cXFwiLmZvcm1hdChl
+eGlzdGluZ19kZXNjcmlwdGlvbiwgJ1xcXFxuJy5qb2luKG1hdGNoZWQpKVwiLFwicHJlX3Byb2Nl
+c3Npbmdfc2NyaXB0XCI6XCJpbnB1dHMubWlzcF9hdHRyaWJ1dGVfdmFsdWUgPSBhcnRpZmFjdC52
+YWx1ZVwifTwvcmVzaWxpZW50OmZ1bmN0aW9uPjwvZXh0ZW5zaW9uRWxlbWVudHM+PGluY29taW5n
+PlNlcXVlbmNlRmxvd18wYWZoMTFxPC9pbmNvbWluZz48b3V0Z29pbmc+U2VxdWVuY2VGbG93XzBo
+YTdkMXU8L291dGdvaW5nPjwvc2VydmljZVRhc2s+PHNlcXVlbmNlRmxvdyBpZD1cIlNlcXVlbmNl
+Rmxvd18wYWZoMTFxXCIgc291cmNlUmVmPVwiU3RhcnRFdmVudF8xNTVhc3htXCIgdGFyZ2V0UmVm
+PVwiU2VydmljZVRhc2tfMGhlZzhoNlwiLz48ZW5kRXZlbnQgaWQ9XCJFbmRFdmVudF8wazRpdXRh
+XCI+PGluY29taW5nPlNlcXVlbmNlRmxvd18waGE3ZDF1PC9pbmNvbWluZz48L2VuZEV2ZW50Pjxz
+ZXF1ZW5jZUZsb3cgaWQ9XCJTZXF1ZW5jZUZsb3dfMGhhN2QxdVwiIHNvdXJjZVJlZj1cIlNlcnZp
+Y2VUYXNrXzBoZWc4aDZcIiB0YXJnZXRSZWY9XCJFbmRFdmVudF8wazRpdXRhXCIvPjx0ZXh0QW5u
+b3RhdGlvbiBpZD1cIlRleHRBbm5vdGF0aW9uXzFreHhpeXRcIj48dGV4dD5TdGFydCB5b3VyIHdv
+cmtmbG93IGhlcmU8L3RleHQ+PC90ZXh0QW5ub3RhdGlvbj48YXNzb2NpYXRpb24gaWQ9XCJBc3Nv
+Y2lhdGlvbl8xc2V1ajQ4XCIgc291cmNlUmVmPVwiU3RhcnRFdmVudF8xNTVhc3htXCIgdGFyZ2V0
+UmVmPVwiVGV4dEFubm90YXRpb25fMWt4eGl5dFwiLz48dGV4dEFubm90YXRpb24gaWQ9XCJUZXh0
+QW5ub3RhdGlvbl8wMXcxc2s3XCI+PHRleHQ+VGhlIGFydGlmYWN0IGRlc2NyaXB0aW9uIGlzIGFw
+cGVuZGVkIHdpdGggdGhlIHNlYXJjaCByZXN1bHRzPC90ZXh0PjwvdGV4dEFubm90YXRpb24+PGFz
+c29jaWF0aW9uIGlkPVwiQXNzb2NpYXRpb25fMXhtcGZ4b1wiIHNvdXJjZVJlZj1cIlNlcnZpY2VU
+YXNrXzBoZWc4aDZcIiB0YXJnZXRSZWY9XCJUZXh0QW5ub3RhdGlvbl8wMXcxc2s3XCIvPjwvcHJv
+Y2Vzcz48YnBtbmRpOkJQTU5EaWFncmFtIGlkPVwiQlBNTkRpYWdyYW1fMVwiPjxicG1uZGk6QlBN
+TlBsYW5lIGJwbW5FbGVtZW50PVwidW5kZWZpbmVkXCIgaWQ9XCJCUE1OUGxhbmVfMVwiPjxicG1u
+ZGk6QlBNTlNoYXBlIGJwbW5FbGVtZW50PVwiU3RhcnRFdmVudF8xNTVhc3htXCIgaWQ9XCJTdGFy
+dEV2ZW50XzE1NWFzeG1fZGlcIj48b21nZGM6Qm91bmRzIGhlaWdodD1cIjM2XCIgd2lkdGg9XCIz
+NlwiIHg9XCIxNjJcIiB5PVwiMTg4XCIvPjxicG1uZGk6QlBNTkxhYmVsPjxvbWdkYzpCb3VuZHMg
+aGVpZ2h0PVwiMFwiIHdpZHRoPVwiOTBcIiB4PVwiMTU3XCIgeT1cIjIyM1wiLz48L2JwbW5kaTpC
+UE1OTGFiZWw+PC9icG1uZGk6QlBNTlNoYXBlPjxicG1uZGk6QlBNTlNoYXBlIGJwbW5FbGVtZW50
+PVwiVGV4dEFubm90YXRpb25fMWt4eGl5dFwiIGlkPVwiVGV4dEFubm90YXRpb25fMWt4eGl5dF9k
+aVwiPjxvbWdkYzpCb3VuZHMgaGVpZ2h0PVwiMzBcIiB3aWR0aD1cIjEwMFwiIHg9XCI5OVwiIHk9
+XCIyNTRcIi8+PC9icG1uZGk6QlBNTlNoYXBlPjxicG1uZGk6QlBNTkVkZ2UgYnBtbkVsZW1lbnQ9
+XCJBc3NvY2lhdGlvbl8xc2V1ajQ4XCIgaWQ9XCJBc3NvY2lhdGlvbl8xc2V1ajQ4X2RpXCI+PG9t
+Z2RpOndheXBvaW50IHg9XCIxNjlcIiB4c2k6dHlwZT1cIm9tZ2RjOlBvaW50XCIgeT1cIjIyMFwi
+Lz48b21nZGk6d2F5cG9pbnQgeD1cIjE1M1wiIHhzaTp0eXBlPVwib21nZGM6UG9pbnRcIiB5PVwi
+MjU0XCIvPjwvYnBtbmRpOkJQTU5FZGdlPjxicG1uZGk6QlBNTlNoYXBlIGJwbW5FbGVtZW50PVwi
+U2VydmljZVRhc2tfMGhlZzhoNlwiIGlkPVwiU2VydmljZVRhc2tfMGhlZzhoNl9kaVwiPjxvbWdk
+YzpCb3VuZHMgaGVpZ2h0PVwiODBcIiB3aWR0aD1cIjEwMFwiIHg9XCIyODFcIiB5PVwiMTY2XCIv
+PjwvYnBtbmRpOkJQTU5TaGFwZT48YnBtbmRpOkJQTU5FZGdlIGJwbW5FbGVtZW50PVwiU2VxdWVu
+Y2VGbG93XzBhZmgxMXFcIiBpZD1cIlNlcXVlbmNlRmxvd18wYWZoMTFxX2RpXCI+PG9tZ2RpOndh
+eXBvaW50IHg9XCIxOThcIiB4c2k6dHlwZT1cIm9tZ2RjOlBvaW50XCIgeT1cIjIwNlwiLz48b21n
+ZGk6d2F5cG9pbnQgeD1cIjI4MVwiIHhzaTp0eXBlPVwib21nZGM6UG9pbnRcIiB5PVwiMjA2XCIv
+PjxicG1uZGk6QlBNTkxhYmVsPjxvbWdkYzpCb3VuZHMgaGVpZ2h0PVwiMTNcIiB3aWR0aD1cIjBc
+IiB4PVwiMjM5LjVcIiB5PVwiMTg0XCIvPjwvYnBtbmRpOkJQTU5MYWJlbD48L2JwbW5kaTpCUE1O
+RWRnZT48YnBtbmRpOkJQTU5TaGFwZSBicG1uRWxlbWVudD1cIkVuZEV2ZW50XzBrNGl1dGFcIiBp
+ZD1cIkVuZEV2ZW50XzBrNGl1dGFfZGlcIj48b21nZGM6Qm91bmRzIGhlaWdodD1cIjM2XCIgd2lk
+dGg9XCIzNlwiIHg9XCI0NjdcIiB5PVwiMTg4XCIvPjxicG1uZGk6QlBNTkxhYmVsPjxvbWdkYzpC
+b3VuZHMgaGVpZ2h0PVwiMTNcIiB3aWR0aD1cIjBcIiB4PVwiNDg1XCIgeT1cIjIyN1wiLz48L2Jw
+bW5kaTpCUE1OTGFiZWw+PC9icG1uZGk6QlBNTlNoYXBlPjxicG1uZGk6QlBNTkVkZ2UgYnBtbkVs
+ZW1lbnQ9XCJTZXF1ZW5jZUZsb3dfMGhhN2QxdVwiIGlkPVwiU2VxdWVuY2VGbG93XzBoYTdkMXVf
+ZGlcIj48b21nZGk6d2F5cG9pbnQgeD1cIjM4MVwiIHhzaTp0eXBlPVwib21nZGM6UG9pbnRcIiB5
+PVwiMjA2XCIvPjxvbWdkaTp3YXlwb2ludCB4PVwiNDY3XCIgeHNpOnR5cGU9XCJvbWdkYzpQb2lu
+dFwiIHk9XCIyMDZcIi8+PGJwbW5kaTpCUE1OTGFiZWw+PG9tZ2RjOkJvdW5kcyBoZWlnaHQ9XCIx
+M1wiIHdpZHRoPVwiMFwiIHg9XCI0MjRcIiB5PVwiMTg0XCIvPjwvYnBtbmRpOkJQTU5MYWJlbD48
+L2JwbW5kaTpCUE1ORWRnZT48YnBtbmRpOkJQTU5TaGFwZSBicG1uRWxlbWVudD1cIlRleHRBbm5v
+dGF0aW9uXzAxdzFzazdcIiBpZD1cIlRleHRBbm5vdGF0aW9uXzAxdzFzazdfZGlcIj48b21nZGM6
+Qm91bmRzIGhlaWdodD1cIjYzXCIgd2lkdGg9XCIyMzNcIiB4PVwiMzY0XCIgeT1cIjc1XCIvPjwv
+YnBtbmRpOkJQTU5TaGFwZT48YnBtbmRpOkJQTU5FZGdlIGJwbW5FbGVtZW50PVwiQXNzb2NpYXRp
+b25fMXhtcGZ4b1wiIGlkPVwiQXNzb2NpYXRpb25fMXhtcGZ4b19kaVwiPjxvbWdkaTp3YXlwb2lu
+dCB4PVwiMzc5XCIgeHNpOnR5cGU9XCJvbWdkYzpQb2ludFwiIHk9XCIxNzRcIi8+PG9tZ2RpOndh
+eXBvaW50IHg9XCI0MzRcIiB4c2k6dHlwZT1cIm9tZ2RjOlBvaW50XCIgeT1cIjEzOFwiLz48L2Jw
+bW5kaTpCUE1ORWRnZT48L2JwbW5kaTpCUE1OUGxhbmU+PC9icG1uZGk6QlBNTkRpYWdyYW0+PC9k
+ZWZpbml0aW9ucz4ifSwgImNvbnRlbnRfdmVyc2lvbiI6IDIsICJjcmVhdG9yX2lkIjogImViMmQx
+ZjdkLTY2NTEtNDE1YS1iNGZmLWExNGZjZDJmODRmNSIsICJkZXNjcmlwdGlvbiI6ICJJZGVudGlm
+eSBvdGhlciBNSVNQIGV2ZW50cyB3aXRoIHRoZSBzYW1lIGF0dHJpYnV0ZSIsICJleHBvcnRfa2V5
+IjogImV4YW1wbGVfbWlzcF9zZWFyY2hfYXR0cmlidXRlIiwgImxhc3RfbW9kaWZpZWRfYnkiOiAi
+ZWIyZDFmN2QtNjY1MS00MTVhLWI0ZmYtYTE0ZmNkMmY4NGY1IiwgImxhc3RfbW9kaWZpZWRfdGlt
+ZSI6IDE2MDA3ODkxMjQzMDcsICJuYW1lIjogIkV4YW1wbGU6IE1JU1AgU2VhcmNoIEF0dHJpYnV0
+ZSIsICJvYmplY3RfdHlwZSI6ICJhcnRpZmFjdCIsICJwcm9ncmFtbWF0aWNfbmFtZSI6ICJleGFt
+cGxlX21pc3Bfc2VhcmNoX2F0dHJpYnV0ZSIsICJ0YWdzIjogW10sICJ1dWlkIjogIjUwNjdjYzJi
+LTQwMjItNDZmYi1hZTMwLTI4ZGRjZTMzNGFjOCIsICJ3b3JrZmxvd19pZCI6IDh9XSwgIndvcmtz
+cGFjZXMiOiBbXX0=
 """)
@@ -40,9 +40,12 @@ setup(
                      "See the sample workflows for sample payloads returned.",
     install_requires=['resilient_circuits>=32.0',
                       'resilient_lib>=32.0',
-                      'pymisp>=2.4; python_version>="3"',
+                      'pymisp>=2.4.157; python_version>="3"',
                       'pymisp==2.4.119.1; python_version<"3"'
                       ],
+    extras_require={
+        'streaming': ['ijson>=3.1']
+    },
     packages=find_packages(),
     include_package_data=True,
     platforms='any',
@@ -0,0 +1,31 @@
+# -*- coding: utf-8 -*-
+"""Unit tests for the misp_sync_attributes checkpoints"""
+
+import os
+from fn_misp.lib.checkpoints import SyncCheckpoints
+
+
+class TestSyncCheckpoints:
+    """ Tests for SyncCheckpoints"""
+
+    def test_record_and_get(self, tmp_path):
+        checkpoints = SyncCheckpoints(str(tmp_path / "checkpoints.db"))
+        assert checkpoints.get(1, "event-uuid") == {}
+        checkpoints.record(1, "event-uuid", [(10, 1000), (11, 1100)])
+        checkpoints.record(1, "event-uuid", [(11, 1200)])
+        checkpoints.record(2, "event-uuid", [(20, 2000)])
+        assert checkpoints.get(1, "event-uuid") == {10: 1000, 11: 1200}
+        assert checkpoints.get(1, "other-uuid") == {}
+
+    def test_database_is_created_on_first_use(self, tmp_path):
+        path = str(tmp_path / "checkpoints.db")
+        checkpoints = SyncCheckpoints(path)
+        assert not os.path.exists(path)
+        checkpoints.record(1, "event-uuid", [(10, 1000)])
+        assert os.path.exists(path)
+
+    def test_unusable_database_disables_checkpoints(self, tmp_path):
+        checkpoints = SyncCheckpoints(str(tmp_path / "missing" / "checkpoints.db"))
+        checkpoints.record(1, "event-uuid", [(10, 1000)])
+        assert checkpoints.get(1, "event-uuid") == {}
+        assert not os.path.exists(str(tmp_path / "missing"))
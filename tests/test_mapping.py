@@ -0,0 +1,64 @@
+# -*- coding: utf-8 -*-
+"""Unit tests for the Resilient to MISP type mapping"""
+
+import os
+import json
+import pytest
+from fn_misp.lib import mapping
+
+
+def write_mapping(path, type_mapping, mtime):
+    path.write(json.dumps(type_mapping) if isinstance(type_mapping, dict) else type_mapping)
+    os.utime(str(path), (mtime, mtime))
+
+
+@pytest.fixture
+def mapping_file(tmpdir):
+    path = tmpdir.join("misp_mapping.cfg")
+    write_mapping(path, {"IP Address": "ip-dst", "String": None}, 1000)
+    return path
+
+
+class TestTypeMapping:
+    """ Tests for TypeMapping"""
+
+    def test_lookup_and_blacklist(self, mapping_file):
+        type_mapping = mapping.TypeMapping(str(mapping_file))
+        assert type_mapping.get("IP Address") == "ip-dst"
+        assert type_mapping.get("String") is None and type_mapping.is_blacklisted("String")
+        assert type_mapping.get("Email Sender", "unmapped") == "unmapped" and not type_mapping.is_blacklisted("Email Sender")
+
+    def test_reloads_when_the_file_changes(self, mapping_file):
+        type_mapping = mapping.TypeMapping(str(mapping_file), check_interval=0)
+        write_mapping(mapping_file, {"IP Address": "ip-src", "DNS Name": "domain"}, 2000)
+        assert type_mapping.get("IP Address") == "ip-src"
+        assert type_mapping.get("DNS Name") == "domain"
+        assert not type_mapping.is_blacklisted("String")
+
+    def test_checks_at_most_every_check_interval(self, mapping_file):
+        type_mapping = mapping.TypeMapping(str(mapping_file), check_interval=3600)
+        write_mapping(mapping_file, {"IP Address": "ip-src"}, 2000)
+        assert type_mapping.get("IP Address") == "ip-dst"
+
+    def test_keeps_the_mapping_on_a_parse_error(self, mapping_file):
+        type_mapping = mapping.TypeMapping(str(mapping_file), check_interval=0)
+        write_mapping(mapping_file, "{not json", 2000)
+        assert type_mapping.get("IP Address") == "ip-dst"
+        type_mapping.reload()
+        assert type_mapping.get("IP Address") == "ip-dst"
+
+    def test_keeps_the_mapping_if_the_file_is_gone(self, mapping_file):
+        type_mapping = mapping.TypeMapping(str(mapping_file), check_interval=0)
+        mapping_file.remove()
+        type_mapping.reload()
+        assert type_mapping.get("IP Address") == "ip-dst"
+        write_mapping(mapping_file, {"IP Address": "ip-src"}, 2000)
+        assert type_mapping.get("IP Address") == "ip-src"
+
+    def test_initial_load_fails_loudly(self, tmpdir):
+        with pytest.raises(OSError):
+            mapping.TypeMapping(str(tmpdir.join("missing.cfg")))
+        path = tmpdir.join("broken.cfg")
+        path.write("{not json")
+        with pytest.raises(ValueError):
+            mapping.TypeMapping(str(path))
@@ -0,0 +1,83 @@
+# -*- coding: utf-8 -*-
+"""Unit tests for the local attribute mirror"""
+
+import pytest
+from fn_misp.lib import mirror
+
+
+def make_attribute(uuid, event_id, value, tags=()):
+    return {"id": uuid, "uuid": uuid, "event_id": event_id, "type": "domain", "category": "Network activity", "value": value,
+            "Event": {"id": event_id, "uuid": "event-" + event_id, "info": "Event " + event_id}, "Tag": [{"name": tag} for tag in tags]}
+
+
+class AttributeSource(object):
+    """Pages the attributes of the events changed since event_timestamp, like the attributes restSearch"""
+
+    def __init__(self, attributes):
+        self.attributes = attributes
+        self.changed_events = None
+        self.queries = []
+
+    def __call__(self, event_timestamp, limit, page):
+        self.queries.append((event_timestamp, page))
+        attributes = [attribute for attribute in self.attributes
+                      if self.changed_events is None or attribute["event_id"] in self.changed_events]
+        return attributes[(page - 1) * limit:page * limit]
+
+
+@pytest.fixture
+def attribute_mirror(tmpdir):
+    mirror.configure(str(tmpdir.join("mirror.db")))
+    yield mirror.AttributeMirror(str(tmpdir.join("mirror.db")))
+    mirror.configure(None)
+
+
+class TestAttributeMirror:
+    """ Tests for AttributeMirror"""
+
+    def test_lookup_composite_and_case(self, attribute_mirror):
+        source = AttributeSource([make_attribute("1", "1", "Evil.com", ["tlp:white"]), make_attribute("2", "1", "1.2.3.4|443")])
+        assert attribute_mirror.sync(source, page_size=1) == 2
+        assert [a["uuid"] for a in attribute_mirror.lookup("EVIL.COM")] == ["1"]
+        assert attribute_mirror.lookup("evil.com")[0]["Tag"] == [{"name": "tlp:white"}]
+        assert [a["uuid"] for a in attribute_mirror.lookup("1.2.3.4")] == ["2"]
+        assert [a["uuid"] for a in attribute_mirror.lookup("443")] == ["2"]
+        assert len(source.queries) == 3
+
+    def test_changed_event_is_replaced(self, attribute_mirror):
+        source = AttributeSource([make_attribute("1", "1", "evil.com"), make_attribute("2", "1", "bad.com"),
+                                  make_attribute("3", "2", "other.com")])
+        attribute_mirror.sync(source)
+        # Event 1 changed: bad.com was deleted and worse.com added, event 2 is not returned by the incremental sync
+        source.attributes = [make_attribute("1", "1", "evil.com"), make_attribute("4", "1", "worse.com")]
+        attribute_mirror.sync(source)
+        assert source.queries[-1][0] > 0
+        assert attribute_mirror.lookup("bad.com") == []
+        assert [a["uuid"] for a in attribute_mirror.lookup("worse.com")] == ["4"]
+        assert [a["uuid"] for a in attribute_mirror.lookup("other.com")] == ["3"]
+
+    def test_full_sync_prunes_deleted_events(self, attribute_mirror):
+        source = AttributeSource([make_attribute("1", "1", "evil.com"), make_attribute("3", "2", "other.com")])
+        attribute_mirror.sync(source)
+        source.attributes = [make_attribute("1", "1", "evil.com")]
+        mirror._settings["full_sync_interval"], full_sync_interval = -1, mirror._settings["full_sync_interval"]
+        try:
+            attribute_mirror.sync(source)
+        finally:
+            mirror._settings["full_sync_interval"] = full_sync_interval
+        assert source.queries[-1][0] == 0
+        assert attribute_mirror.lookup("other.com") == []
+        assert [a["uuid"] for a in attribute_mirror.lookup("evil.com")] == ["1"]
+
+    def test_dirty_values_are_stale_until_the_next_sync(self, attribute_mirror):
+        source = AttributeSource([make_attribute("1", "1", "evil.com")])
+        assert not attribute_mirror.is_fresh()
+        attribute_mirror.sync(source)
+        assert attribute_mirror.is_fresh("evil.com")
+        attribute_mirror.invalidate("1.2.3.4|443")
+        assert not attribute_mirror.is_fresh("443")
+        assert attribute_mirror.is_fresh("evil.com")
+        attribute_mirror.invalidate()
+        assert not attribute_mirror.is_fresh("evil.com")
+        attribute_mirror.sync(source)
+        assert attribute_mirror.is_fresh("evil.com") and attribute_mirror.is_fresh("443")
@@ -0,0 +1,377 @@
+# -*- coding: utf-8 -*-
+"""Unit tests for the response handling of misp_3_helper, using stub MISP clients"""
+
+import pytest
+from fn_misp.lib import bloom, cache, mirror, outbox
+from fn_misp.lib import misp_3_helper as misp_helper
+
+
+class WarninglistClient(object):
+    """Answers warninglists/checkValue like MISP: a dict of hits, or an empty list without any"""
+
+    def __init__(self, hits):
+        self.hits = hits
+        self.calls = []
+
+    def values_in_warninglist(self, values):
+        self.calls.append(values)
+        hits = {value: self.hits[value] for value in values if value in self.hits}
+        return hits or []
+
+
+class TestCheckMispWarninglists:
+    """ Tests for check_misp_warninglists"""
+
+    def test_no_hits_list_response(self):
+        misp_client = WarninglistClient({})
+        assert misp_helper.check_misp_warninglists(misp_client, ["evil.com", "1.2.3.4"]) == {"evil.com": False, "1.2.3.4": False}
+
+    def test_dict_response(self):
+        misp_client = WarninglistClient({"8.8.8.8": [{"id": "1", "name": "List of known DNS resolvers"}]})
+        assert misp_helper.check_misp_warninglists(misp_client, ["8.8.8.8", "evil.com"]) == {"8.8.8.8": True, "evil.com": False}
+
+    def test_hits_match_trimmed_values(self):
+        misp_client = WarninglistClient({"8.8.8.8": [{"id": "1", "name": "List of known DNS resolvers"}]})
+        assert misp_helper.check_misp_warninglists(misp_client, [" 8.8.8.8 ", "8.8.8.8"]) == {" 8.8.8.8 ": True, "8.8.8.8": True}
+        assert misp_client.calls == [["8.8.8.8"]]
+
+    def test_errors_raise(self):
+        class ErrorClient(object):
+            def values_in_warninglist(self, values):
+                return {"errors": (403, "Forbidden")}
+        with pytest.raises(Exception):
+            misp_helper.check_misp_warninglists(ErrorClient(), ["evil.com"])
+
+
+class AttributeSearchClient(object):
+    """Answers attributes restSearch with paging from a fixed list of attributes"""
+
+    def __init__(self, attributes):
+        self.attributes = attributes
+        self.searches = []
+
+    def search(self, controller=None, value=None, limit=None, page=None, **kwargs):
+        values = value if isinstance(value, list) else [value]
+        self.searches.append(values)
+        matching = [attribute for attribute in self.attributes
+                    if any(v in attribute['value'].lower().split('|') + [attribute['value'].lower()] for v in values)]
+        return {"Attribute": matching[(page - 1) * limit:page * limit]}
+
+
+class TestSearchMispAttributes:
+    """ Tests for search_misp_attributes"""
+
+    def setup_method(self):
+        misp_helper.configure_search({"search_max_results": 3, "search_page_size": 2})
+
+    def teardown_method(self):
+        misp_helper.configure_search({})
+
+    def test_composite_values_match_either_part(self):
+        misp_client = AttributeSearchClient([{"uuid": "1", "event_id": "1", "value": "1.2.3.4|80"}])
+        results = misp_helper.search_misp_attributes(misp_client, ["1.2.3.4", "80", "5.6.7.8"])
+        assert results["1.2.3.4"]["search_status"] and results["80"]["search_status"]
+        assert not results["5.6.7.8"]["search_status"]
+
+    def test_cap_applies_per_value(self):
+        popular = [{"uuid": str(i), "event_id": str(i), "value": "popular"} for i in range(10)]
+        misp_client = AttributeSearchClient(popular + [{"uuid": "r", "event_id": "1", "value": "rare"}])
+        results = misp_helper.search_misp_attributes(misp_client, ["popular", "rare"])
+        assert len(results["popular"]["search_results"]) == 3
+        assert results["rare"]["search_status"]
+        assert "rare" not in misp_helper._absent_values
+
+
+class TestOutbox:
+    """ Tests for the idempotency of Outbox.enqueue"""
+
+    def test_duplicate_is_not_queued(self, tmpdir):
+        queue = outbox.Outbox(str(tmpdir.join("outbox.db")))
+        assert queue.enqueue("tag", {"value": "evil.com"}, "key")
+        assert not queue.enqueue("tag", {"value": "evil.com"}, "key")
+        assert queue.stats()["depth"] == 1
+
+    def test_failed_operation_is_requeued(self, tmpdir):
+        queue = outbox.Outbox(str(tmpdir.join("outbox.db")))
+        queue._replay = lambda operation, entries: {key: "MISP is down" for key, _ in entries}
+        queue.enqueue("tag", {"value": "evil.com"}, "key")
+        outbox._settings["max_attempts"], max_attempts = 1, outbox._settings["max_attempts"]
+        try:
+            queue.flush()
+        finally:
+            outbox._settings["max_attempts"] = max_attempts
+        assert queue.stats() == {"depth": 0, "lag": 0, "failed": 1}
+        assert queue.enqueue("tag", {"value": "evil.com"}, "key")
+        assert queue.stats()["depth"] == 1 and queue.stats()["failed"] == 0
+
+
+class TestRotatingBloomFilter:
+    """ Tests for RotatingBloomFilter"""
+
+    def test_remove_undoes_repeated_adds(self):
+        absent_values = bloom.RotatingBloomFilter(capacity=100)
+        absent_values.add("evil.com")
+        absent_values.add("evil.com")
+        assert "evil.com" in absent_values
+        absent_values.remove("evil.com")
+        assert "evil.com" not in absent_values
+
+
+class TestSplitAttributesResponse:
+    """ Tests for _split_attributes_response"""
+
+    batch = [("ip-dst", "1.2.3.4"), ("domain", "evil.com"), ("url", "http://evil.com/")]
+
+    def test_all_created(self):
+        response = {"Attribute": [{"uuid": "1", "value": "1.2.3.4"}, {"uuid": "2", "value": "evil.com"}, {"uuid": "3", "value": "http://evil.com/"}]}
+        results = misp_helper._split_attributes_response(self.batch, response)
+        assert [result["success"] for result in results] == [True, True, True]
+        assert [result["content"]["uuid"] for result in results] == ["1", "2", "3"]
+
+    def test_single_attribute_dict(self):
+        results = misp_helper._split_attributes_response(self.batch[:1], {"Attribute": {"uuid": "1", "value": "1.2.3.4"}})
+        assert results == [{"type": "ip-dst", "value": "1.2.3.4", "success": True, "content": {"uuid": "1", "value": "1.2.3.4"}}]
+
+    def test_rejected_attributes_keep_order(self):
+        response = {"Attribute": [{"uuid": "1", "value": "1.2.3.4"}, {"uuid": "3", "value": "http://evil.com/"}],
+                    "errors": {"attribute_1": {"value": ["A similar attribute already exists for this event."]}}}
+        results = misp_helper._split_attributes_response(self.batch, response)
+        assert [result["success"] for result in results] == [True, False, True]
+        assert results[2]["content"]["uuid"] == "3"
+        assert "similar attribute" in results[1]["error"]
+
+    def test_rejected_request(self):
+        response = {"errors": (403, {"message": "You do not have permission to use this functionality."})}
+        results = misp_helper._split_attributes_response(self.batch, response)
+        assert not any(result["success"] for result in results)
+        assert all("permission" in result["error"] for result in results)
+
+    def test_missing_attribute(self):
+        results = misp_helper._split_attributes_response(self.batch[:2], {"Attribute": [{"uuid": "1", "value": "1.2.3.4"}]})
+        assert results[1] == {"type": "domain", "value": "evil.com", "success": False, "error": "Attribute missing from MISP response"}
+
+    def test_create_misp_attributes_batches(self):
+        class AttributeAddClient(object):
+            def __init__(self):
+                self.batches = []
+
+            def add_attribute(self, misp_event, attributes):
+                self.batches.append([attribute.value for attribute in attributes])
+                return {"Attribute": [{"uuid": attribute.value, "value": attribute.value} for attribute in attributes]}
+
+        misp_client = AttributeAddClient()
+        misp_helper.remember_event({"Event": {"id": "7", "uuid": "event-uuid"}})
+        results = misp_helper.create_misp_attributes(misp_client, "event-uuid", self.batch, batch_size=2)
+        assert misp_client.batches == [["1.2.3.4", "evil.com"], ["http://evil.com/"]]
+        assert [result["value"] for result in results if result["success"]] == ["1.2.3.4", "evil.com", "http://evil.com/"]
+
+
+class SightingSearchClient(object):
+    """Answers sightings/restSearch/event from a fixed list, optionally ignoring the paging like older MISPs"""
+
+    def __init__(self, sighting_count, paging=True):
+        self.sightings = [{"Sighting": {"id": str(i)}} for i in range(sighting_count)]
+        self.paging = paging
+        self.queries = []
+
+    def direct_call(self, url, query):
+        self.queries.append(dict(query))
+        if not self.paging:
+            return {"response": self.sightings}
+        start = (query["page"] - 1) * query["limit"]
+        return {"response": self.sightings[start:start + query["limit"]]}
+
+
+class TestGetMispSightingPages:
+    """ Tests for get_misp_sighting_pages"""
+
+    def test_pages_until_short_page(self):
+        misp_client = SightingSearchClient(5)
+        pages = list(misp_helper.get_misp_sighting_pages(misp_client, 7, page_size=2))
+        assert [len(page) for page in pages] == [2, 2, 1]
+        assert [query["page"] for query in misp_client.queries] == [1, 2, 3]
+        assert misp_client.queries[0] == {"id": 7, "includeAttribute": True, "limit": 2, "page": 1}
+
+    def test_exact_multiple_ends_with_empty_page(self):
+        misp_client = SightingSearchClient(4)
+        pages = list(misp_helper.get_misp_sighting_pages(misp_client, 7, page_size=2))
+        assert [len(page) for page in pages] == [2, 2, 0]
+
+    def test_single_page(self):
+        misp_client = SightingSearchClient(5)
+        pages = list(misp_helper.get_misp_sighting_pages(misp_client, 7, page_size=2, page=2))
+        assert [[s["Sighting"]["id"] for s in page] for page in pages] == [["2", "3"]]
+
+    def test_repeated_page_stops(self):
+        misp_client = SightingSearchClient(3, paging=False)
+        pages = list(misp_helper.get_misp_sighting_pages(misp_client, 7, page_size=3))
+        assert [len(page) for page in pages] == [3]
+        assert len(misp_client.queries) == 2
+
+    def test_errors_raise(self):
+        class ErrorClient(object):
+            def direct_call(self, url, query):
+                return {"errors": (403, "Forbidden")}
+        with pytest.raises(Exception):
+            list(misp_helper.get_misp_sighting_pages(ErrorClient(), 7))
+
+
+class TestNormalizeAttributeValue:
+    """ Tests for normalize_attribute_value"""
+
+    def test_values_compare_as_misp_stores_them(self):
+        assert misp_helper.normalize_attribute_value(" Evil.COM ") == "evil.com"
+        assert misp_helper.normalize_attribute_value("2001:DB8:0:0::1") == "2001:db8::1"
+        assert misp_helper.normalize_attribute_value("2001:db8:0::1|443") == "2001:db8::1|443"
+        assert misp_helper.normalize_attribute_value("not:an:ip") == "not:an:ip"
+
+    def test_clean_orphaned_attributes_matches_normalized(self):
+        class DeleteClient(object):
+            def __init__(self):
+                self.deleted = []
+
+            def delete_attribute(self, uuid):
+                self.deleted.append(uuid)
+                return {"message": "Attribute deleted."}
+
+        misp_client = DeleteClient()
+        event_attributes = [{"uuid": "1", "value": "evil.com"}, {"uuid": "2", "value": "2001:db8::1"}, {"uuid": "3", "value": "good.com"}]
+        results = misp_helper.clean_orphaned_attributes(misp_client, "event-uuid", ["EVIL.com", "2001:db8:0::1"], event_attributes)
+        assert misp_client.deleted == ["1", "2"]
+        assert all(result["success"] for result in results)
+
+
+class TestSearchMispAttributeMirror:
+    """ Tests for the attribute mirror in search_misp_attribute"""
+
+    class FailingClient(object):
+        def search(self, *args, **kwargs):
+            raise ConnectionError("MISP is down")
+
+    @pytest.fixture
+    def attribute_mirror(self, tmpdir):
+        misp_helper.configure_search({"attribute_mirror_db": str(tmpdir.join("mirror.db")), "search_cache_ttl": 0})
+        attribute_mirror = mirror.get_mirror()
+        attribute_mirror.sync(lambda event_timestamp, limit, page: [] if page > 1 else
+                              [{"uuid": "1", "event_id": "1", "value": "evil.com", "Event": {"id": "1"}}])
+        yield attribute_mirror
+        misp_helper.configure_search({})
+
+    def test_events_mode_does_not_use_the_mirror(self, attribute_mirror):
+        with pytest.raises(ConnectionError):
+            misp_helper.search_misp_attribute(self.FailingClient(), "evil.com")
+
+    def test_attributes_mode_answers_from_the_mirror(self, attribute_mirror):
+        misp_helper._search_settings["mode"] = "attributes"
+        results = misp_helper.search_misp_attribute(self.FailingClient(), "evil.com")
+        assert results["search_status"] and results["search_results"][0]["uuid"] == "1"
+
+
+class TestSearchInvalidation:
+    """ Tests for searches racing with writes of the searched value"""
+
+    class RacingClient(AttributeSearchClient):
+        """Creates the searched value in MISP while the search is in flight"""
+
+        def search(self, controller=None, value=None, **kwargs):
+            results = super().search(controller=controller, value=value, **kwargs)
+            if not self.searches[1:]:
+                misp_helper.invalidate_search_cache("evil.com")
+            return results
+
+    def setup_method(self):
+        misp_helper.configure_search({"search_mode": "attributes"})
+
+    def teardown_method(self):
+        misp_helper.configure_search({})
+
+    def test_single_search_does_not_cache_a_stale_miss(self):
+        misp_client = self.RacingClient([])
+        assert not misp_helper.search_misp_attribute(misp_client, "evil.com")["search_status"]
+        assert "evil.com" not in misp_helper._absent_values
+        assert misp_helper._search_cache.get(("attributes", "evil.com")) is None
+
+    def test_bulk_search_does_not_cache_a_stale_miss(self):
+        misp_client = self.RacingClient([])
+        misp_helper.search_misp_attributes(misp_client, ["evil.com", "good.com"])
+        assert "evil.com" not in misp_helper._absent_values
+        assert "good.com" in misp_helper._absent_values
+
+    def test_composite_write_invalidates_its_parts(self):
+        misp_client = AttributeSearchClient([])
+        misp_helper.search_misp_attributes(misp_client, ["1.2.3.4", "80"])
+        assert "1.2.3.4" in misp_helper._absent_values
+        misp_helper.invalidate_search_cache("1.2.3.4|80")
+        assert "1.2.3.4" not in misp_helper._absent_values and "80" not in misp_helper._absent_values
+
+
+class TestSearchCacheSize:
+    """ Tests for sizing search cache entries"""
+
+    def test_estimate_is_close_to_the_json_size(self):
+        import json
+        response = {"search_status": True, "search_tags": ["tlp:white"],
+                    "search_results": [{"uuid": "uuid-%05d" % i, "event_id": str(i), "value": "host%05d.example.org" % i, "to_ids": True}
+                                       for i in range(1000)]}
+        actual = len(json.dumps(response))
+        assert 0.8 * actual < misp_helper._estimate_size(response) < 1.2 * actual
+
+    def test_disabled_cache_does_not_size_values(self):
+        sized = []
+        search_cache = cache.TTLCache(maxsize=0, ttl=0, sizeof=sized.append)
+        search_cache.set("key", {"search_results": []})
+        assert sized == [] and len(search_cache) == 0
+
+
+class SightingClient(AttributeSearchClient):
+    """Records sightings, failing those of the attributes in failing_uuids"""
+
+    def __init__(self, attributes, failing_uuids=()):
+        super().__init__(attributes)
+        self.failing_uuids = set(failing_uuids)
+        self.sighted = []
+
+    def add_sighting(self, sighting, attribute=None):
+        if attribute in self.failing_uuids:
+            return {"errors": (500, "Internal error")}
+        self.sighted.append(attribute or tuple(sighting["values"]))
+        return {"message": "Sighting added"}
+
+
+class TestReplaySightings:
+    """ Tests for the idempotency of sighting replays"""
+
+    attributes = [{"uuid": "1", "event_id": "1", "value": "evil.com"}, {"uuid": "2", "event_id": "1", "value": "bad.com"}]
+    entries = [("key-evil", {"value": "evil.com", "source": "SOAR", "timestamp": 10}),
+               ("key-bad", {"value": "bad.com", "source": "SOAR", "timestamp": 20})]
+
+    def teardown_method(self):
+        misp_helper.configure_sightings({})
+        misp_helper.configure_search({})
+
+    def test_only_failed_uuids_are_retried(self):
+        misp_helper.configure_sightings({"sighting_mode": "uuid"})
+        misp_client = SightingClient(self.attributes, failing_uuids=["2"])
+        errors = misp_helper._replay_sightings(misp_client, self.entries)
+        assert list(errors) == ["key-bad"]
+        assert misp_client.sighted == ["1"]
+
+    def test_failed_request_fails_all_values(self):
+        misp_client = SightingClient(self.attributes)
+        misp_client.add_sighting = lambda sighting, attribute=None: {"errors": (403, "Forbidden")}
+        assert set(misp_helper._replay_sightings(misp_client, self.entries)) == {"key-evil", "key-bad"}
+
+    def test_create_misp_sightings_reports_failures(self):
+        misp_helper.configure_sightings({"sighting_mode": "uuid"})
+        misp_client = SightingClient(self.attributes, failing_uuids=["2"])
+        result = misp_helper.create_misp_sightings(misp_client, ["evil.com", "bad.com", "good.com"])
+        assert result["sighted"] == ["evil.com"] and result["skipped"] == ["good.com"]
+        assert [failure["value"] for failure in result["failed"]] == ["bad.com"]
+
+    def test_create_misp_sighting_goes_through_the_outbox(self, tmpdir, monkeypatch):
+        # The outbox is not started, so the sighting stays queued
+        monkeypatch.setitem(outbox._settings, "path", str(tmpdir.join("outbox.db")))
+        misp_client = SightingClient(self.attributes)
+        result = misp_helper.create_misp_sighting(misp_client, "evil.com")
+        assert result["queued"] and result["outbox"]["depth"] == 1
+        assert misp_client.sighted == []
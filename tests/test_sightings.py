@@ -0,0 +1,101 @@
+# -*- coding: utf-8 -*-
+"""Unit tests for the coalescing and summarizing of MISP sightings"""
+
+from fn_misp.lib import sightings
+
+
+def make_sighting(sighting_id, attribute_id, date_sighting, source="", sighting_type="0"):
+    return {"Sighting": {"id": sighting_id, "attribute_id": attribute_id, "date_sighting": str(date_sighting),
+                         "source": source, "type": sighting_type,
+                         "Attribute": {"id": attribute_id, "uuid": "uuid-" + attribute_id, "value": "value-" + attribute_id, "type": "ip-dst"}}}
+
+
+class TestSightingSummary:
+    """ Tests for SightingSummary"""
+
+    def test_aggregates_per_attribute_across_pages(self):
+        summary = sightings.SightingSummary()
+        summary.add([make_sighting("1", "5", 1000, "IDS"), make_sighting("2", "6", 2000)])
+        summary.add([make_sighting("3", "5", 500, "IDS", "1"), make_sighting("4", "5", 3000, "SOC")])
+        result = summary.result()
+        assert result["total"] == 4
+        first = result["attributes"][0]
+        assert first == {"attribute_id": "5", "attribute_uuid": "uuid-5", "value": "value-5", "type": "ip-dst", "count": 3,
+                         "first_seen": 500, "last_seen": 3000, "sources": {"IDS": 2, "SOC": 1},
+                         "sighting_types": {"0": 2, "1": 1}}
+        assert result["attributes"][1]["count"] == 1
+
+    def test_histogram(self):
+        summary = sightings.SightingSummary(bucket=3600)
+        summary.add([make_sighting("1", "5", 7300), make_sighting("2", "5", 3700), make_sighting("3", "5", 7199)])
+        assert summary.result()["attributes"][0]["histogram"] == [{"start": 3600, "count": 2}, {"start": 7200, "count": 1}]
+
+    def test_unwrapped_sightings(self):
+        summary = sightings.SightingSummary()
+        summary.add([{"attribute_id": "5", "date_sighting": "10"}])
+        assert summary.result()["attributes"][0]["count"] == 1
+
+
+class TestSightingBatcher:
+    """ Tests for SightingBatcher"""
+
+    def test_only_failed_values_stay_buffered(self):
+        sent = []
+
+        def send(misp_client, source, timestamp, values):
+            sent.append(values)
+            return {"bad.com": "Internal error"} if len(sent) == 1 else {}
+
+        batcher = sightings.SightingBatcher(send, window=3600)
+        try:
+            batcher.add(None, "evil.com", "SOAR", 10)
+            batcher.add(None, "bad.com", "SOAR", 10)
+            batcher.flush()
+            assert batcher.pending() == 1
+            batcher.flush()
+            assert sent == [["evil.com", "bad.com"], ["bad.com"]]
+            assert batcher.pending() == 0
+        finally:
+            batcher.close()
+
+    def test_retries_are_capped(self):
+        sent = []
+
+        def send(misp_client, source, timestamp, values):
+            sent.append(values)
+            return {value: "MISP is down" for value in values}
+
+        batcher = sightings.SightingBatcher(send, window=3600, max_attempts=2)
+        try:
+            batcher.add(None, "evil.com", "SOAR", 10)
+            batcher.flush()
+            assert batcher.pending() == 1
+            batcher.flush()
+            assert batcher.pending() == 0
+            batcher.flush()
+            assert len(sent) == 2
+        finally:
+            batcher.close()
+
+    def test_closed_batcher_rejects_sightings(self):
+        batcher = sightings.SightingBatcher(lambda *args: {}, window=3600)
+        batcher.close()
+        assert not batcher.add(None, "evil.com", "SOAR", 10)
+        assert batcher.pending() == 0
+
+    def test_add_after_reset_goes_to_a_new_batcher(self):
+        class Client(object):
+            root_url = "https://misp.example.org"
+
+        sent = []
+        sightings.configure(window=3600)
+        try:
+            stale = sightings.get_batcher(Client(), lambda misp_client, source, timestamp, values: sent.append(values) or {})
+            sightings.reset()
+            assert not stale.add(Client(), "evil.com", "SOAR", 10)
+            sightings.add(Client(), lambda misp_client, source, timestamp, values: sent.append(values) or {}, "evil.com", "SOAR", 10)
+            sightings.flush_all()
+            assert sent == [["evil.com"]]
+        finally:
+            sightings.reset()
+            sightings.configure()
@@ -0,0 +1,87 @@
+# -*- coding: utf-8 -*-
+"""Unit tests for the streaming restSearch parser, using a stub MISP session"""
+
+import io
+import json
+import pytest
+from resilient_lib import IntegrationError
+from fn_misp.lib import streaming
+
+ijson = pytest.importorskip("ijson")
+
+EVENTS = {"response": [
+    {"Event": {"id": "1", "Attribute": [{"value": "evil.com"}, {"value": "good.com"}], "Tag": [{"name": "tlp:white"}]}},
+    {"Event": {"id": "2", "Attribute": [{"value": "good.com"}], "Tag": []}}
+]}
+
+
+def parse(document):
+    return ijson.parse(io.BytesIO(json.dumps(document).encode("utf8")))
+
+
+class TestIterItems:
+    """ Tests for iter_items"""
+
+    def test_items_are_assembled(self):
+        assert list(streaming.iter_items(parse(EVENTS), "response")) == EVENTS["response"]
+
+    def test_nested_elements_are_filtered(self):
+        keep = {"Event.Attribute": lambda attribute: attribute["value"] == "evil.com"}
+        events = list(streaming.iter_items(parse(EVENTS), "response", keep))
+        assert [event["Event"]["Attribute"] for event in events] == [[{"value": "evil.com"}], []]
+        assert events[0]["Event"]["Tag"] == [{"name": "tlp:white"}]
+
+    def test_scalar_items_and_top_level_array(self):
+        assert list(streaming.iter_items(parse([1, "two", None]), "")) == [1, "two", None]
+
+    def test_nested_prefix(self):
+        document = {"response": {"Attribute": [{"value": "evil.com"}]}}
+        assert list(streaming.iter_items(parse(document), "response.Attribute")) == [{"value": "evil.com"}]
+
+
+class StubResponse(object):
+
+    def __init__(self, status_code, document):
+        self.status_code = status_code
+        self.text = json.dumps(document)
+        self.raw = io.BytesIO(self.text.encode("utf8"))
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.raw.close()
+
+
+class StubSession(object):
+
+    def __init__(self, response):
+        self.response = response
+        self.requests = []
+
+    def post(self, url, json=None, **kwargs):
+        self.requests.append((url, json))
+        return self.response
+
+
+class StubMispClient(object):
+    root_url = "https://misp.example.org/"
+    timeout = ssl = proxies = cert = None
+
+
+class TestSearch:
+    """ Tests for search"""
+
+    def test_query_and_results(self):
+        misp_client = StubMispClient()
+        session = StubSession(StubResponse(200, EVENTS))
+        streaming._sessions[misp_client] = session
+        events = list(streaming.search(misp_client, "events", "response", value="evil.com", limit=None))
+        assert [event["Event"]["id"] for event in events] == ["1", "2"]
+        assert session.requests == [("https://misp.example.org/events/restSearch", {"value": "evil.com", "returnFormat": "json"})]
+
+    def test_http_error_raises(self):
+        misp_client = StubMispClient()
+        streaming._sessions[misp_client] = StubSession(StubResponse(403, {"message": "Forbidden"}))
+        with pytest.raises(IntegrationError):
+            list(streaming.search(misp_client, "events", "response", value="evil.com"))
@@ -0,0 +1,133 @@
+# -*- coding: utf-8 -*-
+"""Unit tests for the misp_sync_attributes flow, using stub Resilient and MISP clients"""
+
+from types import SimpleNamespace
+from resilient_circuits import FunctionResult
+from fn_misp.components.misp_sync_attributes import FunctionComponent
+from fn_misp.lib import common, misp_3_helper
+from fn_misp.lib.checkpoints import SyncCheckpoints
+
+MISP_EVENT_UUID = "event-uuid"
+
+
+class StubResilientClient(object):
+    """Serves the artifacts of an incident like the query_paged endpoint"""
+
+    def __init__(self, artifacts):
+        self.artifacts = artifacts
+        self.requests = []
+
+    def post(self, uri, payload):
+        self.requests.append(payload)
+        data = self.artifacts[payload["start"]:payload["start"] + payload["length"]]
+        return {"recordsTotal": len(self.artifacts), "data": data}
+
+
+class StubMispClient(object):
+    """Holds the attributes of one event, add_attribute rejects the values in reject"""
+
+    def __init__(self, attributes=(), reject=()):
+        self.attributes = [dict(attribute, uuid="uuid-{}".format(index)) for index, attribute in enumerate(attributes)]
+        self.reject = set(reject)
+        self.added = []
+        self.deleted = []
+
+    def search(self, controller, eventid):
+        return {"Attribute": list(self.attributes)}
+
+    def values_in_warninglist(self, values):
+        return []
+
+    def add_attribute(self, event, attributes):
+        self.added.append([attribute.value for attribute in attributes])
+        errors = {"attribute_{}".format(index): "Rejected" for index, attribute in enumerate(attributes)
+                  if attribute.value in self.reject}
+        response = {"Attribute": [{"type": attribute.type, "value": attribute.value} for attribute in attributes
+                                  if attribute.value not in self.reject]}
+        if errors:
+            response["errors"] = errors
+        return response
+
+    def delete_attribute(self, uuid):
+        self.deleted.append(uuid)
+        return {"message": "Attribute deleted."}
+
+
+class StubMapping(object):
+
+    def get(self, resilient_type):
+        return {"DNS Name": "domain", "IP Address": "ip-dst"}.get(resilient_type)
+
+    def is_blacklisted(self, resilient_type):
+        return False
+
+
+def artifact(artifact_id, value, tags=(), last_modified=1000, artifact_type="DNS Name"):
+    return {"id": artifact_id, "type": artifact_type, "value": value, "last_modified_time": last_modified,
+            "global_info": {"tags": [{"tag_handle": tag} for tag in tags]}}
+
+
+def sync(misp_client, artifacts, sync_checkpoints=None, artifact_page_size=500, monkeypatch=None):
+    monkeypatch.setattr(common, "get_proxies", lambda opts, options: None)
+    monkeypatch.setattr(misp_3_helper, "get_misp_client", lambda *args, **kwargs: misp_client)
+    misp_3_helper.remember_event({"Event": {"id": "1", "uuid": MISP_EVENT_UUID}})
+    res_client = StubResilientClient(artifacts)
+    component = SimpleNamespace(
+        opts={}, options={"misp_key": "key", "misp_url": "https://misp.example.org", "verify_cert": "false"},
+        misp_type_mapping=StubMapping(), attribute_batch_size=100, artifact_page_size=artifact_page_size,
+        max_concurrency=1, status_every=100, status_interval=10, sync_checkpoints=sync_checkpoints,
+        rest_client=lambda: res_client)
+    messages = list(FunctionComponent._misp_sync_attributes_function.__wrapped__(
+        component, None, misp_event_uuid=MISP_EVENT_UUID, incident_id=1))
+    results = [message for message in messages if isinstance(message, FunctionResult)]
+    assert len(results) == 1
+    return results[0].value, res_client
+
+
+class TestSyncAttributes:
+    """ Tests for the misp_sync_attributes function"""
+
+    def test_new_artifacts_are_created(self, monkeypatch):
+        misp_client = StubMispClient([{"type": "domain", "value": "known.com"}])
+        results, _ = sync(misp_client, [artifact(1, "evil.com"), artifact(2, "KNOWN.com")], monkeypatch=monkeypatch)
+        assert results["success"]
+        assert misp_client.added == [["evil.com"]]
+
+    def test_pages_are_submitted_separately(self, monkeypatch):
+        misp_client = StubMispClient()
+        artifacts = [artifact(index, "evil{}.com".format(index)) for index in range(5)]
+        results, res_client = sync(misp_client, artifacts, artifact_page_size=2, monkeypatch=monkeypatch)
+        assert [request["start"] for request in res_client.requests] == [0, 2, 4]
+        assert misp_client.added == [["evil0.com", "evil1.com"], ["evil2.com", "evil3.com"], ["evil4.com"]]
+        assert results["content"] == "Created 5/5 attributes, removed 0."
+
+    def test_dont_share_artifacts_are_removed(self, monkeypatch):
+        misp_client = StubMispClient([{"type": "domain", "value": "secret.com"}, {"type": "domain", "value": "public.com"}])
+        results, _ = sync(misp_client, [artifact(1, "Secret.com", tags=["dont_share"]), artifact(2, "other.com", tags=["dont_share"])],
+                          monkeypatch=monkeypatch)
+        assert misp_client.deleted == ["uuid-0"]
+        assert misp_client.added == []
+        assert results["content"] == "Created 0/2 attributes, removed 1."
+
+    def test_checkpoint_skips_unchanged_artifacts(self, tmp_path, monkeypatch):
+        checkpoints = SyncCheckpoints(str(tmp_path / "checkpoints.db"))
+        checkpoints.record(1, MISP_EVENT_UUID, [(1, 1000), (2, 1000)])
+        misp_client = StubMispClient()
+        sync(misp_client, [artifact(1, "evil.com"), artifact(2, "bad.com", last_modified=2000), artifact(3, "new.com")],
+             sync_checkpoints=checkpoints, monkeypatch=monkeypatch)
+        assert misp_client.added == [["bad.com", "new.com"]]
+        assert checkpoints.get(1, MISP_EVENT_UUID) == {1: 1000, 2: 2000, 3: 1000}
+
+    def test_failed_artifacts_are_not_recorded(self, tmp_path, monkeypatch):
+        checkpoints = SyncCheckpoints(str(tmp_path / "checkpoints.db"))
+        misp_client = StubMispClient(reject=["bad.com"])
+        results, _ = sync(misp_client, [artifact(1, "evil.com"), artifact(2, "bad.com")],
+                          sync_checkpoints=checkpoints, monkeypatch=monkeypatch)
+        assert [failed["value"] for failed in results["failed"]] == ["bad.com"]
+        assert checkpoints.get(1, MISP_EVENT_UUID) == {1: 1000}
+
+        # The next run only retries the failed artifact
+        misp_client.reject.clear()
+        sync(misp_client, [artifact(1, "evil.com"), artifact(2, "bad.com")], sync_checkpoints=checkpoints, monkeypatch=monkeypatch)
+        assert misp_client.added[-1] == ["bad.com"]
+        assert checkpoints.get(1, MISP_EVENT_UUID) == {1: 1000, 2: 1000}
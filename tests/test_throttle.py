@@ -0,0 +1,141 @@
+# -*- coding: utf-8 -*-
+"""Unit tests for the adaptive rate limiting of MISP requests"""
+
+import io
+import pytest
+import requests
+from requests.adapters import HTTPAdapter
+from requests.exceptions import ConnectTimeout, ReadTimeout
+from fn_misp.lib import throttle
+
+
+class TestAdaptiveRateLimiter:
+    """ Tests for AdaptiveRateLimiter"""
+
+    def test_additive_increase_up_to_max_rate(self):
+        limiter = throttle.AdaptiveRateLimiter(10, increase=0.5)
+        limiter.rate = 4
+        limiter.on_success(0.1)
+        assert limiter.rate == 4.5
+        limiter.rate = 9.8
+        limiter.on_success(0.1)
+        assert limiter.rate == 10
+
+    def test_multiplicative_decrease_once_per_overload(self):
+        limiter = throttle.AdaptiveRateLimiter(10, min_rate=2)
+        limiter.on_overload()
+        limiter.on_overload()
+        assert limiter.rate == 5
+        limiter._last_decrease -= 1
+        limiter.on_success(limiter.latency_target + 1)
+        assert limiter.rate == 2.5
+        limiter._last_decrease -= 1
+        limiter.on_overload()
+        assert limiter.rate == 2
+
+    def test_reconfigure_in_place(self):
+        limiter = throttle.AdaptiveRateLimiter(20)
+        limiter.reconfigure(5, latency_target=1)
+        assert (limiter.max_rate, limiter.rate, limiter.latency_target) == (5, 5, 1)
+        limiter.reconfigure(0.2, latency_target=1)
+        assert limiter.min_rate == 0.2
+        limiter.reconfigure(5, latency_target=1)
+        assert limiter.min_rate == 0.5
+
+    def test_configure_keeps_the_shared_limiter(self):
+        adapter = throttle.get_adapter()
+        try:
+            throttle.configure({"rate_limit": 7, "rate_limit_latency": 2})
+            assert throttle.get_adapter().limiter is adapter.limiter
+            assert adapter.limiter.max_rate == 7
+            throttle.configure({"rate_limit": 0})
+            assert throttle.get_adapter() is None
+        finally:
+            throttle.configure({})
+
+
+def make_response(status_code, headers=None):
+    response = requests.Response()
+    response.status_code = status_code
+    response.raw = io.BytesIO(b"")
+    response.headers.update(headers or {})
+    return response
+
+
+class TestThrottledAdapter:
+    """ Tests for the retries of ThrottledAdapter"""
+
+    @pytest.fixture
+    def send(self, monkeypatch):
+        """Replace the transport with a queue of outcomes, returns (outcomes, sleeps)"""
+        outcomes, sleeps = [], []
+
+        def transport_send(adapter, request, **kwargs):
+            outcome = outcomes.pop(0)
+            if isinstance(outcome, Exception):
+                raise outcome
+            return outcome
+
+        monkeypatch.setattr(HTTPAdapter, "send", transport_send)
+        monkeypatch.setattr(throttle.time, "sleep", sleeps.append)
+        throttle.configure({"rate_limit": 1000, "rate_limit_retries": 2})
+        yield outcomes, sleeps
+        throttle.configure({})
+
+    def adapter(self):
+        limiter = throttle.AdaptiveRateLimiter(1000)
+        return throttle.ThrottledAdapter(limiter), limiter
+
+    def test_retry_after_is_honoured(self, send):
+        outcomes, sleeps = send
+        outcomes += [make_response(429, {"Retry-After": "7"}), make_response(200)]
+        adapter, limiter = self.adapter()
+        assert adapter.send(None).status_code == 200
+        assert sleeps == [7.0]
+        # Halved by the 429, then increased by the successful retry
+        assert limiter.rate == 500.5
+
+    def test_503_backs_off_exponentially_and_gives_up(self, send):
+        outcomes, sleeps = send
+        outcomes += [make_response(503), make_response(503), make_response(503)]
+        adapter, _ = self.adapter()
+        assert adapter.send(None).status_code == 503
+        assert sleeps == [2, 4]
+        assert not outcomes
+
+    def test_server_errors_are_not_retried(self, send):
+        outcomes, sleeps = send
+        outcomes += [make_response(500), make_response(200)]
+        adapter, limiter = self.adapter()
+        assert adapter.send(None).status_code == 500
+        assert sleeps == [] and limiter.rate == 500
+
+    def test_connect_timeout_is_retried(self, send):
+        outcomes, sleeps = send
+        outcomes += [ConnectTimeout(), ConnectTimeout(), make_response(200)]
+        adapter, _ = self.adapter()
+        assert adapter.send(None).status_code == 200
+        assert sleeps == [2, 4]
+
+    def test_connect_timeout_raises_after_retries(self, send):
+        outcomes, _ = send
+        outcomes += [ConnectTimeout(), ConnectTimeout(), ConnectTimeout()]
+        adapter, _ = self.adapter()
+        with pytest.raises(ConnectTimeout):
+            adapter.send(None)
+
+    def test_read_timeout_is_not_retried(self, send):
+        outcomes, _ = send
+        outcomes += [ReadTimeout(), make_response(200)]
+        adapter, limiter = self.adapter()
+        with pytest.raises(ReadTimeout):
+            adapter.send(None)
+        assert limiter.rate == 500
+
+    def test_disabled_sends_directly(self, send):
+        outcomes, sleeps = send
+        outcomes += [make_response(429)]
+        adapter, _ = self.adapter()
+        throttle.configure({"rate_limit": 0})
+        assert adapter.send(None).status_code == 429
+        assert sleeps == []
@@ -0,0 +1,95 @@
+# -*- coding: utf-8 -*-
+"""Unit tests for the local MISP Warninglist indexes, using a stub MISP client"""
+
+from fn_misp.lib import warninglists
+
+
+class WarninglistsClient(object):
+    """Serves warninglists and their entries like the MISP warninglists controller"""
+
+    def __init__(self, warninglists):
+        self.warninglists_by_id = {str(index): warninglist for index, warninglist in enumerate(warninglists, 1)}
+        self.downloads = []
+
+    def warninglists(self):
+        return {"Warninglists": [{"Warninglist": {"id": warninglist_id, "name": warninglist["name"], "type": warninglist["type"],
+                                                  "version": warninglist.get("version", "1"), "enabled": warninglist.get("enabled", True)}}
+                                 for warninglist_id, warninglist in self.warninglists_by_id.items()]}
+
+    def get_warninglist(self, warninglist_id):
+        self.downloads.append(warninglist_id)
+        warninglist = self.warninglists_by_id[warninglist_id]
+        return {"Warninglist": {"id": warninglist_id, "name": warninglist["name"], "type": warninglist["type"],
+                                "version": warninglist.get("version", "1"),
+                                "WarninglistEntry": [{"value": entry} for entry in warninglist["entries"]]}}
+
+
+class TestCidrIndex:
+    """ Tests for CidrIndex"""
+
+    def test_addresses_and_networks(self):
+        index = warninglists.CidrIndex()
+        index.add("10.0.0.0/8")
+        index.add("2001:db8::/32")
+        index.add("8.8.8.8")
+        assert "10.1.2.3" in index
+        assert "10.1.0.0/16" in index
+        assert "2001:db8::1" in index
+        assert "8.8.8.8" in index
+        assert "8.8.4.4" not in index
+        assert "11.0.0.1" not in index
+        assert "10.0.0.0/7" not in index
+        assert "evil.com" not in index
+
+
+class TestHostnameIndex:
+    """ Tests for HostnameIndex"""
+
+    def test_subdomains_match(self):
+        index = warninglists.HostnameIndex()
+        index.add("google.com.")
+        assert "google.com" in index
+        assert "mail.google.com" in index
+        assert "https://WWW.Google.com/search" in index
+        assert "notgoogle.com" not in index
+        assert "com" not in index
+
+
+class TestWarninglistIndex:
+    """ Tests for WarninglistIndex"""
+
+    def test_list_types(self):
+        index = warninglists.WarninglistIndex([
+            {"name": "strings", "type": "string", "entries": ["example.org"]},
+            {"name": "substrings", "type": "substring", "entries": ["amazonaws"]},
+            {"name": "regexes", "type": "regex", "entries": ["/^localhost$/i", "[unbalanced"]},
+        ])
+        assert "example.org" in index
+        assert "sub.example.org" not in index
+        assert "s3.amazonaws.com" in index
+        assert "LOCALHOST" in index
+        assert "localhost.evil.com" not in index
+
+
+class TestWarninglistEngine:
+    """ Tests for WarninglistEngine"""
+
+    def test_only_enabled_lists_are_checked(self):
+        misp_client = WarninglistsClient([
+            {"name": "List of known DNS resolvers", "type": "cidr", "entries": ["8.8.8.8/32"]},
+            {"name": "Disabled list", "type": "hostname", "entries": ["evil.com"], "enabled": False},
+        ])
+        engine = warninglists.WarninglistEngine()
+        assert engine.check_values(misp_client, ["8.8.8.8", "evil.com"]) == {"8.8.8.8": True, "evil.com": False}
+        assert misp_client.downloads == ["1"]
+
+    def test_unchanged_lists_are_not_downloaded_again(self):
+        misp_client = WarninglistsClient([{"name": "Hostnames", "type": "hostname", "entries": ["example.org"], "version": "1"}])
+        engine = warninglists.WarninglistEngine()
+        engine.refresh(misp_client)
+        engine.refresh(misp_client)
+        assert misp_client.downloads == ["1"]
+        misp_client.warninglists_by_id["1"].update(version="2", entries=["example.net"])
+        engine.refresh(misp_client)
+        assert misp_client.downloads == ["1", "1"]
+        assert engine.check(misp_client, "www.example.net")